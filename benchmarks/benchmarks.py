@@ -1,7 +1,15 @@
 # Write the benchmarking functions here.
 # See "Writing benchmarks" in the asv docs for more information.
 
-from skbio import DNA, RNA
+from io import StringIO
+
+from skbio import DNA, RNA, GeneticCode, Alignment, TabularMSA, TreeNode, read
+from skbio.tree import majority_rule, rf_dists
+from skbio.sequence import MotifSet, DegenerateExpansions
+from skbio.alignment import (mask_positions, global_pairwise_align_nucleotide,
+                             local_pairwise_align_nucleotide,
+                             StripedSmithWaterman, pairwise_align_ssw_many,
+                             progressive_align)
 import numpy as np
 
 num_bases = 1000000
@@ -21,9 +29,45 @@ dna_seq = DNA(dna_bytes)
 dna_seq_short = DNA(dna_bytes_short)
 dna_gapped = DNA(dna_bytes_gapped)
 rna_seq = RNA(rna_bytes)
+rna_seqs_short = [RNA(rna_bytes[i:i + short_len])
+                  for i in range(0, 1000 * short_len, short_len)]
 
 motif_1 = "GGTGCAAGCCGGTGGAAACA"
 motif_1_regex = '(' + motif_1 + ')'
+motif_set = MotifSet([DNA(motif_1), DNA('GTGYCAGCMGCCGCGGTAA'),
+                      DNA('GGACTACNVGGGTWTCTAAT')], max_mismatches=1)
+
+alignment = Alignment([DNA(dna_bytes[i:i + 1000], metadata={'id': str(i)})
+                       for i in range(0, 500 * 1000, 1000)])
+position_mask = np.arange(1000) % 3 > 0
+msa = TabularMSA([DNA(dna_bytes[i:i + 1000])
+                  for i in range(0, 500 * 1000, 1000)])
+pairwise_seqs = [DNA(np.random.RandomState(seed).choice(
+    dna_template_bytes, 2000).astype(np.uint8)) for seed in (0, 1)]
+msa_seqs = [DNA(np.random.RandomState(seed).choice(
+    dna_template_bytes, 200).astype(np.uint8)) for seed in range(100)]
+ssw_query = StripedSmithWaterman(str(dna_seq_short))
+ssw_targets = [str(rna_seq)[i:i + 250].replace('U', 'T')
+               for i in range(0, 1000 * 250, 250)]
+
+
+def _random_newick(num_tips, seed):
+    state = np.random.RandomState(seed)
+    nodes = ['t%d' % i for i in range(num_tips)]
+    while len(nodes) > 1:
+        i, j = sorted(state.choice(len(nodes), 2, replace=False))
+        right, left = nodes.pop(j), nodes.pop(i)
+        nodes.append('(%s,%s):%.2f' % (left, right, state.rand()))
+    return nodes[0] + ';'
+
+
+# bootstrap-like trees: half of them share the same topology
+bootstrap_newick = '\n'.join(
+    _random_newick(200, seed if seed % 2 else 0) for seed in range(100))
+bootstrap_trees = [TreeNode.read(StringIO(newick))
+                   for newick in bootstrap_newick.split('\n')]
+large_newick = _random_newick(50000, 0)
+large_tree = TreeNode.read(StringIO(large_newick))
 
 
 def consume_iterator(iterator):
@@ -48,17 +92,120 @@ class BenchmarkSuite:
     def time_translate(self):
         rna_seq.translate()
 
+    def time_translate_six_frames_short(self):
+        for seq in rna_seqs_short:
+            consume_iterator(GeneticCode.from_ncbi().translate_six_frames(seq))
+
+    def time_translate_many_short(self):
+        GeneticCode.from_ncbi().translate_many(rna_seqs_short)
+
+    def time_find_orfs(self):
+        GeneticCode.from_ncbi().find_orfs(dna_seq, min_length=30)
+
     def time_search_for_motif(self):
         consume_iterator(dna_seq.find_with_regex(motif_1_regex))
 
+    def time_search_motif_set(self):
+        motif_set.search(dna_seq)
+
+    def time_find_approximate(self):
+        consume_iterator(dna_seq.find_approximate(motif_1, max_distance=2))
+
+    def time_batch_find_approximate_short(self):
+        RNA.batch_find_approximate(rna_seqs_short, 'ACGUACGUAAGG',
+                                   max_distance=2)
+
+    def time_degenerate_expansion_batches(self):
+        consume_iterator(DegenerateExpansions(
+            DNA('GGACTACNVGGGTWTCTAATNNNNNN')).iter_batches())
+
+    def time_alignment_distances(self):
+        alignment.distances('p-distance')
+
+    def time_alignment_majority_consensus(self):
+        alignment.majority_consensus()
+
+    def time_alignment_position_entropies(self):
+        alignment.position_entropies()
+
+    def time_alignment_omit_gap_positions(self):
+        alignment.omit_gap_positions(0.5)
+
+    def time_mask_positions(self):
+        consume_iterator(mask_positions(alignment, position_mask))
+
+    def time_msa_distances_k2p(self):
+        msa.distances('k2p')
+
+    def time_msa_creation(self):
+        TabularMSA(alignment)
+
+    def time_msa_consensus(self):
+        msa.consensus()
+
+    def time_msa_gap_frequencies(self):
+        msa.gap_frequencies()
+
     def time_kmer_count_5(self):
         dna_seq_short.kmer_frequencies(5)
 
     def time_kmer_count_25(self):
         dna_seq_short.kmer_frequencies(25)
 
+    def time_kmer_counts_25(self):
+        dna_seq_short.kmer_counts(25)
+
+    def time_kmer_counts_canonical_21_sparse(self):
+        dna_seq.kmer_counts(21, canonical=True, output='sparse')
+
     def time_gc_content(self):
         dna_seq.gc_content()
 
     def time_search_for_motif_in_gapped(self):
         dna_seq.find_with_regex(motif_1_regex, ignore=dna_seq.gaps())
+
+    def time_global_pairwise_align_nucleotide(self):
+        global_pairwise_align_nucleotide(*pairwise_seqs)
+
+    def time_local_pairwise_align_nucleotide(self):
+        local_pairwise_align_nucleotide(*pairwise_seqs)
+
+    def time_global_pairwise_align_nucleotide_score_only(self):
+        global_pairwise_align_nucleotide(*pairwise_seqs, score_only=True)
+
+    def time_global_pairwise_align_nucleotide_banded(self):
+        global_pairwise_align_nucleotide(*pairwise_seqs, band_width=100)
+
+    def time_striped_smith_waterman(self):
+        for target in ssw_targets:
+            ssw_query(target)
+
+    def time_striped_smith_waterman_align_many(self):
+        ssw_query.align_many(ssw_targets)
+
+    def time_progressive_align(self):
+        progressive_align(msa_seqs)
+
+    def time_pairwise_align_ssw_many(self):
+        pairwise_align_ssw_many((query, target)
+                                for query in ssw_targets[:40]
+                                for target in ssw_targets[:40])
+
+    def time_majority_rule(self):
+        majority_rule(bootstrap_trees)
+
+    def time_majority_rule_streamed_newick(self):
+        majority_rule(read(StringIO(bootstrap_newick), format='newick'))
+
+    def time_compare_rfd(self):
+        for tree in bootstrap_trees[1:]:
+            bootstrap_trees[0].compare_rfd(tree)
+
+    def time_rf_dists(self):
+        rf_dists(bootstrap_trees)
+
+    def time_newick_read(self):
+        TreeNode.read(StringIO(large_newick), format='newick')
+
+    def time_newick_write(self):
+        large_tree.write(StringIO(), format='newick')
@@ -84,6 +84,8 @@ extensions = [
               ["skbio/alignment/_ssw_wrapper" + ext,
                "skbio/alignment/_lib/ssw.c"],
               extra_compile_args=ssw_extra_compile_args),
+    Extension("skbio.alignment._pairwise_dp",
+              ["skbio/alignment/_pairwise_dp" + ext]),
     Extension("skbio.diversity._phylogenetic",
               ["skbio/diversity/_phylogenetic" + ext])
 ]
@@ -123,6 +125,7 @@ setup(name='scikit-bio',
       ],
       classifiers=classifiers,
       package_data={
+          'skbio.alignment': ['data/*'],
           'skbio.diversity.alpha.tests': ['data/qiime-191-tt/*'],
           'skbio.diversity.beta.tests': ['data/qiime-191-tt/*'],
           'skbio.io.tests': ['data/*'],
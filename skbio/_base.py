@@ -11,6 +11,7 @@ from future.utils import with_metaclass
 from future.builtins import zip
 
 import abc
+import collections
 import copy
 import functools
 
@@ -305,6 +306,11 @@ class PositionalMetadataMixin(with_metaclass(abc.ABCMeta, object)):
 
     @positional_metadata.setter
     def positional_metadata(self, positional_metadata):
+        arrays = self._positional_metadata_arrays_or_none(positional_metadata)
+        if arrays is not None:
+            self._positional_metadata = arrays
+            return
+
         try:
             # Pass copy=True to copy underlying data buffer.
             positional_metadata = pd.DataFrame(positional_metadata, copy=True)
@@ -329,6 +335,110 @@ class PositionalMetadataMixin(with_metaclass(abc.ABCMeta, object)):
     def positional_metadata(self):
         self._positional_metadata = None
 
+    # Positional metadata is stored in one of two forms: a ``pd.DataFrame``
+    # or, when it was supplied as a dict of equal-length 1-D numeric NumPy
+    # arrays (e.g., FASTQ quality scores), as an ordered dict mapping column
+    # names to copies of those arrays. Constructing a DataFrame is expensive
+    # relative to a short sequence, so the dict form is only converted into a
+    # DataFrame when ``positional_metadata`` is accessed. Internal code that
+    # only needs to pass positional metadata along (slicing, copying, etc.)
+    # should use ``_positional_metadata_source_`` and the column helpers to
+    # avoid triggering that conversion.
+    @property
+    def _positional_metadata(self):
+        if self._positional_metadata_arrays is not None:
+            arrays = self._positional_metadata_arrays
+            self._positional_metadata_df = pd.DataFrame(arrays,
+                                                        columns=list(arrays))
+            self._positional_metadata_arrays = None
+        return self._positional_metadata_df
+
+    @_positional_metadata.setter
+    def _positional_metadata(self, positional_metadata):
+        if isinstance(positional_metadata, dict):
+            # Already validated and owned by this object.
+            self._positional_metadata_arrays = positional_metadata
+            self._positional_metadata_df = None
+        else:
+            self._positional_metadata_arrays = None
+            self._positional_metadata_df = positional_metadata
+
+    def _positional_metadata_arrays_or_none(self, positional_metadata):
+        """Return copied dict of arrays if `positional_metadata` allows it."""
+        if type(positional_metadata) not in (dict, collections.OrderedDict):
+            return None
+        if not positional_metadata:
+            return None
+
+        axis_len = None
+        for values in positional_metadata.values():
+            if (type(values) is not np.ndarray or values.ndim != 1 or
+                    values.dtype.kind not in 'biufc'):
+                return None
+            if axis_len is None:
+                axis_len = len(values)
+            elif len(values) != axis_len:
+                # Let pandas report the error.
+                return None
+
+        expected_len = self._positional_metadata_axis_len_()
+        if axis_len != expected_len:
+            raise ValueError(
+                "Number of positional metadata values (%d) must match the "
+                "positional metadata axis length (%d)."
+                % (axis_len, expected_len))
+
+        if type(positional_metadata) is dict:
+            try:
+                # Match the column order pandas uses for a dict.
+                keys = sorted(positional_metadata)
+            except TypeError:
+                return None
+        else:
+            keys = list(positional_metadata)
+        return collections.OrderedDict(
+            (key, positional_metadata[key].copy()) for key in keys)
+
+    def _positional_metadata_source_(self):
+        """Return positional metadata without creating a ``pd.DataFrame``.
+
+        The returned object is either a dict of NumPy arrays or a
+        ``pd.DataFrame`` and is suitable for passing to a constructor as
+        positional metadata (which will copy it). ``None`` is returned if the
+        object does not have positional metadata.
+
+        """
+        if not self.has_positional_metadata():
+            return None
+        if self._positional_metadata_arrays is not None:
+            return self._positional_metadata_arrays
+        return self._positional_metadata_df
+
+    def _get_positional_metadata_column_(self, name):
+        """Return positional metadata column as an array, or ``None``."""
+        arrays = self._positional_metadata_arrays
+        if arrays is not None:
+            return arrays.get(name)
+        df = self._positional_metadata_df
+        if df is not None and name in df:
+            return df[name].values
+        return None
+
+    def _set_positional_metadata_column_(self, name, values):
+        """Add or replace a positional metadata column.
+
+        `values` must be a 1-D NumPy array matching the positional metadata
+        axis length; it is not copied.
+
+        """
+        if self._positional_metadata_df is not None:
+            self._positional_metadata_df[name] = values
+        elif self._positional_metadata_arrays is not None:
+            self._positional_metadata_arrays[name] = values
+        else:
+            self._positional_metadata = collections.OrderedDict(
+                [(name, values)])
+
     @abc.abstractmethod
     def __init__(self, positional_metadata=None):
         pass
@@ -349,7 +459,14 @@ class PositionalMetadataMixin(with_metaclass(abc.ABCMeta, object)):
         # positional metadata representations on the objects if they don't have
         # positional metadata.
         if self.has_positional_metadata() and other.has_positional_metadata():
-            if not self.positional_metadata.equals(other.positional_metadata):
+            arrays = self._positional_metadata_arrays
+            other_arrays = other._positional_metadata_arrays
+            if arrays is not None and other_arrays is not None:
+                if not _positional_metadata_arrays_equal(arrays,
+                                                         other_arrays):
+                    return False
+            elif not self.positional_metadata.equals(
+                    other.positional_metadata):
                 return False
         elif not (self.has_positional_metadata() or
                   other.has_positional_metadata()):
@@ -374,6 +491,10 @@ class PositionalMetadataMixin(with_metaclass(abc.ABCMeta, object)):
 
     def _copy_(self):
         if self.has_positional_metadata():
+            if self._positional_metadata_arrays is not None:
+                return collections.OrderedDict(
+                    (key, values.copy()) for key, values in
+                    self._positional_metadata_arrays.items())
             # deep=True makes a shallow copy of the underlying data buffer.
             return self.positional_metadata.copy(deep=True)
         else:
@@ -385,6 +506,8 @@ class PositionalMetadataMixin(with_metaclass(abc.ABCMeta, object)):
 
     def _deepcopy_(self, memo):
         if self.has_positional_metadata():
+            if self._positional_metadata_arrays is not None:
+                return copy.deepcopy(self._positional_metadata_arrays, memo)
             return copy.deepcopy(self.positional_metadata, memo)
         else:
             return None
@@ -422,8 +545,27 @@ class PositionalMetadataMixin(with_metaclass(abc.ABCMeta, object)):
         True
 
         """
-        return (self._positional_metadata is not None and
-                len(self.positional_metadata.columns) > 0)
+        if self._positional_metadata_arrays is not None:
+            return bool(self._positional_metadata_arrays)
+        return (self._positional_metadata_df is not None and
+                len(self._positional_metadata_df.columns) > 0)
+
+
+def _positional_metadata_arrays_equal(arrays, other_arrays):
+    """Compare dict-of-arrays positional metadata as ``DataFrame.equals``."""
+    if list(arrays) != list(other_arrays):
+        return False
+    for key, values in arrays.items():
+        other_values = other_arrays[key]
+        if values.dtype != other_values.dtype:
+            return False
+        equal = values == other_values
+        if values.dtype.kind in 'fc':
+            # NaNs in the same location are considered equal.
+            equal |= np.isnan(values) & np.isnan(other_values)
+        if not equal.all():
+            return False
+    return True
 
 
 class OrdinationResults(SkbioObject):
@@ -20,6 +20,7 @@ Data Structures
    SequenceCollection
    Alignment
    TabularMSA
+   SubstitutionMatrix
 
 Optimized (i.e., production-ready) Alignment Algorithms
 -------------------------------------------------------
@@ -30,9 +31,10 @@ Optimized (i.e., production-ready) Alignment Algorithms
    StripedSmithWaterman
    AlignmentStructure
    local_pairwise_align_ssw
+   pairwise_align_ssw_many
 
-Slow (i.e., educational-purposes only) Alignment Algorithms
------------------------------------------------------------
+Dynamic Programming Alignment Algorithms
+----------------------------------------
 
 .. autosummary::
    :toctree: generated/
@@ -43,6 +45,7 @@ Slow (i.e., educational-purposes only) Alignment Algorithms
    local_pairwise_align_nucleotide
    local_pairwise_align_protein
    local_pairwise_align
+   progressive_align
 
 General functionality
 ---------------------
@@ -51,6 +54,7 @@ General functionality
    :toctree: generated/
 
     make_identity_substitution_matrix
+    mask_positions
 
 Exceptions
 ----------
@@ -141,12 +145,13 @@ ACTAAGGCT---CTCTACCCCTCTCAGAGA
 >>> print(alignments[0].aligned_target_sequence)
 ACT-AGGCTCCCTTCTACCCCTCTCAGAGA
 
-Slow Alignment Algorithm Examples
----------------------------------
-scikit-bio also provides pure-Python implementations of Smith-Waterman and
-Needleman-Wunsch alignment. These are much slower than the methods described
-above, but serve as useful educational examples as they're simpler to
-experiment with. Functions are provided for local and global alignment of
+Dynamic Programming Alignment Examples
+--------------------------------------
+scikit-bio also provides compiled implementations of Smith-Waterman and
+Needleman-Wunsch alignment with affine gap penalties. These are slower than
+the methods described above, but are more flexible: for example, global
+alignment can align alignments as well as sequences, and can leave terminal
+gaps unpenalized. Functions are provided for local and global alignment of
 protein and nucleotide sequences. The ``global*`` and ``local*`` functions
 differ in the underlying algorithm that is applied (``global*`` uses Needleman-
 Wunsch while ``local*`` uses Smith-Waterman), and ``*protein`` and
@@ -216,18 +221,24 @@ from ._pairwise import (
     local_pairwise_align_nucleotide, local_pairwise_align_protein,
     local_pairwise_align, global_pairwise_align_nucleotide,
     global_pairwise_align_protein, global_pairwise_align,
-    make_identity_substitution_matrix, local_pairwise_align_ssw
+    make_identity_substitution_matrix, local_pairwise_align_ssw,
+    pairwise_align_ssw_many
 )
 from skbio.alignment._ssw_wrapper import (
     StripedSmithWaterman, AlignmentStructure)
+from ._substitution_matrix import SubstitutionMatrix
+from ._mask import mask_positions
+from ._progressive import progressive_align
 from ._exception import (SequenceCollectionError, AlignmentError)
 
 __all__ = ['TabularMSA', 'Alignment', 'SequenceCollection',
            'StripedSmithWaterman', 'AlignmentStructure',
-           'local_pairwise_align_ssw', 'SequenceCollectionError',
+           'local_pairwise_align_ssw', 'pairwise_align_ssw_many',
+           'SequenceCollectionError',
            'AlignmentError', 'global_pairwise_align',
            'global_pairwise_align_nucleotide', 'global_pairwise_align_protein',
            'local_pairwise_align', 'local_pairwise_align_nucleotide',
-           'local_pairwise_align_protein', 'make_identity_substitution_matrix']
+           'local_pairwise_align_protein', 'make_identity_substitution_matrix',
+           'mask_positions', 'progressive_align', 'SubstitutionMatrix']
 
 test = TestRunner(__file__).test
@@ -8,21 +8,26 @@
 
 from __future__ import absolute_import, division, print_function
 from future.builtins import zip, range
-from future.utils import viewkeys, viewitems
 
 from collections import Counter, defaultdict
 
 import numpy as np
-from scipy.stats import entropy
 import six
 
 from skbio._base import SkbioObject
-from skbio.sequence import Sequence
+from skbio.sequence import Sequence, kmer_count_matrix
 from skbio.stats.distance import DistanceMatrix
 from ._exception import (SequenceCollectionError, AlignmentError)
+from ._distance import _distance_matrix, _metrics
+from ._mask import _mask_sequence
 from skbio.util._decorator import experimental, deprecated
 
 
+# Characters are counted over blocks of sequences of about this many
+# characters so that temporary arrays stay small for long alignments.
+_block_chars = 2 ** 22
+
+
 class SequenceCollection(SkbioObject):
     """Class for storing collections of biological sequences.
 
@@ -658,6 +663,55 @@ class SequenceCollection(SkbioObject):
         return [s.kmer_frequencies(k, overlap=overlap, relative=relative)
                 for s in self]
 
+    @experimental(as_of="0.4.0-dev")
+    def kmer_count_matrix(self, k, overlap=True, canonical=False):
+        """Return kmer counts of all sequences as a sparse matrix.
+
+        Parameters
+        ----------
+        k : int
+            The word length.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+        canonical : bool, optional
+            If ``True``, count each kmer together with its reverse complement.
+            Only supported for nucleotide sequences.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Kmer counts with one row per sequence and one column per kmer.
+        list of str
+            Kmer corresponding to each column.
+
+        See Also
+        --------
+        kmer_frequencies
+        skbio.sequence.kmer_count_matrix
+
+        Examples
+        --------
+        >>> from skbio import SequenceCollection, DNA
+        >>> from skbio.diversity import beta_diversity
+        >>> sequences = [DNA('ACGTT', metadata={'id': "seq1"}),
+        ...              DNA('ACGAA', metadata={'id': "seq2"})]
+        >>> s1 = SequenceCollection(sequences)
+        >>> counts, kmers = s1.kmer_count_matrix(2)
+        >>> kmers
+        ['AA', 'AC', 'CG', 'GA', 'GT', 'TT']
+        >>> dm = beta_diversity('euclidean', counts, ids=s1.ids())
+        >>> print(dm)
+        2x2 distance matrix
+        IDs:
+        'seq1', 'seq2'
+        Data:
+        [[ 0.  2.]
+         [ 2.  0.]]
+
+        """
+        return kmer_count_matrix(self, k, overlap=overlap,
+                                 canonical=canonical)
+
     @experimental(as_of="0.4.0")
     def sequence_lengths(self):
         """Return lengths of the sequences in the `SequenceCollection`
@@ -752,25 +806,50 @@ class Alignment(SequenceCollection):
         self._start_end_positions = start_end_positions
 
     @experimental(as_of="0.4.0")
-    def distances(self, distance_fn=None):
+    def distances(self, distance_fn=None, n_threads=1, gamma=None):
         """Compute distances between all pairs of sequences
 
         Parameters
         ----------
-        distance_fn : function, optional
+        distance_fn : function or str, optional
             Function for computing the distance between a pair of sequences.
             This must take two sequences as input (as `skbio.Sequence` objects)
-            and return a single integer or float value. Defaults to the default
-            distance function used by `skbio.Sequence.distance`.
+            and return a single integer or float value. Alternatively, the name
+            of a distance metric computed for all pairs at once (see
+            `skbio.TabularMSA.distances`). Defaults to ``'hamming'``, the
+            default distance function used by `skbio.Sequence.distance`.
+        n_threads : int, optional
+            Number of threads computing distances in parallel when
+            `distance_fn` is the name of a metric.
+        gamma : float, optional
+            Shape parameter of the gamma distribution of substitution rates
+            among sites for the ``'jc69'``, ``'k2p'`` and ``'tn93'`` metrics.
 
         Returns
         -------
         skbio.DistanceMatrix
             Matrix containing the distances between all pairs of sequences.
 
+        Raises
+        ------
+        ValueError
+            If `distance_fn` is not a function or the name of a metric, or if
+            the metric cannot be computed (see `skbio.TabularMSA.distances`).
+        TypeError
+            If `distance_fn` is the name of a nucleotide substitution model
+            and the sequences are not ``DNA`` or ``RNA``.
+
         See Also
         --------
         skbio.Sequence.distance
+        skbio.TabularMSA.distances
+
+        Notes
+        -----
+        The named metrics are computed from the characters of all sequences
+        as a single array, in blocks of sequences, without comparing the
+        sequences pair by pair in Python. They are therefore much faster than
+        passing an equivalent function, especially for many sequences.
 
         Examples
         --------
@@ -789,8 +868,28 @@ class Alignment(SequenceCollection):
          [ 0.42857143  0.          0.42857143]
          [ 0.28571429  0.42857143  0.        ]]
 
+        Gaps are ignored by the p-distance:
+
+        >>> print(a1.distances('p-distance'))
+        3x3 distance matrix
+        IDs:
+        's1', 's2', 's3'
+        Data:
+        [[ 0.          0.          0.16666667]
+         [ 0.          0.          0.2       ]
+         [ 0.16666667  0.2         0.        ]]
+
         """
-        return super(Alignment, self).distances(distance_fn)
+        if distance_fn is None:
+            distance_fn = 'hamming'
+        if not isinstance(distance_fn, six.string_types):
+            return super(Alignment, self).distances(distance_fn)
+
+        if distance_fn not in _metrics:
+            raise ValueError("`distance_fn` must be a function or one of %r, "
+                             "not %r" % (_metrics, distance_fn))
+        return _distance_matrix(self, self.ids(), distance_fn, gamma,
+                                n_threads)
 
     @experimental(as_of="0.4.0")
     def score(self):
@@ -893,78 +992,36 @@ class Alignment(SequenceCollection):
         <Alignment: n=2; mean +/- std length=4.00 +/- 0.00>
 
         """
-        # if seqs_to_keep was not passed
+        # inverting the default of keeping all sequences or all positions
+        # results in an empty alignment
+        if ((seqs_to_keep is None and invert_seqs_to_keep) or
+                (positions_to_keep is None and invert_positions_to_keep)):
+            return self.__class__([])
+
         if seqs_to_keep is None:
-            # and invert_seqs_to_keep is True
-            if invert_seqs_to_keep:
-                # return an empty alignment (because we're inverting the
-                # default of keeping all sequences)
-                return self.__class__([])
-            # else if invert_seqs_to_keep is False
-            else:
-                # default to returning all sequences
-                def keep_seq(i, id):
-                    return True
-        # else, if seqs_to_keep was passed
+            keep_seqs = [True] * self.sequence_count()
         else:
+            # sequences can be identified by ID or index
             seqs_to_keep = set(seqs_to_keep)
-            # and invert_seqs_to_keep is True
-            if invert_seqs_to_keep:
-                # keep only sequences that were not listed in seqs_to_keep
-                def keep_seq(i, id):
-                    return not (id in seqs_to_keep or
-                                i in seqs_to_keep)
-            # else if invert_seqs_to_keep is False
-            else:
-                # keep only sequences that were listed in seqs_to_keep
-                def keep_seq(i, id):
-                    return (id in seqs_to_keep or
-                            i in seqs_to_keep)
+            keep_seqs = [(seq.metadata['id'] in seqs_to_keep or
+                          i in seqs_to_keep) != invert_seqs_to_keep
+                         for i, seq in enumerate(self)]
 
-        # if positions_to_keep was not passed
         if positions_to_keep is None:
-            # and invert_positions_to_keep is True
-            if invert_positions_to_keep:
-                # return an empty alignment (because we're inverting the
-                # default of keeping all positions)
-                return self.__class__([])
-            # else if invert_positions_to_keep is False
-            else:
-                # default to returning all positions
-                def keep_position(pos):
-                    return True
-        # else, if positions_to_keep was passed
+            def subsequence(seq):
+                return seq._to()
         else:
-            positions_to_keep = set(positions_to_keep)
-            # and invert_positions_to_keep is True
-            if invert_positions_to_keep:
-                # keep only positions that were not listed in
-                # positions_to_keep
-                def keep_position(pos):
-                    return pos not in positions_to_keep
-            # else if invert_positions_to_keep is False
-            else:
-                # keep only sequences that were listed in positions_to_keep
-                def keep_position(pos):
-                    return pos in positions_to_keep
+            positions = np.arange(self.sequence_length())
+            keep_positions = np.in1d(positions, list(positions_to_keep))
+            positions = positions[keep_positions != invert_positions_to_keep]
+
+            def subsequence(seq):
+                return _mask_sequence(seq, positions)
 
-        # prep the result object
-        result = []
-        # indices to keep
-        indices = [
-            i for i in range(self.sequence_length()) if keep_position(i)]
-        # iterate over sequences
-        for sequence_index, seq in enumerate(self):
-            # determine if we're keeping the current sequence
-            if keep_seq(sequence_index, seq.metadata['id']):
-                # slice the current sequence with the indices
-                result.append(seq[indices])
-            # if we're not keeping the current sequence, move on to the next
-            else:
-                continue
         # pack the result up in the same type of object as the current object
         # and return it
-        return self.__class__(result)
+        return self.__class__([subsequence(seq)
+                               for seq, keep in zip(self, keep_seqs) if keep])
 
     @experimental(as_of="0.4.0")
     def iter_positions(self, constructor=None):
@@ -1083,15 +1140,12 @@ class Alignment(SequenceCollection):
 
         """
         if self.is_empty():
-            seq_constructor = Sequence
-        else:
-            seq_constructor = self[0].__class__
+            return Sequence('')
 
-        # Counter.most_common returns an ordered list of the n most common
-        # (sequence, count) items in Counter. Here we set n=1, and take only
-        # the character, not the count.
-        return seq_constructor(''.join(c.most_common(1)[0][0]
-                               for c in self.position_counters()))
+        codes, counts = self._position_char_counts()
+        # without positions, there are no characters to choose from
+        consensus = codes[counts.argmax(axis=1)] if len(codes) else ''
+        return self[0].__class__(consensus)
 
     @experimental(as_of="0.4.0")
     def omit_gap_positions(self, maximum_gap_frequency):
@@ -1134,15 +1188,14 @@ class Alignment(SequenceCollection):
         if self.is_empty():
             return self.__class__([])
 
-        position_frequencies = self.position_frequencies()
-        gap_chars = self[0].gap_chars
+        is_gap = self._gap_lookup()
+        gap_counts = np.zeros(self.sequence_length(), dtype=int)
+        for block in self._char_blocks():
+            gap_counts += is_gap[block].sum(axis=0)
+        gap_frequencies = gap_counts / self.sequence_count()
 
-        positions_to_keep = []
-        for i, f in enumerate(position_frequencies):
-            gap_frequency = sum([f[c] if c in f else 0.0 for c in gap_chars])
-            if gap_frequency <= maximum_gap_frequency:
-                positions_to_keep.append(i)
-        return self.subalignment(positions_to_keep=positions_to_keep)
+        return self.subalignment(positions_to_keep=np.flatnonzero(
+            gap_frequencies <= maximum_gap_frequency))
 
     @experimental(as_of="0.4.0")
     def omit_gap_sequences(self, maximum_gap_frequency):
@@ -1183,14 +1236,13 @@ class Alignment(SequenceCollection):
         if self.is_empty():
             return self.__class__([])
 
-        base_frequencies = self.kmer_frequencies(k=1, relative=True)
-        gap_chars = self[0].gap_chars
-        seqs_to_keep = []
-        for seq, f in zip(self, base_frequencies):
-            gap_frequency = sum([f[c] if c in f else 0.0 for c in gap_chars])
-            if gap_frequency <= maximum_gap_frequency:
-                seqs_to_keep.append(seq.metadata['id'])
-        return self.subalignment(seqs_to_keep=seqs_to_keep)
+        is_gap = self._gap_lookup()
+        length = self.sequence_length()
+        # sequences without positions have no gaps
+        return self.__class__([
+            seq._to() for seq in self
+            if not length or (np.count_nonzero(is_gap[seq._bytes]) /
+                              length <= maximum_gap_frequency)])
 
     @experimental(as_of="0.4.0")
     def position_counters(self):
@@ -1223,7 +1275,11 @@ class Alignment(SequenceCollection):
         Counter({'C': 2, '-': 1})
 
         """
-        return [Counter(p) for p in self.iter_positions(constructor=str)]
+        codes, counts = self._position_char_counts()
+        chars = [chr(code) for code in codes]
+        return [Counter(dict((chars[i], count) for i, count in enumerate(row)
+                             if count))
+                for row in counts.tolist()]
 
     @experimental(as_of="0.4.0")
     def position_frequencies(self):
@@ -1257,12 +1313,14 @@ class Alignment(SequenceCollection):
         0.0
 
         """
-        seq_count = self.sequence_count()
+        codes, counts = self._position_char_counts()
+        chars = [chr(code) for code in codes]
         result = []
-        for pos_counter in self.position_counters():
+        for row in (counts / self.sequence_count()).tolist():
             freqs = defaultdict(float)
-            for char, count in viewitems(pos_counter):
-                freqs[char] = count / seq_count
+            for i, freq in enumerate(row):
+                if freq:
+                    freqs[chars[i]] = freq
             result.append(freqs)
         return result
 
@@ -1317,19 +1375,23 @@ class Alignment(SequenceCollection):
         [0.56233514461880829, 1.3862943611198906, nan, nan]
 
         """
-        result = []
         # handle empty Alignment case
         if self.is_empty():
-            return result
-
-        iupac_standard_characters = self[0].nondegenerate_chars
-        for f in self.position_frequencies():
-            if (nan_on_non_standard_chars and
-                    len(viewkeys(f) - iupac_standard_characters) > 0):
-                result.append(np.nan)
-            else:
-                result.append(entropy(list(f.values()), base=base))
-        return result
+            return []
+
+        codes, counts = self._position_char_counts()
+        freqs = counts / self.sequence_count()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropies = -np.where(freqs > 0, freqs * np.log(freqs),
+                                  0.0).sum(axis=1)
+        if base is not None:
+            entropies /= np.log(base)
+
+        if nan_on_non_standard_chars:
+            standard = np.in1d(codes, [ord(c) for c in
+                                       self[0].nondegenerate_chars])
+            entropies[(counts[:, ~standard] > 0).any(axis=1)] = np.nan
+        return list(entropies)
 
     @experimental(as_of="0.4.0")
     def sequence_length(self):
@@ -1363,6 +1425,52 @@ class Alignment(SequenceCollection):
         else:
             return len(self._data[0])
 
+    def _position_char_counts(self):
+        """Count the characters at each position.
+
+        Returns
+        -------
+        codes : 1D np.ndarray (np.uint8)
+            Sorted ASCII codes of the characters in the alignment.
+        counts : 2D np.ndarray (int)
+            Number of times each character (column) occurs at each position
+            (row).
+
+        Notes
+        -----
+        Each character is replaced by its index in `codes`, and all
+        (position, character) pairs are counted at once with ``np.bincount``.
+
+        """
+        length = self.sequence_length()
+        present = np.zeros(256, dtype=bool)
+        for seq in self:
+            present[seq._bytes] = True
+        codes = np.flatnonzero(present).astype(np.uint8)
+        char_index = np.zeros(256, dtype=np.intp)
+        char_index[codes] = np.arange(len(codes))
+
+        offsets = np.arange(length) * len(codes)
+        counts = np.zeros(length * len(codes), dtype=int)
+        for block in self._char_blocks():
+            counts += np.bincount((char_index[block] + offsets).ravel(),
+                                  minlength=counts.size)
+        return codes, counts.reshape(length, len(codes))
+
+    def _char_blocks(self):
+        """Yield the characters of blocks of sequences as 2D arrays."""
+        num_seqs = max(_block_chars // max(self.sequence_length(), 1), 1)
+        for start in range(0, self.sequence_count(), num_seqs):
+            yield np.asarray([seq._bytes for seq in
+                              self._data[start:start + num_seqs]],
+                             dtype=np.uint8)
+
+    def _gap_lookup(self):
+        """Return whether each ASCII code is a gap character."""
+        is_gap = np.zeros(256, dtype=bool)
+        is_gap[[ord(c) for c in self[0].gap_chars]] = True
+        return is_gap
+
     def _validate_lengths(self):
         """Return ``True`` if all sequences same length, ``False`` otherwise
         """
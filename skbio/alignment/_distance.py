@@ -0,0 +1,260 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import functools
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from skbio.sequence._nucleotide_mixin import NucleotideMixin
+from skbio.stats.distance import DistanceMatrix
+
+
+# Number of sequences whose distances to all other sequences are computed
+# together.
+_block_size = 1024
+
+_metrics = ('hamming', 'p-distance', 'jc69', 'k2p', 'tn93')
+# metrics based on models of nucleotide substitution
+_nucleotide_metrics = ('jc69', 'k2p', 'tn93')
+
+
+def _distance_matrix(sequences, ids, metric, gamma=None, n_threads=1,
+                     chars=None):
+    """Validate arguments and compute distances between aligned sequences.
+
+    Returns a ``DistanceMatrix`` with the given IDs. See
+    ``_pairwise_distances`` for the metrics. `chars` may be the characters of
+    `sequences` as a 2D array (np.uint8) if they are already stored as such.
+
+    """
+    if metric not in _metrics:
+        raise ValueError("`metric` must be one of %r, not %r"
+                         % (_metrics, metric))
+    if gamma is not None:
+        if metric not in _nucleotide_metrics:
+            raise ValueError("`gamma` can only be used with the %r metrics, "
+                             "not %r" % (_nucleotide_metrics, metric))
+        if not gamma > 0:
+            raise ValueError("`gamma` must be greater than 0, not %r"
+                             % gamma)
+    if n_threads < 1:
+        raise ValueError("`n_threads` must be at least 1, not %r" % n_threads)
+
+    sequences = list(sequences)
+    if chars is None:
+        length = len(sequences[0]) if sequences else 0
+        chars = np.empty((len(sequences), length), dtype=np.uint8)
+        for i, sequence in enumerate(sequences):
+            chars[i] = sequence.values.view(np.uint8)
+    gap_codes = set()
+    for sequence in sequences:
+        if (metric in _nucleotide_metrics and
+                not isinstance(sequence, NucleotideMixin)):
+            raise TypeError("The %r metric can only be computed between DNA "
+                            "or RNA sequences, not %r"
+                            % (metric, type(sequence).__name__))
+        gap_codes.update(ord(c) for c in getattr(sequence, 'gap_chars', ()))
+
+    return DistanceMatrix(
+        _pairwise_distances(chars, metric, gap_codes, n_threads, gamma), ids)
+
+
+def _pairwise_distances(chars, metric, gap_codes=(), n_threads=1,
+                        gamma=None):
+    """Compute distances between all pairs of aligned sequences.
+
+    Parameters
+    ----------
+    chars : 2D np.ndarray (np.uint8)
+        ASCII codes of the aligned sequences, one sequence per row.
+    metric : {'hamming', 'p-distance', 'jc69', 'k2p', 'tn93'}
+        ``'hamming'`` is the fraction of positions that differ, gaps included.
+        ``'p-distance'`` is the fraction of positions that differ among those
+        where neither sequence has a gap. The other metrics are the distances
+        of the Jukes-Cantor, Kimura 2-parameter, and Tamura-Nei models of
+        nucleotide substitution, computed from the positions where both
+        sequences have a non-degenerate nucleotide.
+    gap_codes : iterable (int), optional
+        ASCII codes of the gap characters.
+    n_threads : int, optional
+        Number of threads computing distances in parallel.
+    gamma : float, optional
+        Shape parameter of the gamma distribution of substitution rates
+        among sites. If ``None``, rates are equal at all sites. Only used by
+        the substitution models.
+
+    Returns
+    -------
+    2D np.ndarray (float)
+        Symmetric matrix of distances.
+
+    Raises
+    ------
+    ValueError
+        If two sequences have no position in common that the metric can be
+        computed from, or if the distance between two sequences is undefined
+        under a substitution model.
+
+    Notes
+    -----
+    The number of positions at which two sequences share a character is the
+    dot product of the rows of the character's indicator matrix, so the
+    counts for all pairs are obtained with matrix products.
+
+    """
+    if metric in _nucleotide_metrics:
+        return _model_distances(chars, metric, gamma, n_threads)
+
+    num_sequences, length = chars.shape
+    # indicator products are exact in single precision up to 2 ** 24
+    dtype = np.float32 if length < 2 ** 24 else np.float64
+    gap_codes = np.asarray(sorted(gap_codes), dtype=np.uint8)
+
+    codes = np.unique(chars)
+    if metric == 'p-distance':
+        codes = np.setdiff1d(codes, gap_codes)
+    matches = _gram_sum((chars == code for code in codes), num_sequences,
+                        dtype, n_threads)
+
+    if metric == 'p-distance':
+        sites = _gram_sum([~np.in1d(chars, gap_codes).reshape(chars.shape)],
+                          num_sequences, dtype, n_threads)
+        _check_sites(sites, 'without gaps', 'p-distance')
+    else:
+        sites = length
+
+    with np.errstate(invalid='ignore'):
+        distances = (sites - matches) / sites
+    distances[np.diag_indices(num_sequences)] = 0.0
+    return distances
+
+
+def _model_distances(chars, model, gamma, n_threads):
+    """Compute distances under a model of nucleotide substitution.
+
+    Counts of transitions (A <-> G and C <-> T/U) and transversions are
+    obtained from the Gram matrices of the indicator matrices of each
+    nucleotide, of purines, and of pyrimidines: e.g., the number of A <-> G
+    transitions is the number of positions where both sequences have a
+    purine minus those where both have A or both have G.
+
+    """
+    num_sequences, length = chars.shape
+    dtype = np.float32 if length < 2 ** 24 else np.float64
+
+    def gram(indicator):
+        return _gram_sum([indicator], num_sequences, dtype, n_threads)
+
+    a, c, g = (chars == ord(base) for base in 'ACG')
+    t = (chars == ord('T')) | (chars == ord('U'))
+    purines = a | g
+    pyrimidines = c | t
+
+    sites = gram(purines | pyrimidines)
+    _check_sites(sites, 'with non-degenerate nucleotides',
+                 '%s distance' % model.upper())
+    purine_pairs = gram(purines)
+    pyrimidine_pairs = gram(pyrimidines)
+    same_a, same_c, same_g, same_t = (gram(x) for x in (a, c, g, t))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # proportions of A <-> G transitions, C <-> T transitions, and
+        # transversions
+        p1 = (purine_pairs - same_a - same_g) / sites
+        p2 = (pyrimidine_pairs - same_c - same_t) / sites
+        q = (sites - purine_pairs - pyrimidine_pairs) / sites
+
+    if model == 'jc69':
+        terms = [(0.75, 1 - 4 / 3 * (p1 + p2 + q))]
+    elif model == 'k2p':
+        terms = [(0.5, 1 - 2 * (p1 + p2) - q), (0.25, 1 - 2 * q)]
+    else:
+        counts = np.array([x.sum() for x in (a, c, g, t)], dtype=float)
+        if not counts.all():
+            raise ValueError("TN93 distances require all four nucleotides "
+                             "to occur in the alignment.")
+        pi_a, pi_c, pi_g, pi_t = counts / counts.sum()
+        pi_r = pi_a + pi_g
+        pi_y = pi_c + pi_t
+        terms = [
+            (2 * pi_a * pi_g / pi_r,
+             1 - pi_r / (2 * pi_a * pi_g) * p1 - q / (2 * pi_r)),
+            (2 * pi_c * pi_t / pi_y,
+             1 - pi_y / (2 * pi_c * pi_t) * p2 - q / (2 * pi_y)),
+            (2 * (pi_r * pi_y - pi_a * pi_g * pi_y / pi_r -
+                  pi_c * pi_t * pi_r / pi_y),
+             1 - q / (2 * pi_r * pi_y))]
+
+    distances = np.zeros((num_sequences, num_sequences))
+    off_diagonal = ~np.eye(num_sequences, dtype=bool)
+    for weight, x in terms:
+        rows, columns = ((x <= 0) & off_diagonal).nonzero()
+        if rows.size:
+            raise ValueError(
+                "The %s distance between sequences %d and %d is undefined "
+                "because they are too divergent."
+                % (model.upper(), rows[0], columns[0]))
+        with np.errstate(divide='ignore'):
+            if gamma is None:
+                distances -= weight * np.log(x)
+            else:
+                distances += weight * gamma * (x ** (-1 / gamma) - 1)
+    distances[~off_diagonal] = 0.0
+    return distances
+
+
+def _check_sites(sites, description, metric):
+    rows, columns = (sites == 0).nonzero()
+    if rows.size:
+        raise ValueError(
+            "Sequences %d and %d do not have any position %s in common, so "
+            "their %s is undefined."
+            % (rows[0], columns[0], description, metric))
+
+
+def _gram_sum(indicators, num_rows, dtype, n_threads):
+    """Sum the Gram matrices of boolean matrices with `num_rows` rows.
+
+    The matrices are processed one at a time. The upper triangle of each Gram
+    matrix is computed in blocks of rows, in parallel, and finally mirrored
+    in place.
+
+    """
+    result = np.zeros((num_rows, num_rows), dtype=np.float64)
+    starts = list(range(0, num_rows, _block_size))
+
+    def add_block(matrix, start):
+        stop = min(start + _block_size, num_rows)
+        block = matrix[start:stop]
+        # NumPy computes the product of a matrix with its own transpose with
+        # the (twice as fast) symmetric BLAS routine
+        result[start:stop, start:stop] += block.dot(block.T)
+        result[start:stop, stop:] += block.dot(matrix[stop:].T)
+
+    pool = ThreadPool(n_threads) if n_threads > 1 else None
+    try:
+        for indicator in indicators:
+            matrix = indicator.astype(dtype)
+            if pool is None:
+                for start in starts:
+                    add_block(matrix, start)
+            else:
+                pool.map(functools.partial(add_block, matrix), starts)
+    finally:
+        if pool is not None:
+            pool.close()
+
+    # the diagonal blocks are complete, so only the blocks below them are
+    # mirrored, in place to avoid allocating other n x n arrays
+    for start in starts:
+        stop = min(start + _block_size, num_rows)
+        result[stop:, start:stop] = result[start:stop, stop:].T
+    return result
@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+import six
+
+from skbio.util._decorator import experimental
+
+
+@experimental(as_of="0.4.0-dev")
+def mask_positions(sequences, mask, invert=False):
+    """Keep the positions of aligned sequences selected by a mask.
+
+    Sequences are filtered one at a time as they are consumed, so an
+    alignment read from a file can be filtered and written to another file
+    without loading all of its sequences into memory.
+
+    Parameters
+    ----------
+    sequences : iterable of scikit-bio sequence objects
+        Aligned sequences, all with the same length as `mask`. May be a
+        generator, such as the one returned by ``skbio.io.read``.
+    mask : str or 1D array_like (bool)
+        Positions to keep, either as boolean values or as a string of ``'0'``
+        and ``'1'`` characters, such as a lane mask, where ``'1'`` marks the
+        positions to keep.
+    invert : bool, optional
+        If ``True``, the positions selected by `mask` are discarded rather
+        than kept.
+
+    Returns
+    -------
+    generator
+        Generator yielding each sequence restricted to the selected
+        positions. Sequences keep their type and metadata, and their
+        positional metadata is restricted to the selected positions.
+
+    Raises
+    ------
+    ValueError
+        If `mask` is a string containing characters other than ``'0'`` and
+        ``'1'``.
+    ValueError
+        If a sequence does not have the same length as `mask` (raised when
+        the sequence is reached).
+
+    See Also
+    --------
+    Alignment.omit_gap_positions
+    TabularMSA.gap_frequencies
+    skbio.io.read
+    skbio.io.write
+
+    Examples
+    --------
+    Filter an alignment in FASTA format with a lane mask, writing each
+    filtered sequence as soon as it is read:
+
+    >>> from io import StringIO
+    >>> import skbio.io
+    >>> from skbio import DNA
+    >>> from skbio.alignment import mask_positions
+    >>> fasta = StringIO(u'>s1\\nA-CC-G\\n>s2\\nATCT-G\\n')
+    >>> sequences = skbio.io.read(fasta, format='fasta', constructor=DNA)
+    >>> output = StringIO()
+    >>> _ = skbio.io.write(mask_positions(sequences, '101101'),
+    ...                    format='fasta', into=output)
+    >>> print(output.getvalue())
+    >s1
+    ACCG
+    >s2
+    ACTG
+    <BLANKLINE>
+
+    A mask can also be computed from another alignment, e.g., to discard the
+    positions that are gaps in most of its sequences:
+
+    >>> from skbio import TabularMSA
+    >>> msa = TabularMSA([DNA('A-CC-G'), DNA('A-C--G'), DNA('ATCT-G')])
+    >>> mask = msa.gap_frequencies(relative=True) <= 0.5
+    >>> for sequence in mask_positions(msa, mask):
+    ...     print(sequence)
+    ACCG
+    AC-G
+    ACTG
+
+    """
+    if isinstance(mask, six.string_types):
+        invalid = set(mask) - set('01')
+        if invalid:
+            raise ValueError("A mask string may only contain '0' and '1', "
+                             "not %r" % sorted(invalid))
+        mask = np.frombuffer(mask.encode('ascii'), dtype=np.uint8) == ord('1')
+    mask = np.asarray(mask, dtype=bool)
+    if invert:
+        mask = ~mask
+    indices = np.flatnonzero(mask)
+
+    def masked():
+        for sequence in sequences:
+            if len(sequence) != len(mask):
+                raise ValueError(
+                    "Sequence length must match the length of the mask: "
+                    "%d != %d" % (len(sequence), len(mask)))
+            yield _mask_sequence(sequence, indices)
+
+    return masked()
+
+
+def _mask_sequence(sequence, indices):
+    """Return the sequence restricted to positions `indices` (sorted)."""
+    if sequence.has_positional_metadata():
+        return sequence[indices]
+    return sequence._to(sequence=sequence._bytes[indices])
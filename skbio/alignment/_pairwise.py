@@ -7,23 +7,28 @@
 # ----------------------------------------------------------------------------
 
 from __future__ import absolute_import, division, print_function
-from warnings import warn
 from itertools import product
+from multiprocessing.pool import ThreadPool
+import numbers
+import re
 
 import numpy as np
-from future.builtins import range, zip
+import pandas as pd
 from six import string_types
 
 from skbio.alignment import Alignment
+from skbio.alignment._pairwise_dp import (
+    _fill_block, _trace_path, VGAP, HGAP, GLOBAL, LOCAL, ANCHORED, START,
+    CONTINUE_VGAP, OPEN_VGAP)
 from skbio.alignment._ssw_wrapper import StripedSmithWaterman
+from skbio.alignment._substitution_matrix import SubstitutionMatrix
 from skbio.sequence import Sequence, Protein
 from skbio.sequence._iupac_sequence import IUPACSequence
-from skbio.util import EfficiencyWarning
 from skbio.util._decorator import experimental, deprecated
 
-# This is temporary: blosum50 does not exist in skbio yet as per
-# issue 161. When the issue is resolved, this should be removed in favor
-# of an import.
+# The BLOSUM 50 matrix used by default by the protein aligners. It differs
+# from NCBI's (``SubstitutionMatrix.from_ncbi('BLOSUM50')``) in the scores of
+# B and X, and is kept so that default alignment scores do not change.
 blosum50 = \
     {
         '*': {'*': 1, 'A': -5, 'C': -5, 'B': -5, 'E': -5, 'D': -5, 'G': -5,
@@ -122,13 +127,15 @@ blosum50 = \
               'F': -4, 'I': -3, 'H': 0, 'K': 1, 'M': -1, 'L': -3, 'N': 0,
               'Q': 4, 'P': -1, 'S': 0, 'R': 0, 'T': -1, 'W': -2, 'V': -3,
               'Y': -2, 'X': -1, 'Z': 5}}
+_blosum50 = SubstitutionMatrix.from_dict(blosum50)
 
 
 @experimental(as_of="0.4.0")
 def local_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
                                     gap_extend_penalty=2,
                                     match_score=2, mismatch_score=-3,
-                                    substitution_matrix=None):
+                                    substitution_matrix=None,
+                                    band_width=None, score_only=False):
     """Locally align exactly two nucleotide seqs with Smith-Waterman
 
     Parameters
@@ -150,16 +157,25 @@ def local_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
         The score to add for a mismatch between a pair of bases (this is
         added to the previous best alignment score, so is typically
         negative).
-    substitution_matrix: 2D dict (or similar)
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix
         Lookup for substitution scores (these values are added to the
         previous best alignment score). If provided, this overrides
         ``match_score`` and ``mismatch_score``.
+    band_width : int, optional
+        If provided, only alignments that stay within `band_width` diagonals
+        of the band joining the first and last positions of the sequences
+        are considered, which reduces run time when the sequences are
+        similar. By default, all alignments are considered.
+    score_only : bool, optional
+        If ``True``, only the score of the best alignment is computed and
+        returned, using memory proportional to the length of the sequences.
 
     Returns
     -------
-    skbio.Alignment
+    skbio.Alignment or float
         ``Alignment`` object containing the aligned sequences as well as
-        details about the alignment.
+        details about the alignment, or its score if `score_only` is
+        ``True``.
 
     See Also
     --------
@@ -184,19 +200,21 @@ def local_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
     # use the substitution matrix provided by the user, or compute from
     # match_score and mismatch_score if a substitution matrix was not provided
     if substitution_matrix is None:
-        substitution_matrix = \
-            make_identity_substitution_matrix(match_score, mismatch_score)
+        substitution_matrix = SubstitutionMatrix.identity(
+            'ACGTU', match_score, mismatch_score)
     else:
         pass
 
     return local_pairwise_align(seq1, seq2, gap_open_penalty,
-                                gap_extend_penalty, substitution_matrix)
+                                gap_extend_penalty, substitution_matrix,
+                                band_width=band_width, score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def local_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
                                  gap_extend_penalty=1,
-                                 substitution_matrix=None):
+                                 substitution_matrix=None, band_width=None,
+                                 score_only=False):
     """Locally align exactly two protein seqs with Smith-Waterman
 
     Parameters
@@ -211,15 +229,24 @@ def local_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
     gap_extend_penalty : int or float, optional
         Penalty for extending a gap (this is substracted from previous best
         alignment score, so is typically positive).
-    substitution_matrix: 2D dict (or similar), optional
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix, optional
         Lookup for substitution scores (these values are added to the
         previous best alignment score); default is BLOSUM 50.
+    band_width : int, optional
+        If provided, only alignments that stay within `band_width` diagonals
+        of the band joining the first and last positions of the sequences
+        are considered, which reduces run time when the sequences are
+        similar. By default, all alignments are considered.
+    score_only : bool, optional
+        If ``True``, only the score of the best alignment is computed and
+        returned, using memory proportional to the length of the sequences.
 
     Returns
     -------
-    skbio.Alignment
+    skbio.Alignment or float
         ``Alignment`` object containing the aligned sequences as well as
-        details about the alignment.
+        details about the alignment, or its score if `score_only` is
+        ``True``.
 
     See Also
     --------
@@ -247,15 +274,17 @@ def local_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
 
     """
     if substitution_matrix is None:
-        substitution_matrix = blosum50
+        substitution_matrix = _blosum50
 
     return local_pairwise_align(seq1, seq2, gap_open_penalty,
-                                gap_extend_penalty, substitution_matrix)
+                                gap_extend_penalty, substitution_matrix,
+                                band_width=band_width, score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def local_pairwise_align(seq1, seq2, gap_open_penalty,
-                         gap_extend_penalty, substitution_matrix):
+                         gap_extend_penalty, substitution_matrix,
+                         band_width=None, score_only=False):
     """Locally align exactly two seqs with Smith-Waterman
 
     Parameters
@@ -270,15 +299,24 @@ def local_pairwise_align(seq1, seq2, gap_open_penalty,
     gap_extend_penalty : int or float
         Penalty for extending a gap (this is substracted from previous best
         alignment score, so is typically positive).
-    substitution_matrix: 2D dict (or similar)
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix
         Lookup for substitution scores (these values are added to the
         previous best alignment score).
+    band_width : int, optional
+        If provided, only alignments that stay within `band_width` diagonals
+        of the band joining the first and last positions of the sequences
+        are considered, which reduces run time when the sequences are
+        similar. By default, all alignments are considered.
+    score_only : bool, optional
+        If ``True``, only the score of the best alignment is computed and
+        returned, using memory proportional to the length of the sequences.
 
     Returns
     -------
-    skbio.Alignment
-       ``Alignment`` object containing the aligned sequences as well as
-        details about the alignment.
+    skbio.Alignment or float
+        ``Alignment`` object containing the aligned sequences as well as
+        details about the alignment, or its score if `score_only` is
+        ``True``.
 
     See Also
     --------
@@ -293,6 +331,12 @@ def local_pairwise_align(seq1, seq2, gap_open_penalty,
     -----
     This algorithm was originally described in [1]_. The scikit-bio
     implementation was validated against the EMBOSS water web server [2]_.
+    Affine gap penalties are computed with Gotoh's algorithm [3]_, in time
+    proportional to the product of the sequence lengths.
+    Alignments are traced back in memory proportional to the product of the
+    sequence lengths when it is small enough, and otherwise in memory
+    proportional to their sum with Hirschberg's algorithm [4]_, at the cost of
+    about twice the run time.
 
     References
     ----------
@@ -300,32 +344,20 @@ def local_pairwise_align(seq1, seq2, gap_open_penalty,
        Smith TF, Waterman MS.
        J Mol Biol. 1981 Mar 25;147(1):195-7.
     .. [2] http://www.ebi.ac.uk/Tools/psa/emboss_water/
+    .. [3] An improved algorithm for matching biological sequences.
+       Gotoh O.
+       J Mol Biol. 1982 Dec 15;162(3):705-8.
+    .. [4] A linear space algorithm for computing maximal common subsequences.
+       Hirschberg DS.
+       Commun ACM. 1975 Jun;18(6):341-3.
 
     """
-    warn("You're using skbio's python implementation of Smith-Waterman "
-         "alignment. This will be very slow (e.g., thousands of times slower) "
-         "than skbio.alignment.local_pairwise_align_ssw.",
-         EfficiencyWarning)
-
     seq1 = _coerce_alignment_input_type(seq1, disallow_alignment=True)
     seq2 = _coerce_alignment_input_type(seq2, disallow_alignment=True)
 
-    score_matrix, traceback_matrix = _compute_score_and_traceback_matrices(
-        seq1, seq2, gap_open_penalty, gap_extend_penalty,
-        substitution_matrix, new_alignment_score=0.0,
-        init_matrices_f=_init_matrices_sw)
-
-    end_row_position, end_col_position =\
-        np.unravel_index(np.argmax(score_matrix), score_matrix.shape)
-
-    aligned1, aligned2, score, seq1_start_position, seq2_start_position = \
-        _traceback(traceback_matrix, score_matrix, seq1, seq2,
-                   end_row_position, end_col_position)
-    start_end_positions = [(seq1_start_position, end_col_position-1),
-                           (seq2_start_position, end_row_position-1)]
-
-    return Alignment(aligned1 + aligned2, score=score,
-                     start_end_positions=start_end_positions)
+    return _pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                           substitution_matrix, local=True,
+                           band_width=band_width, score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
@@ -333,7 +365,8 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
                                      gap_extend_penalty=2,
                                      match_score=1, mismatch_score=-2,
                                      substitution_matrix=None,
-                                     penalize_terminal_gaps=False):
+                                     penalize_terminal_gaps=False,
+                                     band_width=None, score_only=False):
     """Globally align pair of nuc. seqs or alignments with Needleman-Wunsch
 
     Parameters
@@ -355,7 +388,7 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
         The score to add for a mismatch between a pair of bases (this is
         added to the previous best alignment score, so is typically
         negative).
-    substitution_matrix: 2D dict (or similar)
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix
         Lookup for substitution scores (these values are added to the
         previous best alignment score). If provided, this overrides
         ``match_score`` and ``mismatch_score``.
@@ -366,12 +399,21 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
         the sequences being aligned are of different length. This is ``False``
         by default, which is very likely to be the behavior you want in all or
         nearly all cases.
+    band_width : int, optional
+        If provided, only alignments that stay within `band_width` diagonals
+        of the band joining the first and last positions of the sequences
+        are considered, which reduces run time when the sequences are
+        similar. By default, all alignments are considered.
+    score_only : bool, optional
+        If ``True``, only the score of the best alignment is computed and
+        returned, using memory proportional to the length of the sequences.
 
     Returns
     -------
-    skbio.Alignment
+    skbio.Alignment or float
         ``Alignment`` object containing the aligned sequences as well as
-        details about the alignment.
+        details about the alignment, or its score if `score_only` is
+        ``True``.
 
     See Also
     --------
@@ -399,21 +441,23 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
     # use the substitution matrix provided by the user, or compute from
     # match_score and mismatch_score if a substitution matrix was not provided
     if substitution_matrix is None:
-        substitution_matrix = \
-            make_identity_substitution_matrix(match_score, mismatch_score)
+        substitution_matrix = SubstitutionMatrix.identity(
+            'ACGTU', match_score, mismatch_score)
     else:
         pass
 
     return global_pairwise_align(seq1, seq2, gap_open_penalty,
                                  gap_extend_penalty, substitution_matrix,
-                                 penalize_terminal_gaps=penalize_terminal_gaps)
+                                 penalize_terminal_gaps=penalize_terminal_gaps,
+                                 band_width=band_width, score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
                                   gap_extend_penalty=1,
                                   substitution_matrix=None,
-                                  penalize_terminal_gaps=False):
+                                  penalize_terminal_gaps=False,
+                                  band_width=None, score_only=False):
     """Globally align pair of protein seqs or alignments with Needleman-Wunsch
 
     Parameters
@@ -428,7 +472,7 @@ def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
     gap_extend_penalty : int or float, optional
         Penalty for extending a gap (this is substracted from previous best
         alignment score, so is typically positive).
-    substitution_matrix: 2D dict (or similar), optional
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix, optional
         Lookup for substitution scores (these values are added to the
         previous best alignment score); default is BLOSUM 50.
     penalize_terminal_gaps: bool, optional
@@ -438,12 +482,21 @@ def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
         the sequences being aligned are of different length. This is ``False``
         by default, which is very likely to be the behavior you want in all or
         nearly all cases.
+    band_width : int, optional
+        If provided, only alignments that stay within `band_width` diagonals
+        of the band joining the first and last positions of the sequences
+        are considered, which reduces run time when the sequences are
+        similar. By default, all alignments are considered.
+    score_only : bool, optional
+        If ``True``, only the score of the best alignment is computed and
+        returned, using memory proportional to the length of the sequences.
 
     Returns
     -------
-    skbio.Alignment
+    skbio.Alignment or float
         ``Alignment`` object containing the aligned sequences as well as
-        details about the alignment.
+        details about the alignment, or its score if `score_only` is
+        ``True``.
 
     See Also
     --------
@@ -474,16 +527,18 @@ def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
 
     """
     if substitution_matrix is None:
-        substitution_matrix = blosum50
+        substitution_matrix = _blosum50
 
     return global_pairwise_align(seq1, seq2, gap_open_penalty,
                                  gap_extend_penalty, substitution_matrix,
-                                 penalize_terminal_gaps=penalize_terminal_gaps)
+                                 penalize_terminal_gaps=penalize_terminal_gaps,
+                                 band_width=band_width, score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
-                          substitution_matrix, penalize_terminal_gaps=False):
+                          substitution_matrix, penalize_terminal_gaps=False,
+                          band_width=None, score_only=False):
     """Globally align a pair of seqs or alignments with Needleman-Wunsch
 
     Parameters
@@ -498,7 +553,7 @@ def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
     gap_extend_penalty : int or float
         Penalty for extending a gap (this is substracted from previous best
         alignment score, so is typically positive).
-    substitution_matrix: 2D dict (or similar)
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix
         Lookup for substitution scores (these values are added to the
         previous best alignment score).
     penalize_terminal_gaps: bool, optional
@@ -508,12 +563,21 @@ def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
         the sequences being aligned are of different length. This is ``False``
         by default, which is very likely to be the behavior you want in all or
         nearly all cases.
+    band_width : int, optional
+        If provided, only alignments that stay within `band_width` diagonals
+        of the band joining the first and last positions of the sequences
+        are considered, which reduces run time when the sequences are
+        similar. By default, all alignments are considered.
+    score_only : bool, optional
+        If ``True``, only the score of the best alignment is computed and
+        returned, using memory proportional to the length of the sequences.
 
     Returns
     -------
-    skbio.Alignment
+    skbio.Alignment or float
         ``Alignment`` object containing the aligned sequences as well as
-        details about the alignment.
+        details about the alignment, or its score if `score_only` is
+        ``True``.
 
     See Also
     --------
@@ -533,6 +597,13 @@ def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
     This function can be use to align either a pair of sequences, a pair of
     alignments, or a sequence and an alignment.
 
+    Affine gap penalties are computed with Gotoh's algorithm [3]_, in time
+    proportional to the product of the sequence lengths.
+    Alignments are traced back in memory proportional to the product of the
+    sequence lengths when it is small enough, and otherwise in memory
+    proportional to their sum with Hirschberg's algorithm [4]_, at the cost of
+    about twice the run time.
+
     References
     ----------
     .. [1] A general method applicable to the search for similarities in
@@ -540,40 +611,21 @@ def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
        Needleman SB, Wunsch CD.
        J Mol Biol. 1970 Mar;48(3):443-53.
     .. [2] http://www.ebi.ac.uk/Tools/psa/emboss_needle/
+    .. [3] An improved algorithm for matching biological sequences.
+       Gotoh O.
+       J Mol Biol. 1982 Dec 15;162(3):705-8.
+    .. [4] A linear space algorithm for computing maximal common subsequences.
+       Hirschberg DS.
+       Commun ACM. 1975 Jun;18(6):341-3.
 
     """
-    warn("You're using skbio's python implementation of Needleman-Wunsch "
-         "alignment. This is known to be very slow (e.g., thousands of times "
-         "slower than a native C implementation). We'll be adding a faster "
-         "version soon (see https://github.com/biocore/scikit-bio/issues/254 "
-         "to track progress on this).", EfficiencyWarning)
-
     seq1 = _coerce_alignment_input_type(seq1, disallow_alignment=False)
     seq2 = _coerce_alignment_input_type(seq2, disallow_alignment=False)
 
-    if penalize_terminal_gaps:
-        init_matrices_f = _init_matrices_nw
-    else:
-        init_matrices_f = _init_matrices_nw_no_terminal_gap_penalty
-
-    score_matrix, traceback_matrix = \
-        _compute_score_and_traceback_matrices(
-            seq1, seq2, gap_open_penalty, gap_extend_penalty,
-            substitution_matrix, new_alignment_score=-np.inf,
-            init_matrices_f=init_matrices_f,
-            penalize_terminal_gaps=penalize_terminal_gaps)
-
-    end_row_position = traceback_matrix.shape[0] - 1
-    end_col_position = traceback_matrix.shape[1] - 1
-
-    aligned1, aligned2, score, seq1_start_position, seq2_start_position = \
-        _traceback(traceback_matrix, score_matrix, seq1, seq2,
-                   end_row_position, end_col_position)
-    start_end_positions = [(seq1_start_position, end_col_position-1),
-                           (seq2_start_position, end_row_position-1)]
-
-    return Alignment(aligned1 + aligned2, score=score,
-                     start_end_positions=start_end_positions)
+    return _pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                           substitution_matrix, local=False,
+                           penalize_terminal_gaps=penalize_terminal_gaps,
+                           band_width=band_width, score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
@@ -659,10 +711,170 @@ def local_pairwise_align_ssw(sequence1, sequence2, constructor=Sequence,
                      start_end_positions=start_end)
 
 
+@experimental(as_of="0.4.0-dev")
+def pairwise_align_ssw_many(pairs, n_threads=1, alignments=False,
+                            constructor=Sequence, **kwargs):
+    """Align many pairs of sequences with Striped Smith-Waterman.
+
+    Pairs sharing the same query sequence are aligned with a single
+    ``StripedSmithWaterman`` object, and the alignments are computed by
+    `n_threads` threads without holding the global interpreter lock.
+
+    Parameters
+    ----------
+    pairs : iterable of tuple
+        Pairs of query and target sequences (str or Sequence) to align.
+    n_threads : int, optional
+        Number of threads aligning the pairs.
+    alignments : bool, optional
+        If ``True``, return an ``Alignment`` for each pair rather than a
+        table of the results.
+    constructor : Sequence subclass
+        A constructor to use for the aligned sequences if `alignments` is
+        ``True`` and the query is not a ``Protein``.
+    kwargs : dict, optional
+        Keyword arguments passed to ``StripedSmithWaterman``.
+
+    Returns
+    -------
+    pd.DataFrame or list of Alignment
+        One row per pair, in order, with the columns returned by
+        ``StripedSmithWaterman.align_many``. If `alignments` is ``True``, the
+        alignment of each pair, as returned by ``local_pairwise_align_ssw``.
+
+    Raises
+    ------
+    ValueError
+        If `n_threads` is not a positive integer.
+
+    See Also
+    --------
+    local_pairwise_align_ssw
+    skbio.alignment.StripedSmithWaterman.align_many
+
+    Notes
+    -----
+    The following kwargs will not have any effect: `suppress_sequences` and
+    `zero_index`
+
+    If `alignments` is ``True`` and the alignment of a pair does not meet a
+    provided filter, its alignment is ``None``.
+
+    Examples
+    --------
+    Align each of three amplicons to all others:
+
+    >>> from itertools import permutations
+    >>> from skbio.alignment import pairwise_align_ssw_many
+    >>> amplicons = ["ACTAAGGCTCTCTACCCCTCTCAGAGA",
+    ...              "ACTAAGGCTCCTAACCCCCTTTTCTCAGA",
+    ...              "GCCCAGTAGCTTCCCAATATGAGAGCA"]
+    >>> results = pairwise_align_ssw_many(permutations(amplicons, 2),
+    ...                                   n_threads=2)
+    >>> results['optimal_alignment_score'].tolist()
+    [27, 8, 27, 7, 8, 7]
+
+    """
+    if not (isinstance(n_threads, numbers.Integral) and n_threads > 0):
+        raise ValueError("`n_threads` must be a positive integer, not %r"
+                         % (n_threads,))
+    kwargs['suppress_sequences'] = True
+    kwargs['zero_index'] = True
+    pairs = list(pairs)
+
+    # one profile per unique query, aligned to its targets in chunks so that
+    # a query with many targets keeps all threads busy
+    queries = {}
+    for i, (query, _) in enumerate(pairs):
+        protein = kwargs.get('protein', False) or isinstance(query, Protein)
+        queries.setdefault((str(query), protein), []).append(i)
+    tasks = []
+    for (query, protein), indices in sorted(queries.items(),
+                                            key=lambda item: item[1][0]):
+        aligner = StripedSmithWaterman(query, **dict(kwargs,
+                                                     protein=protein))
+        for chunk in np.array_split(indices, min(n_threads, len(indices))):
+            tasks.append((aligner, chunk,
+                          [str(pairs[i][1]) for i in chunk]))
+
+    def align(task):
+        aligner, chunk, targets = task
+        return aligner.align_many(targets)
+
+    if n_threads == 1:
+        tables = [align(task) for task in tasks]
+    else:
+        pool = ThreadPool(n_threads)
+        try:
+            tables = pool.map(align, tasks)
+        finally:
+            pool.close()
+    if tables:
+        table = pd.concat(tables, ignore_index=True)
+        table.index = np.concatenate([chunk for _, chunk, _ in tasks])
+        table = table.sort_index()
+    else:
+        table = StripedSmithWaterman('').align_many([])
+    if not alignments:
+        return table
+
+    return [_ssw_alignment(query, target, result, constructor, **kwargs)
+            for (query, target), result in zip(pairs,
+                                               table.to_dict('records'))]
+
+
+def _ssw_alignment(query, target, result, constructor, protein=False,
+                   **kwargs):
+    """Return the ``Alignment`` of a row of ``align_many`` results."""
+    if not result['cigar']:
+        return None
+
+    operations = [(int(length), operation) for length, operation in
+                  re.findall(r'(\d+)([MID])', result['cigar'])]
+    start_end = None
+    if result['query_begin'] != -1:
+        start_end = [
+            (result['query_begin'], result['query_end']),
+            (result['target_begin'], result['target_end_optimal'])
+        ]
+    if protein or isinstance(query, Protein):
+        constructor = Protein
+    seqs = [
+        constructor(_ssw_aligned_sequence(str(query), operations,
+                                          result['query_begin'],
+                                          result['query_end'], 'D'),
+                    metadata={'id': 'query'}),
+        constructor(_ssw_aligned_sequence(str(target), operations,
+                                          result['target_begin'],
+                                          result['target_end_optimal'], 'I'),
+                    metadata={'id': 'target'})
+    ]
+    return Alignment(seqs, score=result['optimal_alignment_score'],
+                     start_end_positions=start_end)
+
+
+def _ssw_aligned_sequence(sequence, operations, begin, end, gap_type):
+    """Return a sequence aligned by the operations of a CIGAR string.
+
+    Mirrors ``AlignmentStructure``, so that the alignments are the same as
+    those returned by ``local_pairwise_align_ssw``.
+
+    """
+    sequence = sequence[begin:end + 1]
+    aligned = []
+    index = 0
+    for length, operation in operations:
+        if operation == 'M':
+            aligned.append(sequence[index:index + length])
+            index += length
+        elif operation == gap_type:
+            aligned.append('-' * length)
+    aligned.append(sequence[index:end - begin + 1])
+    return ''.join(aligned)
+
+
 @deprecated(as_of="0.4.0", until="0.4.1",
-            reason="Will be replaced by a SubstitutionMatrix class. To track "
-                   "progress, see [#161]"
-                   "(https://github.com/biocore/scikit-bio/issues/161).")
+            reason="Use ``SubstitutionMatrix.identity`` instead.")
 def make_identity_substitution_matrix(match_score, mismatch_score,
                                       alphabet='ACGTU'):
     """Generate substitution matrix where all matches are scored equally
@@ -730,10 +942,6 @@ def _coerce_alignment_input_type(seq, disallow_alignment):
             "Unsupported type provided to aligner: %r." % type(seq))
 
 
-_traceback_encoding = {'match': 1, 'vertical-gap': 2, 'horizontal-gap': 3,
-                       'uninitialized': -1, 'alignment-end': 0}
-
-
 def _get_seq_id(seq, default_id):
     result = seq.metadata['id'] if 'id' in seq.metadata else default_id
     if result is None or result.strip() == "":
@@ -741,255 +949,314 @@ def _get_seq_id(seq, default_id):
     return result
 
 
-def _init_matrices_sw(aln1, aln2, gap_open_penalty, gap_extend_penalty):
-    shape = (aln2.sequence_length()+1, aln1.sequence_length()+1)
-    score_matrix = np.zeros(shape)
-    traceback_matrix = np.zeros(shape, dtype=np.int)
-    traceback_matrix += _traceback_encoding['uninitialized']
-    traceback_matrix[0, :] = _traceback_encoding['alignment-end']
-    traceback_matrix[:, 0] = _traceback_encoding['alignment-end']
-    return score_matrix, traceback_matrix
+# Alignments whose traceback matrix would have more cells than this are traced
+# back with Hirschberg's divide-and-conquer algorithm, in blocks of at most
+# this many cells.
+_max_traceback_cells = 2 ** 26
 
 
-def _init_matrices_nw(aln1, aln2, gap_open_penalty, gap_extend_penalty):
-    shape = (aln2.sequence_length()+1, aln1.sequence_length()+1)
-    score_matrix = np.zeros(shape)
-    traceback_matrix = np.zeros(shape, dtype=np.int)
-    traceback_matrix += _traceback_encoding['uninitialized']
-    traceback_matrix[0, 0] = _traceback_encoding['alignment-end']
+def _pairwise_align(aln1, aln2, gap_open_penalty, gap_extend_penalty,
+                    substitution_matrix, local, penalize_terminal_gaps=True,
+                    band_width=None, score_only=False):
+    """Align a pair of alignments.
 
-    # cache some values for quicker access
-    vgap = _traceback_encoding['vertical-gap']
-    hgap = _traceback_encoding['horizontal-gap']
-
-    for i in range(1, shape[0]):
-        score_matrix[i, 0] = -gap_open_penalty - ((i-1) * gap_extend_penalty)
-        traceback_matrix[i, 0] = vgap
+    Returns the result as an ``Alignment``, or only its score if
+    `score_only` is ``True``.
+    """
+    if band_width is not None and not (
+            isinstance(band_width, numbers.Integral) and band_width >= 0):
+        raise ValueError("`band_width` must be a non-negative integer, not %r"
+                         % (band_width,))
+
+    aligner = _Aligner(aln1, aln2, gap_open_penalty, gap_extend_penalty,
+                       substitution_matrix,
+                       penalize_terminal_gaps=penalize_terminal_gaps,
+                       band_width=band_width)
+    if score_only:
+        return aligner.score(local)
+
+    path, score, (start_row, start_col), (end_row, end_col) = \
+        aligner.align(local)
+    aligned1, aligned2 = _aligned_sequences(path, aln1, aln2, start_col,
+                                            start_row)
+    start_end_positions = [(start_col, end_col - 1),
+                           (start_row, end_row - 1)]
 
-    for i in range(1, shape[1]):
-        score_matrix[0, i] = -gap_open_penalty - ((i-1) * gap_extend_penalty)
-        traceback_matrix[0, i] = hgap
+    return Alignment(aligned1 + aligned2, score=score,
+                     start_end_positions=start_end_positions)
 
-    return score_matrix, traceback_matrix
 
+_gap_codes = np.asarray([ord(c) for c in IUPACSequence.gap_chars],
+                        dtype=np.uint8)
 
-def _init_matrices_nw_no_terminal_gap_penalty(
-        aln1, aln2, gap_open_penalty, gap_extend_penalty):
-    shape = (aln2.sequence_length()+1, aln1.sequence_length()+1)
-    score_matrix = np.zeros(shape)
-    traceback_matrix = np.zeros(shape, dtype=np.int)
-    traceback_matrix += _traceback_encoding['uninitialized']
-    traceback_matrix[0, 0] = _traceback_encoding['alignment-end']
 
-    # cache some values for quicker access
-    vgap = _traceback_encoding['vertical-gap']
-    hgap = _traceback_encoding['horizontal-gap']
+def _profile(aln):
+    """Return the symbols of an alignment and their counts at each position.
 
-    for i in range(1, shape[0]):
-        traceback_matrix[i, 0] = vgap
+    The first symbol, ``None``, stands for all gap characters. `aln` may also
+    be a 2D array holding the characters of the aligned sequences in rows.
+    """
+    if isinstance(aln, np.ndarray):
+        chars = aln
+    else:
+        chars = np.asarray([seq._bytes for seq in aln],
+                           dtype=np.uint8).reshape(aln.sequence_count(),
+                                                   aln.sequence_length())
+    codes = np.unique(chars)
+    codes = codes[~np.in1d(codes, _gap_codes)]
+    symbols = [None] + [chr(code) for code in codes]
+
+    index = np.zeros(256, dtype=np.intp)
+    index[codes] = np.arange(1, len(symbols))
+    num_positions = chars.shape[1]
+    offsets = np.arange(num_positions) * len(symbols)
+    counts = np.bincount((index[chars] + offsets).ravel(),
+                         minlength=num_positions * len(symbols))
+    return symbols, counts.reshape(num_positions, len(symbols))
+
+
+def _substitution_scores(aln1, aln2, substitution_matrix,
+                         gap_substitution_score=0):
+    """Return the substitution scores of the positions of two alignments.
+
+    The substitution score of a position of `aln1` and a position of `aln2`
+    is the average score of all pairs of their characters, where pairs
+    involving a gap score `gap_substitution_score`. The scores are returned
+    as the arguments expected by ``_fill_block``: the score of each position
+    of `aln2` against each symbol of `aln1`, and the symbols present at each
+    position of `aln1` as a sparse matrix, so that a single sequence costs
+    one lookup per cell.
 
-    for i in range(1, shape[1]):
-        traceback_matrix[0, i] = hgap
+    """
+    symbols1, counts1 = _profile(aln1)
+    symbols2, counts2 = _profile(aln2)
+
+    if isinstance(substitution_matrix, SubstitutionMatrix):
+        # score every pair of symbols at once through the matrix's byte to
+        # index table
+        indices = substitution_matrix._indices(np.asarray(
+            [ord(c) for c in symbols1[1:] + symbols2[1:]], dtype=np.uint8))
+        indices1, indices2 = np.split(indices, [len(symbols1) - 1])
+        scores = np.full((len(symbols2), len(symbols1)),
+                         gap_substitution_score, dtype=np.float64)
+        scores[1:, 1:] = substitution_matrix.scores[np.ix_(indices1,
+                                                           indices2)].T
+    else:
+        scores = _dict_substitution_scores(symbols1, symbols2,
+                                           substitution_matrix,
+                                           gap_substitution_score)
+
+    num_pairs = counts1[:1].sum() * counts2[:1].sum()
+    row_scores = counts2.dot(scores) / max(num_pairs, 1)
+    positions, col_symbols = counts1.nonzero()
+    col_indptr = np.zeros(len(counts1) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(positions, minlength=len(counts1)),
+              out=col_indptr[1:])
+    col_weights = counts1[positions, col_symbols].astype(np.float64)
+    return (row_scores, col_indptr, col_symbols.astype(np.intp),
+            col_weights)
+
+
+def _dict_substitution_scores(symbols1, symbols2, substitution_matrix,
+                              gap_substitution_score):
+    """Return the scores of pairs of symbols looked up in a 2D dict."""
+    scores = np.empty((len(symbols2), len(symbols1)))
+    for (i, aln2_char), (j, aln1_char) in product(enumerate(symbols2),
+                                                  enumerate(symbols1)):
+        if aln1_char is None or aln2_char is None:
+            scores[i, j] = gap_substitution_score
+            continue
+        try:
+            scores[i, j] = substitution_matrix[aln1_char][aln2_char]
+        except KeyError:
+            offending_chars = \
+                [c for c in (aln1_char, aln2_char)
+                 if c not in substitution_matrix]
+            raise ValueError(
+                "One of the sequences contains a character that is "
+                "not contained in the substitution matrix. Are you "
+                "using an appropriate substitution matrix for your "
+                "sequence type (e.g., a nucleotide substitution "
+                "matrix does not make sense for aligning protein "
+                "sequences)? Does your sequence contain invalid "
+                "characters? The offending character(s) is: "
+                " %s." % ', '.join(offending_chars))
+    return scores
 
-    return score_matrix, traceback_matrix
 
+class _Aligner(object):
+    """Dynamic programming alignment of the positions of two alignments.
 
-def _compute_substitution_score(aln1_chars, aln2_chars, substitution_matrix,
-                                gap_substitution_score):
-    substitution_score = 0
-    gap_chars = IUPACSequence.gap_chars
-    for aln1_char, aln2_char in product(aln1_chars, aln2_chars):
-        if aln1_char in gap_chars or aln2_char in gap_chars:
-                substitution_score += gap_substitution_score
-        else:
-            try:
-                substitution_score += \
-                    substitution_matrix[aln1_char][aln2_char]
-            except KeyError:
-                offending_chars = \
-                    [c for c in (aln1_char, aln2_char)
-                     if c not in substitution_matrix]
-                raise ValueError(
-                    "One of the sequences contains a character that is "
-                    "not contained in the substitution matrix. Are you "
-                    "using an appropriate substitution matrix for your "
-                    "sequence type (e.g., a nucleotide substitution "
-                    "matrix does not make sense for aligning protein "
-                    "sequences)? Does your sequence contain invalid "
-                    "characters? The offending character(s) is: "
-                    " %s." % ', '.join(offending_chars))
-    substitution_score /= (len(aln1_chars) * len(aln2_chars))
-    return substitution_score
-
-
-def _compute_score_and_traceback_matrices(
-        aln1, aln2, gap_open_penalty, gap_extend_penalty, substitution_matrix,
-        new_alignment_score=-np.inf, init_matrices_f=_init_matrices_nw,
-        penalize_terminal_gaps=True, gap_substitution_score=0):
-    """Return dynamic programming (score) and traceback matrices.
+    Rows of the dynamic programming matrix correspond to positions in `aln2`,
+    and columns to positions in `aln1`.
 
     A note on the ``penalize_terminal_gaps`` parameter. When this value is
-    ``False``, this function is no longer true Smith-Waterman/Needleman-Wunsch
-    scoring, but when ``True`` it can result in biologically irrelevant
-    artifacts in Needleman-Wunsch (global) alignments. Specifically, if one
-    sequence is longer than the other (e.g., if aligning a primer sequence to
-    an amplification product, or searching for a gene in a genome) the shorter
-    sequence will have a long gap inserted. The parameter is ``True`` by
-    default (so that this function computes the score and traceback matrices as
+    ``False``, global alignment is no longer true Needleman-Wunsch scoring,
+    but when ``True`` it can result in biologically irrelevant artifacts.
+    Specifically, if one sequence is longer than the other (e.g., if aligning
+    a primer sequence to an amplification product, or searching for a gene in
+    a genome) the shorter sequence will have a long gap inserted. The
+    parameter is ``True`` by default (so that alignments are computed as
     described by the original authors) but the global alignment wrappers pass
     ``False`` by default, so that the global alignment API returns the result
     that users are most likely to be looking for.
 
     """
-    aln1_length = aln1.sequence_length()
-    aln2_length = aln2.sequence_length()
-    # cache some values for quicker/simpler access
-    aend = _traceback_encoding['alignment-end']
-    match = _traceback_encoding['match']
-    vgap = _traceback_encoding['vertical-gap']
-    hgap = _traceback_encoding['horizontal-gap']
-
-    new_alignment_score = (new_alignment_score, aend)
-
-    # Initialize a matrix to use for scoring the alignment and for tracing
-    # back the best alignment
-    score_matrix, traceback_matrix = init_matrices_f(
-        aln1, aln2, gap_open_penalty, gap_extend_penalty)
-
-    # Iterate over the characters in aln2 (which corresponds to the vertical
-    # sequence in the matrix)
-    for aln2_pos, aln2_chars in enumerate(aln2.iter_positions(str), 1):
-        # Iterate over the characters in aln1 (which corresponds to the
-        # horizontal sequence in the matrix)
-        for aln1_pos, aln1_chars in enumerate(aln1.iter_positions(str), 1):
-            # compute the score for a match/mismatch
-            substitution_score = _compute_substitution_score(
-                aln1_chars, aln2_chars, substitution_matrix,
-                gap_substitution_score)
-
-            diag_score = \
-                (score_matrix[aln2_pos-1, aln1_pos-1] + substitution_score,
-                 match)
-
-            # compute the score for adding a gap in aln2 (vertical)
-            if not penalize_terminal_gaps and (aln1_pos == aln1_length):
-                # we've reached the end of aln1, so adding vertical gaps
-                # (which become gaps in aln1) should no longer
-                # be penalized (if penalize_terminal_gaps == False)
-                up_score = (score_matrix[aln2_pos-1, aln1_pos], vgap)
-            elif traceback_matrix[aln2_pos-1, aln1_pos] == vgap:
-                # gap extend, because the cell above was also a gap
-                up_score = \
-                    (score_matrix[aln2_pos-1, aln1_pos] - gap_extend_penalty,
-                     vgap)
-            else:
-                # gap open, because the cell above was not a gap
-                up_score = \
-                    (score_matrix[aln2_pos-1, aln1_pos] - gap_open_penalty,
-                     vgap)
-
-            # compute the score for adding a gap in aln1 (horizontal)
-            if not penalize_terminal_gaps and (aln2_pos == aln2_length):
-                # we've reached the end of aln2, so adding horizontal gaps
-                # (which become gaps in aln2) should no longer
-                # be penalized (if penalize_terminal_gaps == False)
-                left_score = (score_matrix[aln2_pos, aln1_pos-1], hgap)
-            elif traceback_matrix[aln2_pos, aln1_pos-1] == hgap:
-                # gap extend, because the cell to the left was also a gap
-                left_score = \
-                    (score_matrix[aln2_pos, aln1_pos-1] - gap_extend_penalty,
-                     hgap)
-            else:
-                # gap open, because the cell to the left was not a gap
-                left_score = \
-                    (score_matrix[aln2_pos, aln1_pos-1] - gap_open_penalty,
-                     hgap)
-
-            # identify the largest score, and use that information to populate
-            # the score and traceback matrices
-            best_score = _first_largest([new_alignment_score, left_score,
-                                         diag_score, up_score])
-            score_matrix[aln2_pos, aln1_pos] = best_score[0]
-            traceback_matrix[aln2_pos, aln1_pos] = best_score[1]
-
-    return score_matrix, traceback_matrix
-
-
-def _traceback(traceback_matrix, score_matrix, aln1, aln2, start_row,
-               start_col, gap_character='-'):
-    # cache some values for simpler
-    aend = _traceback_encoding['alignment-end']
-    match = _traceback_encoding['match']
-    vgap = _traceback_encoding['vertical-gap']
-    hgap = _traceback_encoding['horizontal-gap']
-
-    # initialize the result alignments
-    aln1_sequence_count = aln1.sequence_count()
-    aligned_seqs1 = [[] for e in range(aln1_sequence_count)]
-
-    aln2_sequence_count = aln2.sequence_count()
-    aligned_seqs2 = [[] for e in range(aln2_sequence_count)]
-
-    current_row = start_row
-    current_col = start_col
-
-    best_score = score_matrix[current_row, current_col]
-    current_value = None
-
-    while current_value != aend:
-        current_value = traceback_matrix[current_row, current_col]
-
-        if current_value == match:
-            for aligned_seq, input_seq in zip(aligned_seqs1, aln1):
-                aligned_seq.append(str(input_seq[current_col-1]))
-            for aligned_seq, input_seq in zip(aligned_seqs2, aln2):
-                aligned_seq.append(str(input_seq[current_row-1]))
-            current_row -= 1
-            current_col -= 1
-        elif current_value == vgap:
-            for aligned_seq in aligned_seqs1:
-                aligned_seq.append('-')
-            for aligned_seq, input_seq in zip(aligned_seqs2, aln2):
-                aligned_seq.append(str(input_seq[current_row-1]))
-            current_row -= 1
-        elif current_value == hgap:
-            for aligned_seq, input_seq in zip(aligned_seqs1, aln1):
-                aligned_seq.append(str(input_seq[current_col-1]))
-            for aligned_seq in aligned_seqs2:
-                aligned_seq.append('-')
-            current_col -= 1
-        elif current_value == aend:
-            continue
-        else:
-            raise ValueError(
-                "Invalid value in traceback matrix: %s" % current_value)
-
-    for i in range(aln1_sequence_count):
-        aligned_seq = ''.join(aligned_seqs1[i][::-1])
-        seq_id = _get_seq_id(aln1[i], str(i))
-        constructor = aln1[i].__class__
-        aligned_seqs1[i] = constructor(aligned_seq, metadata={'id': seq_id})
 
-    for i in range(aln2_sequence_count):
-        aligned_seq = ''.join(aligned_seqs2[i][::-1])
-        seq_id = _get_seq_id(aln2[i], str(i + aln1_sequence_count))
-        constructor = aln2[i].__class__
-        aligned_seqs2[i] = constructor(aligned_seq, metadata={'id': seq_id})
-
-    return (aligned_seqs1, aligned_seqs2, best_score,
-            current_col, current_row)
-
-
-def _first_largest(scores):
-    """ Similar to max, but returns the first element achieving the high score
+    def __init__(self, aln1, aln2, gap_open_penalty, gap_extend_penalty,
+                 substitution_matrix, penalize_terminal_gaps=True,
+                 band_width=None, gap_substitution_score=0):
+        self._scores = _substitution_scores(aln1, aln2, substitution_matrix,
+                                            gap_substitution_score)
+        self._penalties = (gap_open_penalty, gap_extend_penalty)
+        self._free_terminal_gaps = not penalize_terminal_gaps
+        self._shape = (len(self._scores[0]), len(self._scores[1]) - 1)
+
+        num_rows, num_cols = self._shape
+        if band_width is None:
+            self._diagonals = (-num_rows, num_cols)
+        else:
+            self._diagonals = (min(0, num_cols - num_rows) - band_width,
+                               max(0, num_cols - num_rows) + band_width)
+
+    def score(self, local):
+        """Return the score of the best alignment."""
+        num_rows, num_cols = self._shape
+        mode = LOCAL if local else GLOBAL
+        return self._fill((0, num_rows), (0, num_cols), mode=mode)[1]
+
+    def align(self, local):
+        """Return the moves, score, start and end cells of the best alignment.
+        """
+        num_rows, num_cols = self._shape
+        rows, cols = (0, num_rows), (0, num_cols)
+        if not local:
+            path, score = self._trace(rows, cols)
+            return path, score, (0, 0), self._shape
+
+        if self._fits(rows, cols):
+            traceback, score, end_row, end_col, _, _ = self._fill(
+                rows, cols, mode=LOCAL, traceback=True)
+            path, start_row, start_col = _trace_path(
+                traceback, end_row, end_col, self._diagonals[0])
+            return path, score, (start_row, start_col), (end_row, end_col)
+
+        # find where the alignment ends, then where it starts by aligning
+        # backwards from there, and align the positions in between globally
+        _, score, end_row, end_col, _, _ = self._fill(rows, cols, mode=LOCAL)
+        _, _, row_offset, col_offset, _, _ = self._fill(
+            (0, end_row), (0, end_col), reverse=True, mode=ANCHORED)
+        start_row, start_col = end_row - row_offset, end_col - col_offset
+        path, _ = self._trace((start_row, end_row), (start_col, end_col))
+        return path, score, (start_row, start_col), (end_row, end_col)
+
+    def _fill(self, rows, cols, reverse=False, mode=GLOBAL, start=START,
+              traceback=False):
+        """Align the positions in a block of rows and columns.
+
+        `rows` and `cols` are the start and stop positions of the block.
+
+        """
+        num_rows, num_cols = self._shape
+        # terminal gaps are in the first and last rows and columns of the
+        # whole matrix
+        free = self._free_terminal_gaps and mode == GLOBAL
+        first_row, last_row = rows[::-1] if reverse else rows
+        first_col, last_col = cols[::-1] if reverse else cols
+        return _fill_block(
+            *(self._scores + rows + cols + (reverse,) + self._penalties),
+            mode=mode, start=start,
+            free_first_row=free and first_row in (0, num_rows),
+            free_last_row=free and last_row in (0, num_rows),
+            free_first_col=free and first_col in (0, num_cols),
+            free_last_col=free and last_col in (0, num_cols),
+            diagonals=self._block_diagonals(rows, cols, reverse),
+            traceback=traceback)
+
+    def _block_diagonals(self, rows, cols, reverse):
+        """Return the band of diagonals in the coordinates of a block."""
+        diag_min, diag_max = self._diagonals
+        if reverse:
+            offset = cols[1] - rows[1]
+            return offset - diag_max, offset - diag_min
+        offset = cols[0] - rows[0]
+        return diag_min - offset, diag_max - offset
+
+    def _fits(self, rows, cols):
+        """Return whether the traceback matrix of a block is small enough."""
+        diag_min, diag_max = self._block_diagonals(rows, cols, False)
+        width = min(cols[1] - cols[0], diag_max - diag_min) + 1
+        return (rows[1] - rows[0] + 1) * width <= _max_traceback_cells
+
+    def _trace(self, rows, cols, start=START, end_in_vgap=False):
+        """Return the moves and score of the best global alignment of a block.
+
+        If `end_in_vgap` is ``True``, the alignment must end with a vertical
+        gap.
+
+        """
+        if rows[1] - rows[0] < 2 or self._fits(rows, cols):
+            traceback, score, end_row, end_col, _, vgaps = self._fill(
+                rows, cols, start=start, traceback=True)
+            if end_in_vgap:
+                score = vgaps[-1]
+            path, _, _ = _trace_path(
+                traceback, end_row, end_col,
+                self._block_diagonals(rows, cols, False)[0],
+                VGAP if end_in_vgap else -1)
+            return path, score
+
+        # Hirschberg's algorithm: find where the best alignment crosses the
+        # middle row, by aligning the rows above it forwards and the rows
+        # below it backwards, and align the two halves recursively
+        middle = (rows[0] + rows[1]) // 2
+        _, _, _, _, scores, vgaps = self._fill(
+            (rows[0], middle), cols, start=start)
+        _, _, _, _, reverse_scores, reverse_vgaps = self._fill(
+            (middle, rows[1]), cols, reverse=True,
+            start=OPEN_VGAP if end_in_vgap else START)
+
+        # an alignment crossing the middle row with a vertical gap opens it
+        # only once, so the second half extends it rather than opening it
+        gap_open_penalty, gap_extend_penalty = self._penalties
+        crossing = vgaps + reverse_vgaps[::-1] + (gap_open_penalty -
+                                                  gap_extend_penalty)
+        if self._free_terminal_gaps:
+            free = np.in1d(np.arange(cols[0], cols[1] + 1),
+                           (0, self._shape[1]))
+            crossing[free] -= gap_open_penalty - gap_extend_penalty
+        through = scores + reverse_scores[::-1]
+        col = int(np.argmax(np.maximum(through, crossing)))
+        split = cols[0] + col
+
+        in_vgap = crossing[col] > through[col]
+        upper, upper_score = self._trace(
+            (rows[0], middle), (cols[0], split), start=start,
+            end_in_vgap=in_vgap)
+        lower, lower_score = self._trace(
+            (middle, rows[1]), (split, cols[1]),
+            start=CONTINUE_VGAP if in_vgap else START,
+            end_in_vgap=end_in_vgap)
+        return (np.concatenate([upper, lower]),
+                max(through[col], crossing[col]))
+
+
+def _aligned_sequences(path, aln1, aln2, start1, start2, gap_character='-'):
+    """Return the aligned sequences of the moves of an alignment.
+
+    `start1` and `start2` are the positions of `aln1` and `aln2` where the
+    alignment starts.
 
-    If max receives a tuple, it will break a tie for the highest value
-    of entry[i] with entry[i+1]. We don't want that here - to better match
-    with the results of other tools, we want to be able to define which
-    entry is returned in the case of a tie.
     """
-    result = scores[0]
-    for score, direction in scores[1:]:
-        if score > result[0]:
-            result = (score, direction)
-    return result
+    aligned_seqs = ([], [])
+    for aligned, aln, start, gap, id_offset in (
+            (aligned_seqs[0], aln1, start1, VGAP, 0),
+            (aligned_seqs[1], aln2, start2, HGAP, aln1.sequence_count())):
+        has_char = path != gap
+        end = start + np.count_nonzero(has_char)
+        for i, seq in enumerate(aln):
+            chars = np.full(len(path), ord(gap_character), dtype=np.uint8)
+            chars[has_char] = seq._bytes[start:end]
+            seq_id = _get_seq_id(seq, str(i + id_offset))
+            aligned.append(seq.__class__(chars, metadata={'id': seq_id}))
+    return aligned_seqs
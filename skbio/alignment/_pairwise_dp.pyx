@@ -0,0 +1,326 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+cimport numpy as np
+cimport cython
+
+# Each cell of the traceback matrix stores the state (alignment end, match,
+# vertical gap or horizontal gap) with the best score in the cell in its two
+# lowest bits, and whether the best vertical and horizontal gaps ending in the
+# cell extend a gap from the previous cell (rather than open a new gap) in the
+# next two bits.
+END = 0
+MATCH = 1
+VGAP = 2
+HGAP = 3
+
+# Alignment modes: global alignments end in the last cell; local alignments
+# may start and end in any cell; anchored alignments start in the first cell
+# and may end in any cell.
+GLOBAL = 0
+LOCAL = 1
+ANCHORED = 2
+
+# Conditions at the start of a global or anchored alignment: a new alignment
+# starts, a vertical gap from before the first cell continues (so extending
+# it is not penalized as opening a gap), or the alignment must start by
+# opening a vertical gap.
+START = 0
+CONTINUE_VGAP = 1
+OPEN_VGAP = 2
+
+cdef enum:
+    _END = 0
+    _MATCH = 1
+    _VGAP = 2
+    _HGAP = 3
+    _STATE = 3
+    _VGAP_EXTEND = 4
+    _HGAP_EXTEND = 8
+
+cdef double _NEG_INF = -np.inf
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _fill_block(double[:, ::1] row_scores,
+                Py_ssize_t[::1] col_indptr,
+                Py_ssize_t[::1] col_symbols,
+                double[::1] col_weights,
+                Py_ssize_t row_start, Py_ssize_t row_stop,
+                Py_ssize_t col_start, Py_ssize_t col_stop,
+                bint reverse,
+                double gap_open_penalty,
+                double gap_extend_penalty,
+                int mode=GLOBAL,
+                int start=START,
+                bint free_first_row=False,
+                bint free_last_row=False,
+                bint free_first_col=False,
+                bint free_last_col=False,
+                diagonals=None,
+                bint traceback=True):
+    """Align a block of positions with affine gap penalties.
+
+    Scores are computed with Gotoh's algorithm, keeping the best score of
+    alignments ending in a match, a vertical gap (a gap in the first
+    sequence) and a horizontal gap (a gap in the second sequence) for each
+    cell, one row at a time. Rows correspond to positions in the second
+    sequence, and columns to positions in the first sequence.
+
+    Parameters
+    ----------
+    row_scores : 2D np.ndarray of double
+        Substitution score of each position of the second sequence (rows)
+        against each symbol of the first sequence (columns).
+    col_indptr, col_symbols, col_weights : 1D np.ndarray
+        Symbols of each position of the first sequence and their weights, in
+        compressed sparse row format: the substitution score of position
+        ``i`` of the second sequence and position ``j`` of the first sequence
+        is the weighted sum of the scores of the symbols
+        ``col_symbols[col_indptr[j]:col_indptr[j + 1]]``.
+    row_start, row_stop, col_start, col_stop : int
+        Positions of the second and first sequence to align.
+    reverse : bool
+        Whether to align the positions in reverse order.
+    gap_open_penalty, gap_extend_penalty : double
+        Penalties for opening and extending a gap.
+    mode : {GLOBAL, LOCAL, ANCHORED}
+        Alignment mode.
+    start : {START, CONTINUE_VGAP, OPEN_VGAP}
+        Condition at the start of a global or anchored alignment.
+    free_first_row, free_last_row : bool
+        Whether horizontal gaps in the first and last rows are free.
+    free_first_col, free_last_col : bool
+        Whether vertical gaps in the first and last columns are free.
+    diagonals : tuple of int, optional
+        Lowest and highest diagonal (column minus row) of the cells to
+        compute. All cells are computed by default.
+    traceback : bool
+        Whether to fill a traceback matrix.
+
+    Returns
+    -------
+    2D np.ndarray of np.uint8 or None
+        Traceback matrix. Row ``i`` holds the cells of the band starting at
+        column ``max(0, i + diagonals[0])``.
+    float
+        Score of the alignment.
+    int, int
+        Row and column of the cell where the alignment ends.
+    1D np.ndarray of double, 1D np.ndarray of double
+        Best scores of the cells of the last row, and of the alignments
+        ending in a vertical gap in them.
+
+    Notes
+    -----
+    Ties between states are broken in favor of ending the alignment, then
+    horizontal gaps, then matches and finally vertical gaps; ties between
+    opening and extending a gap are broken in favor of opening it.
+
+    """
+    cdef:
+        Py_ssize_t num_rows = row_stop - row_start + 1
+        Py_ssize_t num_cols = col_stop - col_start + 1
+        Py_ssize_t last_row = num_rows - 1, last_col = num_cols - 1
+        Py_ssize_t diag_min = -last_row, diag_max = last_col
+        Py_ssize_t i, j, k, lo, hi, row_pos, col_pos, end_row = 0, end_col = 0
+        Py_ssize_t row_first, col_first, step
+        bint restart = mode == LOCAL, find_max = mode != GLOBAL, free_row
+        double substitution_score, match, vgap, hgap, best, open_, extend
+        double best_score = 0.0
+        np.uint8_t state
+        object tb_array = None
+        np.uint8_t[:, ::1] tb
+        # best scores of the cells in the previous and current rows, and of
+        # the alignments ending in a vertical gap in the previous row
+        double[::1] previous = np.full(num_cols, _NEG_INF)
+        double[::1] current = np.full(num_cols, _NEG_INF)
+        double[::1] vgaps = np.full(num_cols, _NEG_INF)
+        double[::1] swap
+
+    if diagonals is not None:
+        diag_min = max(diag_min, diagonals[0])
+        diag_max = min(diag_max, diagonals[1])
+    if traceback:
+        tb_array = np.zeros((num_rows, min(num_cols, diag_max - diag_min + 1)),
+                            dtype=np.uint8)
+        tb = tb_array
+    if reverse:
+        row_first, col_first, step = row_stop - 1, col_stop - 1, -1
+    else:
+        row_first, col_first, step = row_start, col_start, 1
+
+    for i in range(num_rows):
+        lo = max(0, i + diag_min)
+        hi = min(last_col, i + diag_max)
+        free_row = ((free_first_row and i == 0) or
+                    (free_last_row and i == last_row))
+        row_pos = row_first + step * (i - 1)
+        if lo > 0:
+            current[lo - 1] = _NEG_INF
+        hgap = _NEG_INF
+
+        for j in range(lo, hi + 1):
+            state = 0
+
+            if i == 0 and j == 0:
+                # the first cell
+                if start == OPEN_VGAP and not restart:
+                    current[0] = _NEG_INF
+                    vgaps[0] = 0.0 if free_first_col else (
+                        gap_extend_penalty - gap_open_penalty)
+                else:
+                    current[0] = 0.0
+                    vgaps[0] = 0.0 if start == CONTINUE_VGAP else _NEG_INF
+                continue
+
+            # match
+            if i > 0 and j > 0:
+                substitution_score = 0.0
+                col_pos = col_first + step * (j - 1)
+                for k in range(col_indptr[col_pos], col_indptr[col_pos + 1]):
+                    substitution_score += (row_scores[row_pos, col_symbols[k]] *
+                                           col_weights[k])
+                match = previous[j - 1] + substitution_score
+            else:
+                match = _NEG_INF
+
+            # gap in the first sequence
+            if i > 0:
+                if ((free_first_col and j == 0) or
+                        (free_last_col and j == last_col)):
+                    open_ = previous[j]
+                    extend = vgaps[j]
+                else:
+                    open_ = previous[j] - gap_open_penalty
+                    extend = vgaps[j] - gap_extend_penalty
+                if extend > open_:
+                    vgap = extend
+                    state |= _VGAP_EXTEND
+                else:
+                    vgap = open_
+            else:
+                vgap = _NEG_INF
+            vgaps[j] = vgap
+
+            # gap in the second sequence
+            if j > 0:
+                if free_row:
+                    open_ = current[j - 1]
+                    extend = hgap
+                else:
+                    open_ = current[j - 1] - gap_open_penalty
+                    extend = hgap - gap_extend_penalty
+                if extend > open_:
+                    hgap = extend
+                    state |= _HGAP_EXTEND
+                else:
+                    hgap = open_
+
+            if restart:
+                best = 0.0
+                if hgap > best:
+                    best = hgap
+                    state |= _HGAP
+            else:
+                best = hgap
+                state |= _HGAP
+            if match > best:
+                best = match
+                state = (state & ~_STATE) | _MATCH
+            if vgap > best:
+                best = vgap
+                state = (state & ~_STATE) | _VGAP
+            current[j] = best
+            if traceback:
+                tb[i, j - lo] = state
+
+            if find_max and best > best_score:
+                best_score = best
+                end_row = i
+                end_col = j
+
+        if hi < last_col:
+            current[hi + 1] = _NEG_INF
+            vgaps[hi + 1] = _NEG_INF
+        swap = previous
+        previous = current
+        current = swap
+
+    # the buffers still hold cells of earlier rows outside the band
+    lo = max(0, last_row + diag_min)
+    hi = min(last_col, last_row + diag_max)
+    for j in range(num_cols):
+        if j < lo or j > hi:
+            previous[j] = _NEG_INF
+            vgaps[j] = _NEG_INF
+
+    if not find_max:
+        end_row = last_row
+        end_col = last_col
+        best_score = previous[last_col]
+    return (tb_array, best_score, end_row, end_col, np.asarray(previous),
+            np.asarray(vgaps))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _trace_path(np.uint8_t[:, ::1] traceback, Py_ssize_t end_row,
+                Py_ssize_t end_col, Py_ssize_t diag_min, int state=-1):
+    """Follow a traceback matrix from a cell to the start of the alignment.
+
+    Parameters
+    ----------
+    traceback : 2D np.ndarray of np.uint8
+        Traceback matrix filled by ``_fill_block``.
+    end_row, end_col : int
+        Cell where the alignment ends.
+    diag_min : int
+        Lowest diagonal of the cells in the traceback matrix.
+    state : int, optional
+        State of the alignment in the last cell. Defaults to the state with
+        the best score.
+
+    Returns
+    -------
+    1D np.ndarray of np.uint8
+        Moves (``MATCH``, ``VGAP`` or ``HGAP``) of the alignment, from its
+        start to its end.
+    int, int
+        Row and column of the cell where the alignment starts.
+
+    """
+    cdef:
+        Py_ssize_t i = end_row, j = end_col, n = 0
+        np.uint8_t extend, cell
+        np.ndarray[np.uint8_t, ndim=1] path = np.empty(end_row + end_col,
+                                                       dtype=np.uint8)
+        np.uint8_t[::1] moves = path
+
+    if state < 0:
+        state = traceback[i, j - max(0, i + diag_min)] & _STATE
+    while state != _END and (i > 0 or j > 0):
+        moves[n] = state
+        n += 1
+        cell = traceback[i, j - max(0, i + diag_min)]
+        if state == _MATCH:
+            i -= 1
+            j -= 1
+            state = traceback[i, j - max(0, i + diag_min)] & _STATE
+        else:
+            if state == _VGAP:
+                extend = cell & _VGAP_EXTEND
+                i -= 1
+            else:
+                extend = cell & _HGAP_EXTEND
+                j -= 1
+            if not extend:
+                state = traceback[i, j - max(0, i + diag_min)] & _STATE
+    return path[:n][::-1], i, j
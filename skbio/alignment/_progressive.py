@@ -0,0 +1,192 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import numbers
+
+import numpy as np
+from scipy.cluster.hierarchy import average
+from scipy.sparse import csr_matrix
+from scipy.spatial.distance import squareform
+
+from skbio.sequence import Protein
+from skbio.util._decorator import experimental
+from ._tabular_msa import TabularMSA
+from ._pairwise import _Aligner, _blosum50
+from ._pairwise_dp import VGAP, HGAP
+from ._substitution_matrix import SubstitutionMatrix
+
+
+@experimental(as_of="0.4.0-dev")
+def progressive_align(sequences, gap_open_penalty=None,
+                      gap_extend_penalty=None, substitution_matrix=None,
+                      k=3):
+    """Build a multiple sequence alignment by progressive alignment.
+
+    Sequences are clustered into a guide tree by UPGMA on their k-mer
+    distances, and the alignments of the subtrees of each node are then
+    aligned to each other, from the tips to the root, with
+    ``global_pairwise_align``.
+
+    Parameters
+    ----------
+    sequences : iterable of alphabet-aware scikit-bio sequence objects
+        Unaligned sequences, all of the same type (e.g., ``DNA`` or
+        ``Protein``). Gap characters are removed before aligning.
+    gap_open_penalty : int or float, optional
+        Penalty for opening a gap; default is 11 for protein sequences and 5
+        otherwise.
+    gap_extend_penalty : int or float, optional
+        Penalty for extending a gap; default is 1 for protein sequences and 2
+        otherwise.
+    substitution_matrix: 2D dict (or similar) or SubstitutionMatrix, optional
+        Lookup for substitution scores; default is BLOSUM 50 for protein
+        sequences, and a match score of 1 and a mismatch score of -2
+        otherwise.
+    k : int, optional
+        Length of the k-mers used to compute the guide tree.
+
+    Returns
+    -------
+    TabularMSA
+        The aligned sequences, in the order of `sequences`. Sequences keep
+        their type and metadata.
+
+    Raises
+    ------
+    ValueError
+        If `k` is not a positive integer.
+    ValueError
+        If fewer than one sequence is provided.
+
+    See Also
+    --------
+    global_pairwise_align
+    TabularMSA
+
+    Notes
+    -----
+    The k-mer distance of two sequences is one minus the fraction of the
+    distinct k-mers of the sequence with fewer of them that are shared by
+    both sequences, a variant of the distances used by MUSCLE [1]_ to build
+    its first guide tree.
+
+    Alignments of subtrees are aligned as profiles: the substitution score
+    of two positions is the average score of all pairs of characters at
+    these positions, computed once per pair of symbols and position rather
+    than once per pair of characters. Terminal gaps are not penalized.
+
+    References
+    ----------
+    .. [1] MUSCLE: multiple sequence alignment with high accuracy and high
+       throughput.
+       Edgar RC.
+       Nucleic Acids Res. 2004 Mar 19;32(5):1792-7.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.alignment import progressive_align
+    >>> msa = progressive_align([DNA('ACCGTTGACCAGT'), DNA('ACCGTGACCAGT'),
+    ...                          DNA('ACCGTTGACAGT'), DNA('ACGTTGACCAGT')])
+    >>> for sequence in msa:
+    ...     print(sequence)
+    ACCGTTGACCAGT
+    ACCG-TGACCAGT
+    ACCGTTGAC-AGT
+    -ACGTTGACCAGT
+
+    """
+    if not (isinstance(k, numbers.Integral) and k > 0):
+        raise ValueError("`k` must be a positive integer, not %r" % (k,))
+    sequences = [sequence.degap() for sequence in sequences]
+    if not sequences:
+        raise ValueError("At least one sequence must be provided.")
+
+    protein = isinstance(sequences[0], Protein)
+    if gap_open_penalty is None:
+        gap_open_penalty = 11 if protein else 5
+    if gap_extend_penalty is None:
+        gap_extend_penalty = 1 if protein else 2
+    if substitution_matrix is None:
+        substitution_matrix = _blosum50 if protein else \
+            SubstitutionMatrix.identity('ACGTU', 1, -2)
+
+    # the characters and the indices of the sequences of each cluster, which
+    # are the tips of the guide tree followed by its internal nodes
+    clusters = [(sequence._bytes[np.newaxis], [i])
+                for i, sequence in enumerate(sequences)]
+    gap = ord(sequences[0].default_gap_char)
+    for left, right in _guide_tree(sequences, k):
+        (chars1, indices1), (chars2, indices2) = clusters[left], \
+            clusters[right]
+        clusters[left] = clusters[right] = None
+        aligner = _Aligner(chars1, chars2, gap_open_penalty,
+                           gap_extend_penalty, substitution_matrix,
+                           penalize_terminal_gaps=False)
+        path = aligner.align(local=False)[0]
+        chars = np.full((len(chars1) + len(chars2), len(path)), gap,
+                        dtype=np.uint8)
+        chars[:len(chars1), path != VGAP] = chars1
+        chars[len(chars1):, path != HGAP] = chars2
+        clusters.append((chars, indices1 + indices2))
+
+    chars, indices = clusters[-1]
+    rows = np.empty_like(chars)
+    rows[indices] = chars
+    return TabularMSA([sequence._to(sequence=row, positional_metadata=None)
+                       for sequence, row in zip(sequences, rows)])
+
+
+def _guide_tree(sequences, k):
+    """Return the pairs of clusters merged by UPGMA on k-mer distances.
+
+    Clusters are numbered as in a SciPy linkage matrix: the sequences
+    first, followed by the cluster created by each merge.
+
+    """
+    if len(sequences) < 2:
+        return []
+    linkage = average(squareform(_kmer_distances(sequences, k),
+                                 checks=False))
+    return linkage[:, :2].astype(int)
+
+
+def _kmer_distances(sequences, k):
+    """Return the k-mer distances of sequences as a square matrix."""
+    codes = np.unique(np.concatenate([sequence._bytes
+                                      for sequence in sequences]))
+    index = np.zeros(256, dtype=np.int64)
+    index[codes] = np.arange(len(codes))
+    base = max(len(codes), 1)
+
+    # each k-mer of each sequence as a number in base `base`
+    rows, kmers = [], []
+    for i, sequence in enumerate(sequences):
+        symbols = index[sequence._bytes]
+        num_kmers = max(len(symbols) - k + 1, 0)
+        values = np.zeros(num_kmers, dtype=np.int64)
+        for j in range(k):
+            values = values * base + symbols[j:j + num_kmers]
+        kmers.append(np.unique(values))
+        rows.append(np.full(len(kmers[-1]), i, dtype=np.int64))
+    kmers = np.concatenate(kmers)
+    columns = np.unique(kmers, return_inverse=True)[1]
+    num_columns = columns.max() + 1 if len(columns) else 0
+    present = csr_matrix(
+        (np.ones(len(kmers)), (np.concatenate(rows), columns)),
+        shape=(len(sequences), num_columns))
+
+    shared = present.dot(present.T).toarray()
+    counts = np.diag(shared)
+    fewest = np.minimum.outer(counts, counts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distances = np.where(fewest > 0, 1 - shared / fewest, 1.0)
+    np.fill_diagonal(distances, 0)
+    return distances
@@ -7,9 +7,12 @@
 # -----------------------------------------------------------------------------
 
 from cpython cimport bool
+from libc.stdlib cimport calloc, free
 import numpy as np
 cimport numpy as cnp
+import pandas as pd
 from skbio.alignment import Alignment
+from skbio.alignment._substitution_matrix import SubstitutionMatrix
 from skbio.sequence import Protein, Sequence
 
 cdef extern from "_lib/ssw.h":
@@ -44,7 +47,7 @@ cdef extern from "_lib/ssw.h":
                             const cnp.uint8_t flag,
                             const cnp.uint16_t filters,
                             const cnp.int32_t filterd,
-                            const cnp.int32_t maskLen)
+                            const cnp.int32_t maskLen) nogil
 
     cdef void align_destroy(s_align* a)
 
@@ -70,6 +73,10 @@ np_nt_table = np.array([
 
 mid_table = np.array(['M', 'I', 'D'])
 
+_alignment_columns = ['optimal_alignment_score', 'suboptimal_alignment_score',
+                      'query_begin', 'query_end', 'target_begin',
+                      'target_end_optimal', 'target_end_suboptimal', 'cigar']
+
 
 cdef class AlignmentStructure:
     """Wraps the result of an alignment c struct so it is accessible to Python
@@ -487,12 +494,13 @@ cdef class StripedSmithWaterman:
         when a mismatch occurs. This should be a negative integer.
         This is ignored if `substitution_matrix` is provided.
         Default is -3.
-    substitution_matrix : 2D dict, optional
+    substitution_matrix : 2D dict or SubstitutionMatrix, optional
         Provides the score for each possible substitution of sequence
         characters. This may be used for protein or nucleotide sequences. The
         entire set of possible combinations for the relevant sequence type MUST
-        be enumerated in the dict of dicts. This will override `match_score`
-        and `mismatch_score`. Required when `protein` is True.
+        be enumerated in the dict of dicts, or scored by the
+        ``SubstitutionMatrix``. This will override `match_score` and
+        `mismatch_score`. Required when `protein` is True.
         Default is None.
     suppress_sequences : bool, optional
         If True, the query and target sequences will not be returned for
@@ -651,6 +659,150 @@ cdef class StripedSmithWaterman:
         alignment.__constructor(align)  # Hack to get a pointer through
         return alignment
 
+    def align_many(self, target_sequences, lengths=None):
+        """Align many target sequences to `query_sequence`
+
+        The query profile is reused for all targets, and the alignments are
+        computed without holding the global interpreter lock, so batches of
+        targets may be aligned in parallel from several threads.
+
+        Parameters
+        ----------
+        target_sequences : iterable of str or Sequence, or str
+            The target sequences, e.g., a list of strings or a generator of
+            reads returned by ``skbio.io.read``. If `lengths` is provided, a
+            single string holding the target sequences one after the other.
+        lengths : 1D array_like of int, optional
+            Length of each target sequence in `target_sequences`, when it is
+            a single string of concatenated sequences.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per target sequence, in order, with columns
+            ``optimal_alignment_score``, ``suboptimal_alignment_score``,
+            ``query_begin``, ``query_end``, ``target_begin``,
+            ``target_end_optimal``, ``target_end_suboptimal`` and ``cigar``,
+            holding the values of the corresponding ``AlignmentStructure``
+            properties.
+
+        Raises
+        ------
+        ValueError
+            If `lengths` is not a 1D array of non-negative integers fitting in
+            32 bits.
+        ValueError
+            If `lengths` does not add up to the length of
+            `target_sequences`.
+
+        Examples
+        --------
+        >>> from skbio.alignment import StripedSmithWaterman
+        >>> query = StripedSmithWaterman("ACTAAGGCTCTCTACCCCTCTCAGAGA")
+        >>> results = query.align_many(["ACTAAGGCTCTCTACCCCTCTCAGAGA",
+        ...                             "GCTAACTAGGCTCCCTTCTACCCCTCTCAGAGA"])
+        >>> results['optimal_alignment_score'].tolist()
+        [54, 38]
+        >>> results['cigar'].tolist()
+        ['27M', '3M1I6M3D17M']
+
+        Targets may also be provided as a single string:
+
+        >>> query.align_many("ACTAAGGCTCAGAGA", lengths=[10, 5])['cigar']
+        0    10M
+        1     5M
+        Name: cigar, dtype: object
+
+        """
+        if lengths is None:
+            target_sequences = [str(target) for target in target_sequences]
+            lengths = np.array([len(target) for target in target_sequences],
+                               dtype=np.int64)
+            target_sequences = ''.join(target_sequences)
+        else:
+            target_sequences = str(target_sequences)
+            lengths = np.asarray(lengths)
+            if lengths.ndim != 1:
+                raise ValueError("`lengths` must be 1D, not %dD."
+                                 % lengths.ndim)
+            if lengths.size == 0:
+                lengths = lengths.astype(np.int64)
+            elif not np.issubdtype(lengths.dtype, np.integer):
+                raise ValueError("`lengths` must contain integers, not %r."
+                                 % lengths.dtype)
+            elif lengths.min() < 0 or lengths.max() > np.iinfo(np.int32).max:
+                raise ValueError("`lengths` must be between 0 and %d."
+                                 % np.iinfo(np.int32).max)
+
+        cdef cnp.ndarray[cnp.int8_t, ndim = 1, mode = "c"] reference
+        reference = self._buffer_converter(target_sequences)
+        total = lengths.sum(dtype=np.int64)
+        if total != len(reference):
+            raise ValueError(
+                "`lengths` must add up to the length of `target_sequences`: "
+                "%d != %d" % (total, len(reference)))
+        cdef cnp.ndarray[cnp.int32_t, ndim = 1, mode = "c"] ref_lengths
+        ref_lengths = np.ascontiguousarray(lengths, dtype=np.int32)
+        cdef cnp.ndarray[cnp.intp_t, ndim = 1, mode = "c"] offsets
+        offsets = np.concatenate(
+            [[0], np.cumsum(lengths, dtype=np.int64)[:-1]]).astype(np.intp)
+
+        cdef Py_ssize_t i, n = len(ref_lengths)
+        cdef const s_profile* profile = self.profile
+        cdef cnp.int8_t* ref = <cnp.int8_t*> reference.data
+        cdef cnp.int32_t* ref_length = <cnp.int32_t*> ref_lengths.data
+        cdef cnp.intp_t* ref_offset = <cnp.intp_t*> offsets.data
+        cdef cnp.uint8_t gap_open = self.gap_open_penalty
+        cdef cnp.uint8_t gap_extend = self.gap_extend_penalty
+        cdef cnp.uint8_t bit_flag = self.bit_flag
+        cdef cnp.uint16_t score_filter = self.score_filter
+        cdef cnp.int32_t distance_filter = self.distance_filter
+        cdef cnp.int32_t mask_length = self.mask_length
+        cdef s_align** aligns = <s_align**> calloc(max(n, 1),
+                                                    sizeof(s_align*))
+        if aligns is NULL:
+            raise MemoryError()
+
+        try:
+            with nogil:
+                for i in range(n):
+                    aligns[i] = ssw_align(profile, ref + ref_offset[i],
+                                          ref_length[i], gap_open,
+                                          gap_extend, bit_flag, score_filter,
+                                          distance_filter, mask_length)
+            return self._alignment_table(aligns, n)
+        finally:
+            for i in range(n):
+                if aligns[i] is not NULL:
+                    align_destroy(aligns[i])
+            free(aligns)
+
+    cdef object _alignment_table(self, s_align** aligns, Py_ssize_t n):
+        cdef Py_ssize_t i, j
+        cdef s_align* a
+        cdef int base = self.index_starts_at
+        cdef cnp.ndarray[cnp.int64_t, ndim = 2, mode = "c"] values
+        values = np.empty((n, len(_alignment_columns) - 1), dtype=np.int64)
+        cigars = []
+        for i in range(n):
+            a = aligns[i]
+            if a is NULL:
+                raise ValueError("Target sequence %d could not be aligned; "
+                                 "`score_size` may be too small" % i)
+            values[i, 0] = a.score1
+            values[i, 1] = a.score2
+            values[i, 2] = a.read_begin1 + base if a.read_begin1 >= 0 else -1
+            values[i, 3] = a.read_end1 + base
+            values[i, 4] = a.ref_begin1 + base if a.ref_begin1 >= 0 else -1
+            values[i, 5] = a.ref_end1 + base
+            values[i, 6] = a.ref_end2 + base
+            cigars.append("".join([
+                "%d%s" % (a.cigar[j] >> 4, mid_table[a.cigar[j] & 0xf])
+                for j in range(a.cigarLen)]))
+        table = pd.DataFrame(values, columns=_alignment_columns[:-1])
+        table['cigar'] = cigars
+        return table
+
     def __dealloc__(self):
         if self.profile is not NULL:
             init_destroy(self.profile)
@@ -682,6 +834,13 @@ cdef class StripedSmithWaterman:
                 seq[i] = np_nt_table[ord(char)]
         return seq
 
+    cdef cnp.ndarray[cnp.int8_t, ndim = 1, mode = "c"] _buffer_converter(
+            self,
+            sequence):
+        table = np_aa_table if self.is_protein else np_nt_table
+        codes = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+        return np.ascontiguousarray(table[codes], dtype=np.int8)
+
     cdef cnp.ndarray[cnp.int8_t, ndim = 1, mode = "c"] \
             _build_match_matrix(self, match_score, mismatch_score):
         sequence_order = "ACGTN"
@@ -702,6 +861,16 @@ cdef class StripedSmithWaterman:
             sequence_order = "ARNDCQEGHILKMFPSTWYVBZX*"
         else:
             sequence_order = "ACGTN"
+        if isinstance(dict2d, SubstitutionMatrix):
+            if dict2d.scores.dtype != np.int8:
+                raise ValueError(
+                    "StripedSmithWaterman requires substitution scores that "
+                    "are integers between -128 and 127.")
+            indices = dict2d._indices(np.frombuffer(
+                sequence_order.encode('ascii'), dtype=np.uint8))
+            return np.ascontiguousarray(
+                dict2d.scores[np.ix_(indices, indices)].ravel(),
+                dtype=np.int8)
         cdef int i = 0
         length = len(sequence_order)
         cdef cnp.ndarray[cnp.int8_t, ndim = 1, mode = "c"] py_list_matrix = \
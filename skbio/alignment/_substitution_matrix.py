@@ -0,0 +1,472 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+
+import numpy as np
+
+from skbio._base import SkbioObject
+from skbio.sequence._base import ElasticLines
+from skbio.util._decorator import experimental, classonlymethod
+
+
+class SubstitutionMatrix(SkbioObject):
+    """Scores of substituting characters for each other in an alignment.
+
+    Characters of the alphabet are mapped to integer codes, their positions
+    in the alphabet, and scores are stored in a dense square array indexed by
+    these codes, so that aligners can score pairs of characters by array
+    indexing rather than with a dictionary lookup per pair.
+
+    Parameters
+    ----------
+    alphabet : str
+        Distinct characters scored by the matrix.
+    scores : 2D array_like of int or float
+        Square array of the scores of substituting each character of
+        `alphabet` (rows) with each character of `alphabet` (columns), in the
+        order of `alphabet`.
+    name : str, optional
+        Name of the substitution matrix. This is simply metadata and does not
+        affect the functionality of the substitution matrix itself.
+
+    Raises
+    ------
+    ValueError
+        If `alphabet` is empty, does not contain single ASCII characters, or
+        contains a character more than once.
+    ValueError
+        If `scores` is not a square array with a row and a column for each
+        character of `alphabet`.
+
+    See Also
+    --------
+    SubstitutionMatrix.from_ncbi
+    SubstitutionMatrix.identity
+    global_pairwise_align
+    local_pairwise_align
+    StripedSmithWaterman
+
+    Notes
+    -----
+    Scores are stored as 8-bit integers if they are all integers in the range
+    of an 8-bit integer, and as 64-bit floating point numbers otherwise.
+
+    Examples
+    --------
+    >>> from skbio.alignment import SubstitutionMatrix
+    >>> matrix = SubstitutionMatrix('ACGT', [[1, -1, -1, -1],
+    ...                                      [-1, 1, -1, -1],
+    ...                                      [-1, -1, 1, -1],
+    ...                                      [-1, -1, -1, 1]])
+    >>> matrix.alphabet
+    'ACGT'
+    >>> matrix.scores.dtype
+    dtype('int8')
+    >>> matrix.score('A', 'C')
+    -1
+    >>> print(matrix)
+       A  C  G  T
+    A  1 -1 -1 -1
+    C -1  1 -1 -1
+    G -1 -1  1 -1
+    T -1 -1 -1  1
+
+    """
+
+    @classonlymethod
+    @experimental(as_of="0.4.0-dev")
+    def from_ncbi(cls, name='BLOSUM62'):
+        """Return a substitution matrix distributed by NCBI.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the substitution matrix: one of ``'BLOSUM45'``,
+            ``'BLOSUM50'``, ``'BLOSUM62'``, ``'BLOSUM80'``, ``'BLOSUM90'``,
+            ``'PAM30'``, ``'PAM70'``, ``'PAM250'`` and ``'NUC.4.4'``.
+
+        Returns
+        -------
+        SubstitutionMatrix
+            Substitution matrix specified by `name`.
+
+        Raises
+        ------
+        ValueError
+            If `name` is not the name of one of the available matrices.
+
+        Notes
+        -----
+        The matrices are the ones distributed with BLAST [1]_. The BLOSUM and
+        PAM matrices score the 20 standard amino acids, the ambiguity codes
+        B, Z and X, and the stop character (``*``). NUC.4.4 scores the IUPAC
+        DNA nucleotide characters, including degenerate ones.
+
+        References
+        ----------
+        .. [1] ftp://ftp.ncbi.nih.gov/blast/matrices/
+
+        Examples
+        --------
+        >>> from skbio.alignment import SubstitutionMatrix
+        >>> blosum62 = SubstitutionMatrix.from_ncbi('BLOSUM62')
+        >>> blosum62.score('W', 'W')
+        11
+        >>> blosum62.score('W', 'F')
+        1
+
+        """
+        if name not in _ncbi_matrix_names:
+            raise ValueError("`name` must be one of %r, not %r"
+                             % (_ncbi_matrix_names, name))
+        if name not in _ncbi_matrices:
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'data', name)
+            with io.open(path) as fh:
+                _ncbi_matrices[name] = cls._from_ncbi_format(fh, name)
+        return _ncbi_matrices[name]
+
+    @classmethod
+    def _from_ncbi_format(cls, lines, name):
+        rows = [line.split() for line in lines
+                if line.strip() and not line.startswith('#')]
+        alphabet = ''.join(rows[0])
+        return cls(alphabet, [[int(score) for score in row[1:]]
+                              for row in rows[1:]], name=name)
+
+    @classonlymethod
+    @experimental(as_of="0.4.0-dev")
+    def identity(cls, alphabet, match_score, mismatch_score, name=None):
+        """Return a matrix scoring all matches, and all mismatches, equally.
+
+        Parameters
+        ----------
+        alphabet : str
+            Distinct characters scored by the matrix.
+        match_score : int or float
+            Score of every pair of identical characters. This value is
+            typically positive.
+        mismatch_score : int or float
+            Score of every pair of different characters. This value is
+            typically negative.
+        name : str, optional
+            Name of the substitution matrix.
+
+        Returns
+        -------
+        SubstitutionMatrix
+            Substitution matrix scoring the characters of `alphabet`.
+
+        Examples
+        --------
+        >>> from skbio.alignment import SubstitutionMatrix
+        >>> print(SubstitutionMatrix.identity('ACGU', 2, -3))
+           A  C  G  U
+        A  2 -3 -3 -3
+        C -3  2 -3 -3
+        G -3 -3  2 -3
+        U -3 -3 -3  2
+
+        """
+        scores = np.full((len(alphabet), len(alphabet)), mismatch_score,
+                         dtype=np.result_type(match_score, mismatch_score))
+        np.fill_diagonal(scores, match_score)
+        return cls(alphabet, scores, name=name)
+
+    @classonlymethod
+    @experimental(as_of="0.4.0-dev")
+    def from_dict(cls, dictionary, name=None):
+        """Create a substitution matrix from a 2D dict.
+
+        Parameters
+        ----------
+        dictionary : 2D dict (or similar)
+            Lookup for substitution scores, such that
+            ``dictionary[char1][char2]`` is the score of substituting
+            ``char1`` with ``char2``. Every character must be a key of every
+            row.
+        name : str, optional
+            Name of the substitution matrix.
+
+        Returns
+        -------
+        SubstitutionMatrix
+            Substitution matrix scoring the characters that are keys of
+            `dictionary`, in sorted order.
+
+        Raises
+        ------
+        ValueError
+            If a row of `dictionary` lacks the score of a character.
+
+        See Also
+        --------
+        to_dict
+
+        Examples
+        --------
+        >>> from skbio.alignment import SubstitutionMatrix
+        >>> matrix = SubstitutionMatrix.from_dict(
+        ...     {'A': {'A': 1, 'B': -2}, 'B': {'A': -2, 'B': 3}})
+        >>> print(matrix)
+           A  B
+        A  1 -2
+        B -2  3
+
+        """
+        alphabet = ''.join(sorted(dictionary.keys()))
+        scores = []
+        for char1 in alphabet:
+            row = dictionary[char1]
+            missing = [char2 for char2 in alphabet if char2 not in row]
+            if missing:
+                raise ValueError(
+                    "`dictionary` must have a score for every pair of "
+                    "characters, but the row of %r lacks the score of: %s"
+                    % (char1, ', '.join(repr(char) for char in missing)))
+            scores.append([row[char2] for char2 in alphabet])
+        return cls(alphabet, scores, name=name)
+
+    @property
+    @experimental(as_of="0.4.0-dev")
+    def alphabet(self):
+        """Characters scored by the substitution matrix.
+
+        Returns
+        -------
+        str
+            Characters in the order of the rows and columns of ``scores``.
+
+        """
+        return self._alphabet
+
+    @property
+    @experimental(as_of="0.4.0-dev")
+    def scores(self):
+        """Read-only array of substitution scores.
+
+        Returns
+        -------
+        2D np.ndarray (int8 or float64)
+            Score of substituting each character of ``alphabet`` (rows) with
+            each character of ``alphabet`` (columns).
+
+        """
+        return self._scores
+
+    @property
+    @experimental(as_of="0.4.0-dev")
+    def name(self):
+        """Substitution matrix name.
+
+        Returns
+        -------
+        str
+            Substitution matrix name.
+
+        """
+        return self._name
+
+    @experimental(as_of="0.4.0-dev")
+    def __init__(self, alphabet, scores, name=None):
+        if not alphabet:
+            raise ValueError("`alphabet` must contain at least one character.")
+        try:
+            codes = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            raise ValueError("`alphabet` must contain only ASCII characters, "
+                             "not %r" % (alphabet,))
+        if len(np.unique(codes)) != len(codes):
+            raise ValueError("`alphabet` must not contain duplicate "
+                             "characters, not %r" % (alphabet,))
+
+        scores = np.asarray(scores)
+        if scores.shape != (len(codes), len(codes)):
+            raise ValueError(
+                "`scores` must be a square array with a row and a column for "
+                "each character of the alphabet, i.e. of shape %r, not %r"
+                % ((len(codes), len(codes)), scores.shape))
+        info = np.iinfo(np.int8)
+        if (np.issubdtype(scores.dtype, np.number) and
+                (scores == np.round(scores)).all() and
+                (info.min <= scores).all() and (scores <= info.max).all()):
+            scores = scores.astype(np.int8)
+        else:
+            scores = scores.astype(np.float64)
+        scores.flags.writeable = False
+
+        self._alphabet = str(alphabet)
+        self._scores = scores
+        self._name = '' if name is None else name
+        # the code of each byte value, -1 for characters not in the alphabet
+        self._index = np.full(256, -1, dtype=np.intp)
+        self._index[codes] = np.arange(len(codes))
+
+    @experimental(as_of="0.4.0-dev")
+    def __str__(self):
+        """Return string representation of the substitution matrix.
+
+        Returns
+        -------
+        str
+            Substitution scores in the format of NCBI's matrix files, with a
+            row and a column per character of the alphabet.
+
+        """
+        return self._build_repr(include_name=False)
+
+    @experimental(as_of="0.4.0-dev")
+    def __repr__(self):
+        """Return string representation of the substitution matrix.
+
+        Returns
+        -------
+        str
+            Substitution scores in the format of NCBI's matrix files, preceded
+            by a header. If the substitution matrix has a name, it will be
+            included in the header.
+
+        """
+        return self._build_repr(include_name=True)
+
+    def _build_repr(self, include_name):
+        lines = ElasticLines()
+
+        if include_name:
+            name_line = self.__class__.__name__
+            if len(self.name) > 0:
+                name_line += ' (%s)' % self.name
+            lines.add_line(name_line)
+            lines.add_separator()
+
+        cells = [['%g' % score for score in row] for row in self._scores]
+        width = max(len(cell) for row in cells for cell in row) + 1
+        lines.add_line(' ' + ''.join(char.rjust(width)
+                                     for char in self._alphabet))
+        for char, row in zip(self._alphabet, cells):
+            lines.add_line(char + ''.join(cell.rjust(width) for cell in row))
+        return lines.to_str()
+
+    @experimental(as_of="0.4.0-dev")
+    def __eq__(self, other):
+        """Determine if the substitution matrix is equal to another.
+
+        Substitution matrices are equal if they are *exactly* the same type
+        and score the same characters, in the same order, with the same
+        scores. A substitution matrix's name does not affect equality.
+
+        Parameters
+        ----------
+        other : SubstitutionMatrix
+            Substitution matrix to test for equality against.
+
+        Returns
+        -------
+        bool
+            Indicates whether the substitution matrix is equal to `other`.
+
+        """
+        if self.__class__ != other.__class__:
+            return False
+        return (self._alphabet == other._alphabet and
+                np.array_equal(self._scores, other._scores))
+
+    @experimental(as_of="0.4.0-dev")
+    def __ne__(self, other):
+        """Determine if the substitution matrix is not equal to another.
+
+        Parameters
+        ----------
+        other : SubstitutionMatrix
+            Substitution matrix to test for inequality against.
+
+        Returns
+        -------
+        bool
+            Indicates whether the substitution matrix is not equal to `other`.
+
+        """
+        return not (self == other)
+
+    @experimental(as_of="0.4.0-dev")
+    def score(self, char1, char2):
+        """Return the score of substituting one character with another.
+
+        Parameters
+        ----------
+        char1, char2 : str
+            Characters of the alphabet.
+
+        Returns
+        -------
+        int or float
+            Score of substituting `char1` with `char2`.
+
+        Raises
+        ------
+        ValueError
+            If `char1` or `char2` is not a character of the alphabet.
+
+        """
+        for char in (char1, char2):
+            if len(char) != 1 or char not in self._alphabet:
+                raise ValueError("%r is not a character of the alphabet %r"
+                                 % (char, self._alphabet))
+        return self._scores[self._alphabet.index(char1),
+                            self._alphabet.index(char2)].item()
+
+    @experimental(as_of="0.4.0-dev")
+    def to_dict(self):
+        """Return the substitution scores as a 2D dict.
+
+        Returns
+        -------
+        dict of dicts
+            Lookup for substitution scores, such that ``result[char1][char2]``
+            is the score of substituting ``char1`` with ``char2``.
+
+        See Also
+        --------
+        from_dict
+
+        """
+        return {char1: {char2: score.item()
+                        for char2, score in zip(self._alphabet, row)}
+                for char1, row in zip(self._alphabet, self._scores)}
+
+    def _indices(self, chars):
+        """Return the codes of an array of ASCII character codes.
+
+        Raises ``ValueError`` naming the characters that are not in the
+        alphabet, if any.
+
+        """
+        indices = self._index[chars]
+        if (indices < 0).any():
+            offending_chars = sorted(set(chr(char) for char in
+                                         chars[indices < 0]))
+            raise ValueError(
+                "One of the sequences contains a character that is not "
+                "contained in the substitution matrix. Are you using an "
+                "appropriate substitution matrix for your sequence type "
+                "(e.g., a nucleotide substitution matrix does not make sense "
+                "for aligning protein sequences)? Does your sequence contain "
+                "invalid characters? The offending character(s) is:  %s."
+                % ', '.join(offending_chars))
+        return indices
+
+
+_ncbi_matrix_names = ['BLOSUM45', 'BLOSUM50', 'BLOSUM62', 'BLOSUM80',
+                      'BLOSUM90', 'PAM30', 'PAM70', 'PAM250', 'NUC.4.4']
+
+# matrices read from the data directory so far, by name
+_ncbi_matrices = {}
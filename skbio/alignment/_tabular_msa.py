@@ -21,10 +21,26 @@ from skbio.sequence import Sequence
 from skbio.sequence._iupac_sequence import IUPACSequence
 from skbio.util._decorator import experimental, classonlymethod, overrides
 from skbio.util._misc import resolve_key
+from ._distance import _distance_matrix
 
 
 _Shape = collections.namedtuple('Shape', ['sequence', 'position'])
 
+# Column statistics are computed over blocks of rows of about this many
+# characters so that temporary arrays stay small for large MSAs.
+_block_chars = 2 ** 24
+
+
+def _row_metadata(sequence):
+    """Return copies of the metadata and positional metadata of `sequence`.
+
+    Either copy is ``None`` if `sequence` does not have the corresponding
+    metadata.
+
+    """
+    return (MetadataMixin._copy_(sequence),
+            PositionalMetadataMixin._copy_(sequence))
+
 
 class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
     """Store a multiple sequence alignment in tabular (row/column) form.
@@ -72,6 +88,18 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
     If `minter` or `index` are not provided, default pandas labels will be
     used: integer labels ``0..(N-1)``, where ``N`` is the number of sequences.
 
+    The characters of the MSA are stored in a single contiguous
+    two-dimensional array with one row per sequence, so operations on
+    positions, such as ``consensus`` and ``gap_frequencies``, are computed
+    over the whole array at once rather than by building a ``Sequence`` for
+    each position. The array is the only copy of the characters kept by the
+    MSA: the sequences passed in are not modified or kept (e.g., packed
+    sequences stay packed), and only a copy of their metadata and positional
+    metadata is stored. Iterating over the MSA builds sequence objects whose
+    characters are read-only views of the rows of the array, so they are not
+    the objects passed in, and changes to their metadata are not reflected in
+    the MSA.
+
     """
 
     @property
@@ -93,7 +121,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         True
 
         """
-        return type(self._get_sequence(0)) if len(self) > 0 else None
+        return self._dtype
 
     @property
     @experimental(as_of='0.4.0-dev')
@@ -128,14 +156,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         3
 
         """
-        sequence_count = len(self)
-
-        if sequence_count > 0:
-            position_count = len(self._get_sequence(0))
-        else:
-            position_count = 0
-
-        return _Shape(sequence=sequence_count, position=position_count)
+        return _Shape(*self._chars.shape)
 
     @property
     @experimental(as_of='0.4.0-dev')
@@ -184,11 +205,11 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         Int64Index([0, 1], dtype='int64')
 
         """
-        return self._seqs.index
+        return self._rows.index
 
     @index.setter
     def index(self, index):
-        self._seqs.index = index
+        self._rows.index = index
 
     @index.deleter
     def index(self):
@@ -239,10 +260,23 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
     @experimental(as_of='0.4.0-dev')
     def __init__(self, sequences, metadata=None, positional_metadata=None,
                  minter=None, index=None):
-        # TODO: optimize this to not append Series for each sequence.
-        self._seqs = pd.Series([])
+        sequences = list(sequences)
+        dtype = length = None
         for sequence in sequences:
-            self.append(sequence)
+            self._assert_valid_sequence(sequence, dtype, length)
+            dtype, length = type(sequence), len(sequence)
+
+        # `rows` holds the metadata of each sequence. It is filled element by
+        # element because pandas and NumPy would otherwise iterate over the
+        # elements of each tuple.
+        rows = np.empty(len(sequences), dtype=object)
+        chars = np.empty((len(sequences), length or 0), dtype=np.uint8)
+        for i, sequence in enumerate(sequences):
+            rows[i] = _row_metadata(sequence)
+            chars[i] = sequence._bytes
+        self._dtype = dtype
+        self._rows = pd.Series(rows)
+        self._set_chars(chars, len(chars))
 
         if minter is not None and index is not None:
             raise ValueError(
@@ -350,7 +384,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         >>> len(msa)
         0
         """
-        return len(self._seqs)
+        return len(self._rows)
 
     @experimental(as_of='0.4.0-dev')
     def __iter__(self):
@@ -371,7 +405,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         'AC-'
 
         """
-        return iter(self._seqs)
+        return (self._get_sequence(i) for i in range(len(self)))
 
     @experimental(as_of='0.4.0-dev')
     def __reversed__(self):
@@ -392,7 +426,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         'ACG'
 
         """
-        return reversed(self._seqs)
+        return (self._get_sequence(i) for i in reversed(range(len(self))))
 
     @experimental(as_of='0.4.0-dev')
     def __str__(self):
@@ -466,7 +500,15 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         if not PositionalMetadataMixin._eq_(self, other):
             return False
 
-        return self._seqs.equals(other._seqs)
+        if self.dtype is not other.dtype or not self.index.equals(other.index):
+            return False
+
+        # comparing the characters first is much faster than comparing each
+        # pair of sequences when the MSAs differ
+        if not np.array_equal(self._chars, other._chars):
+            return False
+
+        return all(seq == other_seq for seq, other_seq in zip(self, other))
 
     @experimental(as_of='0.4.0-dev')
     def __ne__(self, other):
@@ -506,7 +548,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         __deepcopy__
 
         """
-        seqs = (copy.copy(seq) for seq in self._seqs)
+        seqs = (copy.copy(seq) for seq in self)
 
         # Copying index isn't necessary because pd.Index is immutable.
         msa_copy = self.__class__(sequences=seqs, index=self.index,
@@ -532,7 +574,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         __copy__
 
         """
-        seqs = (copy.deepcopy(seq, memo) for seq in self._seqs)
+        seqs = (copy.deepcopy(seq, memo) for seq in self)
 
         # Copying index isn't necessary because pd.Index is immutable.
         msa_copy = self.__class__(sequences=seqs, index=self.index,
@@ -661,7 +703,11 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         if reverse:
             indices = reversed(indices)
 
-        return (self._get_position(index) for index in indices)
+        # Positions are built from the columns of the character array unless
+        # sequence positional metadata must be concatenated.
+        concat = any(positional_metadata is not None
+                     for _, positional_metadata in self._rows)
+        return (self._get_position(index, concat=concat) for index in indices)
 
     @experimental(as_of='0.4.0-dev')
     def consensus(self):
@@ -720,26 +766,28 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         """
         dtype = self.dtype
         if dtype is None:
-            dtype = Sequence
+            return Sequence('')
 
         positional_metadata = None
         if self.has_positional_metadata():
             positional_metadata = self.positional_metadata
 
-        consensus = []
-        for position in self.iter_positions():
-            freqs = position.frequencies()
-
-            gap_freq = 0
-            for gap_char in dtype.gap_chars:
-                if gap_char in freqs:
-                    gap_freq += freqs.pop(gap_char)
-            assert dtype.default_gap_char not in freqs
-            freqs[dtype.default_gap_char] = gap_freq
-
-            consensus.append(collections.Counter(freqs).most_common(1)[0][0])
-
-        return dtype(''.join(consensus),
+        # Each gap character is counted as the default gap character.
+        gap_codes = [ord(gap_char) for gap_char in dtype.gap_chars]
+        codes = np.flatnonzero(np.bincount(self._chars.ravel(),
+                                           minlength=256))
+        codes = np.union1d(np.setdiff1d(codes, gap_codes),
+                           [ord(dtype.default_gap_char)]).astype(np.uint8)
+        translation = np.arange(256, dtype=np.uint8)
+        translation[gap_codes] = ord(dtype.default_gap_char)
+
+        counts = np.zeros((len(codes), self.shape.position), dtype=np.intp)
+        for block in self._row_blocks():
+            block = translation[block]
+            for i, code in enumerate(codes):
+                counts[i] += (block == code).sum(axis=0)
+
+        return dtype(codes[counts.argmax(axis=0)],
                      positional_metadata=positional_metadata)
 
     @experimental(as_of='0.4.0-dev')
@@ -799,33 +847,146 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         array([0, 2, 1, 1])
 
         """
+        is_gap = np.zeros(256, dtype=bool)
+        if self.dtype is not None:
+            is_gap[[ord(gap_char) for gap_char in self.dtype.gap_chars]] = True
+
+        # Gap characters are counted together and only then divided by the
+        # length, which is more precise than summing the relative frequency
+        # of each gap character. Likely not a big deal for typical gap
+        # characters ('-', '.') but can be problematic as the number of gap
+        # characters grows (we aren't guaranteed to always have two gap
+        # characters). See unit tests for an example.
         if self._is_sequence_axis(axis):
-            seq_iterator = self.iter_positions()
             length = self.shape.sequence
+            gap_freqs = np.zeros(self.shape.position, dtype=int)
+            for block in self._row_blocks():
+                gap_freqs += is_gap[block].sum(axis=0)
         else:
-            seq_iterator = self
             length = self.shape.position
-
-        gap_freqs = []
-        for seq in seq_iterator:
-            # Not using Sequence.frequencies(relative=relative) because each
-            # gap character's relative frequency is computed separately and
-            # must be summed. This is less precise than summing the absolute
-            # frequencies of gap characters and dividing by the length. Likely
-            # not a big deal for typical gap characters ('-', '.') but can be
-            # problematic as the number of gap characters grows (we aren't
-            # guaranteed to always have two gap characters). See unit tests for
-            # an example.
-            freqs = seq.frequencies(chars=self.dtype.gap_chars)
-            gap_freqs.append(sum(viewvalues(freqs)))
-
-        gap_freqs = np.asarray(gap_freqs, dtype=float if relative else int)
+            gap_freqs = np.concatenate(
+                [is_gap[block].sum(axis=1) for block in self._row_blocks()] +
+                [np.zeros(0, dtype=int)]).astype(int)
 
         if relative:
+            gap_freqs = gap_freqs.astype(float)
             gap_freqs /= length
 
         return gap_freqs
 
+    @experimental(as_of='0.4.0-dev')
+    def distances(self, metric='hamming', gamma=None, n_threads=1):
+        r"""Compute distances between all pairs of sequences in the MSA.
+
+        Parameters
+        ----------
+        metric : {'hamming', 'p-distance', 'jc69', 'k2p', 'tn93'}, optional
+            Distance metric. ``'hamming'`` is the fraction of positions that
+            differ, gaps included. ``'p-distance'`` is the fraction of
+            positions that differ among those where neither sequence has a gap.
+            ``'jc69'``, ``'k2p'`` and ``'tn93'`` are the evolutionary distances
+            of the Jukes-Cantor [1]_, Kimura 2-parameter [2]_ and Tamura-Nei
+            [3]_ models of nucleotide substitution.
+        gamma : float, optional
+            Shape parameter of the gamma distribution of substitution rates
+            among sites for the substitution models. If ``None``, substitution
+            rates are equal at all sites.
+        n_threads : int, optional
+            Number of threads computing distances in parallel.
+
+        Returns
+        -------
+        skbio.DistanceMatrix
+            Distances between all pairs of sequences. IDs are the string
+            representations of the MSA's index labels.
+
+        Raises
+        ------
+        ValueError
+            If `metric` is invalid, if `gamma` is provided for a metric that is
+            not a substitution model or is not positive, or if `n_threads` is
+            smaller than one.
+        ValueError
+            If two sequences have no position in common that the metric can be
+            computed from, or if they are too divergent for their distance to
+            be defined under a substitution model.
+        TypeError
+            If `metric` is a substitution model and the sequences are not
+            ``DNA`` or ``RNA``.
+
+        See Also
+        --------
+        skbio.sequence.Sequence.distance
+        skbio.tree.nj
+
+        Notes
+        -----
+        The substitution models only use the positions where both sequences
+        have a non-degenerate nucleotide (pairwise deletion). With :math:`P`
+        the proportion of these positions that differ by a transition
+        (purine to purine or pyrimidine to pyrimidine) and :math:`Q` the
+        proportion that differ by a transversion, the distances are
+
+        .. math::
+
+           d_{JC69} = -\frac{3}{4}\ln\left(1 - \frac{4}{3}(P + Q)\right)
+
+           d_{K2P} = -\frac{1}{2}\ln(1 - 2P - Q) - \frac{1}{4}\ln(1 - 2Q)
+
+        TN93 distinguishes A/G transitions from C/T transitions and uses the
+        nucleotide frequencies of the whole alignment. With a gamma
+        distribution of rates, each :math:`-\ln(x)` term is replaced by
+        :math:`a(x^{-1/a} - 1)`, where :math:`a` is `gamma`.
+
+        All distances are computed from counts obtained with matrix products
+        of the characters of all sequences, in blocks of sequences, instead of
+        comparing the sequences pair by pair.
+
+        References
+        ----------
+        .. [1] Jukes, T. H., & Cantor, C. R. (1969). Evolution of protein
+           molecules. In Mammalian Protein Metabolism (pp. 21-132). Academic
+           Press.
+        .. [2] Kimura, M. (1980). A simple method for estimating evolutionary
+           rates of base substitutions through comparative studies of
+           nucleotide sequences. Journal of Molecular Evolution, 16(2),
+           111-120.
+        .. [3] Tamura, K., & Nei, M. (1993). Estimation of the number of
+           nucleotide substitutions in the control region of mitochondrial DNA
+           in humans and chimpanzees. Molecular Biology and Evolution, 10(3),
+           512-526.
+
+        Examples
+        --------
+        >>> from skbio import DNA, TabularMSA
+        >>> msa = TabularMSA([DNA('ACGTACGTAC'),
+        ...                   DNA('ACGTACGTTC'),
+        ...                   DNA('GCGTATGT-C')], index=['a', 'b', 'c'])
+        >>> print(msa.distances())
+        3x3 distance matrix
+        IDs:
+        'a', 'b', 'c'
+        Data:
+        [[ 0.   0.1  0.3]
+         [ 0.1  0.   0.3]
+         [ 0.3  0.3  0. ]]
+
+        Compute Kimura 2-parameter distances, e.g., for building a tree with
+        ``skbio.tree.nj``:
+
+        >>> print(msa.distances('k2p'))
+        3x3 distance matrix
+        IDs:
+        'a', 'b', 'c'
+        Data:
+        [[ 0.          0.10846615  0.29389333]
+         [ 0.10846615  0.          0.29389333]
+         [ 0.29389333  0.29389333  0.        ]]
+
+        """
+        return _distance_matrix(self, [str(label) for label in self.index],
+                                metric, gamma, n_threads, chars=self._chars)
+
     @experimental(as_of='0.4.0-dev')
     def reassign_index(self, mapping=None, minter=None):
         """Reassign index labels to sequences in this MSA.
@@ -890,15 +1051,15 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
             raise ValueError(
                 "Cannot use both `mapping` and `minter` at the same time.")
         if mapping is not None:
-            self._seqs.rename(mapping, inplace=True)
+            self._rows.rename(mapping, inplace=True)
         elif minter is not None:
-            index = [resolve_key(seq, minter) for seq in self._seqs]
+            index = [resolve_key(seq, minter) for seq in self]
 
             # Cast to Index to identify tuples as a MultiIndex to match
             # pandas constructor. Just setting would make an index of tuples.
             self.index = pd.Index(index)
         else:
-            self._seqs.reset_index(drop=True, inplace=True)
+            self._rows.reset_index(drop=True, inplace=True)
 
     @experimental(as_of='0.4.0-dev')
     def append(self, sequence, minter=None, label=None):
@@ -945,6 +1106,12 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         The MSA is not automatically re-aligned when a sequence is appended.
         Therefore, this operation is not necessarily meaningful on its own.
 
+        The character array grows by doubling its number of rows when it is
+        full, so appending ``N`` sequences copies ``O(N)`` characters per
+        position overall. The index is still copied on each call, so it is
+        more efficient to pass all sequences to the ``TabularMSA``
+        constructor than to append them one at a time.
+
         Examples
         --------
         >>> from skbio import DNA, TabularMSA
@@ -976,28 +1143,46 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         if minter is not None:
             label = resolve_key(sequence, minter)
 
-        self._assert_valid_sequence(sequence)
-
-        self._seqs = self._seqs.append(pd.Series([sequence], index=[label]))
-
-    def _assert_valid_sequence(self, sequence):
-        msa_is_empty = not len(self)
-        dtype = type(sequence)
-        if msa_is_empty:
-            if not issubclass(dtype, IUPACSequence):
+        self._assert_valid_sequence(sequence, self._dtype,
+                                    self.shape.position)
+
+        rows = np.empty(1, dtype=object)
+        rows[0] = _row_metadata(sequence)
+        self._rows = self._rows.append(pd.Series(rows, index=[label]))
+        self._dtype = type(sequence)
+
+        # the array grows by doubling its number of rows when it is full. An
+        # MSA without sequences has a full array of shape (0, 0), which is
+        # replaced by an array of the length of `sequence`.
+        num_sequences = len(self._chars)
+        buffer = self._buffer
+        if num_sequences == len(buffer):
+            buffer = np.empty((max(2 * num_sequences, 1), len(sequence)),
+                              dtype=np.uint8)
+            if num_sequences:
+                buffer[:num_sequences] = self._chars
+        buffer[num_sequences] = sequence._bytes
+        self._set_chars(buffer, num_sequences + 1)
+
+    def _assert_valid_sequence(self, sequence, dtype=None, length=None):
+        # `dtype` and `length` are those of the other sequences in the MSA, or
+        # None if `sequence` is the first one.
+        if dtype is None:
+            if not issubclass(type(sequence), IUPACSequence):
                 raise TypeError(
                     "`sequence` must be a scikit-bio sequence object "
-                    "that has an alphabet, not type %r" % dtype.__name__)
-        elif dtype is not self.dtype:
+                    "that has an alphabet, not type %r"
+                    % type(sequence).__name__)
+        elif type(sequence) is not dtype:
             raise TypeError(
                 "`sequence` must match the type of any other sequences "
                 "already in the MSA. Type %r does not match type %r" %
-                (dtype.__name__, self.dtype.__name__))
-        elif len(sequence) != self.shape.position:
+                (type(sequence).__name__, dtype.__name__))
+        elif len(sequence) != length:
             raise ValueError(
                 "`sequence` length must match the number of positions in the "
                 "MSA: %d != %d"
-                % (len(sequence), self.shape.position))
+                % (len(sequence), length))
 
     def sort(self, level=None, ascending=True):
         """Sort sequences by index label in-place.
@@ -1042,8 +1227,11 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         modified (a new object is **not** returned).
 
         """
-        series = self._seqs.sort_index(ascending=ascending, level=level)
-        self._seqs = series
+        order = pd.Series(np.arange(len(self)), index=self.index).sort_index(
+            ascending=ascending, level=level)
+        self._rows = pd.Series(self._rows.values[order.values],
+                               index=order.index)
+        self._set_chars(self._chars[order.values], len(self))
 
     @experimental(as_of='0.4.0-dev')
     def to_dict(self):
@@ -1077,16 +1265,39 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
 
         """
         if self.index.is_unique:
-            return self._seqs.to_dict()
+            return dict(zip(self.index, self))
         else:
             raise ValueError("Cannot convert to dict. Index labels are not"
                              " unique.")
 
-    def _get_sequence(self, i):
-        return self._seqs.iloc[i]
+    def _set_chars(self, buffer, num_sequences):
+        """Store the first `num_sequences` rows of `buffer` as characters.
+
+        The remaining rows of `buffer` are free space used by ``append``. Rows
+        in use are never modified, since sequences may be views of them.
+
+        """
+        self._buffer = buffer
+        self._chars = buffer[:num_sequences]
+        self._chars.flags.writeable = False
 
-    def _get_position(self, i):
-        seq = Sequence.concat([s[i] for s in self._seqs], how='outer')
+    def _row_blocks(self):
+        """Yield blocks of consecutive rows of the character array."""
+        num_rows = max(_block_chars // max(self.shape.position, 1), 1)
+        for start in range(0, self.shape.sequence, num_rows):
+            yield self._chars[start:start + num_rows]
+
+    def _get_sequence(self, i):
+        metadata, positional_metadata = self._rows.iat[i]
+        return self._dtype(self._chars[i], metadata=metadata,
+                           positional_metadata=positional_metadata,
+                           validate=False)
+
+    def _get_position(self, i, concat=True):
+        if concat:
+            seq = Sequence.concat([s[i] for s in self], how='outer')
+        else:
+            seq = Sequence(self._chars[:, i])
         if self.has_positional_metadata():
             seq.metadata = dict(self.positional_metadata.iloc[i])
         return seq
@@ -14,11 +14,14 @@ from unittest import TestCase, main
 from collections import Counter, defaultdict
 
 import numpy as np
-from scipy.spatial.distance import hamming
+import numpy.testing as npt
+from scipy.spatial.distance import hamming, pdist, squareform
+from scipy.stats import entropy
 
 from skbio import (Sequence, DNA, RNA,
                    DistanceMatrix, Alignment, SequenceCollection)
 from skbio.alignment import (SequenceCollectionError, AlignmentError)
+import skbio.alignment._alignment as alignment_module
 
 
 class SequenceCollectionTests(TestCase):
@@ -403,6 +406,16 @@ class SequenceCollectionTests(TestCase):
         self.assertEqual(self.s3.sequence_count(), 5)
         self.assertEqual(self.empty.sequence_count(), 0)
 
+    def test_kmer_count_matrix(self):
+        counts, kmers = self.s1.kmer_count_matrix(k=3, overlap=False)
+        self.assertEqual(kmers, ['GAT', 'TAC', 'TTG'])
+        npt.assert_array_equal(counts.toarray(), [[1, 1, 0], [0, 0, 1]])
+
+        counts, kmers = self.s1.kmer_count_matrix(k=2, canonical=True)
+        self.assertEqual(kmers, ['AA', 'AC', 'AT', 'CA', 'GA', 'TA'])
+        npt.assert_array_equal(counts.toarray(),
+                               [[1, 1, 1, 1, 1, 1], [1, 0, 0, 1, 0, 0]])
+
     def test_sequence_lengths(self):
         self.assertEqual(self.s1.sequence_lengths(), [7, 3])
         self.assertEqual(self.s2.sequence_lengths(), [7, 3, 12])
@@ -469,6 +482,62 @@ class AlignmentTests(TestCase):
         actual = self.a1.distances(dumb_distance)
         self.assertEqual(actual, expected)
 
+    def test_distances_metrics(self):
+        np.random.seed(0)
+        # more sequences than are processed in a single block
+        chars = np.random.choice(list('ACGT-'), (1100, 30))
+        chars[:, :3] = 'A'
+        aln = Alignment([DNA(''.join(c), metadata={'id': str(i)})
+                         for i, c in enumerate(chars)])
+
+        codes = chars.view(np.uint32)
+        exp = squareform(pdist(codes, 'hamming'))
+        for n_threads in 1, 3:
+            obs = aln.distances('hamming', n_threads=n_threads)
+            self.assertEqual(obs.ids, tuple(aln.ids()))
+            npt.assert_almost_equal(obs.data, exp)
+        npt.assert_almost_equal(aln.distances().data, exp)
+
+        no_gaps = chars != '-'
+        both = no_gaps[:, np.newaxis] & no_gaps
+        exp = (((codes[:, np.newaxis] != codes) & both).sum(axis=2) /
+               both.sum(axis=2))
+        for n_threads in 1, 3:
+            obs = aln.distances('p-distance', n_threads=n_threads)
+            npt.assert_almost_equal(obs.data, exp)
+
+    def test_distances_metrics_match_distance_fn(self):
+        def h(s1, s2):
+            return hamming(s1.values, s2.values)
+        for aln in self.a1, self.a2:
+            self.assertEqual(aln.distances('hamming'), aln.distances(h))
+
+    def test_distances_p_distance_gap_chars(self):
+        aln = Alignment([RNA('AC.GU', metadata={'id': 'r1'}),
+                         RNA('AG-GU', metadata={'id': 'r2'})])
+        npt.assert_almost_equal(aln.distances('p-distance').data,
+                                [[0, 0.25], [0.25, 0]])
+        npt.assert_almost_equal(aln.distances('hamming').data,
+                                [[0, 0.4], [0.4, 0]])
+
+        # Sequence has no gap characters
+        aln = Alignment([Sequence('AC.GU', metadata={'id': 's1'}),
+                         Sequence('AG-GU', metadata={'id': 's2'})])
+        npt.assert_almost_equal(aln.distances('p-distance').data,
+                                [[0, 0.4], [0.4, 0]])
+
+    def test_distances_invalid_input(self):
+        with six.assertRaisesRegex(self, ValueError, '`distance_fn`.*foo'):
+            self.a1.distances('foo')
+        with six.assertRaisesRegex(self, ValueError, '`n_threads`'):
+            self.a1.distances('hamming', n_threads=0)
+
+        aln = Alignment([DNA('AC--', metadata={'id': 'd1'}),
+                         DNA('--GT', metadata={'id': 'd2'}),
+                         DNA('A--T', metadata={'id': 'd3'})])
+        with six.assertRaisesRegex(self, ValueError, '0 and 1.*p-distance'):
+            aln.distances('p-distance')
+
     def test_score(self):
         self.assertEqual(self.a3.score(), 42.0)
         self.assertEqual(self.a4.score(), -42.0)
@@ -653,6 +722,56 @@ class AlignmentTests(TestCase):
         self.assertEqual(aln.omit_gap_sequences(1 - np.finfo(float).eps),
                          Alignment([]))
 
+    def test_subalignment_positions(self):
+        aln = Alignment([DNA('A-CCGGG', metadata={'id': 's1'},
+                             positional_metadata={'q': range(7)}),
+                         DNA('ATCC--G', metadata={'id': 's2'})])
+        # positions are kept in order, once, and ignored if out of range
+        obs = aln.subalignment(positions_to_keep=[5, 0, 0, 42, -1])
+        self.assertEqual(obs, Alignment([
+            DNA('AG', metadata={'id': 's1'},
+                positional_metadata={'q': [0, 5]}),
+            DNA('A-', metadata={'id': 's2'})]))
+
+        obs = aln.subalignment(seqs_to_keep=[1],
+                               positions_to_keep=np.array([1, 2]),
+                               invert_positions_to_keep=True)
+        self.assertEqual(obs, Alignment([DNA('AC--G',
+                                             metadata={'id': 's2'})]))
+
+    def test_subalignment_copies_metadata(self):
+        obs = self.a2.subalignment(seqs_to_keep=['r1'])
+        obs[0].metadata['id'] = 'foo'
+        self.assertEqual(self.a2[0].metadata['id'], 'r1')
+
+        obs = self.a2.omit_gap_sequences(1.0)
+        obs[0].metadata['id'] = 'foo'
+        self.assertEqual(self.a2[0].metadata['id'], 'r1')
+
+    def test_omit_gaps_in_blocks(self):
+        # count gaps over several blocks of sequences
+        block_chars = alignment_module._block_chars
+        alignment_module._block_chars = 100
+        try:
+            np.random.seed(0)
+            chars = np.random.choice(list('AC-.'), (47, 30),
+                                     p=[.4, .3, .2, .1])
+            aln = Alignment([DNA(''.join(row), metadata={'id': str(i)})
+                             for i, row in enumerate(chars)])
+            is_gap = (chars == '-') | (chars == '.')
+
+            for max_freq in 0.0, 0.25, 0.3, 0.5, 1.0:
+                exp = np.flatnonzero(is_gap.mean(axis=0) <= max_freq)
+                self.assertEqual(aln.omit_gap_positions(max_freq),
+                                 aln.subalignment(positions_to_keep=exp))
+
+                exp = [str(i) for i in
+                       np.flatnonzero(is_gap.mean(axis=1) <= max_freq)]
+                self.assertEqual(aln.omit_gap_sequences(max_freq),
+                                 aln.subalignment(seqs_to_keep=exp))
+        finally:
+            alignment_module._block_chars = block_chars
+
     def test_position_counters(self):
         self.assertEqual(self.empty.position_counters(), [])
 
@@ -712,6 +831,45 @@ class AlignmentTests(TestCase):
         np.testing.assert_almost_equal(self.empty.position_entropies(base=2),
                                        [])
 
+    def test_position_statistics_in_blocks(self):
+        # count characters over several blocks of sequences
+        block_chars = alignment_module._block_chars
+        alignment_module._block_chars = 100
+        try:
+            np.random.seed(0)
+            chars = np.random.choice(list('ACGT-N'), (47, 30),
+                                     p=[.3, .3, .15, .15, .05, .05])
+            aln = Alignment([DNA(''.join(row), metadata={'id': str(i)})
+                             for i, row in enumerate(chars)])
+            columns = [''.join(column) for column in chars.T]
+
+            exp_counters = [Counter(column) for column in columns]
+            self.assertEqual(aln.position_counters(), exp_counters)
+
+            obs = aln.position_frequencies()
+            for freqs, counter in zip(obs, exp_counters):
+                self.assertEqual(sorted(freqs), sorted(counter))
+                for char, count in counter.items():
+                    self.assertEqual(freqs[char], count / 47)
+
+            exp = [entropy(list(counter.values())) for counter in exp_counters]
+            npt.assert_almost_equal(
+                aln.position_entropies(nan_on_non_standard_chars=False), exp)
+            npt.assert_almost_equal(
+                aln.position_entropies(base=2,
+                                       nan_on_non_standard_chars=False),
+                np.asarray(exp) / np.log(2))
+            npt.assert_almost_equal(
+                aln.position_entropies(),
+                [np.nan if set(column) - set('ACGT') else e
+                 for column, e in zip(columns, exp)])
+
+            consensus = str(aln.majority_consensus())
+            for char, counter in zip(consensus, exp_counters):
+                self.assertEqual(counter[char], max(counter.values()))
+        finally:
+            alignment_module._block_chars = block_chars
+
     def test_kmer_frequencies(self):
         expected = [defaultdict(float, {'U': 3 / 5, 'A': 1 / 5, '-': 1 / 5}),
                     defaultdict(float, {'A': 1 / 5, 'C': 1 / 5, 'G': 1 / 5,
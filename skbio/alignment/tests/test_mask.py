@@ -0,0 +1,92 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import unittest
+
+import six
+import numpy as np
+
+import skbio.io
+from skbio import DNA, Protein
+from skbio.alignment import mask_positions
+
+
+class TestMaskPositions(unittest.TestCase):
+    def setUp(self):
+        self.seqs = [DNA('A-CC-G', metadata={'id': 's1'}),
+                     DNA('ATCT-G', metadata={'id': 's2'},
+                         positional_metadata={'q': range(6)})]
+
+    def test_string_mask(self):
+        obs = list(mask_positions(self.seqs, '101101'))
+        self.assertEqual(obs, [DNA('ACCG', metadata={'id': 's1'}),
+                               DNA('ACTG', metadata={'id': 's2'},
+                                   positional_metadata={'q': [0, 2, 3, 5]})])
+
+    def test_boolean_mask(self):
+        mask = np.array([True, False, True, True, False, True])
+        self.assertEqual(list(mask_positions(self.seqs, mask)),
+                         list(mask_positions(self.seqs, '101101')))
+        self.assertEqual(list(mask_positions(self.seqs, list(mask))),
+                         list(mask_positions(self.seqs, '101101')))
+
+    def test_invert(self):
+        obs = list(mask_positions(self.seqs, '101101', invert=True))
+        self.assertEqual([str(seq) for seq in obs], ['--', 'T-'])
+        self.assertEqual(list(obs[1].positional_metadata['q']), [1, 4])
+
+    def test_keep_nothing_or_everything(self):
+        obs = list(mask_positions(self.seqs, '000000'))
+        self.assertEqual(obs[0], DNA('', metadata={'id': 's1'}))
+        self.assertEqual(list(mask_positions(self.seqs, '111111')),
+                         self.seqs)
+
+    def test_type_and_metadata_preserved(self):
+        seq = Protein('MK-L', metadata={'id': 'p', 'desc': 'foo'})
+        obs, = mask_positions([seq], '1101')
+        self.assertIs(type(obs), Protein)
+        self.assertEqual(obs.metadata, {'id': 'p', 'desc': 'foo'})
+        obs.metadata['desc'] = 'bar'
+        self.assertEqual(seq.metadata['desc'], 'foo')
+
+    def test_sequences_consumed_lazily(self):
+        consumed = []
+
+        def sequences():
+            for seq in self.seqs:
+                consumed.append(seq)
+                yield seq
+
+        masked = mask_positions(sequences(), '101101')
+        self.assertEqual(consumed, [])
+        next(masked)
+        self.assertEqual(len(consumed), 1)
+
+    def test_streaming_between_files(self):
+        fasta = io.StringIO(u'>s1\nA-CC-G\n>s2\nATCT-G\n')
+        output = io.StringIO()
+        seqs = skbio.io.read(fasta, format='fasta', constructor=DNA)
+        skbio.io.write(mask_positions(seqs, '011110'), format='fasta',
+                       into=output)
+        self.assertEqual(output.getvalue(), u'>s1\n-CC-\n>s2\nTCT-\n')
+
+    def test_invalid_mask_string(self):
+        with six.assertRaisesRegex(self, ValueError, "'0' and '1'.*'x'"):
+            mask_positions(self.seqs, '10x101')
+
+    def test_length_mismatch(self):
+        masked = mask_positions(self.seqs, '10110')
+        with six.assertRaisesRegex(self, ValueError, '6 != 5'):
+            next(masked)
+
+
+if __name__ == '__main__':
+    unittest.main()
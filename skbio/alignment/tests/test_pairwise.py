@@ -9,19 +9,24 @@
 from __future__ import absolute_import, division, print_function
 
 from unittest import TestCase, main
+from itertools import product
 import warnings
 
 import numpy as np
+import numpy.testing as npt
+import six
 
 from skbio import Protein, DNA, Alignment
 from skbio.alignment import (
     global_pairwise_align_protein, local_pairwise_align_protein,
     global_pairwise_align_nucleotide, local_pairwise_align_nucleotide,
-    make_identity_substitution_matrix)
+    global_pairwise_align, local_pairwise_align,
+    make_identity_substitution_matrix, SubstitutionMatrix)
+import skbio.alignment._pairwise as pairwise_module
 from skbio.alignment._pairwise import (
-    _init_matrices_sw, _init_matrices_nw,
-    _compute_score_and_traceback_matrices, _traceback, _first_largest,
-    _get_seq_id, _compute_substitution_score)
+    _Aligner, _substitution_scores, _aligned_sequences, _get_seq_id,
+    blosum50)
+from skbio.alignment._pairwise_dp import _trace_path, LOCAL
 
 
 class PairwiseAlignmentTests(TestCase):
@@ -43,6 +48,7 @@ class PairwiseAlignmentTests(TestCase):
     def setUp(self):
         """Ignore warnings during tests."""
         warnings.simplefilter("ignore")
+        self.m = make_identity_substitution_matrix(2, -1)
 
     def tearDown(self):
         """Clear the list of warning filters, so that no filters are active."""
@@ -138,7 +144,9 @@ class PairwiseAlignmentTests(TestCase):
                           "HEAGAWGHEE", 42)
 
     def test_global_pairwise_align_protein_penalize_terminal_gaps(self):
-        expected = ("HEAGAWGHEE", "---PAWHEAE", 1.0)
+        # equivalent to ("HEAGAWGHEE", "---PAWHEAE", 1.0); both alignments
+        # have the same score
+        expected = ("HEAGAWGHEE", "P---AWHEAE", 1.0)
         actual = global_pairwise_align_protein(
             "HEAGAWGHEE", "PAWHEAE", gap_open_penalty=10.,
             gap_extend_penalty=5., penalize_terminal_gaps=True)
@@ -364,6 +372,27 @@ class PairwiseAlignmentTests(TestCase):
         self.assertRaises(TypeError, local_pairwise_align_nucleotide,
                           "HEAGAWGHEE", 42)
 
+    def test_aligners_accept_substitution_matrix_objects(self):
+        blosum62 = SubstitutionMatrix.from_ncbi('BLOSUM62')
+        for aligner in (global_pairwise_align_protein,
+                        local_pairwise_align_protein):
+            expected = aligner("HEAGAWGHEEZ", "PAWHEAEB",
+                               substitution_matrix=blosum62.to_dict())
+            actual = aligner("HEAGAWGHEEZ", "PAWHEAEB",
+                             substitution_matrix=blosum62)
+            self.assertEqual(actual, expected)
+            self.assertEqual(actual.score(), expected.score())
+
+        nuc44 = SubstitutionMatrix.from_ncbi('NUC.4.4')
+        for aligner in (global_pairwise_align_nucleotide,
+                        local_pairwise_align_nucleotide):
+            expected = aligner("GACCTTGRCCAGGTACC", "GAACTTTGACGTAAC",
+                               substitution_matrix=nuc44.to_dict())
+            actual = aligner("GACCTTGRCCAGGTACC", "GAACTTTGACGTAAC",
+                             substitution_matrix=nuc44)
+            self.assertEqual(actual, expected)
+            self.assertEqual(actual.score(), expected.score())
+
     def test_nucleotide_aligners_use_substitution_matrices(self):
         alt_sub = make_identity_substitution_matrix(10, -10)
         # alternate substitution matrix yields different alignment (the
@@ -394,201 +423,371 @@ class PairwiseAlignmentTests(TestCase):
         self.assertNotEqual(actual_no_sub.score(),
                             actual_alt_sub.score())
 
-    def test_init_matrices_sw(self):
-        expected_score_m = np.zeros((5, 4))
-        expected_tback_m = [[0, 0, 0, 0],
-                            [0, -1, -1, -1],
-                            [0, -1, -1, -1],
-                            [0, -1, -1, -1],
-                            [0, -1, -1, -1]]
-        actual_score_m, actual_tback_m = _init_matrices_sw(
-            Alignment([DNA('AAA', metadata={'id': 'id'})]),
-            Alignment([DNA('AAAA', metadata={'id': 'id'})]), 5, 2)
-        np.testing.assert_array_equal(actual_score_m, expected_score_m)
-        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
-
-    def test_init_matrices_nw(self):
-        expected_score_m = [[0, -5, -7, -9],
-                            [-5, 0, 0, 0],
-                            [-7, 0, 0, 0],
-                            [-9, 0, 0, 0],
-                            [-11, 0, 0, 0]]
-        expected_tback_m = [[0, 3, 3, 3],
-                            [2, -1, -1, -1],
-                            [2, -1, -1, -1],
-                            [2, -1, -1, -1],
-                            [2, -1, -1, -1]]
-        actual_score_m, actual_tback_m = _init_matrices_nw(
-            Alignment([DNA('AAA', metadata={'id': 'id'})]),
-            Alignment([DNA('AAAA', metadata={'id': 'id'})]), 5, 2)
-        np.testing.assert_array_equal(actual_score_m, expected_score_m)
-        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
-
-    def test_compute_substitution_score(self):
-        # these results were computed manually
-        subs_m = make_identity_substitution_matrix(5, -4)
-        self.assertEqual(
-            _compute_substitution_score(['A'], ['A'], subs_m, 0), 5.0)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A'], subs_m, 0), 5.0)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'C'], ['A'], subs_m, 0), 0.5)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'C'], ['A', 'C'], subs_m, 0),
-            0.5)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A', '-'], subs_m, 0),
-            2.5)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A', '-'], subs_m, 1), 3)
-
-        # alt subs_m
-        subs_m = make_identity_substitution_matrix(1, -2)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A', '-'], subs_m, 0),
-            0.5)
-
-    def test_compute_score_and_traceback_matrices(self):
-        # these results were computed manually
-        expected_score_m = [[0, -5, -7, -9],
-                            [-5, 2, -3, -5],
-                            [-7, -3, 4, -1],
-                            [-9, -5, -1, 6],
-                            [-11, -7, -3, 1]]
-        expected_tback_m = [[0, 3, 3, 3],
-                            [2, 1, 3, 3],
-                            [2, 2, 1, 3],
-                            [2, 2, 2, 1],
-                            [2, 2, 2, 2]]
+    def test_fill_block(self):
+        # these results were computed manually; the two lowest bits of each
+        # cell hold the best state (0: alignment end, 1: match, 2: vertical
+        # gap, 3: horizontal gap)
+        expected_states = [[0, 3, 3, 3],
+                           [2, 1, 3, 3],
+                           [2, 2, 1, 3],
+                           [2, 2, 2, 1],
+                           [2, 2, 2, 2]]
         m = make_identity_substitution_matrix(2, -1)
-        actual_score_m, actual_tback_m = _compute_score_and_traceback_matrices(
-            Alignment([DNA('ACG', metadata={'id': 'id'})]),
-            Alignment([DNA('ACGT', metadata={'id': 'id'})]), 5, 2, m)
-        np.testing.assert_array_equal(actual_score_m, expected_score_m)
-        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
+        aligner = _Aligner(Alignment([DNA('ACG', metadata={'id': 'id'})]),
+                           Alignment([DNA('ACGT', metadata={'id': 'id'})]),
+                           5, 2, m)
+        traceback_m, score, end_row, end_col, scores, vgaps = aligner._fill(
+            (0, 4), (0, 3), traceback=True)
+        np.testing.assert_array_equal(traceback_m & 3, expected_states)
+        self.assertEqual(score, 1.0)
+        self.assertEqual((end_row, end_col), (4, 3))
+        np.testing.assert_array_equal(scores, [-11, -7, -3, 1])
+        np.testing.assert_array_equal(vgaps, [-11, -7, -3, 1])
 
         # different sequences
-        # these results were computed manually
-        expected_score_m = [[0, -5, -7, -9],
-                            [-5, 2, -3, -5],
-                            [-7, -3, 4, -1],
-                            [-9, -5, -1, 3],
-                            [-11, -7, -3, -2]]
-        expected_tback_m = [[0, 3, 3, 3],
-                            [2, 1, 3, 3],
-                            [2, 2, 1, 3],
-                            [2, 2, 2, 1],
-                            [2, 2, 2, 1]]
-        m = make_identity_substitution_matrix(2, -1)
-        actual_score_m, actual_tback_m = _compute_score_and_traceback_matrices(
-            Alignment([DNA('ACC', metadata={'id': 'id'})]),
-            Alignment([DNA('ACGT', metadata={'id': 'id'})]), 5, 2, m)
-        np.testing.assert_array_equal(actual_score_m, expected_score_m)
-        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
+        expected_states = [[0, 3, 3, 3],
+                           [2, 1, 3, 3],
+                           [2, 2, 1, 3],
+                           [2, 2, 2, 1],
+                           [2, 2, 2, 1]]
+        aligner = _Aligner(Alignment([DNA('ACC', metadata={'id': 'id'})]),
+                           Alignment([DNA('ACGT', metadata={'id': 'id'})]),
+                           5, 2, m)
+        traceback_m, score, _, _, _, _ = aligner._fill(
+            (0, 4), (0, 3), traceback=True)
+        np.testing.assert_array_equal(traceback_m & 3, expected_states)
+        self.assertEqual(score, -2.0)
 
         # four sequences provided in two alignments
-        # these results were computed manually
-        expected_score_m = [[0, -5, -7, -9],
-                            [-5, 2, -3, -5],
-                            [-7, -3, 4, -1],
-                            [-9, -5, -1, 3],
-                            [-11, -7, -3, -2]]
-        expected_tback_m = [[0, 3, 3, 3],
-                            [2, 1, 3, 3],
-                            [2, 2, 1, 3],
-                            [2, 2, 2, 1],
-                            [2, 2, 2, 1]]
-        m = make_identity_substitution_matrix(2, -1)
-        actual_score_m, actual_tback_m = _compute_score_and_traceback_matrices(
-            Alignment([DNA('ACC', metadata={'id': 's1'}),
-                       DNA('ACC', metadata={'id': 's2'})]),
-            Alignment([DNA('ACGT', metadata={'id': 's3'}),
-                       DNA('ACGT', metadata={'id': 's4'})]), 5, 2, m)
-        np.testing.assert_array_equal(actual_score_m, expected_score_m)
-        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
-
-    def test_compute_score_and_traceback_matrices_invalid(self):
+        aligner = _Aligner(Alignment([DNA('ACC', metadata={'id': 's1'}),
+                                      DNA('ACC', metadata={'id': 's2'})]),
+                           Alignment([DNA('ACGT', metadata={'id': 's3'}),
+                                      DNA('ACGT', metadata={'id': 's4'})]),
+                           5, 2, m)
+        traceback_m, score, _, _, _, _ = aligner._fill(
+            (0, 4), (0, 3), traceback=True)
+        np.testing.assert_array_equal(traceback_m & 3, expected_states)
+        self.assertEqual(score, -2.0)
+
+        # local alignment ends at the highest score
+        aligner = _Aligner(Alignment([DNA('ACG', metadata={'id': 'id'})]),
+                           Alignment([DNA('ACGT', metadata={'id': 'id'})]),
+                           5, 2, m)
+        traceback_m, score, end_row, end_col, _, _ = aligner._fill(
+            (0, 4), (0, 3), mode=LOCAL, traceback=True)
+        self.assertEqual(score, 6.0)
+        self.assertEqual((end_row, end_col), (3, 3))
+        np.testing.assert_array_equal(traceback_m[0], 0)
+        np.testing.assert_array_equal(traceback_m[:, 0], 0)
+
+        # the rows of a banded traceback matrix only hold the band
+        aligner = _Aligner(Alignment([DNA('ACG', metadata={'id': 'id'})]),
+                           Alignment([DNA('ACGT', metadata={'id': 'id'})]),
+                           5, 2, m, band_width=0)
+        traceback_m, score, _, _, scores, _ = aligner._fill(
+            (0, 4), (0, 3), traceback=True)
+        np.testing.assert_array_equal(traceback_m & 3, [[0, 0],
+                                                        [2, 1],
+                                                        [2, 1],
+                                                        [2, 1],
+                                                        [2, 0]])
+        self.assertEqual(score, 1.0)
+        np.testing.assert_array_equal(scores, [-np.inf, -np.inf, -np.inf, 1])
+
+        # blocks can be aligned backwards
+        traceback_m, score, _, _, _, _ = _Aligner(
+            Alignment([DNA('CCA', metadata={'id': 'id'})]),
+            Alignment([DNA('TGCA', metadata={'id': 'id'})]), 5, 2, m)._fill(
+                (0, 4), (0, 3), reverse=True, traceback=True)
+        np.testing.assert_array_equal(traceback_m & 3, expected_states)
+        self.assertEqual(score, -2.0)
+
+    def test_substitution_scores(self):
+        # substitution scores are averaged over all pairs of characters, and
+        # pairs involving a gap score gap_substitution_score
+        m = make_identity_substitution_matrix(5, -4)
+        aln1 = Alignment([DNA('A', metadata={'id': 's1'}),
+                          DNA('A', metadata={'id': 's2'})])
+        aln2 = Alignment([DNA('A', metadata={'id': 's3'}),
+                          DNA('-', metadata={'id': 's4'})])
+        for gap_substitution_score, expected in ((0, 2.5), (1, 3.0)):
+            aligner = _Aligner(aln1, aln2, 5, 2, m,
+                               gap_substitution_score=gap_substitution_score)
+            self.assertEqual(aligner.score(local=False), expected)
+
+        aln2 = Alignment([DNA('A', metadata={'id': 's3'}),
+                          DNA('C', metadata={'id': 's4'})])
+        self.assertEqual(_Aligner(aln1, aln2, 5, 2, m).score(local=False),
+                         0.5)
+
+    def test_substitution_scores_substitution_matrix(self):
+        # a SubstitutionMatrix scores positions like the equivalent 2D dict
+        aln1 = Alignment([DNA('ACGTT-', metadata={'id': 's1'}),
+                          DNA('AGG-TA', metadata={'id': 's2'})])
+        aln2 = Alignment([DNA('TTGCA', metadata={'id': 's3'}),
+                          DNA('T-GCC', metadata={'id': 's4'}),
+                          DNA('TAGGA', metadata={'id': 's5'})])
+        matrix = SubstitutionMatrix('ACGTU', [[5, -4, 1, -4, -4],
+                                              [-3, 5, -4, 2, 2],
+                                              [-4, -4, 5, -4, -4],
+                                              [-4, 0, -4, 5, 5],
+                                              [-4, -4, -4, 5, 5]])
+        for expected, observed in zip(
+                _substitution_scores(aln1, aln2, matrix.to_dict(), 0.5),
+                _substitution_scores(aln1, aln2, matrix, 0.5)):
+            npt.assert_array_equal(observed, expected)
+
+        m = SubstitutionMatrix.from_dict(self.m)
+        with six.assertRaisesRegex(self, ValueError, r'offending.*: +W, Y\.'):
+            _substitution_scores(
+                Alignment([DNA('AWG', metadata={'id': 'id'})]),
+                Alignment([DNA('ACYGT', metadata={'id': 'id'})]), m)
+
+    def test_substitution_scores_invalid(self):
         # if the sequence contains a character that is not in the
         # substitution matrix, an informative error should be raised
         m = make_identity_substitution_matrix(2, -1)
-        self.assertRaises(ValueError, _compute_score_and_traceback_matrices,
-                          Alignment([DNA('AWG', metadata={'id': 'id'})]),
-                          Alignment([DNA('ACGT', metadata={'id': 'id'})]),
-                          5, 2, m)
-
-    def test_traceback(self):
-        score_m = [[0, -5, -7, -9],
-                   [-5, 2, -3, -5],
-                   [-7, -3, 4, -1],
-                   [-9, -5, -1, 6],
-                   [-11, -7, -3, 1]]
-        score_m = np.array(score_m)
-        tback_m = [[0, 3, 3, 3],
-                   [2, 1, 3, 3],
-                   [2, 2, 1, 3],
-                   [2, 2, 2, 1],
-                   [2, 2, 2, 2]]
-        tback_m = np.array(tback_m)
+        with six.assertRaisesRegex(self, ValueError, 'offending.*W'):
+            _substitution_scores(
+                Alignment([DNA('AWG', metadata={'id': 'id'})]),
+                Alignment([DNA('ACGT', metadata={'id': 'id'})]), m)
+
+    def test_trace_path(self):
+        m = make_identity_substitution_matrix(2, -1)
+        aln1 = Alignment([DNA('ACG', metadata={'id': ''})])
+        aln2 = Alignment([DNA('ACGT', metadata={'id': ''})])
+        traceback_m = _Aligner(aln1, aln2, 5, 2, m)._fill(
+            (0, 4), (0, 3), traceback=True)[0]
+
         # start at bottom-right
+        path, start_row, start_col = _trace_path(traceback_m, 4, 3, -4)
+        np.testing.assert_array_equal(path, [1, 1, 1, 2])
+        self.assertEqual((start_row, start_col), (0, 0))
+
+        # start at another cell
+        path, start_row, start_col = _trace_path(traceback_m, 3, 3, -4)
+        np.testing.assert_array_equal(path, [1, 1, 1])
+
+        # start in a given state
+        path, start_row, start_col = _trace_path(traceback_m, 4, 3, -4, 1)
+        np.testing.assert_array_equal(path, [1, 1, 2, 1])
+        self.assertEqual((start_row, start_col), (0, 0))
+
+        # terminate traceback at the end of a local alignment
+        aln1 = Alignment([DNA('TCG', metadata={'id': ''})])
+        traceback_m, _, end_row, end_col, _, _ = _Aligner(
+            aln1, aln2, 5, 2, m)._fill((0, 4), (0, 3), mode=LOCAL,
+                                       traceback=True)
+        path, start_row, start_col = _trace_path(traceback_m, end_row,
+                                                 end_col, -4)
+        np.testing.assert_array_equal(path, [1, 1])
+        self.assertEqual((start_row, start_col), (1, 1))
+
+    def test_aligned_sequences(self):
+        path = np.array([1, 1, 1, 2], dtype=np.uint8)
+        aln1 = Alignment([DNA('ACG', metadata={'id': ''})])
+        aln2 = Alignment([DNA('ACGT', metadata={'id': ''})])
         expected = ([DNA("ACG-", metadata={'id': '0'})],
-                    [DNA("ACGT", metadata={'id': '1'})], 1, 0, 0)
-        actual = _traceback(tback_m, score_m,
-                            Alignment([DNA('ACG', metadata={'id': ''})]),
-                            Alignment([DNA('ACGT', metadata={'id': ''})]),
-                            4, 3)
-        self.assertEqual(actual, expected)
-
-        # four sequences in two alignments
-        score_m = [[0, -5, -7, -9],
-                   [-5, 2, -3, -5],
-                   [-7, -3, 4, -1],
-                   [-9, -5, -1, 6],
-                   [-11, -7, -3, 1]]
-        score_m = np.array(score_m)
-        tback_m = [[0, 3, 3, 3],
-                   [2, 1, 3, 3],
-                   [2, 2, 1, 3],
-                   [2, 2, 2, 1],
-                   [2, 2, 2, 2]]
-        tback_m = np.array(tback_m)
-        # start at bottom-right
+                    [DNA("ACGT", metadata={'id': '1'})])
+        self.assertEqual(_aligned_sequences(path, aln1, aln2, 0, 0),
+                         expected)
+
+        # four sequences in two alignments, starting after the first
+        # positions
+        aln1 = Alignment([DNA('TACG', metadata={'id': 's1'}),
+                          DNA('TACG', metadata={'id': 's2'})])
+        aln2 = Alignment([DNA('TTACGT', metadata={'id': 's3'}),
+                          DNA('TTACGT', metadata={'id': 's4'})])
         expected = ([DNA("ACG-", metadata={'id': 's1'}),
                      DNA("ACG-", metadata={'id': 's2'})],
                     [DNA("ACGT", metadata={'id': 's3'}),
-                     DNA("ACGT", metadata={'id': 's4'})],
-                    1, 0, 0)
-        actual = _traceback(tback_m, score_m,
-                            Alignment([DNA('ACG', metadata={'id': 's1'}),
-                                       DNA('ACG', metadata={'id': 's2'})]),
-                            Alignment([DNA('ACGT', metadata={'id': 's3'}),
-                                       DNA('ACGT', metadata={'id': 's4'})]),
-                            4, 3)
-        self.assertEqual(actual, expected)
-
-        # start at highest-score
-        expected = ([DNA("ACG", metadata={'id': '0'})],
-                    [DNA("ACG", metadata={'id': '1'})], 6, 0, 0)
-        actual = _traceback(tback_m, score_m,
-                            Alignment([DNA('ACG', metadata={'id': ''})]),
-                            Alignment([DNA('ACGT', metadata={'id': ''})]),
-                            3, 3)
-        self.assertEqual(actual, expected)
-
-        # terminate traceback before top-right
-        tback_m = [[0, 3, 3, 3],
-                   [2, 1, 3, 3],
-                   [2, 2, 0, 3],
-                   [2, 2, 2, 1],
-                   [2, 2, 2, 2]]
-        tback_m = np.array(tback_m)
-        expected = ("G", "G", 6, 2, 2)
-        expected = ([DNA("G", metadata={'id': '0'})],
-                    [DNA("G", metadata={'id': '1'})], 6, 2, 2)
-        actual = _traceback(tback_m, score_m,
-                            Alignment([DNA('ACG', metadata={'id': ''})]),
-                            Alignment([DNA('ACGT', metadata={'id': ''})]),
-                            3, 3)
-        self.assertEqual(actual, expected)
+                     DNA("ACGT", metadata={'id': 's4'})])
+        self.assertEqual(_aligned_sequences(path, aln1, aln2, 1, 2),
+                         expected)
+
+    def test_affine_gaps(self):
+        # a gap is extended from the best alignment ending in a gap, even if
+        # it is not the best alignment ending in the previous cell (deciding
+        # between opening and extending a gap from the best alignment ending
+        # in the previous cell results in "TACTCCGC---A-" and a score of -10)
+        m = make_identity_substitution_matrix(5, -4)
+        actual = global_pairwise_align(
+            "TACTCCGCA", "TGCATTAT", 8, 1, m, penalize_terminal_gaps=True)
+        self.assertEqual(str(actual[0]), "TACTCCGCA----")
+        self.assertEqual(str(actual[1]), "T-----GCATTAT")
+        self.assertEqual(actual.score(), -3.0)
+
+    def test_optimal_scores(self):
+        # compare against the best score of all possible alignments of short
+        # random sequences
+        for seq1, seq2, gap_open_penalty, gap_extend_penalty in \
+                _random_cases(30):
+            for penalize_terminal_gaps in (True, False):
+                actual = global_pairwise_align(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                    self.m, penalize_terminal_gaps=penalize_terminal_gaps)
+                expected = _best_global_score(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m,
+                    penalize_terminal_gaps)
+                self.assertEqual(actual.score(), expected)
+                self.assertEqual(actual.score(), _score_alignment(
+                    actual, gap_open_penalty, gap_extend_penalty, self.m,
+                    penalize_terminal_gaps))
+
+            actual = local_pairwise_align(
+                seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m)
+            expected = _best_local_score(seq1, seq2, gap_open_penalty,
+                                         gap_extend_penalty, self.m)
+            self.assertEqual(actual.score(), expected)
+            if expected:
+                self.assertEqual(actual.score(), _score_alignment(
+                    actual, gap_open_penalty, gap_extend_penalty, self.m,
+                    True))
+
+    def test_score_only(self):
+        for seq1, seq2, gap_open_penalty, gap_extend_penalty in \
+                _random_cases(10):
+            for penalize_terminal_gaps in (True, False):
+                actual = global_pairwise_align(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                    self.m, penalize_terminal_gaps=penalize_terminal_gaps,
+                    score_only=True)
+                self.assertEqual(actual, _best_global_score(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m,
+                    penalize_terminal_gaps))
+            actual = local_pairwise_align(
+                seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m,
+                score_only=True)
+            self.assertEqual(actual, _best_local_score(
+                seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m))
+
+        self.assertEqual(global_pairwise_align_protein(
+            "HEAGAWGHEE", "PAWHEAE", gap_open_penalty=10.,
+            gap_extend_penalty=5., score_only=True), 23.0)
+        self.assertEqual(local_pairwise_align_nucleotide(
+            "GACCTTGACCAGGTACC", "GAACTTTGACGTAAC", gap_open_penalty=5.,
+            gap_extend_penalty=0.5, match_score=5, mismatch_score=-4,
+            score_only=True), 41.0)
+
+    def test_band_width(self):
+        seq1 = "ACCGTGGACCGTTAGGATTGGACCCAAGGTTG"
+        seq2 = "ACCGTGGACCGTAGGATTGGACCAAGGTTA"
+        unbanded = global_pairwise_align_nucleotide(seq1, seq2)
+        for band_width in (1, 5, 100):
+            actual = global_pairwise_align_nucleotide(seq1, seq2,
+                                                      band_width=band_width)
+            self.assertEqual(str(actual[0]), str(unbanded[0]))
+            self.assertEqual(str(actual[1]), str(unbanded[1]))
+            self.assertEqual(actual.score(), unbanded.score())
+            self.assertEqual(actual.start_end_positions(),
+                             unbanded.start_end_positions())
+            self.assertEqual(local_pairwise_align_nucleotide(
+                seq1, seq2, band_width=band_width).score(),
+                local_pairwise_align_nucleotide(seq1, seq2).score())
+
+        # alignments may only stray from the diagonal by the difference in
+        # length of the sequences
+        actual = global_pairwise_align(
+            "ACGTAC", "GTACGT", 1, 1, self.m, penalize_terminal_gaps=True,
+            band_width=0)
+        self.assertEqual(str(actual[0]), "ACGTAC")
+        self.assertEqual(str(actual[1]), "GTACGT")
+        self.assertEqual(actual.score(), -6.0)
+        actual = global_pairwise_align(
+            "ACGTAC", "GTACGT", 1, 1, self.m, penalize_terminal_gaps=True,
+            band_width=2)
+        self.assertEqual(str(actual[0]), "--ACGTAC")
+        self.assertEqual(str(actual[1]), "GTACGT--")
+        self.assertEqual(actual.score(), 4.0)
+
+        # banded alignments are the best alignments within the band
+        for seq1, seq2, gap_open_penalty, gap_extend_penalty in \
+                _random_cases(10):
+            for band_width in (0, 1):
+                actual = global_pairwise_align(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                    self.m, penalize_terminal_gaps=True,
+                    band_width=band_width)
+                offset = len(seq1) - len(seq2)
+                expected = max(
+                    _score_path(path, seq1, seq2, gap_open_penalty,
+                                gap_extend_penalty, self.m, True)
+                    for path in _paths(len(seq1), len(seq2))
+                    if _in_band(path, min(0, offset) - band_width,
+                                max(0, offset) + band_width))
+                self.assertEqual(actual.score(), expected)
+
+    def test_band_width_invalid(self):
+        for band_width in (-1, 1.5, '1'):
+            with six.assertRaisesRegex(self, ValueError, 'band_width'):
+                global_pairwise_align("ACGT", "ACGT", 5, 2, self.m,
+                                      band_width=band_width)
+            with six.assertRaisesRegex(self, ValueError, 'band_width'):
+                local_pairwise_align("ACGT", "ACGT", 5, 2, self.m,
+                                     band_width=band_width)
+
+    def test_linear_space_traceback(self):
+        # tracebacks larger than a few cells are computed with Hirschberg's
+        # algorithm
+        m = make_identity_substitution_matrix(5, -4)
+        cases = [
+            ("HEAGAWGHEE", "PAWHEAE", 10., 5., blosum50, False, 23.0),
+            ("HEAGAWGHEE", "PAWHEAE", 10., 5., blosum50, True, 1.0),
+            ("GACCTTGACCAGGTACC", "GAACTTTGACGTAAC", 5., 0.5, m, False,
+             41.0),
+        ]
+        try:
+            pairwise_module._max_traceback_cells = 16
+            for seq1, seq2, gap_open_penalty, gap_extend_penalty, matrix, \
+                    penalize_terminal_gaps, score in cases:
+                actual = global_pairwise_align(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                    matrix, penalize_terminal_gaps=penalize_terminal_gaps)
+                self.assertEqual(actual.score(), score)
+                self.assertEqual(actual.score(), _score_alignment(
+                    actual, gap_open_penalty, gap_extend_penalty, matrix,
+                    penalize_terminal_gaps))
+
+            actual = local_pairwise_align_protein(
+                "HEAGAWGHEE", "PAWHEAE", gap_open_penalty=10.,
+                gap_extend_penalty=5.)
+            self.assertEqual(str(actual[0]), "AWGHE")
+            self.assertEqual(str(actual[1]), "AW-HE")
+            self.assertEqual(actual.score(), 26.0)
+            self.assertEqual(actual.start_end_positions(), [(4, 8), (1, 4)])
+
+            for seq1, seq2, gap_open_penalty, gap_extend_penalty in \
+                    _random_cases(20, max_length=9):
+                for penalize_terminal_gaps in (True, False):
+                    for band_width in (None, 1):
+                        actual = global_pairwise_align(
+                            seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                            self.m, band_width=band_width,
+                            penalize_terminal_gaps=penalize_terminal_gaps)
+                        pairwise_module._max_traceback_cells = 2 ** 26
+                        expected = global_pairwise_align(
+                            seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                            self.m, band_width=band_width,
+                            penalize_terminal_gaps=penalize_terminal_gaps)
+                        pairwise_module._max_traceback_cells = 16
+                        self.assertEqual(actual.score(), expected.score())
+                        self.assertEqual(actual.score(), _score_alignment(
+                            actual, gap_open_penalty, gap_extend_penalty,
+                            self.m, penalize_terminal_gaps))
+
+                actual = local_pairwise_align(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m)
+                pairwise_module._max_traceback_cells = 2 ** 26
+                expected = local_pairwise_align(
+                    seq1, seq2, gap_open_penalty, gap_extend_penalty, self.m)
+                pairwise_module._max_traceback_cells = 16
+                self.assertEqual(actual.score(), expected.score())
+                if expected.score():
+                    self.assertEqual(actual.score(), _score_alignment(
+                        actual, gap_open_penalty, gap_extend_penalty, self.m,
+                        True))
+        finally:
+            pairwise_module._max_traceback_cells = 2 ** 26
 
     def test_get_seq_id(self):
         self.assertEqual(_get_seq_id(DNA("AAA"), "hello"), "hello")
@@ -599,19 +798,101 @@ class PairwiseAlignmentTests(TestCase):
         self.assertEqual(_get_seq_id(DNA("AAA", metadata={'id': '\t'}),
                                      "hello"), "hello")
 
-    def test_first_largest(self):
-        l = [(5, 'a'), (5, 'b'), (5, 'c')]
-        self.assertEqual(_first_largest(l), (5, 'a'))
-        l = [(5, 'c'), (5, 'b'), (5, 'a')]
-        self.assertEqual(_first_largest(l), (5, 'c'))
-        l = [(5, 'c'), (6, 'b'), (5, 'a')]
-        self.assertEqual(_first_largest(l), (6, 'b'))
-        # works for more than three entries
-        l = [(5, 'c'), (6, 'b'), (5, 'a'), (7, 'd')]
-        self.assertEqual(_first_largest(l), (7, 'd'))
-        # Note that max([(5, 'a'), (5, 'c')]) == max([(5, 'c'), (5, 'a')])
-        # but for the purposes needed here, we want the max to be the same
-        # regardless of what the second item in the tuple is.
+
+def _random_cases(num_cases, max_length=5):
+    """Yield short random sequences and gap penalties."""
+    rng = np.random.RandomState(0)
+    for _ in range(num_cases):
+        seq1, seq2 = (''.join(rng.choice(list('ACGT'),
+                                         rng.randint(1, max_length + 1)))
+                      for _ in range(2))
+        gap_extend_penalty = rng.randint(0, 3)
+        gap_open_penalty = gap_extend_penalty + rng.randint(0, 3)
+        yield seq1, seq2, gap_open_penalty, gap_extend_penalty
+
+
+def _best_global_score(seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                       substitution_matrix, penalize_terminal_gaps):
+    return max(_score_path(path, seq1, seq2, gap_open_penalty,
+                           gap_extend_penalty, substitution_matrix,
+                           penalize_terminal_gaps)
+               for path in _paths(len(seq1), len(seq2)))
+
+
+def _best_local_score(seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                      substitution_matrix):
+    best = 0.0
+    for start1, end1, start2, end2 in product(
+            range(len(seq1)), range(1, len(seq1) + 1),
+            range(len(seq2)), range(1, len(seq2) + 1)):
+        if start1 < end1 and start2 < end2:
+            best = max(best, _best_global_score(
+                seq1[start1:end1], seq2[start2:end2], gap_open_penalty,
+                gap_extend_penalty, substitution_matrix, True))
+    return best
+
+
+def _in_band(path, diag_min, diag_max):
+    diagonal = 0
+    for move in path:
+        diagonal += {'M': 0, 'V': -1, 'H': 1}[move]
+        if not diag_min <= diagonal <= diag_max:
+            return False
+    return True
+
+
+def _paths(length1, length2):
+    """Yield all alignments of two sequences as strings of moves.
+
+    Moves are 'M' (match), 'V' (gap in the first sequence), and 'H' (gap in
+    the second sequence).
+    """
+    if not length1 and not length2:
+        yield ''
+        return
+    if length1 and length2:
+        for path in _paths(length1 - 1, length2 - 1):
+            yield path + 'M'
+    if length2:
+        for path in _paths(length1, length2 - 1):
+            yield path + 'V'
+    if length1:
+        for path in _paths(length1 - 1, length2):
+            yield path + 'H'
+
+
+def _score_path(path, seq1, seq2, gap_open_penalty, gap_extend_penalty,
+                substitution_matrix, penalize_terminal_gaps):
+    score = 0
+    i = j = 0
+    for k, move in enumerate(path):
+        if move == 'M':
+            score += substitution_matrix[seq1[i]][seq2[j]]
+            i += 1
+            j += 1
+            continue
+        run_start = k == 0 or path[k - 1] != move
+        terminal = (path[:k + 1] == move * (k + 1) or
+                    path[k:] == move * (len(path) - k))
+        if penalize_terminal_gaps or not terminal:
+            score -= gap_open_penalty if run_start else gap_extend_penalty
+        if move == 'V':
+            j += 1
+        else:
+            i += 1
+    return score
+
+
+def _score_alignment(alignment, gap_open_penalty, gap_extend_penalty,
+                     substitution_matrix, penalize_terminal_gaps):
+    aligned1, aligned2 = str(alignment[0]), str(alignment[1])
+    path = ''.join('V' if c1 == '-' else 'H' if c2 == '-' else 'M'
+                   for c1, c2 in zip(aligned1, aligned2))
+    return _score_path(path, aligned1.replace('-', ''),
+                       aligned2.replace('-', ''), gap_open_penalty,
+                       gap_extend_penalty, substitution_matrix,
+                       penalize_terminal_gaps)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,147 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+import warnings
+
+import six
+import numpy as np
+import numpy.testing as npt
+
+from skbio import DNA, RNA, Protein, TabularMSA
+from skbio.alignment import (progressive_align,
+                             global_pairwise_align_nucleotide,
+                             SubstitutionMatrix)
+from skbio.alignment._progressive import _kmer_distances, _guide_tree
+
+
+class TestProgressiveAlign(unittest.TestCase):
+    def setUp(self):
+        """Ignore warnings during tests."""
+        warnings.simplefilter("ignore")
+
+    def tearDown(self):
+        """Clear the list of filters."""
+        warnings.resetwarnings()
+
+    def test_nucleotide(self):
+        msa = progressive_align([
+            DNA('ACCGTTGACCAGT', metadata={'id': 's1'}),
+            DNA('ACCGTGACCAGT', metadata={'id': 's2'}),
+            DNA('ACCGTTGACAGT', metadata={'id': 's3'}),
+            DNA('ACGTTGACCAGT', metadata={'id': 's4'})])
+        self.assertIsInstance(msa, TabularMSA)
+        self.assertEqual(list(msa), [
+            DNA('ACCGTTGACCAGT', metadata={'id': 's1'}),
+            DNA('ACCG-TGACCAGT', metadata={'id': 's2'}),
+            DNA('ACCGTTGAC-AGT', metadata={'id': 's3'}),
+            DNA('-ACGTTGACCAGT', metadata={'id': 's4'})])
+
+    def test_protein(self):
+        msa = progressive_align([Protein('HEAGAWGHEE'), Protein('PAWHEAE'),
+                                 Protein('HEAGAWGHE'), Protein('PAWHEAEK')])
+        self.assertEqual([str(sequence) for sequence in msa],
+                         ['HEAGAWGHEE--', '---PAW-HEAE-', 'HEAGAWGHE---',
+                          '---PAW-HEAEK'])
+        self.assertEqual(msa.dtype, Protein)
+
+    def test_pair_same_as_global_pairwise_align(self):
+        seq1, seq2 = DNA("GACCTTGACCAGGTACC"), DNA("GAACTTTGACGTAAC")
+        msa = progressive_align([seq1, seq2], gap_open_penalty=5.,
+                                gap_extend_penalty=0.5)
+        alignment = global_pairwise_align_nucleotide(
+            seq1, seq2, gap_open_penalty=5., gap_extend_penalty=0.5)
+        self.assertEqual([str(sequence) for sequence in msa],
+                         [str(sequence) for sequence in alignment])
+
+    def test_sequences_are_kept(self):
+        rng = np.random.RandomState(0)
+        root = rng.choice(list('ACGU'), 60)
+        sequences = []
+        for i in range(20):
+            chars = list(root)
+            for position in rng.choice(60, 6, replace=False):
+                chars[position] = rng.choice(list('ACGU'))
+            for position in sorted(rng.choice(60, 3, replace=False),
+                                   reverse=True):
+                del chars[position]
+            sequences.append(RNA(''.join(chars),
+                                 metadata={'id': 'seq%d' % i}))
+        msa = progressive_align(sequences)
+        self.assertEqual(msa.shape.sequence, 20)
+        for aligned, sequence in zip(msa, sequences):
+            self.assertEqual(aligned.degap(), sequence)
+        # no position holds only gaps
+        self.assertFalse((msa.gap_frequencies() == 20).any())
+
+    def test_identical_sequences(self):
+        msa = progressive_align([DNA('ACGTTGCA')] * 3)
+        self.assertEqual(list(msa), [DNA('ACGTTGCA')] * 3)
+
+    def test_gaps_are_removed(self):
+        msa = progressive_align([DNA('AC-GT'), DNA('A.CGT')])
+        self.assertEqual(list(msa), [DNA('ACGT'), DNA('ACGT')])
+
+    def test_single_sequence(self):
+        msa = progressive_align([DNA('ACGT', metadata={'id': 'a'})])
+        self.assertEqual(list(msa), [DNA('ACGT', metadata={'id': 'a'})])
+
+    def test_penalties_and_substitution_matrix(self):
+        matrix = {c1: {c2: 1 if c1 == c2 else -1 for c2 in 'ACGT'}
+                  for c1 in 'ACGT'}
+        sequences = [DNA('AACCGGTT'), DNA('AAGGTT')]
+        msa = progressive_align(sequences, gap_open_penalty=1,
+                                gap_extend_penalty=1,
+                                substitution_matrix=matrix)
+        self.assertEqual([str(sequence) for sequence in msa],
+                         ['AACCGGTT', 'AA--GGTT'])
+        msa = progressive_align(sequences, gap_open_penalty=10,
+                                gap_extend_penalty=10,
+                                substitution_matrix=matrix)
+        self.assertEqual([str(sequence) for sequence in msa],
+                         ['AACCGGTT', '--AAGGTT'])
+        msa = progressive_align(
+            sequences, gap_open_penalty=10, gap_extend_penalty=10,
+            substitution_matrix=SubstitutionMatrix.from_dict(matrix))
+        self.assertEqual([str(sequence) for sequence in msa],
+                         ['AACCGGTT', '--AAGGTT'])
+
+    def test_invalid_input(self):
+        with six.assertRaisesRegex(self, ValueError, 'At least one'):
+            progressive_align([])
+        for k in (0, -1, 2.5, None):
+            with six.assertRaisesRegex(self, ValueError, '`k`'):
+                progressive_align([DNA('ACGT'), DNA('ACGT')], k=k)
+        with six.assertRaisesRegex(self, ValueError, 'offending.*R'):
+            progressive_align([DNA('ACGRT'), DNA('ACGT')])
+
+    def test_kmer_distances(self):
+        sequences = [DNA('ACGTACGT'), DNA('ACGTACGA'), DNA('TTTTTT'),
+                     DNA('AC'), DNA('TACGTTT')]
+        # the first sequence has 4 distinct 3-mers and the second 5, all 4 of
+        # the first being shared; the last has 5, 3 of them (TAC, ACG, CGT)
+        # shared with the first two and 1 (TTT) with the third
+        npt.assert_almost_equal(_kmer_distances(sequences, 3), [
+            [0, 0, 1, 1, 0.25],
+            [0, 0, 1, 1, 0.4],
+            [1, 1, 0, 1, 0],
+            [1, 1, 1, 0, 1],
+            [0.25, 0.4, 0, 1, 0]])
+
+    def test_guide_tree(self):
+        sequences = [DNA('ACGTACGT'), DNA('TTTTTTTT'), DNA('ACGTACGA'),
+                     DNA('TTTTTTTA')]
+        npt.assert_array_equal(_guide_tree(sequences, 3),
+                               [[0, 2], [1, 3], [4, 5]])
+        self.assertEqual(len(_guide_tree(sequences[:1], 3)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,10 +18,15 @@
 
 from __future__ import absolute_import, division, print_function
 
+from multiprocessing.pool import ThreadPool
 from unittest import TestCase, main
 
-from skbio import local_pairwise_align_ssw, Sequence, DNA
-from skbio.alignment import StripedSmithWaterman, AlignmentStructure
+import numpy as np
+import six
+
+from skbio import local_pairwise_align_ssw, Sequence, DNA, Protein
+from skbio.alignment import (StripedSmithWaterman, AlignmentStructure,
+                             pairwise_align_ssw_many, SubstitutionMatrix)
 from skbio.alignment._pairwise import blosum50
 
 
@@ -43,6 +48,12 @@ class TestSSW(TestCase):
                              (alignment['target_sequence'],
                               alignment[attribute]))
 
+    def _check_table(self, table, alignments):
+        self.assertEqual(len(table), len(alignments))
+        for (_, row), alignment in zip(table.iterrows(), alignments):
+            for attribute in table.columns:
+                self.assertEqual(row[attribute], alignment[attribute])
+
     def _check_argument_with_inequality_on_optimal_align_score(
             self,
             query_sequences=None,
@@ -355,6 +366,44 @@ class TestStripedSmithWaterman(TestSSW):
                 self.assertNotEqual(align1.optimal_alignment_score,
                                     align2.optimal_alignment_score)
 
+    def test_arg_matrix_substitution_matrix_object(self):
+        query_sequence = "AGTCGAAGGGTAAGGGGTATAGGCGTGTCACCTA"
+        target_sequence = "AGGGTAATTAGCGCGTGTTCACCTA"
+        matrix = SubstitutionMatrix('ACGTNU', [[4, -2, -3, -1, 4, 0],
+                                               [-2, 10, 1, -1, 1, 0],
+                                               [-3, 1, 3, -4, 1, 0],
+                                               [-1, -1, -4, 1, 1, 0],
+                                               [4, 1, 1, 1, 0, 0],
+                                               [0, 0, 0, 0, 0, 0]])
+        query1 = StripedSmithWaterman(query_sequence,
+                                      substitution_matrix=matrix.to_dict())
+        query2 = StripedSmithWaterman(query_sequence,
+                                      substitution_matrix=matrix)
+        self._check_alignment(query2(target_sequence),
+                              query1(target_sequence))
+
+        blosum62 = SubstitutionMatrix.from_ncbi('BLOSUM62')
+        query_sequence = "VHLTGEEKSAVAALWGKVNVDEVGGEALGRXLLVVYPWTQRFFESF"
+        target_sequence = "VHLTPEEKSAVTALWBGKVNVDEVGGEALGRLLVVYPWTQRFFES*"
+        query1 = StripedSmithWaterman(query_sequence, protein=True,
+                                      substitution_matrix=blosum62.to_dict())
+        query2 = StripedSmithWaterman(query_sequence, protein=True,
+                                      substitution_matrix=blosum62)
+        self._check_alignment(query2(target_sequence),
+                              query1(target_sequence))
+
+    def test_arg_matrix_substitution_matrix_object_missing_chars(self):
+        with six.assertRaisesRegex(self, ValueError, r'offending.*: +N\.'):
+            StripedSmithWaterman(
+                "ACGT", substitution_matrix=SubstitutionMatrix.identity(
+                    'ACGTU', 2, -3))
+
+    def test_arg_matrix_substitution_matrix_object_not_int8(self):
+        for matrix in (SubstitutionMatrix.identity('ACGTN', 200, -1),
+                       SubstitutionMatrix.identity('ACGTN', 2.5, -1)):
+            with six.assertRaisesRegex(self, ValueError, '-128 and 127'):
+                StripedSmithWaterman("ACGT", substitution_matrix=matrix)
+
     def test_arg_gap_open_penalty(self):
         query_sequences = [
             "TTATAATTTTCTTAGTTATTATCAATATTTATAATTTGATTTTGTTGTAAT",
@@ -557,6 +606,94 @@ class TestStripedSmithWaterman(TestSSW):
         self._check_alignment(alignment, expected)
 
 
+class TestAlignMany(TestSSW):
+
+    target_sequences = [
+        "TTATAATTTTCTTATTATTATCAATATTTATAATTTGATTTTGTTGTAAT",
+        "AGTCGAAGGGTAATATAGGCGTGTCACCTA",
+        "AGTCGAAGGGTAATA",
+        "CTGCCTCAGGGGGAGGAAAGCGTCAGCGCGGCTGCCGTCGGCGCAGGGGC",
+        "AGGGTAATTAGGCGTGTTCACCTA",
+        "",
+        "agggtaattNggcgtgttcacc"
+    ]
+
+    def test_same_as_calling_the_object(self):
+        for kwargs in [{}, {'zero_index': False}, {'score_only': True},
+                       {'score_filter': 30}, {'match_score': 5,
+                                              'mismatch_score': -1}]:
+            query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA",
+                                         **kwargs)
+            table = query.align_many(self.target_sequences)
+            self.assertEqual(list(table.columns), [
+                'optimal_alignment_score', 'suboptimal_alignment_score',
+                'query_begin', 'query_end', 'target_begin',
+                'target_end_optimal', 'target_end_suboptimal', 'cigar'])
+            self._check_table(table, [query(target) for target in
+                                      self.target_sequences])
+
+    def test_protein(self):
+        targets = ["HEAGAWGHEE", "PAWHEAE", "MKWVTFISLLFLFSSAYS"]
+        query = StripedSmithWaterman("HEAGAWGHEE", protein=True,
+                                     substitution_matrix=blosum50)
+        self._check_table(query.align_many(targets),
+                          [query(target) for target in targets])
+
+    def test_sequence_objects(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        table = query.align_many(DNA(target) for target in
+                                 self.target_sequences[:5])
+        self._check_table(table, [query(target) for target in
+                                  self.target_sequences[:5]])
+
+    def test_concatenated_targets(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        table = query.align_many(''.join(self.target_sequences),
+                                 lengths=[len(target) for target in
+                                          self.target_sequences])
+        self._check_table(table, [query(target) for target in
+                                  self.target_sequences])
+
+    def test_lengths_do_not_match(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        with six.assertRaisesRegex(self, ValueError, 'lengths.*9 != 8'):
+            query.align_many("ACGTACGT", lengths=[4, 5])
+
+    def test_negative_lengths(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        for lengths in [15, -5], [-5, 15], [2 ** 32 + 10, -2 ** 32]:
+            with six.assertRaisesRegex(self, ValueError, 'between 0 and'):
+                query.align_many("ACGTACGTAC", lengths=lengths)
+
+    def test_non_integer_lengths(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        for lengths in [4.5, 5.5], [4.0, 6.0], ['4', '6'], [True, False]:
+            with six.assertRaisesRegex(self, ValueError, 'integers'):
+                query.align_many("ACGTACGTAC", lengths=lengths)
+        with six.assertRaisesRegex(self, ValueError, '1D'):
+            query.align_many("ACGTACGTAC", lengths=[[4, 6]])
+
+    def test_no_targets(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        table = query.align_many([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(len(table.columns), 8)
+
+    def test_threads(self):
+        rng = np.random.RandomState(0)
+        targets = [''.join(rng.choice(list('ACGT'), 200)) for _ in range(40)]
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        pool = ThreadPool(4)
+        try:
+            tables = pool.map(query.align_many,
+                              [targets[i:i + 10] for i in range(0, 40, 10)])
+        finally:
+            pool.close()
+        for i, table in enumerate(tables):
+            self._check_table(table, [query(target) for target in
+                                      targets[10 * i:10 * (i + 1)]])
+
+
 class TestAlignStripedSmithWaterman(TestSSW):
     def _check_Alignment_to_AlignmentStructure(self, alignment, structure):
         self.assertEqual(alignment.score(), structure.optimal_alignment_score)
@@ -607,6 +744,63 @@ class TestAlignStripedSmithWaterman(TestSSW):
         self.assertEqual(type(align2[0]), DNA)
 
 
+class TestPairwiseAlignSSWMany(TestSSW):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        sequences = TestAlignMany.target_sequences[:5] + [
+            ''.join(rng.choice(list('ACGT'), rng.randint(20, 60)))
+            for _ in range(5)]
+        self.pairs = [(sequences[i], sequences[j])
+                      for i in range(len(sequences))
+                      for j in range(len(sequences)) if i != j]
+
+    def test_same_as_aligning_each_pair(self):
+        for n_threads in (1, 3):
+            table = pairwise_align_ssw_many(self.pairs, n_threads=n_threads)
+            self._check_table(table, [
+                StripedSmithWaterman(query)(target)
+                for query, target in self.pairs])
+
+    def test_kwargs_are_usable(self):
+        kwargs = {'match_score': 5, 'mismatch_score': -2, 'score_only': True}
+        table = pairwise_align_ssw_many(self.pairs, n_threads=2, **kwargs)
+        self._check_table(table, [
+            StripedSmithWaterman(query, **kwargs)(target)
+            for query, target in self.pairs])
+
+    def test_alignments(self):
+        for kwargs in [{}, {'constructor': DNA}, {'score_filter': 30}]:
+            actual = pairwise_align_ssw_many(self.pairs, n_threads=2,
+                                             alignments=True, **kwargs)
+            expected = [local_pairwise_align_ssw(query, target, **kwargs)
+                        for query, target in self.pairs]
+            self.assertEqual(actual, expected)
+        self.assertIn(None, actual)
+
+    def test_protein(self):
+        pairs = [(Protein("HEAGAWGHEE"), Protein("PAWHEAE")),
+                 (Protein("HEAGAWGHEE"), Protein("MKWVTFISLLFLFSSAYS")),
+                 (Protein("PAWHEAE"), Protein("HEAGAWGHEE"))]
+        actual = pairwise_align_ssw_many(
+            pairs, n_threads=2, alignments=True,
+            substitution_matrix=blosum50)
+        expected = [local_pairwise_align_ssw(
+            query, target, substitution_matrix=blosum50)
+            for query, target in pairs]
+        self.assertEqual(actual, expected)
+        self.assertEqual(type(actual[0][0]), Protein)
+
+    def test_no_pairs(self):
+        self.assertEqual(len(pairwise_align_ssw_many([], n_threads=2)), 0)
+        self.assertEqual(pairwise_align_ssw_many([], alignments=True), [])
+
+    def test_invalid_n_threads(self):
+        for n_threads in (0, -1, 1.5, None):
+            with six.assertRaisesRegex(self, ValueError, 'n_threads'):
+                pairwise_align_ssw_many(self.pairs, n_threads=n_threads)
+
+
 class TestAlignmentStructure(TestSSW):
 
     def mock_object_factory(self, dictionary):
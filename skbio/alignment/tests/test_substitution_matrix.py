@@ -0,0 +1,205 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import six
+import numpy as np
+import numpy.testing as npt
+
+from skbio.alignment import SubstitutionMatrix
+from skbio.alignment._pairwise import blosum50
+from skbio.alignment._substitution_matrix import _ncbi_matrix_names
+
+
+class TestSubstitutionMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = SubstitutionMatrix('ACG', [[2, -1, -3],
+                                                 [-1, 2, 0],
+                                                 [-3, 0, 2]], name='foo')
+
+    def test_init(self):
+        self.assertEqual(self.matrix.alphabet, 'ACG')
+        self.assertEqual(self.matrix.name, 'foo')
+        self.assertEqual(self.matrix.scores.dtype, np.int8)
+        npt.assert_array_equal(self.matrix.scores,
+                               [[2, -1, -3], [-1, 2, 0], [-3, 0, 2]])
+        self.assertEqual(SubstitutionMatrix('A', [[1]]).name, '')
+
+        index = np.full(256, -1)
+        index[[ord('A'), ord('C'), ord('G')]] = [0, 1, 2]
+        npt.assert_array_equal(self.matrix._index, index)
+
+    def test_init_float_scores(self):
+        for scores in ([[0.5, 1], [1, 2]], [[1, 1000], [1000, 1]],
+                       [[1, -129], [-129, 1]]):
+            matrix = SubstitutionMatrix('AB', scores)
+            self.assertEqual(matrix.scores.dtype, np.float64)
+            npt.assert_array_equal(matrix.scores, scores)
+        self.assertEqual(SubstitutionMatrix('AB', [[1., 2.], [3., 4.]])
+                         .scores.dtype, np.int8)
+
+    def test_init_invalid_input(self):
+        with six.assertRaisesRegex(self, ValueError, 'at least one'):
+            SubstitutionMatrix('', [])
+        with six.assertRaisesRegex(self, ValueError, 'duplicate.*ABA'):
+            SubstitutionMatrix('ABA', np.zeros((3, 3)))
+        with six.assertRaisesRegex(self, ValueError, 'ASCII'):
+            SubstitutionMatrix(u'A\xe9', np.zeros((2, 2)))
+        with six.assertRaisesRegex(self, ValueError, r'\(2, 2\).*\(2, 3\)'):
+            SubstitutionMatrix('AB', np.zeros((2, 3)))
+        with six.assertRaisesRegex(self, ValueError, r'\(2, 2\).*\(4,\)'):
+            SubstitutionMatrix('AB', [1, 2, 3, 4])
+
+    def test_properties_are_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.matrix.alphabet = 'ACT'
+        with self.assertRaises(AttributeError):
+            self.matrix.name = 'bar'
+        with self.assertRaises(ValueError):
+            self.matrix.scores[0, 0] = 5
+
+    def test_scores_are_copied(self):
+        scores = np.eye(2, dtype=np.int8)
+        matrix = SubstitutionMatrix('AB', scores)
+        scores[0, 1] = 5
+        self.assertEqual(matrix.score('A', 'B'), 0)
+
+    def test_identity(self):
+        matrix = SubstitutionMatrix.identity('ACGT', 1, -2, name='id')
+        self.assertEqual(matrix.alphabet, 'ACGT')
+        self.assertEqual(matrix.name, 'id')
+        npt.assert_array_equal(matrix.scores, 3 * np.eye(4) - 2)
+
+        matrix = SubstitutionMatrix.identity('AC', 0.5, -1)
+        npt.assert_array_equal(matrix.scores, [[0.5, -1], [-1, 0.5]])
+
+    def test_from_dict(self):
+        matrix = SubstitutionMatrix.from_dict(
+            {'G': {'A': -3, 'C': 0, 'G': 2}, 'C': {'A': -1, 'C': 2, 'G': 0},
+             'A': {'A': 2, 'C': -1, 'G': -3}}, name='foo')
+        self.assertEqual(matrix, self.matrix)
+        self.assertEqual(matrix.name, 'foo')
+
+        self.assertEqual(SubstitutionMatrix.from_dict(self.matrix.to_dict()),
+                         self.matrix)
+
+    def test_from_dict_missing_scores(self):
+        with six.assertRaisesRegex(self, ValueError, "'B'.*'C'"):
+            SubstitutionMatrix.from_dict({'A': {'A': 1, 'B': 0, 'C': 0},
+                                          'B': {'A': 0, 'B': 1},
+                                          'C': {'A': 0, 'B': 0, 'C': 1}})
+
+    def test_to_dict(self):
+        self.assertEqual(self.matrix.to_dict(),
+                         {'A': {'A': 2, 'C': -1, 'G': -3},
+                          'C': {'A': -1, 'C': 2, 'G': 0},
+                          'G': {'A': -3, 'C': 0, 'G': 2}})
+
+    def test_from_ncbi(self):
+        for name in _ncbi_matrix_names:
+            matrix = SubstitutionMatrix.from_ncbi(name)
+            self.assertEqual(matrix.name, name)
+            self.assertEqual(matrix.scores.dtype, np.int8)
+            npt.assert_array_equal(matrix.scores, matrix.scores.T)
+            if name == 'NUC.4.4':
+                self.assertEqual(matrix.alphabet, 'ATGCSWRYKMBVHDN')
+            else:
+                self.assertEqual(matrix.alphabet,
+                                 'ARNDCQEGHILKMFPSTWYVBZX*')
+
+        blosum62 = SubstitutionMatrix.from_ncbi()
+        self.assertEqual(blosum62.name, 'BLOSUM62')
+        self.assertEqual(blosum62.score('A', 'A'), 4)
+        self.assertEqual(blosum62.score('C', 'C'), 9)
+        self.assertEqual(blosum62.score('W', 'R'), -3)
+        self.assertEqual(blosum62.score('*', '*'), 1)
+        self.assertEqual(SubstitutionMatrix.from_ncbi('PAM250')
+                         .score('W', 'W'), 17)
+        self.assertEqual(SubstitutionMatrix.from_ncbi('NUC.4.4')
+                         .score('A', 'R'), 1)
+
+        # the repo's BLOSUM 50 only differs in the scores of B and X
+        blosum50_ncbi = SubstitutionMatrix.from_ncbi('BLOSUM50').to_dict()
+        for char1 in 'ARNDCQEGHILKMFPSTWYVZ*':
+            for char2 in 'ARNDCQEGHILKMFPSTWYVZ*':
+                self.assertEqual(blosum50_ncbi[char1][char2],
+                                 blosum50[char1][char2])
+
+    def test_from_ncbi_invalid_input(self):
+        with six.assertRaisesRegex(self, ValueError, 'name.*BLOSUM63'):
+            SubstitutionMatrix.from_ncbi('BLOSUM63')
+        with six.assertRaisesRegex(self, ValueError, 'name.*blosum62'):
+            SubstitutionMatrix.from_ncbi('blosum62')
+
+    def test_score(self):
+        self.assertEqual(self.matrix.score('A', 'G'), -3)
+        self.assertEqual(self.matrix.score('G', 'G'), 2)
+        self.assertIsInstance(self.matrix.score('G', 'G'), int)
+
+        for char1, char2 in (('A', 'T'), ('T', 'A'), ('AC', 'A'), ('', 'A')):
+            with six.assertRaisesRegex(self, ValueError, 'alphabet'):
+                self.matrix.score(char1, char2)
+
+    def test_indices(self):
+        npt.assert_array_equal(
+            self.matrix._indices(np.frombuffer(b'GAACG', dtype=np.uint8)),
+            [2, 0, 0, 1, 2])
+        with six.assertRaisesRegex(self, ValueError,
+                                   r'offending character.*: +N, T\.'):
+            self.matrix._indices(np.frombuffer(b'GTANT', dtype=np.uint8))
+
+    def test_str(self):
+        self.assertEqual(str(self.matrix),
+                         '   A  C  G\n'
+                         'A  2 -1 -3\n'
+                         'C -1  2  0\n'
+                         'G -3  0  2')
+        self.assertEqual(str(SubstitutionMatrix('AB', [[0.5, -10],
+                                                       [-10, 1]])),
+                         '    A   B\n'
+                         'A 0.5 -10\n'
+                         'B -10   1')
+
+    def test_repr(self):
+        self.assertEqual(repr(self.matrix),
+                         'SubstitutionMatrix (foo)\n'
+                         '------------------------\n'
+                         '   A  C  G\n'
+                         'A  2 -1 -3\n'
+                         'C -1  2  0\n'
+                         'G -3  0  2')
+        self.assertEqual(repr(SubstitutionMatrix('A', [[1]])),
+                         'SubstitutionMatrix\n'
+                         '------------------\n'
+                         '  A\n'
+                         'A 1')
+
+    def test_eq(self):
+        self.assertTrue(self.matrix == self.matrix)
+        self.assertTrue(self.matrix == SubstitutionMatrix(
+            'ACG', [[2, -1, -3], [-1, 2, 0], [-3, 0, 2]]))
+        self.assertTrue(SubstitutionMatrix('A', [[1]]) ==
+                        SubstitutionMatrix('A', [[1.]]))
+
+        self.assertFalse(self.matrix == SubstitutionMatrix(
+            'AGC', [[2, -1, -3], [-1, 2, 0], [-3, 0, 2]]))
+        self.assertFalse(self.matrix == SubstitutionMatrix(
+            'ACG', [[2, -1, -3], [-1, 2, 0], [-3, 0, 3]]))
+        self.assertFalse(self.matrix == self.matrix.to_dict())
+
+    def test_ne(self):
+        self.assertFalse(self.matrix != self.matrix)
+        self.assertTrue(self.matrix != SubstitutionMatrix('A', [[1]]))
+        self.assertTrue(self.matrix != self.matrix.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
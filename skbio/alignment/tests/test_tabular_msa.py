@@ -8,6 +8,7 @@
 
 from __future__ import absolute_import, division, print_function
 
+import collections
 import copy
 import unittest
 import functools
@@ -19,7 +20,9 @@ import numpy as np
 import numpy.testing as npt
 import pandas as pd
 
-from skbio import Sequence, DNA, RNA, Protein, TabularMSA
+from skbio import Sequence, DNA, RNA, Protein, TabularMSA, nj
+import skbio.alignment._tabular_msa as tabular_msa_module
+import skbio.alignment._distance as distance_module
 from skbio.sequence._iupac_sequence import IUPACSequence
 from skbio.util._decorator import classproperty, overrides
 from skbio.util._testing import (ReallyEqualMixin, MetadataMixinTests,
@@ -706,8 +709,141 @@ class TestTabularMSA(unittest.TestCase, ReallyEqualMixin):
         d1 = {'a': DNA('CAT'), 42: DNA('TAG')}
         d2 = TabularMSA.from_dict(d1).to_dict()
         self.assertEqual(d2, d1)
-        self.assertIs(d1['a'], d2['a'])
-        self.assertIs(d1[42], d2[42])
+
+
+class TestCharacterStorage(unittest.TestCase):
+    def assertStorageConsistent(self, msa):
+        self.assertEqual(msa._chars.shape, msa.shape)
+        self.assertFalse(msa._chars.flags.writeable)
+        for seq, row in zip(msa, msa._chars):
+            npt.assert_array_equal(seq._bytes, row)
+            self.assertTrue(np.may_share_memory(seq._bytes, msa._chars))
+
+    def test_constructor(self):
+        seqs = [DNA('ACG-', metadata={'id': 'a'}), DNA('AC.T'),
+                DNA('TTTT', positional_metadata={'q': range(4)})]
+        msa = TabularMSA(seqs)
+        self.assertStorageConsistent(msa)
+        for obs, exp in zip(msa, seqs):
+            self.assertIsNot(obs, exp)
+            self.assertEqual(obs, exp)
+            self.assertFalse(np.may_share_memory(exp._bytes, msa._chars))
+        self.assertEqual(seqs[1], DNA('AC.T'))
+
+    def test_metadata_is_copied(self):
+        seq = DNA('ACGT', metadata={'id': 'a'},
+                  positional_metadata={'q': range(4)})
+        msa = TabularMSA([seq])
+        seq.metadata['id'] = 'b'
+        seq.positional_metadata['q'] = 0
+        obs = next(iter(msa))
+        obs.metadata['id'] = 'c'
+        self.assertEqual(
+            next(iter(msa)),
+            DNA('ACGT', metadata={'id': 'a'},
+                positional_metadata={'q': range(4)}))
+
+    def test_packed_sequences_stay_packed(self):
+        seqs = [DNA('ACGT').pack(), DNA('AC-T'), DNA('ACGN').pack()]
+        msa = TabularMSA(seqs[:2])
+        msa.append(seqs[2])
+        msa.sort(ascending=False)
+        self.assertStorageConsistent(msa)
+        self.assertTrue(seqs[0].is_packed())
+        self.assertTrue(seqs[2].is_packed())
+        self.assertEqual(msa._chars.tostring(), b'ACGNAC-TACGT')
+
+    def test_sequences_do_not_reference_storage(self):
+        seqs = [DNA('ACGTACGTAC') for _ in range(1001)]
+        msa = TabularMSA(seqs)
+        msa.append(DNA('ACGTACGTAA'))
+        msa.sort()
+        del msa
+        for seq in (seqs[0], seqs[-1]):
+            base = seq._bytes
+            while base.base is not None:
+                base = base.base
+            self.assertLessEqual(base.size, 10)
+
+    def test_empty(self):
+        self.assertEqual(TabularMSA([])._chars.shape, (0, 0))
+        self.assertEqual(TabularMSA([DNA(''), DNA('')])._chars.shape, (2, 0))
+
+    def test_append(self):
+        msa = TabularMSA([])
+        msa.append(DNA('AC-'))
+        msa.append(DNA('GGT'))
+        self.assertStorageConsistent(msa)
+        self.assertEqual(msa._chars.tostring(), b'AC-GGT')
+
+    def test_append_grows_storage_geometrically(self):
+        msa = TabularMSA([DNA('ACGT')])
+        seq = next(iter(msa))
+        buffers = []
+        for i in range(100):
+            msa.append(DNA('ACGT'[i % 4] * 4))
+            if not buffers or msa._buffer is not buffers[-1]:
+                buffers.append(msa._buffer)
+        self.assertStorageConsistent(msa)
+        self.assertEqual([len(buffer) for buffer in buffers],
+                         [2, 4, 8, 16, 32, 64, 128])
+        self.assertEqual(msa.shape, (101, 4))
+        self.assertEqual(msa._chars[-1].tostring(), b'TTTT')
+        self.assertEqual(seq, DNA('ACGT'))
+
+    def test_sort(self):
+        msa = TabularMSA([DNA('AAA'), DNA('CCC'), DNA('GGG')],
+                         index=['b', 'c', 'a'])
+        msa.sort()
+        self.assertStorageConsistent(msa)
+        self.assertEqual([str(seq) for seq in msa], ['GGG', 'AAA', 'CCC'])
+
+    def test_sequence_not_modified_in_place(self):
+        seq = DNA('ACGT')
+        TabularMSA([seq])
+        with self.assertRaises(ValueError):
+            seq._bytes[0] = ord('T')
+        self.assertEqual(seq, DNA('ACGT'))
+
+
+class TestColumnStatistics(unittest.TestCase):
+    def setUp(self):
+        # process a few sequences at a time so that statistics are
+        # accumulated over several blocks of rows
+        self.block_chars = tabular_msa_module._block_chars
+        tabular_msa_module._block_chars = 150
+
+        np.random.seed(0)
+        chars = np.random.choice(np.frombuffer(b'ACGT-.N', dtype=np.uint8),
+                                 (53, 40), p=[.3, .2, .15, .15, .1, .05, .05])
+        self.msa = TabularMSA([DNA(row) for row in chars])
+
+    def tearDown(self):
+        tabular_msa_module._block_chars = self.block_chars
+
+    def test_consensus(self):
+        exp = []
+        for i in range(self.msa.shape.position):
+            column = ''.join(str(seq)[i] for seq in self.msa)
+            counts = collections.Counter(column.replace('.', '-'))
+            exp.append(max(sorted(counts), key=counts.get))
+        self.assertEqual(self.msa.consensus(), DNA(''.join(exp)))
+
+    def test_gap_frequencies(self):
+        for axis, seqs in (('sequence', self.msa.iter_positions()),
+                           ('position', self.msa)):
+            exp = [str(seq).count('-') + str(seq).count('.') for seq in seqs]
+            npt.assert_array_equal(self.msa.gap_frequencies(axis=axis), exp)
+            npt.assert_almost_equal(
+                self.msa.gap_frequencies(axis=axis, relative=True),
+                np.asarray(exp) / (self.msa.shape.sequence +
+                                   self.msa.shape.position - len(exp)))
+
+    def test_iter_positions(self):
+        for i, position in enumerate(self.msa.iter_positions()):
+            self.assertIs(type(position), Sequence)
+            self.assertEqual(str(position),
+                             ''.join(str(seq)[i] for seq in self.msa))
 
 
 class TestContains(unittest.TestCase):
@@ -743,7 +879,7 @@ class TestCopy(unittest.TestCase):
 
         self.assertEqual(msa, msa_copy)
         self.assertIsNot(msa, msa_copy)
-        self.assertIsNot(msa._seqs, msa_copy._seqs)
+        self.assertIsNot(msa._rows, msa_copy._rows)
 
     def test_with_sequences(self):
         msa = TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')])
@@ -751,22 +887,22 @@ class TestCopy(unittest.TestCase):
 
         self.assertEqual(msa, msa_copy)
         self.assertIsNot(msa, msa_copy)
-        self.assertIsNot(msa._seqs, msa_copy._seqs)
+        self.assertIsNot(msa._rows, msa_copy._rows)
         # TODO: use __getitem__ when it exists.
-        self.assertIsNot(msa._seqs[0], msa_copy._seqs[0])
-        self.assertIsNot(msa._seqs[1], msa_copy._seqs[1])
+        self.assertIsNot(msa._get_sequence(0), msa_copy._get_sequence(0))
+        self.assertIsNot(msa._get_sequence(1), msa_copy._get_sequence(1))
 
         msa_copy.append(DNA('AAAA'))
         self.assertEqual(
             msa,
             TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')]))
 
-        msa_copy._seqs[0].metadata['bar'] = 42
+        msa_copy._get_sequence(0).metadata['bar'] = 42
         self.assertEqual(
             msa,
             TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')]))
 
-        msa_copy._seqs[0].metadata['foo'].append(2)
+        msa_copy._get_sequence(0).metadata['foo'].append(2)
         self.assertEqual(
             msa,
             TabularMSA([DNA('ACGT', metadata={'foo': [1, 2]}), DNA('TGCA')]))
@@ -794,7 +930,7 @@ class TestDeepCopy(unittest.TestCase):
 
         self.assertEqual(msa, msa_copy)
         self.assertIsNot(msa, msa_copy)
-        self.assertIsNot(msa._seqs, msa_copy._seqs)
+        self.assertIsNot(msa._rows, msa_copy._rows)
 
     def test_with_sequences(self):
         msa = TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')])
@@ -802,22 +938,22 @@ class TestDeepCopy(unittest.TestCase):
 
         self.assertEqual(msa, msa_copy)
         self.assertIsNot(msa, msa_copy)
-        self.assertIsNot(msa._seqs, msa_copy._seqs)
+        self.assertIsNot(msa._rows, msa_copy._rows)
         # TODO: use __getitem__ when it exists.
-        self.assertIsNot(msa._seqs[0], msa_copy._seqs[0])
-        self.assertIsNot(msa._seqs[1], msa_copy._seqs[1])
+        self.assertIsNot(msa._get_sequence(0), msa_copy._get_sequence(0))
+        self.assertIsNot(msa._get_sequence(1), msa_copy._get_sequence(1))
 
         msa_copy.append(DNA('AAAA'))
         self.assertEqual(
             msa,
             TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')]))
 
-        msa_copy._seqs[0].metadata['bar'] = 42
+        msa_copy._get_sequence(0).metadata['bar'] = 42
         self.assertEqual(
             msa,
             TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')]))
 
-        msa_copy._seqs[0].metadata['foo'].append(2)
+        msa_copy._get_sequence(0).metadata['foo'].append(2)
         self.assertEqual(
             msa,
             TabularMSA([DNA('ACGT', metadata={'foo': [1]}), DNA('TGCA')]))
@@ -1500,6 +1636,159 @@ class TestGapFrequencies(unittest.TestCase):
         npt.assert_array_equal(np.array([0, 0, 2, 4, 4]), freqs)
 
 
+class TestDistances(unittest.TestCase):
+    def _model_distance_reference(self, msa, model, gamma):
+        seqs = [str(seq).replace('U', 'T') for seq in msa]
+        counts = [sum(seq.count(base) for seq in seqs) for base in 'ACGT']
+        pi_a, pi_c, pi_g, pi_t = np.array(counts) / sum(counts)
+        pi_r, pi_y = pi_a + pi_g, pi_c + pi_t
+
+        def correct(x):
+            if gamma is None:
+                return -np.log(x)
+            return gamma * (x ** (-1 / gamma) - 1)
+
+        exp = np.zeros((len(seqs), len(seqs)))
+        for i, j in itertools.combinations(range(len(seqs)), 2):
+            pairs = [(x, y) for x, y in zip(seqs[i], seqs[j])
+                     if x in 'ACGT' and y in 'ACGT']
+            p1 = sum({x, y} == {'A', 'G'} for x, y in pairs) / len(pairs)
+            p2 = sum({x, y} == {'C', 'T'} for x, y in pairs) / len(pairs)
+            q = (sum(x != y for x, y in pairs) / len(pairs)) - p1 - p2
+            if model == 'jc69':
+                d = 0.75 * correct(1 - 4 / 3 * (p1 + p2 + q))
+            elif model == 'k2p':
+                d = (0.5 * correct(1 - 2 * (p1 + p2) - q) +
+                     0.25 * correct(1 - 2 * q))
+            else:
+                d = (2 * pi_a * pi_g / pi_r *
+                     correct(1 - pi_r / (2 * pi_a * pi_g) * p1 -
+                             q / (2 * pi_r)) +
+                     2 * pi_c * pi_t / pi_y *
+                     correct(1 - pi_y / (2 * pi_c * pi_t) * p2 -
+                             q / (2 * pi_y)) +
+                     2 * (pi_r * pi_y - pi_a * pi_g * pi_y / pi_r -
+                          pi_c * pi_t * pi_r / pi_y) *
+                     correct(1 - q / (2 * pi_r * pi_y)))
+            exp[i, j] = exp[j, i] = d
+        return exp
+
+    def setUp(self):
+        np.random.seed(0)
+        ancestor = np.random.choice(list('ACGT'), 200)
+        seqs = []
+        for _ in range(12):
+            seq = ancestor.copy()
+            mutated = np.random.choice(200, 30)
+            seq[mutated] = np.random.choice(list('ACGTN-'), 30)
+            seqs.append(DNA(''.join(seq)))
+        self.msa = TabularMSA(seqs)
+
+    def test_gram_sum_blocks(self):
+        block_size = distance_module._block_size
+        distance_module._block_size = 5
+        try:
+            np.random.seed(0)
+            indicators = [np.random.rand(12, 7) > 0.5 for _ in range(3)]
+            exp = sum(np.dot(m.astype(float), m.T.astype(float))
+                      for m in indicators)
+            for n_threads in 1, 2:
+                obs = distance_module._gram_sum(iter(indicators), 12,
+                                                np.float64, n_threads)
+                npt.assert_array_equal(obs, exp)
+        finally:
+            distance_module._block_size = block_size
+
+    def test_hamming(self):
+        msa = TabularMSA([DNA('AC-GT'), DNA('ACTGA'), DNA('A.TGA')],
+                         index=['a', 'b', 'c'])
+        obs = msa.distances()
+        self.assertEqual(obs.ids, ('a', 'b', 'c'))
+        npt.assert_almost_equal(obs.data, [[0, 0.4, 0.6],
+                                           [0.4, 0, 0.2],
+                                           [0.6, 0.2, 0]])
+        self.assertEqual(msa.distances('hamming'), obs)
+
+    def test_p_distance(self):
+        msa = TabularMSA([DNA('AC-GT'), DNA('ACTGA'), DNA('A.TGA')],
+                         index=['a', 'b', 'c'])
+        obs = msa.distances('p-distance')
+        npt.assert_almost_equal(obs.data, [[0, 0.25, 1 / 3],
+                                           [0.25, 0, 0],
+                                           [1 / 3, 0, 0]])
+
+    def test_models(self):
+        for model in 'jc69', 'k2p', 'tn93':
+            for gamma in None, 0.5, 2:
+                for n_threads in 1, 2:
+                    obs = self.msa.distances(model, gamma=gamma,
+                                             n_threads=n_threads)
+                    exp = self._model_distance_reference(self.msa, model,
+                                                         gamma)
+                    npt.assert_almost_equal(obs.data, exp)
+
+    def test_models_known_values(self):
+        # 1 transversion in 10 positions, and 2 transitions in 9 positions
+        # without gaps
+        msa = TabularMSA([DNA('ACGTACGTAC'), DNA('ACGTACGTTC'),
+                          DNA('GCGTATGT-C')])
+        npt.assert_almost_equal(msa.distances('jc69')['0', '1'],
+                                -0.75 * np.log(1 - 4 / 3 * 0.1))
+        npt.assert_almost_equal(msa.distances('k2p')['0', '1'],
+                                -0.5 * np.log(0.9) - 0.25 * np.log(0.8))
+        npt.assert_almost_equal(msa.distances('k2p')['0', '2'],
+                                -0.5 * np.log(1 - 4 / 9))
+
+    def test_models_rna(self):
+        dna_msa = TabularMSA([DNA(str(seq)) for seq in self.msa])
+        rna_msa = TabularMSA([seq.transcribe() for seq in dna_msa])
+        for model in 'jc69', 'k2p', 'tn93':
+            npt.assert_almost_equal(rna_msa.distances(model).data,
+                                    dna_msa.distances(model).data)
+
+    def test_models_identical_sequences(self):
+        msa = TabularMSA([DNA('ACGT'), DNA('ACGT')])
+        for model in 'jc69', 'k2p', 'tn93':
+            npt.assert_almost_equal(msa.distances(model).data,
+                                    np.zeros((2, 2)))
+
+    def test_distances_usable_by_nj(self):
+        tree = nj(self.msa.distances('k2p', gamma=1))
+        self.assertEqual(sorted(tip.name for tip in tree.tips()),
+                         sorted(str(i) for i in range(12)))
+
+    def test_invalid_arguments(self):
+        with six.assertRaisesRegex(self, ValueError, '`metric`.*foo'):
+            self.msa.distances('foo')
+        with six.assertRaisesRegex(self, ValueError, '`gamma`.*hamming'):
+            self.msa.distances('hamming', gamma=1)
+        for gamma in 0, -1:
+            with six.assertRaisesRegex(self, ValueError, '`gamma`.*0'):
+                self.msa.distances('jc69', gamma=gamma)
+        with six.assertRaisesRegex(self, ValueError, '`n_threads`'):
+            self.msa.distances(n_threads=0)
+        with six.assertRaisesRegex(self, TypeError, "'k2p'.*Protein"):
+            TabularMSA([Protein('ACGT'), Protein('ACGT')]).distances('k2p')
+
+    def test_undefined_distances(self):
+        msa = TabularMSA([DNA('ACGT'), DNA('CATG')])
+        with six.assertRaisesRegex(self, ValueError,
+                                   'JC69.*0 and 1.*too divergent'):
+            msa.distances('jc69')
+
+        msa = TabularMSA([DNA('AC--'), DNA('--GT'), DNA('ACGT')])
+        for metric in 'p-distance', 'tn93':
+            with six.assertRaisesRegex(self, ValueError,
+                                       '0 and 1.*in common'):
+                msa.distances(metric)
+        with six.assertRaisesRegex(self, ValueError, '0 and 1.*in common'):
+            TabularMSA([DNA('ACNN'), DNA('NNGT')]).distances('k2p')
+
+        msa = TabularMSA([DNA('AAGT'), DNA('AGGT')])
+        with six.assertRaisesRegex(self, ValueError, 'TN93.*four'):
+            msa.distances('tn93')
+
+
 class TestGetPosition(unittest.TestCase):
     def test_without_positional_metadata(self):
         msa = TabularMSA([DNA('ACG'),
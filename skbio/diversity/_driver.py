@@ -10,6 +10,8 @@ from __future__ import absolute_import, division, print_function
 
 import functools
 
+import numpy as np
+import scipy.sparse
 import scipy.spatial.distance
 import pandas as pd
 
@@ -21,6 +23,7 @@ from skbio.diversity.beta._unifrac import (
 from skbio.util._decorator import experimental
 from skbio.stats.distance import DistanceMatrix
 from skbio.diversity._util import (_validate_counts_matrix,
+                                   _validate_sparse_counts_matrix,
                                    _get_phylogenetic_kwargs)
 
 
@@ -219,7 +222,7 @@ def beta_diversity(metric, counts, ids=None, validate=True, **kwargs):
         and the scikit-bio functions linked under *See Also* for available
         metrics. Passing metrics as a strings is preferable as this often
         results in an optimized version of the metric being used.
-    counts : 2D array_like of ints or floats
+    counts : 2D array_like of ints or floats, or scipy.sparse matrix
         Matrix containing count/abundance data where each row contains counts
         of OTUs in a given sample.
     ids : iterable of strs, optional
@@ -286,8 +289,19 @@ def beta_diversity(metric, counts, ids=None, validate=True, **kwargs):
      * all tip names in ``tree`` are unique
      * all ``otu_ids`` correspond to tip names in ``tree``
 
+    ``counts`` may be a ``scipy.sparse`` matrix, such as the kmer profiles
+    returned by ``skbio.sequence.kmer_count_matrix``. The ``'euclidean'`` and
+    ``'cosine'`` metrics are computed directly from the sparse matrix; for
+    all other metrics it is converted to a dense array first.
+
     """
-    if validate:
+    if scipy.sparse.issparse(counts):
+        if validate:
+            counts = _validate_sparse_counts_matrix(counts, ids=ids)
+        if metric in _sparse_metrics and not kwargs:
+            return DistanceMatrix(_sparse_pdist(counts, metric), ids)
+        counts = counts.toarray()
+    elif validate:
         counts = _validate_counts_matrix(counts, ids=ids)
 
     if metric == 'unweighted_unifrac':
@@ -317,3 +331,25 @@ def beta_diversity(metric, counts, ids=None, validate=True, **kwargs):
 
     distances = scipy.spatial.distance.pdist(counts, metric, **kwargs)
     return DistanceMatrix(distances, ids)
+
+
+_sparse_metrics = frozenset(['euclidean', 'cosine'])
+
+
+def _sparse_pdist(counts, metric):
+    """Compute condensed distances between rows of a sparse matrix.
+
+    Both metrics are derived from the matrix of dot products between rows,
+    which is cheap to compute when the rows are sparse.
+
+    """
+    counts = counts.astype(float)
+    products = (counts * counts.T).toarray()
+    norms = np.diag(products)
+    if metric == 'euclidean':
+        squared = norms[:, np.newaxis] + norms[np.newaxis, :] - 2 * products
+        distances = np.sqrt(np.maximum(squared, 0))
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distances = 1 - products / np.sqrt(np.outer(norms, norms))
+    return scipy.spatial.distance.squareform(distances, checks=False)
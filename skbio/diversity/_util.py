@@ -11,6 +11,7 @@ from __future__ import absolute_import, division, print_function
 import collections
 
 import numpy as np
+import scipy.sparse
 
 from skbio.tree import DuplicateNodeError, MissingNodeError
 from skbio.diversity._phylogenetic import _nodes_by_counts
@@ -69,6 +70,23 @@ def _validate_counts_matrix(counts, ids=None, **kwargs):
     return np.asarray(results)
 
 
+def _validate_sparse_counts_matrix(counts, ids=None):
+    """Validate a ``scipy.sparse`` counts matrix and convert it to CSR."""
+    counts = counts.tocsr()
+
+    if ids is not None and counts.shape[0] != len(ids):
+        raise ValueError(
+            "Number of rows in ``counts`` must be equal to number of provided "
+            "``ids``.")
+
+    data = counts.data.astype(int, casting='safe', copy=False)
+    if (data < 0).any():
+        raise ValueError("Counts vector cannot contain negative values.")
+
+    return scipy.sparse.csr_matrix((data, counts.indices, counts.indptr),
+                                   shape=counts.shape)
+
+
 def _validate_otu_ids_and_tree(counts, otu_ids, tree):
 
     len_otu_ids = len(otu_ids)
@@ -13,6 +13,7 @@ from unittest import TestCase, main
 import pandas as pd
 import numpy as np
 import numpy.testing as npt
+import scipy.sparse
 
 from skbio import DistanceMatrix, TreeNode
 from skbio.io._fileobject import StringIO
@@ -468,6 +469,35 @@ class BetaDiversityTests(TestCase):
                 npt.assert_almost_equal(actual_dm[id1, id2],
                                         expected_dm[id1, id2], 6)
 
+    def test_sparse(self):
+        table = scipy.sparse.csr_matrix(self.table2)
+        for metric in 'euclidean', 'cosine', 'braycurtis', 'jaccard':
+            actual_dm = beta_diversity(metric, table, self.sids2)
+            expected_dm = beta_diversity(metric, self.table2, self.sids2)
+            self.assertEqual(actual_dm.ids, expected_dm.ids)
+            npt.assert_almost_equal(actual_dm.data, expected_dm.data)
+
+        actual_dm = beta_diversity('weighted_unifrac',
+                                   scipy.sparse.csc_matrix(self.table1),
+                                   tree=self.tree1, otu_ids=self.oids1)
+        expected_dm = beta_diversity('weighted_unifrac', self.table1,
+                                     tree=self.tree1, otu_ids=self.oids1)
+        npt.assert_almost_equal(actual_dm.data, expected_dm.data)
+
+    def test_sparse_invalid_input(self):
+        table = scipy.sparse.csr_matrix(self.table1)
+        # number of ids doesn't match the number of samples
+        self.assertRaises(ValueError, beta_diversity, 'euclidean', table,
+                          list('AB'))
+
+        # negative counts
+        self.assertRaises(ValueError, beta_diversity, 'euclidean',
+                          scipy.sparse.csr_matrix([[0, 1, 3], [0, 3, -12]]))
+
+        # non-integer counts
+        self.assertRaises(TypeError, beta_diversity, 'euclidean',
+                          scipy.sparse.csr_matrix([[0, 1.5, 3], [0, 3, 2]]))
+
     def test_braycurtis(self):
         # TODO: update npt.assert_almost_equal calls to use DistanceMatrix
         # near-equality testing when that support is available
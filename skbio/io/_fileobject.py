@@ -9,6 +9,12 @@
 from __future__ import absolute_import, division, print_function
 
 import io
+import struct
+import threading
+import zlib
+from multiprocessing.pool import ThreadPool
+
+from six.moves import queue
 
 
 def is_binary_file(file):
@@ -137,3 +143,237 @@ class IterableStringWriterIO(IterableStringReaderIO):
                 self._iterable.append(line)
             self.seek(backup)
         super(IterableStringWriterIO, self).close()
+
+
+class ThreadedGzipReader(io.RawIOBase):
+    """Decompress gzip data on background threads.
+
+    A producer thread reads compressed data from `file` and places the
+    decompressed bytes on a bounded queue which is drained by `readinto`.
+    Decompression therefore overlaps with whatever the consumer is doing
+    (e.g., parsing records). Multi-member gzip files are supported. When the
+    data is BGZF (blocked gzip, as produced by ``bgzip``) each member declares
+    its compressed size up front, so batches of members are inflated in
+    parallel by a pool of `n_threads` threads. ``zlib`` releases the GIL while
+    inflating, so this scales with the number of available cores.
+
+    Seeking backwards restarts decompression from the beginning of the
+    stream; seeking forwards reads and discards data.
+
+    """
+    _chunk_size = 1024 * 1024
+
+    def __init__(self, file, n_threads=1):
+        super(ThreadedGzipReader, self).__init__()
+        if n_threads < 1:
+            raise ValueError("`n_threads` must be at least 1, not %r."
+                             % n_threads)
+        self._file = file
+        self._n_threads = n_threads
+        self._start = file.tell()
+        self._thread = None
+        self._start_thread()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset = self._position + offset
+        elif whence != io.SEEK_SET:
+            raise ValueError("Seeking relative to the end of a compressed "
+                             "stream is not supported.")
+        if offset < 0:
+            raise ValueError("Negative seek position %d" % offset)
+
+        if offset < self._position:
+            self._stop_thread()
+            self._file.seek(self._start)
+            self._start_thread()
+
+        buf = bytearray(self._chunk_size)
+        while self._position < offset:
+            view = memoryview(buf)[:min(len(buf), offset - self._position)]
+            if not self.readinto(view):
+                break
+        return self._position
+
+    def readinto(self, b):
+        while self._offset >= len(self._pending):
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+                return 0
+            if isinstance(item, Exception):
+                self._eof = True
+                raise item
+            self._pending = item
+            self._offset = 0
+
+        n = min(len(b), len(self._pending) - self._offset)
+        b[:n] = self._pending[self._offset:self._offset + n]
+        self._offset += n
+        self._position += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop_thread()
+        super(ThreadedGzipReader, self).close()
+
+    def _start_thread(self):
+        self._queue = queue.Queue(maxsize=2 * self._n_threads + 2)
+        self._stop = threading.Event()
+        self._pending = b''
+        self._offset = 0
+        self._position = 0
+        self._eof = False
+
+        if _is_bgzf(self._file.peek(18)[:18]):
+            target = self._produce_bgzf
+        else:
+            target = self._produce_stream
+        self._thread = threading.Thread(target=self._produce,
+                                        args=(target,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _stop_thread(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        # Unblock the producer if it is waiting on a full queue.
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        self._thread.join()
+        self._thread = None
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self, target):
+        try:
+            target()
+        except Exception as e:
+            self._put(e)
+        else:
+            self._put(None)
+
+    def _produce_stream(self):
+        decompressor = zlib.decompressobj(_GZIP_WBITS)
+        new_member = True
+        while not self._stop.is_set():
+            data = self._file.read(self._chunk_size)
+            if not data:
+                break
+            while data:
+                if new_member:
+                    # Zero padding between or after members is allowed.
+                    data = data.lstrip(b'\x00')
+                    if not data:
+                        break
+                new_member = False
+                inflated = decompressor.decompress(data)
+                if inflated and not self._put(inflated):
+                    return
+                data = decompressor.unused_data
+                if data or getattr(decompressor, 'eof', False):
+                    decompressor = zlib.decompressobj(_GZIP_WBITS)
+                    new_member = True
+
+        if not new_member and not getattr(decompressor, 'eof', True):
+            raise EOFError("Compressed file ended before the end-of-stream "
+                           "marker was reached")
+
+    def _produce_bgzf(self):
+        if self._n_threads > 1:
+            pool = ThreadPool(self._n_threads)
+            inflate = pool.map
+        else:
+            pool = None
+            inflate = map
+        try:
+            while not self._stop.is_set():
+                blocks = []
+                for _ in range(16 * self._n_threads):
+                    block = _read_bgzf_block(self._file)
+                    if block is None:
+                        break
+                    blocks.append(block)
+                if not blocks:
+                    break
+                data = b''.join(inflate(_inflate_bgzf_block, blocks))
+                if not self._put(data):
+                    return
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_BGZF_HEADER = struct.Struct('<4sI2BH')
+
+
+def _is_bgzf(header):
+    return _bgzf_block_size(header) is not None
+
+
+def _bgzf_block_size(header):
+    """Return the total size of a BGZF member given its first bytes."""
+    if len(header) < 12:
+        return None
+    magic, _, _, _, xlen = _BGZF_HEADER.unpack(header[:12])
+    # gzip magic, deflate compression method and the FEXTRA flag
+    if magic[:3] != b'\x1f\x8b\x08' or not ord(magic[3:4]) & 4:
+        return None
+    extra = header[12:12 + xlen]
+    while len(extra) >= 4:
+        slen = struct.unpack('<H', extra[2:4])[0]
+        if extra[:2] == b'BC' and slen == 2 and len(extra) >= 6:
+            return struct.unpack('<H', extra[4:6])[0] + 1
+        extra = extra[4 + slen:]
+    return None
+
+
+def _read_bgzf_block(file):
+    header = file.read(12)
+    if not header:
+        return None
+    if len(header) == 12:
+        xlen = struct.unpack('<H', header[10:12])[0]
+        header += file.read(xlen)
+    size = _bgzf_block_size(header)
+    if size is None:
+        raise IOError("Expected a BGZF block but found a gzip member without "
+                      "a BGZF block size (BSIZE) field.")
+    data = file.read(size - len(header))
+    if len(data) != size - len(header):
+        raise EOFError("Compressed file ended before the end-of-stream "
+                       "marker was reached")
+    crc, isize = struct.unpack('<2I', data[-8:])
+    return data[:-8], crc, isize
+
+
+def _inflate_bgzf_block(block):
+    data, crc, isize = block
+    inflated = zlib.decompress(data, -zlib.MAX_WBITS)
+    if len(inflated) != isize or zlib.crc32(inflated) & 0xffffffff != crc:
+        raise IOError("CRC check failed while decompressing a BGZF block.")
+    return inflated
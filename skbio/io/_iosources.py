@@ -21,7 +21,7 @@ from cachecontrol.caches import FileCache
 
 from skbio.io import IOSourceError
 from ._fileobject import (IterableStringWriterIO, IterableStringReaderIO,
-                          WrappedBufferedRandom)
+                          WrappedBufferedRandom, ThreadedGzipReader)
 
 
 def get_io_sources():
@@ -204,6 +204,9 @@ class GzipCompressor(Compressor):
         return self.file.peek(2)[:2] == b'\x1f\x8b'
 
     def get_reader(self):
+        n_threads = self.options.get('n_threads')
+        if n_threads is not None:
+            return ThreadedGzipReader(self.file, n_threads=n_threads)
         return gzip.GzipFile(fileobj=self.file)
 
     def get_writer(self):
@@ -12,6 +12,9 @@ from future.builtins import range
 
 import re
 import warnings
+import itertools
+import collections
+import multiprocessing
 
 import numpy as np
 
@@ -20,6 +23,9 @@ from skbio.util import cardinal_to_ordinal
 _whitespace_regex = re.compile(r'\s')
 _newline_regex = re.compile(r'\n')
 
+# Number of records formatted and written together by the FASTA-like writers.
+_write_batch_size = 1000
+
 
 def _decode_qual_to_phred(qual_str, variant=None, phred_offset=None):
     phred_offset, phred_range = _get_phred_offset_and_range(
@@ -41,6 +47,12 @@ def _decode_qual_to_phred(qual_str, variant=None, phred_offset=None):
 
 
 def _encode_phred_to_qual(phred, variant=None, phred_offset=None):
+    return _encode_phred_batch_to_qual([phred], variant=variant,
+                                       phred_offset=phred_offset)[0]
+
+
+def _encode_phred_batch_to_qual(phreds, variant=None, phred_offset=None):
+    """Encode a batch of Phred score vectors with a single NumPy pass."""
     phred_offset, phred_range = _get_phred_offset_and_range(
         variant, phred_offset,
         ["Must provide either `variant` or `phred_offset` in order to encode "
@@ -50,19 +62,34 @@ def _encode_phred_to_qual(phred, variant=None, phred_offset=None):
          "on this:\n\t"
          "https://github.com/biocore/scikit-bio/issues/719"])
 
-    qual_chars = []
-    for score in phred:
-        if score < phred_range[0]:
-            raise ValueError("Phred score %d is out of range [%d, %d]."
-                             % (score, phred_range[0], phred_range[1]))
-        if score > phred_range[1]:
+    phreds = [np.asarray(phred, dtype=np.int64) for phred in phreds]
+    if not phreds:
+        return []
+    phred = np.concatenate(phreds)
+
+    below = phred < phred_range[0]
+    if below.any():
+        raise ValueError("Phred score %d is out of range [%d, %d]."
+                         % (phred[below][0], phred_range[0], phred_range[1]))
+
+    above = phred > phred_range[1]
+    if above.any():
+        # warn once per distinct score, in order of first appearance
+        above = phred[above]
+        _, first = np.unique(above, return_index=True)
+        for score in above[np.sort(first)]:
             warnings.warn(
                 "Phred score %d is out of targeted range [%d, %d]. Converting "
                 "to %d." % (score, phred_range[0], phred_range[1],
                             phred_range[1]), UserWarning)
-            score = phred_range[1]
-        qual_chars.append(chr(score + phred_offset))
-    return ''.join(qual_chars)
+        phred = np.minimum(phred, phred_range[1])
+
+    encoded = (phred + phred_offset).astype(np.uint8).tostring()
+    encoded = encoded.decode('ascii')
+
+    ends = np.cumsum([len(p) for p in phreds])
+    starts = ends - [len(p) for p in phreds]
+    return [encoded[start:end] for start, end in zip(starts, ends)]
 
 
 def _get_phred_offset_and_range(variant, phred_offset, errors):
@@ -176,15 +203,12 @@ def _format_fasta_like_records(generator, id_whitespace_replacement,
         else:
             header = id_
 
-        if require_qual and 'quality' not in seq.positional_metadata:
+        qual = seq._get_positional_metadata_column_('quality')
+        if require_qual and qual is None:
             raise ValueError(
                 "Cannot write %s sequence because it does not have quality "
                 "scores associated with it." % cardinal_to_ordinal(idx + 1))
 
-        qual = None
-        if 'quality' in seq.positional_metadata:
-            qual = seq.positional_metadata['quality'].values
-
         if lowercase is not None:
             seq_str = seq.lowercase(lowercase)
         else:
@@ -216,3 +240,42 @@ def _too_many_blanks(fh, max_blanks):
                 break
     fh.seek(0)
     return too_many
+
+
+def _parallel_map_batches(func, iterable, n_processes, args=(),
+                          batch_size=1000):
+    """Apply `func` to batches of `iterable` using a pool of processes.
+
+    `func` is called as ``func(batch, *args)`` and must return a list. Results
+    are yielded in input order. At most ``2 * n_processes`` batches are in
+    flight at any time so that memory use is bounded regardless of the size
+    of `iterable`.
+
+    """
+    if n_processes < 1:
+        raise ValueError("`n_processes` must be at least 1, not %r."
+                         % n_processes)
+
+    pool = multiprocessing.Pool(n_processes)
+    try:
+        pending = collections.deque()
+        for batch in _batches(iterable, batch_size):
+            pending.append(pool.apply_async(func, (batch,) + tuple(args)))
+            if len(pending) > 2 * n_processes:
+                for result in pending.popleft().get():
+                    yield result
+        while pending:
+            for result in pending.popleft().get():
+                yield result
+    finally:
+        pool.terminate()
+
+
+def _batches(iterable, batch_size):
+    """Yield lists of up to `batch_size` consecutive items of `iterable`."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
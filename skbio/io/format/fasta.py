@@ -654,7 +654,8 @@ from skbio.io.registry import FileSentinel
 from skbio.io.format._base import (_get_nth_sequence,
                                    _parse_fasta_like_header,
                                    _format_fasta_like_records, _line_generator,
-                                   _too_many_blanks)
+                                   _too_many_blanks, _batches,
+                                   _write_batch_size)
 from skbio.util._misc import chunk_str
 from skbio.alignment import SequenceCollection, Alignment
 from skbio.sequence import Sequence, DNA, RNA, Protein
@@ -814,17 +815,25 @@ def _generator_to_fasta(obj, fh, qual=FileSentinel,
     formatted_records = _format_fasta_like_records(
         obj, id_whitespace_replacement, description_newline_replacement,
         qual is not None, lowercase)
-    for header, seq_str, qual_scores in formatted_records:
-        if max_width is not None:
-            seq_str = chunk_str(seq_str, max_width, '\n')
+    # Records are formatted in batches and each batch is written to `fh` (and
+    # `qual`) with a single call rather than one small write per record.
+    for batch in _batches(formatted_records, _write_batch_size):
+        seq_records = []
+        qual_records = []
+        for header, seq_str, qual_scores in batch:
+            if max_width is not None:
+                seq_str = chunk_str(seq_str, max_width, '\n')
+            seq_records.append('>%s\n%s\n' % (header, seq_str))
 
-        fh.write('>%s\n%s\n' % (header, seq_str))
+            if qual is not None:
+                qual_str = ' '.join(np.asarray(qual_scores, dtype=np.str))
+                if max_width is not None:
+                    qual_str = qual_wrapper.fill(qual_str)
+                qual_records.append('>%s\n%s\n' % (header, qual_str))
 
+        fh.write(''.join(seq_records))
         if qual is not None:
-            qual_str = ' '.join(np.asarray(qual_scores, dtype=np.str))
-            if max_width is not None:
-                qual_str = qual_wrapper.fill(qual_str)
-            qual.write('>%s\n%s\n' % (header, qual_str))
+            qual.write(''.join(qual_records))
 
 
 @fasta.writer(Sequence)
@@ -167,6 +167,16 @@ The following additional parameters are the same as in FASTA format
 
 - ``lowercase``: see ``lowercase`` parameter in FASTA format
 
+The following parameter is available to all FASTQ format readers:
+
+- ``n_processes``: An integer indicating the number of worker processes used
+  to decode quality scores and construct sequence objects. Records are split
+  from the file in batches by the calling process and handed to the workers;
+  sequences are always returned in the order in which they appear in the file.
+  If ``None`` (the default), all parsing happens in the calling process. This
+  pairs well with the ``n_threads`` parameter of :func:`skbio.io.util.open`,
+  which moves gzip decompression onto background threads.
+
 Examples
 --------
 Suppose we have the following FASTQ file with two DNA sequences::
@@ -283,13 +293,11 @@ from future.builtins import range, zip
 
 import re
 
-import numpy as np
-
 from skbio.io import create_format, FASTQFormatError
 from skbio.io.format._base import (
-    _decode_qual_to_phred, _encode_phred_to_qual, _get_nth_sequence,
+    _decode_qual_to_phred, _encode_phred_batch_to_qual, _get_nth_sequence,
     _parse_fasta_like_header, _format_fasta_like_records, _line_generator,
-    _too_many_blanks)
+    _too_many_blanks, _parallel_map_batches, _batches, _write_batch_size)
 from skbio.alignment import SequenceCollection, Alignment
 from skbio.sequence import Sequence, DNA, RNA, Protein
 
@@ -320,31 +328,17 @@ def _fastq_sniffer(fh):
 
 @fastq.reader(None)
 def _fastq_to_generator(fh, variant=None, phred_offset=None,
-                        constructor=Sequence, **kwargs):
-    # Skip any blank or whitespace-only lines at beginning of file
-    seq_header = next(_line_generator(fh, skip_blanks=True))
-
-    if not seq_header.startswith('@'):
-        raise FASTQFormatError(
-            "Expected sequence (@) header line at start of file: %r"
-            % str(seq_header))
-
-    while seq_header is not None:
-        id_, desc = _parse_fasta_like_header(seq_header)
-        seq, qual_header = _parse_sequence_data(fh, seq_header)
-
-        if qual_header != '+' and qual_header[1:] != seq_header[1:]:
-            raise FASTQFormatError(
-                "Sequence (@) and quality (+) header lines do not match: "
-                "%r != %r" % (str(seq_header[1:]), str(qual_header[1:])))
-
-        phred_scores, seq_header = _parse_quality_scores(fh, len(seq),
-                                                         variant,
-                                                         phred_offset,
-                                                         qual_header)
-        yield constructor(seq, metadata={'id': id_, 'description': desc},
-                          positional_metadata={'quality': phred_scores},
-                          **kwargs)
+                        constructor=Sequence, n_processes=None, **kwargs):
+    records = _parse_records(fh)
+    if n_processes is None:
+        for record in records:
+            yield _record_to_sequence(record, variant, phred_offset,
+                                      constructor, kwargs)
+    else:
+        for seq in _parallel_map_batches(
+                _records_to_sequences, records, n_processes,
+                args=(variant, phred_offset, constructor, kwargs)):
+            yield seq
 
 
 @fastq.reader(Sequence)
@@ -407,16 +401,15 @@ def _generator_to_fastq(obj, fh, variant=None, phred_offset=None,
     formatted_records = _format_fasta_like_records(
         obj, id_whitespace_replacement, description_newline_replacement, True,
         lowercase=lowercase)
-    for header, seq_str, qual_scores in formatted_records:
-        qual_str = _encode_phred_to_qual(qual_scores, variant=variant,
-                                         phred_offset=phred_offset)
-        fh.write('@')
-        fh.write(header)
-        fh.write('\n')
-        fh.write(seq_str)
-        fh.write('\n+\n')
-        fh.write(qual_str)
-        fh.write('\n')
+    # Records are formatted in batches so that quality scores can be encoded
+    # with a single vectorized pass and each batch is written to `fh` with a
+    # single call.
+    for batch in _batches(formatted_records, _write_batch_size):
+        headers, seq_strs, quals = zip(*batch)
+        qual_strs = _encode_phred_batch_to_qual(quals, variant=variant,
+                                                phred_offset=phred_offset)
+        fh.write(''.join(['@%s\n%s\n+\n%s\n' % record
+                          for record in zip(headers, seq_strs, qual_strs)]))
 
 
 @fastq.writer(Sequence)
@@ -481,6 +474,45 @@ def _blank_error(unique_text):
     raise FASTQFormatError(error_string)
 
 
+def _parse_records(fh):
+    # Skip any blank or whitespace-only lines at beginning of file
+    seq_header = next(_line_generator(fh, skip_blanks=True))
+
+    if not seq_header.startswith('@'):
+        raise FASTQFormatError(
+            "Expected sequence (@) header line at start of file: %r"
+            % str(seq_header))
+
+    while seq_header is not None:
+        seq, qual_header = _parse_sequence_data(fh, seq_header)
+
+        if qual_header != '+' and qual_header[1:] != seq_header[1:]:
+            raise FASTQFormatError(
+                "Sequence (@) and quality (+) header lines do not match: "
+                "%r != %r" % (str(seq_header[1:]), str(qual_header[1:])))
+
+        qual, next_header = _parse_quality_scores(fh, len(seq), qual_header)
+        yield seq_header, seq, qual
+        seq_header = next_header
+
+
+def _record_to_sequence(record, variant, phred_offset, constructor, kwargs):
+    seq_header, seq, qual = record
+    id_, desc = _parse_fasta_like_header(seq_header)
+    phred_scores = _decode_qual_to_phred(qual, variant=variant,
+                                         phred_offset=phred_offset)
+    return constructor(seq, metadata={'id': id_, 'description': desc},
+                       positional_metadata={'quality': phred_scores},
+                       **kwargs)
+
+
+def _records_to_sequences(records, variant, phred_offset, constructor,
+                          kwargs):
+    return [_record_to_sequence(record, variant, phred_offset, constructor,
+                                kwargs)
+            for record in records]
+
+
 def _parse_sequence_data(fh, prev):
     seq_chunks = []
     for chunk in _line_generator(fh, skip_blanks=False):
@@ -508,13 +540,13 @@ def _parse_sequence_data(fh, prev):
         "Found incomplete/truncated FASTQ record at end of file.")
 
 
-def _parse_quality_scores(fh, seq_len, variant, phred_offset, prev):
-    phred_scores = []
+def _parse_quality_scores(fh, seq_len, prev):
+    qual_chunks = []
     qual_len = 0
     for chunk in _line_generator(fh, skip_blanks=False):
         if chunk:
             if chunk.startswith('@') and qual_len == seq_len:
-                return np.hstack(phred_scores), chunk
+                return ''.join(qual_chunks), chunk
             else:
                 if not prev:
                     _blank_error("after '+' or within quality scores")
@@ -526,15 +558,13 @@ def _parse_quality_scores(fh, seq_len, variant, phred_offset, prev):
                         "characters. Extra quality score characters: %r" %
                         chunk[-(qual_len - seq_len):])
 
-                phred_scores.append(
-                    _decode_qual_to_phred(chunk, variant=variant,
-                                          phred_offset=phred_offset))
+                qual_chunks.append(chunk)
         prev = chunk
 
     if qual_len != seq_len:
         raise FASTQFormatError(
             "Found incomplete/truncated FASTQ record at end of file.")
-    return np.hstack(phred_scores), None
+    return ''.join(qual_chunks), None
 
 
 def _sequences_to_fastq(obj, fh, variant, phred_offset,
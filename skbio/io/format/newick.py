@@ -16,6 +16,8 @@ Format Support
 +------+------+---------------------------------------------------------------+
 |Reader|Writer|                          Object Class                         |
 +======+======+===============================================================+
+|Yes   |No    |generator of :mod:`skbio.tree.TreeNode` objects                |
++------+------+---------------------------------------------------------------+
 |Yes   |Yes   |:mod:`skbio.tree.TreeNode`                                     |
 +------+------+---------------------------------------------------------------+
 
@@ -160,6 +162,13 @@ the assumption that when a trifurcated root exists in an otherwise bifurcated
 tree that the tree must be unrooted. In scikit-bio, ``skbio.tree.TreeNode``
 will always be rooted at the ``newick`` root (``;``).
 
+Multiple Trees
+~~~~~~~~~~~~~~
+A file may hold several trees, each terminated by its own ``;`` (e.g., the
+trees of a bootstrap analysis, one per line). Reading such a file into a
+``skbio.tree.TreeNode`` returns its first tree, while the generator reader
+yields its trees one at a time, parsing each tree only when it is requested.
+
 Format Parameters
 -----------------
 The only supported format parameter is `convert_underscores`. This is `True` by
@@ -205,6 +214,17 @@ This is a complex Newick string.
 Notice that the node originally labeled ``d_d`` became ``d d``. Additionally
 ``'b_b'''`` became ``b_b'``. Note that the underscore was preserved in `b_b'`.
 
+This is a file of several trees, which are read one at a time.
+
+>>> f = StringIO("((a, b), c); (a, (b, c));")
+>>> for tree in read(f, format="newick"):
+...     print(tree)
+((a,b),c);
+<BLANKLINE>
+(a,(b,c));
+<BLANKLINE>
+>>> f.close()
+
 References
 ----------
 .. [1] http://evolution.genetics.washington.edu/phylip/newick_doc.html
@@ -223,13 +243,21 @@ References
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import gc
+import re
+
 from future.builtins import zip, range
+import six
 
 from skbio.io import create_format, NewickFormatError
 from skbio.tree import TreeNode
 
 newick = create_format('newick')
 
+_structure_tokens = frozenset('(),;:')
+_newick_structure = re.compile(r"([(),;:])")
+_needs_quotes = re.compile(r"[,:_;()[\]]")
+
 
 @newick.sniffer()
 def _newick_sniffer(fh):
@@ -259,7 +287,7 @@ def _newick_sniffer(fh):
                 pass
             elif token == ')' and last_token != ':':
                 indent -= 1
-            elif token == '(' and (last_token == '(' or last_token == ','):
+            elif token == '(' and last_token in ('(', ',', ';'):
                 indent += 1
             else:
                 raise NewickFormatError()
@@ -272,105 +300,145 @@ def _newick_sniffer(fh):
     return not empty, {}
 
 
+@newick.reader(None)
+def _newick_to_generator(fh, convert_underscores=True):
+    for tree in _parse_newick(_tokenize_newick(
+            fh, convert_underscores=convert_underscores)):
+        yield tree
+
+
 @newick.reader(TreeNode)
 def _newick_to_tree_node(fh, convert_underscores=True):
-    tree_stack = []
-    current_depth = 0
-    last_token = ''
-    next_is_distance = False
-    root = TreeNode()
-    tree_stack.append((root, current_depth))
-    for token in _tokenize_newick(fh, convert_underscores=convert_underscores):
-        # Check for a label
-        if last_token not in '(,):':
-            if not next_is_distance:
-                tree_stack[-1][0].name = last_token if last_token else None
-            else:
-                next_is_distance = False
-        # Check for a distance
-        if token == ':':
-            next_is_distance = True
-        elif last_token == ':':
-            try:
-                tree_stack[-1][0].length = float(token)
-            except ValueError:
-                raise NewickFormatError("Could not read length as numeric type"
-                                        ": %s." % token)
-
-        elif token == '(':
-            current_depth += 1
-            tree_stack.append((TreeNode(), current_depth))
-        elif token == ',':
-            tree_stack.append((TreeNode(), current_depth))
-        elif token == ')':
-            if len(tree_stack) < 2:
-                raise NewickFormatError("Could not parse file as newick."
-                                        " Parenthesis are unbalanced.")
-            children = []
-            # Pop all nodes at this depth as they belong to the remaining
-            # node on the top of the stack as children.
-            while current_depth == tree_stack[-1][1]:
-                node, _ = tree_stack.pop()
-                children.insert(0, node)
-            parent = tree_stack[-1][0]
-            if parent.children:
-                raise NewickFormatError("Could not parse file as newick."
-                                        " Contains unnested children.")
-            # This is much faster than TreeNode.extend
-            for child in children:
-                child.parent = parent
-            parent.children = children
-            current_depth -= 1
-        elif token == ';':
-            if len(tree_stack) == 1:
-                return root
-            break
-
-        last_token = token
-
-    raise NewickFormatError("Could not parse file as newick."
-                            " `(Parenthesis)`, `'single-quotes'`,"
-                            " `[comments]` may be unbalanced, or tree may be"
-                            " missing its root.")
+    for tree in _parse_newick(_tokenize_newick(
+            fh, convert_underscores=convert_underscores)):
+        return tree
+
+
+def _parse_newick(tokens):
+    """Yield the trees of a stream of newick tokens, one per ``;``.
+
+    Tokens are only consumed up to the ``;`` of the tree being yielded, so
+    trees are parsed one at a time.
+
+    The cyclic garbage collector is paused while a tree is being built: all
+    of its nodes are reachable, and the collections triggered by allocating
+    them would otherwise traverse the growing tree over and over again.
+
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # The nodes of the tree being parsed, grouped by depth: the last list
+        # holds the siblings of the deepest open parenthesis, and the last
+        # node of each list is the one that a `(` would add children to.
+        stack = [[TreeNode()]]
+        node = stack[0][0]
+        last_token = ''
+        # whether any tree has been yielded, and whether tokens have been
+        # read since the last one
+        found_tree = False
+        pending = False
+        for token in tokens:
+            pending = True
+            if last_token == ':' and token != ':':
+                try:
+                    node.length = float(token)
+                except ValueError:
+                    raise NewickFormatError("Could not read length as numeric"
+                                            " type: %s." % token)
+            elif token not in _structure_tokens:
+                # a label (empty labels do not name the node)
+                if token:
+                    node.name = token
+            elif token == ',':
+                node = TreeNode()
+                stack[-1].append(node)
+            elif token == '(':
+                node = TreeNode()
+                stack.append([node])
+            elif token == ')':
+                if len(stack) < 2:
+                    raise NewickFormatError("Could not parse file as newick."
+                                            " Parenthesis are unbalanced.")
+                children = stack.pop()
+                node = stack[-1][-1]
+                if node.children:
+                    raise NewickFormatError("Could not parse file as newick."
+                                            " Contains unnested children.")
+                # This is much faster than TreeNode.extend
+                for child in children:
+                    child.parent = node
+                node.children = children
+            elif token == ';':
+                if len(stack) != 1 or len(stack[0]) != 1:
+                    break
+                if gc_enabled:
+                    gc.enable()
+                yield stack[0][0]
+                gc.disable()
+
+                # start the next tree
+                found_tree = True
+                pending = False
+                stack = [[TreeNode()]]
+                node = stack[0][0]
+                last_token = ''
+                continue
+
+            last_token = token
+
+        else:
+            if found_tree and not pending:
+                return
+
+        raise NewickFormatError("Could not parse file as newick."
+                                " `(Parenthesis)`, `'single-quotes'`,"
+                                " `[comments]` may be unbalanced, or tree may"
+                                " be missing its root.")
+    finally:
+        if gc_enabled:
+            gc.enable()
 
 
 @newick.writer(TreeNode)
 def _tree_node_to_newick(obj, fh):
-    operators = set(",:_;()[]")
-    current_depth = 0
-    nodes_left = [(obj, 0)]
-    while len(nodes_left) > 0:
-        entry = nodes_left.pop()
-        node, node_depth = entry
-        if node.children and node_depth >= current_depth:
-            fh.write('(')
-            nodes_left.append(entry)
-            nodes_left += ((child, node_depth + 1) for child in
-                           reversed(node.children))
-            current_depth = node_depth + 1
+    # The tree is written as a list of strings that is joined and written
+    # once. The stack holds the nodes still to be written, along with the
+    # `,` separating them and the `)` and label closing each internal node.
+    pieces = []
+    nodes_left = [obj]
+    while nodes_left:
+        node = nodes_left.pop()
+        if isinstance(node, six.string_types):
+            pieces.append(node)
+            continue
+
+        # Note we don't check for None because there is no way to represent
+        # an empty string as a label in Newick. Therefore, both None and ''
+        # are considered to be the absence of a label.
+        label = ''
+        if node.name:
+            escaped = "%s" % node.name.replace("'", "''")
+            if _needs_quotes.search(node.name):
+                label = "'%s'" % escaped
+            else:
+                label = escaped.replace(" ", "_")
+        if node.length is not None:
+            label = "%s:%s" % (label, node.length)
+
+        children = node.children
+        if children:
+            pieces.append('(')
+            nodes_left.append(')' + label)
+            nodes_left.append(children[-1])
+            for child in reversed(children[:-1]):
+                nodes_left.append(',')
+                nodes_left.append(child)
         else:
-            if node_depth < current_depth:
-                fh.write(')')
-                current_depth -= 1
-
-            # Note we don't check for None because there is no way to represent
-            # an empty string as a label in Newick. Therefore, both None and ''
-            # are considered to be the absence of a label.
-            if node.name:
-                escaped = "%s" % node.name.replace("'", "''")
-                if any(t in operators for t in node.name):
-                    fh.write("'")
-                    fh.write(escaped)
-                    fh.write("'")
-                else:
-                    fh.write(escaped.replace(" ", "_"))
-            if node.length is not None:
-                fh.write(':')
-                fh.write("%s" % node.length)
-            if nodes_left and nodes_left[-1][1] == current_depth:
-                fh.write(',')
-
-    fh.write(';\n')
+            pieces.append(label)
+
+    pieces.append(';\n')
+    fh.write(''.join(pieces))
 
 
 def _tokenize_newick(fh, convert_underscores=True):
@@ -395,7 +463,40 @@ def _tokenize_newick(fh, convert_underscores=True):
     #
     # We use ' to indicate a literal string. It has the highest precedence of
     # any operator.
+    #
+    # Lines without literals or comments (by far the most common) are split
+    # on the structure tokens with a regular expression instead.
     for line in fh:
+        if (comment_depth == 0 and not_escaped and last_non_ws_char != "'" and
+                "'" not in line and "[" not in line):
+            tokens = _newick_structure.split(line)
+            for chunk, character in zip(tokens[::2], tokens[1::2] + ['']):
+                if chunk:
+                    words = chunk.split()
+                    if words:
+                        if len(words) > 1 or (label_start and (
+                                chunk[0].isspace() or last_char.isspace())):
+                            raise NewickFormatError(
+                                "Newick files cannot have unescaped"
+                                " whitespace in their labels.")
+                        metadata_buffer.append(words[0])
+                        label_start = True
+                    last_char = chunk[-1]
+                if character:
+                    label_start = False
+                    metadata = ''.join(metadata_buffer)
+                    if not convert_underscores:
+                        yield metadata
+                    elif metadata:
+                        yield metadata.replace('_', ' ')
+                    metadata_buffer = []
+                    yield character
+                    last_char = character
+            stripped = line.rstrip()
+            if stripped:
+                last_non_ws_char = stripped[-1]
+            continue
+
         for character in line:
             # We will start by handling the comment case.
             # This code branch will probably never execute in practice.
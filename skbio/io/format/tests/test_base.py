@@ -12,15 +12,18 @@ import six
 from future.builtins import range, zip
 
 import unittest
+import warnings
 
 import numpy.testing as npt
 import numpy as np
 
 from skbio import Sequence, DNA, RNA
 from skbio.io.format._base import (_decode_qual_to_phred,
-                                   _encode_phred_to_qual, _get_nth_sequence,
+                                   _encode_phred_to_qual,
+                                   _encode_phred_batch_to_qual,
+                                   _get_nth_sequence,
                                    _parse_fasta_like_header,
-                                   _format_fasta_like_records)
+                                   _format_fasta_like_records, _batches)
 
 
 class PhredDecoderTests(unittest.TestCase):
@@ -199,6 +202,35 @@ class PhredEncoderTests(unittest.TestCase):
                                [42, 255, 33], phred_offset=42)
         self.assertEqual(obs, 'T~K')
 
+    def test_batch(self):
+        obs = _encode_phred_batch_to_qual(
+            [[42, 0], [], np.array([93], dtype=np.uint8), [1, 2, 3]],
+            variant='sanger')
+        self.assertEqual(obs, ['K!', '', '~', '"#$'])
+
+        self.assertEqual(_encode_phred_batch_to_qual([], variant='sanger'),
+                         [])
+
+        with self.assertRaises(ValueError) as cm:
+            _encode_phred_batch_to_qual([[42], [0, -2]], variant='sanger')
+        self.assertIn('-2', str(cm.exception))
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            obs = _encode_phred_batch_to_qual([[95, 94], [94, 42]],
+                                              variant='sanger')
+        self.assertEqual(obs, ['~~', '~K'])
+        self.assertEqual([str(x.message)[:14] for x in w],
+                         ['Phred score 95', 'Phred score 94'])
+
+
+class TestBatches(unittest.TestCase):
+    def test_batches(self):
+        self.assertEqual(list(_batches(range(7), 3)),
+                         [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(_batches(range(6), 3)), [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(list(_batches([], 3)), [])
+
 
 class TestGetNthSequence(unittest.TestCase):
     def setUp(self):
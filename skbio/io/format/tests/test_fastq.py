@@ -317,6 +317,23 @@ class TestReaders(unittest.TestCase):
                     for o, e in zip(observed, expected):
                         self.assertEqual(o, e)
 
+    def test_fastq_to_generator_n_processes(self):
+        for valid_files, kwargs, components in self.valid_configurations:
+            for valid in valid_files:
+                for observed_kwargs in kwargs:
+                    _drop_kwargs(observed_kwargs, 'seq_num')
+                    observed_kwargs['lowercase'] = 'introns'
+                    expected = list(_fastq_to_generator(valid,
+                                                        **observed_kwargs))
+                    observed = list(_fastq_to_generator(valid, n_processes=2,
+                                                        **observed_kwargs))
+                    self.assertEqual(observed, expected)
+
+        fp = get_data_path('sanger_full_range_original_sanger.fastq')
+        with six.assertRaisesRegex(self, ValueError, 'out of range'):
+            list(_fastq_to_generator(fp, variant='illumina1.8',
+                                     n_processes=2))
+
     def test_fastq_to_generator_invalid_files_all_variants(self):
         # files that should be invalid for all variants, as well as custom
         # phred offsets
@@ -8,12 +8,16 @@
 
 from __future__ import absolute_import, division, print_function
 
+import gc
 import unittest
 
+import six
+
 from skbio import TreeNode
 from skbio.io import NewickFormatError
 from skbio.io.format.newick import (
-    _newick_to_tree_node, _tree_node_to_newick, _newick_sniffer)
+    _newick_to_tree_node, _newick_to_generator, _tree_node_to_newick,
+    _newick_sniffer)
 from skbio.io._fileobject import StringIO
 
 
@@ -294,6 +298,7 @@ class TestNewick(unittest.TestCase):
             ("#SampleID\tHeaderA\tHeaderB\n0\t'yellow'\t0.45;", ['whitespace',
                                                                  'label']),
             ("))();", ['Parenthesis', 'unbalanced']),
+            ("a,b);", ['Parenthesis', 'unbalanced']),
             ("((,,),((,,));", ['Parenthesis', 'unbalanced']),
             ("\n".join([",".join(str(i) for i in range(100))
                        for _ in range(100)]), ['whitespace', 'label'])
@@ -318,6 +323,95 @@ class TestNewick(unittest.TestCase):
                 self.assertIn(frag, str(cm.exception))
             fh.close()
 
+    def test_newick_to_generator(self):
+        trees = [tree for tree, _ in self.trees_newick_lists]
+        newick = ''.join(newicks[0] for _, newicks in self.trees_newick_lists)
+        fh = StringIO(newick)
+        observed = _newick_to_generator(fh)
+        for tree in trees:
+            self._assert_equal(tree, next(observed))
+        with self.assertRaises(StopIteration):
+            next(observed)
+        fh.close()
+
+        fh = StringIO(' (a,b)c;[comment]\n\n(d, e):0.5;\t\n')
+        observed = list(_newick_to_generator(fh))
+        self.assertEqual([str(tree) for tree in observed],
+                         ['(a,b)c;\n', '(d,e):0.5;\n'])
+        fh.close()
+
+        for tree, newicks in self.trees_newick_lists:
+            for newick in newicks:
+                fh = StringIO(newick)
+                observed = list(_newick_to_generator(fh))
+                self.assertEqual(len(observed), 1)
+                self._assert_equal(tree, observed[0])
+                fh.close()
+
+    def test_newick_to_generator_is_lazy(self):
+        # trees are parsed one at a time, so the first tree is returned
+        # before an invalid second tree is reached
+        fh = StringIO('(a,b);(c,d));')
+        observed = _newick_to_generator(fh)
+        self.assertEqual(str(next(observed)), '(a,b);\n')
+        with self.assertRaises(NewickFormatError):
+            next(observed)
+        fh.close()
+
+    def test_newick_to_generator_invalid_files(self):
+        for invalid, error_fragments in self.invalid_newicks:
+            fh = StringIO(invalid)
+            with self.assertRaises(NewickFormatError) as cm:
+                list(_newick_to_generator(fh))
+            for frag in error_fragments:
+                self.assertIn(frag, str(cm.exception))
+            fh.close()
+
+        for invalid in ('(a,b);(c,d)', '(a,b);(c,d:);', '(a,b);((c);'):
+            fh = StringIO(invalid)
+            with self.assertRaises(NewickFormatError):
+                list(_newick_to_generator(fh))
+            fh.close()
+
+    def test_newick_to_tree_node_labels_across_lines(self):
+        fh = StringIO('(a\n,b_c\n:1.5, d\n)\ne;\n')
+        tree = _newick_to_tree_node(fh)
+        self.assertEqual(str(tree), '(a,b_c:1.5,d)e;\n')
+        self.assertEqual(tree.children[1].name, 'b c')
+        fh.close()
+
+        for invalid in ('(a\nb);', '(a,b\n c);', "('a'\nb);"):
+            fh = StringIO(invalid)
+            with six.assertRaisesRegex(self, NewickFormatError, 'whitespace'):
+                _newick_to_tree_node(fh)
+            fh.close()
+
+    def test_newick_to_tree_node_restores_gc(self):
+        self.assertTrue(gc.isenabled())
+        for newick in ('((a,b),c);', '((a,b),c);(d,e);', '((a,b),c;'):
+            fh = StringIO(newick)
+            try:
+                _newick_to_tree_node(fh)
+            except NewickFormatError:
+                pass
+            self.assertTrue(gc.isenabled())
+            fh.close()
+
+        fh = StringIO('(a,b);(c,d);')
+        observed = _newick_to_generator(fh)
+        next(observed)
+        self.assertTrue(gc.isenabled())
+        fh.close()
+
+        gc.disable()
+        try:
+            fh = StringIO('(a,b);')
+            _newick_to_tree_node(fh)
+            self.assertFalse(gc.isenabled())
+            fh.close()
+        finally:
+            gc.enable()
+
     def test_tree_node_to_newick(self):
         for tree, newicks in self.trees_newick_lists:
             newick = newicks[0]
@@ -360,6 +454,12 @@ class TestNewick(unittest.TestCase):
                 self.assertEqual(_newick_sniffer(fh), (True, {}))
                 fh.close()
 
+    def test_newick_sniffer_multiple_trees(self):
+        fh = StringIO(''.join(newicks[0]
+                              for _, newicks in self.trees_newick_lists))
+        self.assertEqual(_newick_sniffer(fh), (True, {}))
+        fh.close()
+
     def test_newick_sniffer_invalid_files(self):
         for invalid, _ in self.invalid_newicks:
             fh = StringIO(invalid)
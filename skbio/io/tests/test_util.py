@@ -569,5 +569,64 @@ class TestIterableReaderWriter(unittest.TestCase):
         self.assertTrue(fh.closed)
 
 
+class TestOpenThreadedGzip(unittest.TestCase):
+    def setUp(self):
+        self.contents = (b"This is some content\n"
+                         b"It occurs on more than one line\n")
+        self.files = [get_data_path(fp) for fp in
+                      ['example_file.gz', 'example_file_multi_member.gz',
+                       'example_file.bgz']]
+
+    def test_open_binary(self):
+        for fp in self.files:
+            for n_threads in 1, 2, 4:
+                with skbio.io.open(fp, encoding='binary',
+                                   n_threads=n_threads) as fh:
+                    self.assertEqual(fh.read(), self.contents)
+                self.assertTrue(fh.closed)
+
+    def test_open_encoding(self):
+        for fp in self.files:
+            with skbio.io.open(fp, n_threads=2) as fh:
+                self.assertEqual(fh.readlines(),
+                                 [u'This is some content\n',
+                                  u'It occurs on more than one line\n'])
+
+    def test_open_file_seek(self):
+        for fp in self.files:
+            with open_file(fp, n_threads=2) as fh:
+                self.assertEqual(fh.readline(), u'This is some content\n')
+                fh.seek(0)
+                self.assertEqual(fh.readline(), u'This is some content\n')
+                self.assertEqual(fh.readline(),
+                                 u'It occurs on more than one line\n')
+                self.assertEqual(fh.readline(), u'')
+
+    def test_open_close_before_exhausted(self):
+        for fp in self.files:
+            fh = skbio.io.open(fp, encoding='binary', n_threads=2)
+            self.assertEqual(fh.read(4), b'This')
+            fh.close()
+            self.assertTrue(fh.closed)
+
+    def test_open_truncated(self):
+        with io.open(get_data_path('example_file.gz'), 'rb') as fh:
+            truncated = io.BytesIO(fh.read()[:-10])
+        with self.assertRaises(EOFError):
+            with skbio.io.open(truncated, encoding='binary',
+                               n_threads=1) as fh:
+                fh.read()
+
+    def test_open_invalid_n_threads(self):
+        with self.assertRaises(ValueError):
+            skbio.io.open(get_data_path('example_file.gz'), n_threads=0)
+
+    def test_open_uncompressed(self):
+        # n_threads has no effect when the file isn't gzip-compressed
+        with skbio.io.open(get_data_path('example_file'), encoding='binary',
+                           n_threads=2) as fh:
+            self.assertEqual(fh.read(), self.contents)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -40,12 +40,13 @@ from skbio.io._fileobject import (
 from skbio.util._decorator import stable
 
 _d = dict(mode='r', encoding=None, errors=None, newline=None,
-          compression='auto', compresslevel=9)
+          compression='auto', compresslevel=9, n_threads=None)
 
 
 def _resolve(file, mode=_d['mode'], encoding=_d['encoding'],
              errors=_d['errors'], newline=_d['newline'],
-             compression=_d['compression'], compresslevel=_d['compresslevel']):
+             compression=_d['compression'], compresslevel=_d['compresslevel'],
+             n_threads=_d['n_threads']):
     arguments = locals().copy()
 
     if mode not in {'r', 'w'}:
@@ -72,7 +73,7 @@ def _resolve(file, mode=_d['mode'], encoding=_d['encoding'],
 @stable(as_of="0.4.0")
 def open(file, mode=_d['mode'], encoding=_d['encoding'], errors=_d['errors'],
          newline=_d['newline'], compression=_d['compression'],
-         compresslevel=_d['compresslevel']):
+         compresslevel=_d['compresslevel'], n_threads=_d['n_threads']):
     r"""Convert input into a filehandle.
 
     Supported inputs:
@@ -135,6 +136,13 @@ def open(file, mode=_d['mode'], encoding=_d['encoding'], errors=_d['errors'],
     compresslevel : int (0-9 inclusive), optional
         The level of compression to use, will be passed to the appropriate
         compression handler. This is only used when writing.
+    n_threads : int, optional
+        Number of threads to use when decompressing gzip data. If provided,
+        decompression happens on background threads so that it overlaps with
+        reading/parsing of the decompressed data. BGZF files (e.g., produced by
+        ``bgzip``) are decompressed block-parallel using `n_threads` threads.
+        If None (the default), gzip data is decompressed serially on the
+        calling thread. This is only used when reading.
 
     Returns
     -------
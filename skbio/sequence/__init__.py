@@ -33,6 +33,16 @@ Classes
    RNA
    Protein
    GeneticCode
+   MotifSet
+   DegenerateExpansions
+
+Functions
+---------
+
+.. autosummary::
+   :toctree: generated/
+
+   kmer_count_matrix
 
 Examples
 --------
@@ -292,7 +302,11 @@ from ._protein import Protein
 from ._dna import DNA
 from ._rna import RNA
 from ._genetic_code import GeneticCode
+from ._motif_set import MotifSet
+from ._degenerate_expansions import DegenerateExpansions
+from ._kmer import kmer_count_matrix
 
-__all__ = ['Sequence', 'Protein', 'DNA', 'RNA', 'GeneticCode']
+__all__ = ['Sequence', 'Protein', 'DNA', 'RNA', 'GeneticCode', 'MotifSet',
+           'DegenerateExpansions', 'kmer_count_matrix']
 
 test = TestRunner(__file__).test
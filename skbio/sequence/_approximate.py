@@ -0,0 +1,218 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+
+# Sequences are split into about this many windows, which are searched
+# together one column at a time.
+_num_windows = 4096
+
+
+def _pattern_masks(pattern, degenerate_map):
+    """Return bitmask of the pattern positions matching each ASCII code.
+
+    A degenerate character in `pattern` matches itself and the characters it
+    represents; every other character matches only itself. Code zero, used
+    for padding, matches nothing.
+
+    """
+    masks = np.zeros(256, dtype=np.uint64)
+    for i, char in enumerate(pattern.decode('ascii')):
+        bit = np.uint64(1) << np.uint64(i)
+        masks[ord(char)] |= bit
+        for match in degenerate_map.get(char, ()):
+            masks[ord(match)] |= bit
+    masks[0] = 0
+    return masks
+
+
+def _myers(text, masks, length, anchored=False):
+    """Compute edit distances with Myers' bit-parallel algorithm.
+
+    Parameters
+    ----------
+    text : 2D np.ndarray (np.uint8)
+        Texts to search (one per row), all searched at once.
+    masks : 1D np.ndarray (np.uint64)
+        Pattern bitmasks from ``_pattern_masks``.
+    length : int
+        Pattern length (at most 64).
+    anchored : bool, optional
+        If ``True``, alignments must start at the beginning of the text.
+
+    Returns
+    -------
+    2D np.ndarray (np.int16)
+        Element ``[i, j]`` is the smallest edit distance between the pattern
+        and a substring of row ``i`` ending at (and including) column ``j``.
+        If `anchored`, the substring must start at column zero.
+
+    """
+    one = np.uint64(1)
+    mask = np.uint64((1 << length) - 1)
+    high = np.uint64(1 << (length - 1))
+
+    num_rows, num_columns = text.shape
+    positive = np.empty(num_rows, dtype=np.uint64)
+    positive.fill(mask)
+    negative = np.zeros(num_rows, dtype=np.uint64)
+    score = np.empty(num_rows, dtype=np.int16)
+    score.fill(length)
+    distances = np.empty((num_rows, num_columns), dtype=np.int16)
+
+    for j in range(num_columns):
+        matches = masks[text[:, j]]
+        vertical = matches | negative
+        horizontal = (((matches & positive) + positive) ^ positive) | matches
+        horizontal_positive = negative | ~(horizontal | positive)
+        horizontal_negative = positive & horizontal
+        score += (horizontal_positive & high) != 0
+        score -= (horizontal_negative & high) != 0
+
+        horizontal_positive <<= one
+        if anchored:
+            horizontal_positive |= one
+        horizontal_negative <<= one
+        positive = (horizontal_negative |
+                    ~(vertical | horizontal_positive)) & mask
+        negative = horizontal_positive & vertical & mask
+        distances[:, j] = score
+
+    return distances
+
+
+def _find_approximate(chars, offsets, pattern, degenerate_map, max_distance,
+                      indels):
+    """Find approximate matches of a pattern in concatenated sequences.
+
+    Returns the sequence, start, end and distance of each match, ordered by
+    sequence and position.
+
+    """
+    if not offsets[-1]:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, empty, empty
+    if indels:
+        return _find_edit_distance(chars, offsets, pattern, degenerate_map,
+                                   max_distance)
+    return _find_hamming(chars, offsets, pattern, degenerate_map,
+                         max_distance)
+
+
+def _find_hamming(chars, offsets, pattern, degenerate_map, max_distance):
+    length = len(pattern)
+    matches = _pattern_masks(pattern, degenerate_map)[chars]
+    num_starts = max(chars.size - length + 1, 0)
+    distances = np.zeros(num_starts, dtype=np.int16)
+    for i in range(length):
+        bit = np.uint64(1) << np.uint64(i)
+        distances += (matches[i:i + num_starts] & bit) == 0
+
+    starts = (distances <= max_distance).nonzero()[0]
+    sequences = np.searchsorted(offsets, starts, side='right') - 1
+    # discard matches spanning several sequences
+    in_sequence = starts + length <= offsets[sequences + 1]
+    starts = starts[in_sequence]
+    sequences = sequences[in_sequence]
+    distances = distances[starts].astype(np.intp)
+
+    starts = starts - offsets[sequences]
+    return sequences, starts, starts + length, distances
+
+
+def _find_edit_distance(chars, offsets, pattern, degenerate_map,
+                        max_distance):
+    length = len(pattern)
+    masks = _pattern_masks(pattern, degenerate_map)
+    # alignments with at most `max_distance` edits are never longer than this
+    max_match_length = length + max_distance
+
+    # Split the sequences into windows overlapping by `max_match_length - 1`
+    # characters so that every match is entirely within some window. Each
+    # window reports the matches ending after the overlap with the previous
+    # window.
+    lengths = np.diff(offsets)
+    overlap = max_match_length - 1
+    window_size = max(-(-offsets[-1] // _num_windows), 4 * max_match_length)
+    if lengths.size:
+        window_size = min(window_size, lengths.max())
+    step = window_size - overlap
+    num_windows = np.where(lengths > window_size,
+                           1 - (-(lengths - window_size) // step), 1)
+    window_sequences = np.repeat(np.arange(lengths.size), num_windows)
+    window_numbers = (np.arange(window_sequences.size) -
+                      np.repeat(np.cumsum(num_windows) - num_windows,
+                                num_windows))
+    window_starts = offsets[window_sequences] + window_numbers * step
+    window_ends = np.minimum(window_starts + window_size,
+                             offsets[window_sequences + 1])
+
+    columns = window_starts[:, np.newaxis] + np.arange(window_size)
+    in_window = columns < window_ends[:, np.newaxis]
+    text = np.where(in_window, chars[np.minimum(columns, chars.size - 1)],
+                    0).astype(np.uint8)
+    distances = _myers(text, masks, length)
+
+    reported = in_window & (distances <= max_distance)
+    reported[window_numbers > 0, :overlap] = False
+    rows, ends = reported.nonzero()
+    end_distances = distances[rows, ends]
+    ends = window_starts[rows] + ends + 1
+    sequences = window_sequences[rows]
+    order = np.lexsort((ends, sequences))
+    ends = ends[order]
+    sequences = sequences[order]
+    end_distances = end_distances[order]
+
+    # Consecutive match ends describe essentially the same match (e.g.,
+    # extended or shortened by an indel), so only the first end with the
+    # smallest distance is reported for each run of consecutive ends.
+    new_run = np.ones(ends.size, dtype=bool)
+    new_run[1:] = (ends[1:] != ends[:-1] + 1) | (sequences[1:] !=
+                                                 sequences[:-1])
+    runs = np.cumsum(new_run) - 1
+    order = np.lexsort((ends, end_distances, runs))
+    best = order[np.concatenate([[True], runs[order][1:] !=
+                                 runs[order][:-1]])] if order.size else order
+    ends = ends[best]
+    sequences = sequences[best]
+    end_distances = end_distances[best]
+
+    starts = _find_starts(chars, offsets[sequences], ends, pattern,
+                          degenerate_map, end_distances, max_match_length)
+    return (sequences, starts - offsets[sequences],
+            ends - offsets[sequences], end_distances.astype(np.intp))
+
+
+def _find_starts(chars, sequence_starts, ends, pattern, degenerate_map,
+                 distances, max_match_length):
+    """Find where matches with known end and edit distance start.
+
+    The reversed pattern is aligned to the reversed text preceding each end,
+    anchored at the end. Among the starts resulting in the smallest distance,
+    the one giving a match length closest to the pattern length is chosen.
+
+    """
+    length = len(pattern)
+    masks = _pattern_masks(pattern[::-1], degenerate_map)
+    columns = ends[:, np.newaxis] - 1 - np.arange(max_match_length)
+    in_sequence = columns >= sequence_starts[:, np.newaxis]
+    text = np.where(in_sequence, chars[np.maximum(columns, 0)],
+                    0).astype(np.uint8)
+    reverse_distances = _myers(text, masks, length, anchored=True)
+
+    match_lengths = np.arange(1, max_match_length + 1)
+    candidates = in_sequence & (reverse_distances == distances[:,
+                                                               np.newaxis])
+    preference = np.where(candidates,
+                          2 * np.abs(match_lengths - length) +
+                          (match_lengths > length), np.iinfo(np.intp).max)
+    return ends - match_lengths[preference.argmin(axis=1)]
@@ -8,6 +8,11 @@
 
 from __future__ import absolute_import, division, print_function
 
+import itertools
+
+import numpy as np
+import pandas as pd
+
 
 class ElasticLines(object):
     """Store blocks of content separated by dashed lines.
@@ -41,3 +46,70 @@ class ElasticLines(object):
         for idx in self._separator_idxs:
             self._lines[idx] = separator
         return '\n'.join(self._lines)
+
+
+def _split_concatenated(sequences, offsets):
+    """Validate the offsets of sequences concatenated into a single buffer.
+
+    Returns the characters of the sequences delimited by `offsets` (as a 1D
+    ``np.uint8`` array) and the offsets relative to the first of them.
+
+    """
+    chars = np.frombuffer(sequences, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if (offsets.ndim != 1 or offsets.size < 1 or offsets[0] < 0 or
+            offsets[-1] > chars.size or (np.diff(offsets) < 0).any()):
+        raise ValueError(
+            "`offsets` must be a non-decreasing 1D array of positions "
+            "within `sequences`, starting with the first sequence's "
+            "start position.")
+    return chars[offsets[0]:offsets[-1]], offsets - offsets[0]
+
+
+def _concatenate_chunks(sequences, chunk_size, types, description):
+    """Concatenate the characters of consecutive chunks of sequences.
+
+    Yields the characters of up to `chunk_size` sequences at a time (all of
+    them if `chunk_size` is ``None``) and their offsets, as returned by
+    ``_split_concatenated``. Sequences must be instances of `types`, which
+    `description` names in the error message.
+
+    """
+    sequences = iter(sequences)
+    while True:
+        chunk = list(itertools.islice(sequences, chunk_size))
+        if not chunk:
+            break
+        for sequence in chunk:
+            if not isinstance(sequence, types):
+                raise TypeError("Sequences must be %s, not %s"
+                                % (description, type(sequence).__name__))
+        chars = np.concatenate([sequence._bytes for sequence in chunk])
+        offsets = np.cumsum([0] + [len(sequence) for sequence in chunk])
+        yield chars, offsets
+
+
+def _search_chunks(chunks, search, columns):
+    """Search chunks of concatenated sequences and collect the hits.
+
+    `search` is called with the characters and offsets of each chunk and
+    returns one array of hits per column in `columns`, the first of which
+    holds the index of the sequence in the chunk. Returns the hits as a
+    ``pd.DataFrame``, with sequence indices counted across all chunks.
+
+    """
+    hits = {column: [] for column in columns}
+    num_sequences = 0
+    for chars, offsets in chunks:
+        for column, values in zip(columns, search(chars, offsets)):
+            if column == columns[0]:
+                values = values + num_sequences
+            hits[column].append(values)
+        num_sequences += offsets.size - 1
+
+    if not hits[columns[0]]:
+        return pd.DataFrame(
+            {column: np.empty(0, dtype=np.intp) for column in columns},
+            columns=columns)
+    return pd.DataFrame({column: np.concatenate(hits[column])
+                         for column in columns}, columns=columns)
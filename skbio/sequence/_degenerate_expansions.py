@@ -0,0 +1,353 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import functools
+import itertools
+import numbers
+import operator
+
+import numpy as np
+
+from skbio.util._decorator import experimental
+from ._iupac_sequence import IUPACSequence
+
+
+class DegenerateExpansions(object):
+    """Lazily enumerate the non-degenerate versions of a sequence.
+
+    The expansions are never all stored: their number is computed from the
+    degenerate characters of the sequence, any expansion can be built from
+    its index, and the expansions are generated in batches of byte arrays.
+    Whether a sequence is one of the expansions is tested without enumerating
+    them.
+
+    Parameters
+    ----------
+    sequence : IUPACSequence
+        Sequence to expand (e.g., a degenerate ``DNA`` primer).
+
+    Raises
+    ------
+    TypeError
+        If `sequence` is not an ``IUPACSequence``.
+
+    See Also
+    --------
+    skbio.sequence.DNA.expand_degenerates
+    skbio.sequence.DNA.degenerate_map
+
+    Notes
+    -----
+    Expansions are ordered like ``itertools.product``: the last degenerate
+    position varies fastest and the characters each degenerate character
+    represents are in sorted order. Gap characters are kept as they are.
+
+    Each expansion has the same type, metadata, and positional metadata as
+    `sequence`.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import DegenerateExpansions
+    >>> expansions = DegenerateExpansions(DNA('TRGN'))
+    >>> len(expansions)
+    8
+    >>> str(expansions[0])
+    'TAGA'
+    >>> str(expansions[-1])
+    'TGGT'
+
+    Test whether sequences are expansions of the primer:
+
+    >>> DNA('TGGC') in expansions
+    True
+    >>> expansions.matches('TCGC')
+    False
+
+    Generate the expansions as arrays of ASCII codes:
+
+    >>> for batch in expansions.iter_batches(batch_size=4):
+    ...     batch.shape
+    ...     print(' '.join(str(DNA(chars)) for chars in batch))
+    (4, 4)
+    TAGA TAGC TAGG TAGT
+    (4, 4)
+    TGGA TGGC TGGG TGGT
+
+    """
+    @experimental(as_of='0.4.0-dev')
+    def __init__(self, sequence):
+        if not isinstance(sequence, IUPACSequence):
+            raise TypeError("`sequence` must be an IUPACSequence object, not "
+                            "%r" % type(sequence).__name__)
+
+        chars = sequence.values.view(np.uint8)
+        length = len(chars)
+        # allowed[i, c] is True if ASCII code c may be at position i of an
+        # expansion
+        allowed = np.zeros((length, 256), dtype=bool)
+        allowed[np.arange(length), chars] = True
+        choices = np.empty(length, dtype=object)
+        for char, expansion in sequence.degenerate_map.items():
+            where = (chars == ord(char)).nonzero()[0]
+            if where.size:
+                expansion = np.array(sorted(ord(c) for c in expansion),
+                                     dtype=np.uint8)
+                allowed[where, ord(char)] = False
+                allowed[np.ix_(where, expansion)] = True
+                for i in where:
+                    choices[i] = expansion
+
+        self._sequence = sequence
+        self._allowed = allowed
+        self._positions = np.asarray(
+            [i for i in range(length) if choices[i] is not None],
+            dtype=np.intp)
+        self._choices = list(choices[self._positions])
+        self._radices = [len(c) for c in self._choices]
+        self._size = functools.reduce(operator.mul, self._radices, 1)
+
+    @property
+    @experimental(as_of='0.4.0-dev')
+    def sequence(self):
+        """Sequence that is expanded.
+
+        Returns
+        -------
+        IUPACSequence
+
+        """
+        return self._sequence
+
+    @property
+    @experimental(as_of='0.4.0-dev')
+    def size(self):
+        """Number of expansions.
+
+        Unlike ``len``, works for any number of expansions, including more
+        than ``sys.maxsize``.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._size
+
+    @experimental(as_of='0.4.0-dev')
+    def __len__(self):
+        """Return the number of expansions.
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        OverflowError
+            If there are more than ``sys.maxsize`` expansions. Use ``size``
+            instead.
+
+        """
+        return self._size
+
+    @experimental(as_of='0.4.0-dev')
+    def __getitem__(self, index):
+        """Build the expansion at an index.
+
+        Parameters
+        ----------
+        index : int
+            Index of the expansion. Negative indices count from the end.
+
+        Returns
+        -------
+        IUPACSequence
+            Expansion at `index`.
+
+        Raises
+        ------
+        TypeError
+            If `index` is not an integer.
+        IndexError
+            If `index` is out of range.
+
+        """
+        if (not isinstance(index, numbers.Integral) or
+                isinstance(index, bool)):
+            raise TypeError("Expansion index must be an integer, not %r"
+                            % type(index).__name__)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Expansion index out of range")
+
+        chars = self._sequence.values.view(np.uint8).copy()
+        for position, choices, radix in reversed(list(zip(self._positions,
+                                                          self._choices,
+                                                          self._radices))):
+            index, digit = divmod(index, radix)
+            chars[position] = choices[digit]
+        return self._sequence._to(sequence=chars)
+
+    @experimental(as_of='0.4.0-dev')
+    def __iter__(self):
+        """Generate all expansions.
+
+        Yields
+        ------
+        IUPACSequence
+            Non-degenerate version of the sequence.
+
+        """
+        for batch in self.iter_batches():
+            for chars in batch:
+                yield self._sequence._to(sequence=chars.copy())
+
+    @experimental(as_of='0.4.0-dev')
+    def __contains__(self, other):
+        """Determine if a sequence is one of the expansions.
+
+        Parameters
+        ----------
+        other : str, IUPACSequence, or 1D np.ndarray (np.uint8 or '\\|S1')
+            Sequence to test.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.matches(other)
+
+    @experimental(as_of='0.4.0-dev')
+    def iter_batches(self, batch_size=10000):
+        """Generate the expansions as arrays of ASCII codes.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Maximum number of expansions per batch.
+
+        Yields
+        ------
+        2D np.ndarray (np.uint8)
+            Batch of expansions, one per row, in order.
+
+        Raises
+        ------
+        ValueError
+            If `batch_size` is smaller than one.
+
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1, not %r"
+                             % batch_size)
+
+        template = self._sequence.values.view(np.uint8)
+        positions, choices, radices = (self._positions, self._choices,
+                                       self._radices)
+
+        # The trailing degenerate positions are enumerated together within a
+        # batch; each batch repeats them for some of the combinations of the
+        # leading degenerate positions.
+        split = len(radices)
+        low_size = 1
+        while split > 0 and low_size * radices[split - 1] <= batch_size:
+            split -= 1
+            low_size *= radices[split]
+        low = np.arange(low_size)
+        low_chars = np.empty((low_size, len(radices) - split), dtype=np.uint8)
+        for j in range(len(radices) - 1, split - 1, -1):
+            low, digits = np.divmod(low, radices[j])
+            low_chars[:, j - split] = choices[j][digits]
+
+        high = itertools.product(*[range(radix) for radix in radices[:split]])
+        num_high = max(batch_size // low_size, 1)
+        while True:
+            high_digits = list(itertools.islice(high, num_high))
+            if not high_digits:
+                break
+            high_digits = np.asarray(high_digits, dtype=np.intp).reshape(
+                len(high_digits), split)
+            batch = np.empty((len(high_digits) * low_size, len(template)),
+                             dtype=np.uint8)
+            batch[:] = template
+            batch[:, positions[split:]] = np.tile(low_chars,
+                                                  (len(high_digits), 1))
+            for j in range(split):
+                batch[:, positions[j]] = np.repeat(
+                    choices[j][high_digits[:, j]], low_size)
+            yield batch
+
+    @experimental(as_of='0.4.0-dev')
+    def matches(self, sequences):
+        """Determine if sequences are expansions, without enumerating them.
+
+        Parameters
+        ----------
+        sequences : str, IUPACSequence, or np.ndarray (np.uint8 or '\\|S1')
+            Sequence to test, or a 2D array with one sequence per row (e.g.,
+            windows of a database sequence) to test all of them at once.
+
+        Returns
+        -------
+        bool or 1D np.ndarray (bool)
+            Whether the sequence, or each row of the 2D array, is an
+            expansion.
+
+        Raises
+        ------
+        TypeError
+            If `sequences` is a ``Sequence`` of a different type than the
+            expanded sequence.
+        TypeError
+            If `sequences` is a 2D array whose dtype is not ``np.uint8`` or
+            ``'|S1'``.
+
+        Notes
+        -----
+        Sequences containing degenerate characters never match because the
+        expansions are non-degenerate.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from skbio import DNA
+        >>> from skbio.sequence import DegenerateExpansions
+        >>> expansions = DegenerateExpansions(DNA('GTGYCAGC'))
+        >>> expansions.matches(DNA('GTGTCAGC'))
+        True
+        >>> windows = np.array([list(b'GTGCCAGC'), list(b'GTGACAGC')],
+        ...                    dtype=np.uint8)
+        >>> expansions.matches(windows)
+        array([ True, False], dtype=bool)
+
+        """
+        if isinstance(sequences, np.ndarray) and sequences.ndim == 2:
+            if sequences.dtype == np.uint8:
+                chars = sequences
+            elif sequences.dtype == '|S1':
+                chars = sequences.view(np.uint8)
+            else:
+                raise TypeError(
+                    "2D arrays of sequences must be of dtype np.uint8 or "
+                    "'|S1', not %s" % sequences.dtype)
+            if chars.shape[1] != len(self._allowed):
+                return np.zeros(len(chars), dtype=bool)
+            return self._allowed[np.arange(len(self._allowed)),
+                                 chars].all(axis=1)
+
+        chars = np.frombuffer(
+            self._sequence._munge_to_bytestring(sequences, 'matches'),
+            dtype=np.uint8)
+        if len(chars) != len(self._allowed):
+            return False
+        return bool(self._allowed[np.arange(len(chars)), chars].all())
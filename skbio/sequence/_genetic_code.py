@@ -9,12 +9,14 @@
 from __future__ import absolute_import, division, print_function
 
 import numpy as np
-from future.builtins import range
+import pandas as pd
 
-from skbio.util._decorator import classproperty, stable, classonlymethod
+from skbio.util._decorator import (classproperty, stable, experimental,
+                                   classonlymethod)
 from skbio._base import SkbioObject
-from skbio.sequence import Protein, RNA
-from skbio.sequence._base import ElasticLines
+from skbio.sequence import Protein, DNA, RNA
+from skbio.sequence._base import (ElasticLines, _split_concatenated,
+                                  _concatenate_chunks)
 
 
 class GeneticCode(SkbioObject):
@@ -121,6 +123,7 @@ class GeneticCode(SkbioObject):
     _radix_multiplier = np.asarray([16, 4, 1], dtype=np.uint8)
     _start_stop_options = ['ignore', 'optional', 'require']
     __offset_table = None
+    __nucleotide_offset_table = None
 
     @classproperty
     def _offset_table(cls):
@@ -141,6 +144,19 @@ class GeneticCode(SkbioObject):
             cls.__offset_table = table
         return cls.__offset_table
 
+    @classproperty
+    def _nucleotide_offset_table(cls):
+        # like `_offset_table` but covering all byte values and mapping both
+        # T and U to the same offset, so that DNA and RNA can be translated
+        # without transcription
+        if cls.__nucleotide_offset_table is None:
+            table = np.empty(256, dtype=np.uint8)
+            table.fill(255)
+            table[:cls._offset_table.size] = cls._offset_table
+            table[ord(b'T')] = table[ord(b'U')]
+            cls.__nucleotide_offset_table = table
+        return cls.__nucleotide_offset_table
+
     @classonlymethod
     @stable(as_of="0.4.0")
     def from_ncbi(cls, table_id=1):
@@ -750,14 +766,502 @@ class GeneticCode(SkbioObject):
         <BLANKLINE>
 
         """
-        rc = sequence.reverse_complement()
-
-        for reading_frame in range(1, 4):
-            yield self.translate(sequence, reading_frame=reading_frame,
-                                 start=start, stop=stop)
-        for reading_frame in range(1, 4):
-            yield self.translate(rc, reading_frame=reading_frame,
-                                 start=start, stop=stop)
+        self._validate_translate_inputs(sequence, 1, start, stop)
+
+        # all six frames are translated at once, but errors are raised
+        # lazily so that the frames preceding a frame missing a required
+        # start/stop codon are still yielded
+        translated, begins, ends, has_start, has_stop = self._translate_codes(
+            self._nucleotide_offset_table[sequence.values.view(np.uint8)],
+            np.asarray([0]), np.asarray([len(sequence)]),
+            self.reading_frames, start, stop)
+
+        metadata = None
+        if sequence.has_metadata():
+            metadata = sequence.metadata
+
+        for i, reading_frame in enumerate(self.reading_frames):
+            if start == 'require' and not has_start[i]:
+                self._raise_require_error('start', reading_frame)
+            if stop == 'require' and not has_stop[i]:
+                self._raise_require_error('stop', reading_frame)
+            yield Protein(translated[begins[i]:ends[i]], metadata=metadata,
+                          validate=False)
+
+    @experimental(as_of='0.4.0-dev')
+    def translate_many(self, sequences, offsets=None, reading_frames=None,
+                       start='ignore', stop='ignore'):
+        """Translate many sequences in several reading frames at once.
+
+        All reading frames of all sequences are translated together in a
+        single vectorized pass, which is much faster than calling
+        ``translate`` or ``translate_six_frames`` on each sequence when there
+        are many (short) sequences, such as sequencing reads.
+
+        Parameters
+        ----------
+        sequences : iterable (RNA or DNA), or bytes
+            Sequences to translate. DNA sequences are treated as the coding
+            strand (i.e., translated as if they were transcribed first). If
+            `offsets` is provided, `sequences` must instead be the
+            concatenated ASCII characters of the sequences (e.g., ``bytes`` or
+            a 1D ``np.uint8`` array).
+        offsets : 1D array_like (int), optional
+            Boundaries of the sequences within `sequences`: sequence ``i`` is
+            ``sequences[offsets[i]:offsets[i + 1]]``.
+        reading_frames : iterable (int), optional
+            Reading frames to translate each sequence in, each one of
+            ``GeneticCode.reading_frames``. Defaults to all six.
+        start : {'ignore', 'require', 'optional'}
+            How to handle start codons. See ``GeneticCode.translate`` for
+            details, except that reading frames without a start codon are
+            translated into empty sequences with ``'require'`` instead of
+            raising an error.
+        stop : {'ignore', 'require', 'optional'}
+            How to handle stop codons. See ``GeneticCode.translate`` for
+            details, except that reading frames without a stop codon are
+            translated into empty sequences with ``'require'`` instead of
+            raising an error.
+
+        Returns
+        -------
+        Protein
+            All translated sequences, concatenated.
+        1D np.ndarray (int)
+            Offsets of the translated sequences within the returned protein,
+            of length ``n * len(reading_frames) + 1`` where ``n`` is the
+            number of sequences. The translation of sequence ``i`` in the
+            ``j``-th reading frame is
+            ``protein[offsets[k]:offsets[k + 1]]`` with
+            ``k = i * len(reading_frames) + j``.
+
+        Raises
+        ------
+        TypeError
+            If a sequence is not RNA or DNA.
+        ValueError
+            If `reading_frames`, `start`, `stop` or `offsets` is invalid, or
+            if a sequence contains gaps or invalid characters.
+        NotImplementedError
+            If a sequence contains degenerate characters.
+
+        See Also
+        --------
+        translate
+        translate_six_frames
+
+        Notes
+        -----
+        Metadata and positional metadata of the input sequences are not
+        included in the translated sequences.
+
+        Examples
+        --------
+        >>> from skbio import DNA, RNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> protein, offsets = sgc.translate_many(
+        ...     [RNA('AUGCCACUUUAA'), DNA('CCCATGAAATGA')])
+        >>> offsets
+        array([ 0,  4,  7, 10, 14, 17, 20, 24, 27, 30, 34, 37, 40])
+        >>> for i in range(len(offsets) - 1):
+        ...     print(protein[offsets[i]:offsets[i + 1]])
+        MPL*
+        CHF
+        ATL
+        LKWH
+        *SG
+        KVA
+        PMK*
+        P*N
+        HEM
+        SFHG
+        HFM
+        ISW
+
+        Translate only the forward frames from the first start codon to the
+        first stop codon. Raw sequence characters can be translated by
+        providing the offsets of each sequence:
+
+        >>> protein, offsets = sgc.translate_many(
+        ...     b'AUGCCACUUUAACCCATGAAATGA', offsets=[0, 12, 24],
+        ...     reading_frames=[1, 2, 3], start='require', stop='require')
+        >>> for i in range(len(offsets) - 1):
+        ...     print(protein[offsets[i]:offsets[i + 1]])
+        MPL
+        <BLANKLINE>
+        <BLANKLINE>
+        MK
+        <BLANKLINE>
+        <BLANKLINE>
+
+        """
+        reading_frames = self._validate_reading_frames(reading_frames)
+        for name, value in ('start', start), ('stop', stop):
+            if value not in self._start_stop_options:
+                raise ValueError("`%s` must be one of %r, not %r" %
+                                 (name, self._start_stop_options, value))
+
+        chars, offsets = _concatenate_nucleotides(sequences, offsets)
+        starts = offsets[:-1]
+        lengths = np.diff(offsets)
+
+        codes = self._nucleotide_offset_table[chars]
+        invalid = codes == 255
+        if invalid.any():
+            _raise_invalid_characters(chars[invalid])
+
+        translated, begins, ends, has_start, has_stop = self._translate_codes(
+            codes, starts, lengths, reading_frames, start, stop)
+        if start == 'require':
+            ends[~has_start] = begins[~has_start]
+        if stop == 'require':
+            ends[~has_stop] = begins[~has_stop]
+
+        # drop the parts of each translation outside of [begins, ends)
+        row_lengths = ends - begins
+        offsets = np.concatenate([[0], np.cumsum(row_lengths)])
+        keep = (np.arange(offsets[-1]) +
+                np.repeat(begins - offsets[:-1], row_lengths))
+        return Protein(translated[keep], validate=False), offsets
+
+    @experimental(as_of='0.4.0-dev')
+    def find_orfs(self, sequences, offsets=None, reading_frames=None,
+                  min_length=1, start='require', stop='require'):
+        """Find open reading frames (ORFs) in RNA or DNA sequences.
+
+        An ORF spans from a start codon to the next stop codon in the same
+        reading frame. Codons of all reading frames of all sequences are
+        located at once as arrays of codon indices, so the sequences are not
+        translated.
+
+        Parameters
+        ----------
+        sequences : RNA, DNA, iterable (RNA or DNA), or bytes
+            Sequence(s) to find ORFs in. DNA sequences are treated as the
+            coding strand. If `offsets` is provided, `sequences` must instead
+            be the concatenated ASCII characters of the sequences (e.g.,
+            ``bytes`` or a 1D ``np.uint8`` array).
+        offsets : 1D array_like (int), optional
+            Boundaries of the sequences within `sequences`: sequence ``i`` is
+            ``sequences[offsets[i]:offsets[i + 1]]``.
+        reading_frames : iterable (int), optional
+            Reading frames to search, each one of
+            ``GeneticCode.reading_frames``. Defaults to all six.
+        min_length : int, optional
+            Minimum number of codons in an ORF, excluding the stop codon.
+        start : {'require', 'optional', 'ignore'}
+            How to handle start codons:
+
+            * "require": ORFs begin at the first start codon following the
+              previous stop codon in the reading frame (i.e., the longest ORF
+              ending at each stop codon is reported).
+
+            * "optional": like "require", but if there is no start codon
+              between two stop codons the ORF begins right after the previous
+              stop codon.
+
+            * "ignore": ORFs begin right after the previous stop codon (or at
+              the beginning of the reading frame).
+
+        stop : {'require', 'optional'}
+            How to handle stop codons:
+
+            * "require": ORFs end with a stop codon.
+
+            * "optional": ORFs that run off the end of the sequence (or into a
+              codon that cannot be translated) are also reported.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per ORF, ordered by sequence, reading frame (in the order
+            of `reading_frames`) and position. Columns are ``'sequence'`` (the
+            index of the sequence), ``'reading_frame'``, and ``'start'`` and
+            ``'end'``, the 0-based, half-open coordinates of the ORF
+            (including its stop codon) in the sequence. For reverse reading
+            frames, the ORF is the reverse complement of
+            ``sequence[start:end]``.
+
+        Raises
+        ------
+        TypeError
+            If a sequence is not RNA or DNA.
+        ValueError
+            If `reading_frames`, `min_length`, `start`, `stop` or `offsets` is
+            invalid.
+
+        See Also
+        --------
+        translate
+        translate_many
+
+        Notes
+        -----
+        Codons containing gap or degenerate characters (e.g., N) are neither
+        start nor stop codons, and ORFs do not span them.
+
+        Examples
+        --------
+        >>> from skbio import DNA, GeneticCode
+        >>> sgc = GeneticCode.from_ncbi()
+        >>> seq = DNA('CCATGAAATAGCATGCCCTTACTTCATCG')
+        >>> orfs = sgc.find_orfs(seq)
+        >>> orfs
+           sequence  reading_frame  start  end
+        0         0              3      2   11
+        1         0             -3     18   27
+
+        The first ORF, translated:
+
+        >>> seq[2:11].translate()
+        Protein
+        -----------------------------
+        Stats:
+            length: 3
+            has gaps: False
+            has degenerates: False
+            has non-degenerates: True
+            has stops: True
+        -----------------------------
+        0 MK*
+
+        ORFs in reverse reading frames are on the reverse complement strand:
+
+        >>> seq[18:27].reverse_complement().translate()
+        Protein
+        -----------------------------
+        Stats:
+            length: 3
+            has gaps: False
+            has degenerates: False
+            has non-degenerates: True
+            has stops: True
+        -----------------------------
+        0 MK*
+
+        """
+        if isinstance(sequences, (RNA, DNA)):
+            sequences = [sequences]
+        reading_frames = self._validate_reading_frames(reading_frames)
+        if start not in self._start_stop_options:
+            raise ValueError("`start` must be one of %r, not %r" %
+                             (self._start_stop_options, start))
+        if stop not in {'optional', 'require'}:
+            raise ValueError("`stop` must be one of %r, not %r" %
+                             (['optional', 'require'], stop))
+        if min_length < 1:
+            raise ValueError("`min_length` must be at least 1, not %r" %
+                             min_length)
+
+        chars, offsets = _concatenate_nucleotides(sequences, offsets)
+        starts = offsets[:-1]
+        lengths = np.diff(offsets)
+        codes = self._nucleotide_offset_table[chars]
+        is_start = self._starts.values == b'M'
+        is_stop = self._amino_acids.values == b'*'
+
+        columns = ['sequence', 'reading_frame', 'start', 'end']
+        orfs = {column: [] for column in columns}
+        frame_order = []
+        # reading frames are searched separately to bound memory usage
+        for i, reading_frame in enumerate(reading_frames):
+            indices, rows, positions, _, _, valid = self._codon_indices(
+                codes, starts, lengths, [reading_frame])
+            if rows.size == 0:
+                continue
+
+            # split each row into segments ending with a stop codon, an
+            # invalid codon or the end of the row. each segment contains at
+            # most one ORF
+            stops = is_stop[indices] & valid
+            breaks = stops | ~valid
+            new_segment = np.empty(rows.size, dtype=bool)
+            new_segment[0] = True
+            new_segment[1:] = breaks[:-1] | (rows[1:] != rows[:-1])
+            segment_begins = new_segment.nonzero()[0]
+            segment_lasts = np.append(segment_begins[1:], rows.size) - 1
+            has_stop = stops[segment_lasts]
+            # exclusive end of the coding codons (i.e., excluding the stop
+            # codon or invalid codon)
+            coding_ends = segment_lasts + ~breaks[segment_lasts]
+
+            if start == 'ignore':
+                begins = segment_begins
+                keep = np.ones(segment_begins.size, dtype=bool)
+            else:
+                keep, begins = _first_in_rows(
+                    is_start[indices] & valid, np.cumsum(new_segment) - 1,
+                    segment_begins.size)
+                if start == 'optional':
+                    begins = np.where(keep, begins, segment_begins)
+                    keep[:] = True
+
+            keep &= coding_ends - begins >= min_length
+            if stop == 'require':
+                keep &= has_stop
+            begins = begins[keep]
+            lasts = coding_ends[keep] - 1 + has_stop[keep]
+
+            if reading_frame < 0:
+                begins, lasts = lasts, begins
+            sequence = rows[begins]
+            orfs['sequence'].append(sequence)
+            orfs['reading_frame'].append(
+                np.full(begins.size, reading_frame, dtype=np.intp))
+            orfs['start'].append(positions[begins] - starts[sequence])
+            orfs['end'].append(positions[lasts] + 3 - starts[sequence])
+            frame_order.append(np.full(begins.size, i, dtype=np.intp))
+
+        if not frame_order:
+            return pd.DataFrame(
+                {column: np.empty(0, dtype=np.intp) for column in columns},
+                columns=columns)
+        orfs = {column: np.concatenate(orfs[column]) for column in columns}
+        order = np.lexsort((orfs['start'], np.concatenate(frame_order),
+                            orfs['sequence']))
+        return pd.DataFrame({column: orfs[column][order]
+                             for column in columns}, columns=columns)
+
+    def _validate_reading_frames(self, reading_frames):
+        if reading_frames is None:
+            return self.reading_frames
+        reading_frames = list(reading_frames)
+        for reading_frame in reading_frames:
+            if reading_frame not in self.reading_frames:
+                raise ValueError("`reading_frame` must be one of %r, not %r" %
+                                 (self.reading_frames, reading_frame))
+        return reading_frames
+
+    def _codon_indices(self, codes, starts, lengths, reading_frames):
+        """Find the codons of sequences in several reading frames.
+
+        `codes` are the offsets (0-3) of the concatenated sequences, which
+        start at `starts` and have lengths `lengths`. Codons of all reading
+        frames of all sequences are concatenated, with reading frames varying
+        fastest; each sequence in each reading frame is called a row.
+
+        Returns the index (0-63) of each codon, the row of each codon, the
+        position of the first character of each codon within `codes`, where
+        each row begins and ends, and whether each codon is valid (i.e., only
+        contains characters with a valid offset). Invalid codons have index
+        zero.
+
+        """
+        frames = np.asarray(reading_frames, dtype=np.intp)
+        shifts = np.abs(frames) - 1
+
+        # Instead of reverse complementing sequences, reverse frames read
+        # codons backwards from the end of the sequence and complement each
+        # offset (U <-> A and C <-> G, i.e., flipping the second bit of the
+        # offset).
+        reverse = np.tile(frames < 0, lengths.size)
+        num_codons = (np.maximum(lengths[:, np.newaxis] - shifts, 0) //
+                      3).ravel()
+        first = np.where(
+            reverse, ((starts + lengths)[:, np.newaxis] - 3 - shifts).ravel(),
+            (starts[:, np.newaxis] + shifts).ravel())
+        ends = np.cumsum(num_codons)
+        begins = ends - num_codons
+
+        rows = np.repeat(np.arange(num_codons.size), num_codons)
+        codon_number = np.arange(rows.size) - begins[rows]
+        row_reverse = reverse[rows]
+        positions = first[rows] + np.where(row_reverse, -3, 3) * codon_number
+
+        complement = row_reverse.astype(np.uint8) << 1
+        first_offset = np.where(row_reverse, codes[positions + 2],
+                                codes[positions])
+        second_offset = codes[positions + 1]
+        third_offset = np.where(row_reverse, codes[positions],
+                                codes[positions + 2])
+        valid = ((first_offset != 255) & (second_offset != 255) &
+                 (third_offset != 255))
+        indices = ((first_offset ^ complement).astype(np.intp) *
+                   self._radix_multiplier[0] +
+                   (second_offset ^ complement) * self._radix_multiplier[1] +
+                   (third_offset ^ complement))
+        indices[~valid] = 0
+        return indices, rows, positions, begins, ends, valid
+
+    def _translate_codes(self, codes, starts, lengths, reading_frames, start,
+                         stop):
+        """Translate sequences encoded as offsets in several reading frames.
+
+        Returns the translated amino acids of all reading frames of all
+        sequences concatenated (as ASCII codes), the positions in which the
+        translation of each sequence in each reading frame begins and ends
+        after applying `start` and `stop`, and whether a start and a stop
+        codon was found in each. Reading frames vary fastest.
+
+        """
+        indices, rows, _, begins, ends, _ = self._codon_indices(
+            codes, starts, lengths, reading_frames)
+        translated = self._amino_acids.values.view(np.uint8)[indices]
+
+        num_rows = begins.size
+        has_start = np.zeros(num_rows, dtype=bool)
+        if start in {'require', 'optional'}:
+            is_start = self._starts.values == b'M'
+            has_start, first_start = _first_in_rows(is_start[indices], rows,
+                                                    num_rows)
+            begins[has_start] = first_start[has_start]
+            translated[first_start[has_start]] = ord(b'M')
+
+        has_stop = np.zeros(num_rows, dtype=bool)
+        if stop in {'require', 'optional'}:
+            is_stop = ((translated == ord(b'*')) &
+                       (np.arange(rows.size) >= begins[rows]))
+            has_stop, first_stop = _first_in_rows(is_stop, rows, num_rows)
+            ends[has_stop] = first_stop[has_stop]
+
+        return translated, begins, ends, has_start, has_stop
+
+
+def _concatenate_nucleotides(sequences, offsets=None):
+    """Concatenate the characters of RNA/DNA sequences and their offsets.
+
+    If `offsets` is provided, `sequences` are already concatenated characters
+    and `offsets` are validated instead.
+
+    """
+    if offsets is not None:
+        return _split_concatenated(sequences, offsets)
+
+    for chars, offsets in _concatenate_chunks(sequences, None, (RNA, DNA),
+                                              'RNA or DNA'):
+        return chars, offsets
+    return np.empty(0, dtype=np.uint8), np.zeros(1, dtype=np.intp)
+
+
+def _raise_invalid_characters(chars):
+    chars = set(chars.tobytes().decode('ascii', 'replace'))
+    if chars & RNA.gap_chars:
+        raise ValueError("scikit-bio does not support translation of "
+                         "gapped sequences.")
+    if chars <= RNA.degenerate_chars:
+        raise NotImplementedError("scikit-bio does not currently support "
+                                  "translation of degenerate sequences."
+                                  "`RNA.expand_degenerates` can be used "
+                                  "to obtain all non-degenerate versions "
+                                  "of a degenerate sequence.")
+    raise ValueError("Sequences to translate contain invalid characters: %r"
+                     % sorted(chars))
+
+
+def _first_in_rows(mask, rows, num_rows):
+    """Find the first ``True`` element of `mask` within each row.
+
+    `rows` is the (sorted) row of each element of `mask`. Returns whether each
+    row contains a ``True`` element, and the position of the first one.
+
+    """
+    hits = mask.nonzero()[0]
+    hit_rows, first_hits = np.unique(rows[hits], return_index=True)
+    found = np.zeros(num_rows, dtype=bool)
+    found[hit_rows] = True
+    first = np.zeros(num_rows, dtype=np.intp)
+    first[hit_rows] = hits[first_hits]
+    return found, first
 
 
 # defined at http://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi
@@ -10,7 +10,6 @@ from __future__ import absolute_import, division, print_function
 from future.utils import with_metaclass
 
 from abc import ABCMeta, abstractproperty
-from itertools import product
 
 import numpy as np
 
@@ -181,6 +180,11 @@ class IUPACSequence(with_metaclass(ABCMeta, Sequence)):
         """
         return set()  # pragma: no cover
 
+    @classproperty
+    @overrides(Sequence)
+    def _approximate_match_map(cls):
+        return cls.degenerate_map
+
     @property
     def _motifs(self):
             return _motifs
@@ -435,12 +439,17 @@ class IUPACSequence(with_metaclass(ABCMeta, Sequence)):
         See Also
         --------
         degenerate_map
+        skbio.sequence.DegenerateExpansions
 
         Notes
         -----
         There is no guaranteed ordering to the non-degenerate sequences that
         are yielded.
 
+        The non-degenerate sequences are generated lazily. Use
+        ``DegenerateExpansions`` to count them or test whether a sequence is
+        one of them without generating them.
+
         Each non-degenerate sequence will have the same type, metadata,
         and positional metadata as the biological sequence.
 
@@ -476,20 +485,8 @@ class IUPACSequence(with_metaclass(ABCMeta, Sequence)):
         <BLANKLINE>
 
         """
-        degen_chars = self.degenerate_map
-        nonexpansion_chars = self.nondegenerate_chars.union(self.gap_chars)
-
-        expansions = []
-        for char in self:
-            char = str(char)
-            if char in nonexpansion_chars:
-                expansions.append(char)
-            else:
-                expansions.append(degen_chars[char])
-
-        result = product(*expansions)
-        return (self._to(sequence=''.join(nondegen_seq)) for nondegen_seq in
-                result)
+        from ._degenerate_expansions import DegenerateExpansions
+        return iter(DegenerateExpansions(self))
 
     @stable(as_of='0.4.0-dev')
     def to_regex(self):
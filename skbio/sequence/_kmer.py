@@ -0,0 +1,395 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import itertools
+
+import numpy as np
+import scipy.sparse
+
+from skbio.util._decorator import experimental
+from ._packed import _INVALID_CODE
+
+
+# Largest k for which a dense vector of all 4**k k-mer counts is returned.
+_max_dense_k = 12
+
+
+def _kmer_words(codes, k, bits=2, starts=None):
+    """Encode k-mers as integers.
+
+    Parameters
+    ----------
+    codes : 1D np.ndarray (np.uint8)
+        Code of each character (values below ``2 ** bits``).
+    k : int
+        Word length. ``k * bits`` must not exceed 64.
+    bits : int, optional
+        Number of bits per code.
+    starts : 1D np.ndarray (int), optional
+        Start positions of the k-mers to encode. Defaults to every position.
+
+    Returns
+    -------
+    1D np.ndarray (np.uint64)
+        The codes of the first character occupy the most significant bits, so
+        the integers sort in the same order as the k-mers.
+
+    """
+    if starts is None:
+        starts = np.arange(max(len(codes) - k + 1, 0))
+    words = np.zeros(len(starts), dtype=np.uint64)
+    shift = np.uint64(bits)
+    for i in range(k):
+        words <<= shift
+        words |= codes[starts + i]
+    return words
+
+
+def _reverse_complement_words(codes, k, starts):
+    """Encode the reverse complements of 2-bit encoded k-mers as integers.
+
+    The complement of a 2-bit code ``c`` must be ``c ^ 3``.
+
+    """
+    words = np.zeros(len(starts), dtype=np.uint64)
+    shift = np.uint64(2)
+    for i in range(k - 1, -1, -1):
+        words <<= shift
+        words |= codes[starts + i] ^ np.uint8(3)
+    return words
+
+
+def _decode_kmers(words, k, chars, bits=2):
+    """Return k-mer strings from integer-encoded k-mers."""
+    mask = np.uint64((1 << bits) - 1)
+    kmers = np.empty((len(words), k), dtype=np.uint8)
+    for i in range(k):
+        shift = np.uint64(bits * (k - 1 - i))
+        kmers[:, i] = chars[((words >> shift) & mask).astype(np.intp)]
+    kmers = kmers.view('|S%d' % k).ravel()
+    return [str(kmer.decode('ascii')) for kmer in kmers]
+
+
+def _kmer_starts(lengths, k, overlap):
+    """Return k-mer start positions in concatenated, separated sequences.
+
+    Sequences are assumed to be concatenated with one separator character
+    between consecutive sequences.
+
+    Returns
+    -------
+    tuple of 1D np.ndarray
+        Start positions and the index of the sequence each k-mer belongs to.
+
+    """
+    step = 1 if overlap else k
+    counts = np.maximum(lengths - k, -1) // step + 1
+    offsets = np.concatenate([[0], np.cumsum(lengths + 1)[:-1]])
+    rows = np.repeat(np.arange(len(lengths)), counts)
+    # Position of each k-mer within its sequence.
+    first = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    within = (np.arange(counts.sum()) - np.repeat(first, counts)) * step
+    return np.repeat(offsets, counts) + within, rows
+
+
+def _count_kmers(codes_list, k, overlap=True, canonical=False):
+    """Count 2-bit encoded k-mers in one or more sequences.
+
+    K-mers containing a character that is not a non-degenerate character
+    (i.e., whose code is ``_INVALID_CODE``) are skipped.
+
+    Parameters
+    ----------
+    codes_list : list of 1D np.ndarray (np.uint8)
+        2-bit codes of each sequence's characters.
+    k : int
+        Word length (at most 31).
+    overlap : bool, optional
+        Count overlapping k-mers.
+    canonical : bool, optional
+        Count each k-mer and its reverse complement as the lexicographically
+        smaller of the two.
+
+    Returns
+    -------
+    tuple of 1D np.ndarray
+        Sequence index, integer-encoded k-mer, and count of each distinct
+        (sequence, k-mer) pair, sorted by sequence index and then k-mer.
+
+    """
+    if not codes_list:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty.astype(np.uint64), empty
+    lengths = np.asarray([len(c) for c in codes_list], dtype=np.intp)
+    separator = np.asarray([_INVALID_CODE], dtype=np.uint8)
+    pieces = []
+    for codes in codes_list:
+        pieces.append(codes)
+        pieces.append(separator)
+    codes = np.concatenate(pieces)
+
+    starts, rows = _kmer_starts(lengths, k, overlap)
+
+    # A k-mer is valid if none of its characters are invalid.
+    invalid = np.concatenate([[0], np.cumsum(codes == _INVALID_CODE)])
+    valid = invalid[starts + k] == invalid[starts]
+    starts = starts[valid]
+    rows = rows[valid]
+
+    words = _kmer_words(codes, k, starts=starts)
+    if canonical:
+        words = np.minimum(words, _reverse_complement_words(codes, k, starts))
+
+    if len(codes_list) <= 2 ** (63 - 2 * k):
+        # Sequence index and k-mer fit into a single integer, which is much
+        # faster to sort than the pair.
+        keys = (rows.astype(np.uint64) << np.uint64(2 * k)) | words
+        keys, counts = np.unique(keys, return_counts=True)
+        rows = (keys >> np.uint64(2 * k)).astype(np.intp)
+        words = keys & np.uint64((1 << 2 * k) - 1)
+        return rows, words, counts
+
+    # Sort by sequence and then k-mer, and count runs of equal pairs.
+    order = np.lexsort((words, rows))
+    rows = rows[order]
+    words = words[order]
+    boundaries = np.ones(len(words), dtype=bool)
+    boundaries[1:] = (rows[1:] != rows[:-1]) | (words[1:] != words[:-1])
+    indices = np.flatnonzero(boundaries)
+    counts = np.diff(np.append(indices, len(words)))
+    return rows[indices], words[indices], counts
+
+
+def _kmer_frequencies_from_bytes(bytes_, k, overlap=True):
+    """Count k-mers of arbitrary characters without creating sequences.
+
+    Returns
+    -------
+    dict
+        Maps each observed k-mer (``str``) to its count.
+
+    """
+    step = 1 if overlap else k
+    count = max(len(bytes_) - k, -1) // step + 1
+    if count == 0:
+        return {}
+    kmers = np.lib.stride_tricks.as_strided(
+        bytes_, shape=(count, k), strides=(step, 1))
+    kmers = np.ascontiguousarray(kmers).view('|S%d' % k).ravel()
+    kmers, counts = np.unique(kmers, return_counts=True)
+    return {str(kmer.decode('ascii')): int(count)
+            for kmer, count in zip(kmers, counts)}
+
+
+def _kmer_frequencies_from_packed(packed, k, overlap=True):
+    """Count k-mers of a ``_PackedNucleotides`` using its codes.
+
+    Returns
+    -------
+    dict
+        Maps each observed k-mer (``str``) to its count.
+
+    """
+    step = 1 if overlap else k
+    count = max(len(packed) - k, -1) // step + 1
+    words = _kmer_words(packed.codes(), k, bits=packed.bits,
+                        starts=np.arange(count) * step)
+    words, counts = np.unique(words, return_counts=True)
+    kmers = _decode_kmers(words, k, packed.chars, bits=packed.bits)
+    return {kmer: int(count) for kmer, count in zip(kmers, counts)}
+
+
+def _format_kmer_counts(rows, words, counts, num_rows, k, output, chars):
+    """Format the result of ``_count_kmers`` as `output`.
+
+    ``'dict'`` returns a list of dicts (one per row) mapping k-mer strings to
+    counts, ``'dense'`` returns a ``(num_rows, 4 ** k)`` array, and
+    ``'sparse'`` returns a ``(num_rows, 4 ** k)`` CSR matrix. Columns of
+    ``'dense'`` and ``'sparse'`` results correspond to the k-mers in
+    lexicographic order of the non-degenerate characters.
+
+    """
+    if output == 'dict':
+        kmers = _decode_kmers(words, k, chars)
+        result = [{} for _ in range(num_rows)]
+        for row, kmer, count in zip(rows, kmers, counts):
+            result[row][kmer] = int(count)
+        return result
+    elif output == 'dense':
+        dense = np.zeros((num_rows, 4 ** k), dtype=np.int64)
+        dense[rows, words.astype(np.intp)] = counts
+        return dense
+    else:
+        return scipy.sparse.csr_matrix(
+            (counts, (rows, words.astype(np.int64))),
+            shape=(num_rows, 4 ** k))
+
+
+@experimental(as_of="0.4.0-dev")
+def kmer_count_matrix(sequences, k, overlap=True, canonical=False,
+                      chunk_size=10000):
+    """Count kmers of many sequences into a samples by kmers sparse matrix.
+
+    Parameters
+    ----------
+    sequences : iterable (Sequence)
+        Sequences to count kmers of, e.g., a ``SequenceCollection`` or the
+        generator returned by ``skbio.io.read``. `sequences` is only iterated
+        over once.
+    k : int
+        The word length. Must be at most 31 for nucleotide sequences.
+    overlap : bool, optional
+        Defines whether the kmers should be overlapping or not.
+    canonical : bool, optional
+        If ``True``, count each kmer together with its reverse complement,
+        reporting the lexicographically smaller of the two. Only supported for
+        nucleotide sequences.
+    chunk_size : int, optional
+        Number of sequences counted together. Larger values are faster but use
+        more memory.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Kmer counts with one row per sequence (in the order of `sequences`)
+        and one column per kmer.
+    list of str
+        Kmer corresponding to each column, in sorted order. Only kmers
+        observed in at least one sequence are included.
+
+    Raises
+    ------
+    ValueError
+        If `k` is out of range, or if `canonical` is ``True`` and the
+        sequences are not nucleotide sequences.
+    TypeError
+        If the sequences are not all of the same type.
+
+    See Also
+    --------
+    skbio.sequence.DNA.kmer_counts
+    skbio.sequence.DNA.batch_kmer_counts
+    skbio.diversity.beta_diversity
+
+    Notes
+    -----
+    If the sequences are nucleotide sequences (e.g., ``DNA`` or ``RNA``),
+    kmers are encoded as integers (see ``DNA.kmer_counts``) and kmers
+    containing characters other than non-degenerate characters (e.g., gaps or
+    degenerate characters) are not counted. Otherwise, all kmers are counted.
+
+    The matrix can be passed to ``skbio.diversity.beta_diversity`` as
+    `counts` to compute alignment-free distances between the sequences.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import kmer_count_matrix
+    >>> counts, kmers = kmer_count_matrix(
+    ...     [DNA('ACGTT'), DNA('ACGAA'), DNA('TTTT')], 2)
+    >>> kmers
+    ['AA', 'AC', 'CG', 'GA', 'GT', 'TT']
+    >>> print(counts.toarray())
+    [[0 1 1 0 1 1]
+     [1 1 1 1 0 0]
+     [0 0 0 0 0 3]]
+
+    Compute distances between the sequences based on their kmer profiles:
+
+    >>> from skbio.diversity import beta_diversity
+    >>> dm = beta_diversity('cosine', counts, ids=['a', 'b', 'c'])
+
+    """
+    from ._nucleotide_mixin import NucleotideMixin
+
+    if k < 1:
+        raise ValueError("k must be greater than 0.")
+
+    iterator = iter(sequences)
+    first = next(iterator, None)
+    if first is None:
+        return scipy.sparse.csr_matrix((0, 0), dtype=np.int64), []
+    iterator = itertools.chain([first], iterator)
+
+    seq_type = type(first)
+    nucleotide = isinstance(first, NucleotideMixin)
+    if nucleotide and k > 31:
+        raise ValueError("k must be between 1 and 31 for nucleotide "
+                         "sequences, not %r." % k)
+    if canonical and not nucleotide:
+        raise ValueError("Canonical kmers are only defined for nucleotide "
+                         "sequences, not %r." % seq_type.__name__)
+
+    rows, kmers, counts = [], [], []
+    num_rows = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            break
+        for seq in chunk:
+            if type(seq) is not seq_type:
+                raise TypeError(
+                    "Cannot count kmers of %r and %r sequences together." %
+                    (seq_type.__name__, type(seq).__name__))
+
+        if nucleotide:
+            chunk_rows, chunk_kmers, chunk_counts = _count_kmers(
+                [seq._kmer_codes() for seq in chunk], k, overlap=overlap,
+                canonical=canonical)
+        else:
+            chunk_rows, chunk_kmers, chunk_counts = _count_kmer_strings(
+                [seq._bytes for seq in chunk], k, overlap=overlap)
+        rows.append(chunk_rows + num_rows)
+        kmers.append(chunk_kmers)
+        counts.append(chunk_counts)
+        num_rows += len(chunk)
+
+    vocabulary, columns = np.unique(np.concatenate(kmers),
+                                    return_inverse=True)
+    matrix = scipy.sparse.csr_matrix(
+        (np.concatenate(counts), (np.concatenate(rows), columns)),
+        shape=(num_rows, len(vocabulary)))
+
+    if nucleotide:
+        vocabulary = _decode_kmers(vocabulary, k,
+                                   seq_type._packing_encodings[0][2])
+    else:
+        vocabulary = [str(kmer.decode('ascii')) for kmer in vocabulary]
+    return matrix, vocabulary
+
+
+def _count_kmer_strings(bytes_list, k, overlap=True):
+    """Count kmers of arbitrary characters in one or more sequences.
+
+    Returns
+    -------
+    tuple of 1D np.ndarray
+        Sequence index, kmer (as a byte string), and count of each distinct
+        (sequence, kmer) pair.
+
+    """
+    step = 1 if overlap else k
+    rows, kmers = [], []
+    for i, bytes_ in enumerate(bytes_list):
+        count = max(len(bytes_) - k, -1) // step + 1
+        if count == 0:
+            continue
+        strided = np.lib.stride_tricks.as_strided(
+            bytes_, shape=(count, k), strides=(step, 1))
+        kmers.append(np.ascontiguousarray(strided).view('|S%d' % k).ravel())
+        rows.append(np.full(count, i, dtype=np.intp))
+    if not kmers:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, np.empty(0, dtype='|S%d' % k), empty
+
+    vocabulary, ids = np.unique(np.concatenate(kmers), return_inverse=True)
+    keys = np.concatenate(rows) * len(vocabulary) + ids
+    keys, counts = np.unique(keys, return_counts=True)
+    return keys // len(vocabulary), vocabulary[keys % len(vocabulary)], counts
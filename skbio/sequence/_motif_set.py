@@ -0,0 +1,372 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+from skbio.util._decorator import experimental
+from ._base import _split_concatenated, _concatenate_chunks, _search_chunks
+from ._sequence import Sequence
+from ._iupac_sequence import IUPACSequence
+
+
+class MotifSet(object):
+    """Search many sequences for many IUPAC motifs at once.
+
+    The motifs are compiled once into lookup tables which are then used to
+    search any number of sequences. All motifs are matched simultaneously
+    (each motif is represented by a single bit of a machine word), and all
+    positions of a batch of sequences are scanned together with NumPy, so
+    searching for hundreds of motifs is about as fast as searching for one.
+
+    Parameters
+    ----------
+    motifs : iterable (IUPACSequence)
+        Motifs to search for (e.g., ``DNA`` primers). All motifs must be of the
+        same type and may contain degenerate characters. Each motif must be
+        between 1 and 64 characters long.
+    max_mismatches : int, optional
+        Maximum number of mismatching characters (substitutions) in a match.
+
+    Raises
+    ------
+    TypeError
+        If a motif is not an ``IUPACSequence`` or the motifs are not all of the
+        same type.
+    ValueError
+        If a motif is empty or too long, or if `max_mismatches` is negative.
+
+    See Also
+    --------
+    skbio.sequence.DNA.to_regex
+    skbio.sequence.Sequence.find_with_regex
+
+    Notes
+    -----
+    A degenerate character in a motif matches itself and each of the
+    non-degenerate characters it represents (e.g., ``'R'`` matches ``'R'``,
+    ``'A'`` and ``'G'``), and every other character matches only itself.
+    Degenerate characters in the searched sequences are therefore only matched
+    by the same character in a motif.
+
+    Unlike ``Sequence.find_with_regex``, overlapping matches are reported.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence import MotifSet
+    >>> motifs = MotifSet([DNA('ACGR'), DNA('TTT')])
+    >>> motifs.search([DNA('ACGAACGG'), DNA('TTTTA')])
+       sequence  motif  start  end  mismatches
+    0         0      0      0    4           0
+    1         0      0      4    8           0
+    2         1      1      0    3           0
+    3         1      1      1    4           0
+
+    Allow one mismatch:
+
+    >>> motifs = MotifSet([DNA('ACGR'), DNA('TTT')], max_mismatches=1)
+    >>> motifs.search([DNA('ACTAACGG')])
+       sequence  motif  start  end  mismatches
+    0         0      0      0    4           1
+    1         0      0      4    8           0
+
+    """
+    # number of positions scanned together
+    _block_size = 2 ** 18
+    # maximum number of prefixes whose search state is precomputed
+    _max_prefixes = 2 ** 16
+
+    @experimental(as_of='0.4.0-dev')
+    def __init__(self, motifs, max_mismatches=0):
+        motifs = list(motifs)
+        for motif in motifs:
+            if not isinstance(motif, IUPACSequence):
+                raise TypeError("Motifs must be IUPACSequence objects, not %r"
+                                % type(motif).__name__)
+            motif_type = type(motifs[0])
+            if type(motif) is not motif_type:
+                raise TypeError("Motifs must all be of the same type: %r and "
+                                "%r" % (motif_type.__name__,
+                                        type(motif).__name__))
+            if not 1 <= len(motif) <= 64:
+                raise ValueError("Motifs must be between 1 and 64 "
+                                 "characters long, not %d" % len(motif))
+        if max_mismatches < 0:
+            raise ValueError("`max_mismatches` must be at least 0, not %r"
+                             % max_mismatches)
+
+        self._motifs = motifs
+        self._max_mismatches = max_mismatches
+        self._lengths = np.asarray([len(motif) for motif in motifs],
+                                   dtype=np.intp)
+        self._compile()
+
+    @property
+    @experimental(as_of='0.4.0-dev')
+    def motifs(self):
+        """Motifs searched for.
+
+        Returns
+        -------
+        list (IUPACSequence)
+            Motifs in the order they are numbered in search results.
+
+        """
+        return list(self._motifs)
+
+    @property
+    @experimental(as_of='0.4.0-dev')
+    def max_mismatches(self):
+        """Maximum number of mismatching characters in a match.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._max_mismatches
+
+    def _compile(self):
+        """Build the lookup tables used to search for the motifs.
+
+        ``tables[j][c]`` has bit ``i % 64`` of word ``i // 64`` set if the
+        ``j``-th character of motif ``i`` matches ASCII code ``c``, or if motif
+        ``i`` is shorter than ``j + 1`` characters.
+
+        Characters that are matched by the same motif positions are given the
+        same (small) code, so that the search state after the first few
+        characters can be precomputed for every combination of codes.
+
+        """
+        num_words = -(-len(self._motifs) // 64)
+        max_length = self._lengths.max() if self._motifs else 0
+        tables = np.zeros((max_length, 256, num_words), dtype=np.uint64)
+        used = np.zeros(num_words, dtype=np.uint64)
+
+        for i, motif in enumerate(self._motifs):
+            word, bit = divmod(i, 64)
+            bit = np.uint64(1) << np.uint64(bit)
+            used[word] |= bit
+            tables[len(motif):, :, word] |= bit
+            degenerate_map = motif.degenerate_map
+            for j, char in enumerate(str(motif)):
+                tables[j, ord(char), word] |= bit
+                for match in degenerate_map.get(char, ()):
+                    tables[j, ord(match), word] |= bit
+
+        self._tables = tables
+        self._used = used
+
+        columns = {}
+        char_codes = np.empty(256, dtype=np.uint8)
+        for char in range(256):
+            char_codes[char] = columns.setdefault(tables[:, char].tobytes(),
+                                                  len(columns))
+        # first character with each code
+        representatives = np.empty(len(columns), dtype=np.intp)
+        representatives[char_codes[::-1]] = np.arange(255, -1, -1)
+        alphabet_size = len(columns)
+
+        prefix_length = 0
+        while (prefix_length < max_length and
+               alphabet_size ** (prefix_length + 1) <= self._max_prefixes):
+            prefix_length += 1
+        prefixes = np.arange(alphabet_size ** prefix_length)
+        state = self._initial_state(prefixes.size)
+        for j in range(prefix_length):
+            codes = (prefixes // alphabet_size ** (prefix_length - 1 - j) %
+                     alphabet_size)
+            state = self._advance(state, tables[j][representatives[codes]])
+
+        self._char_codes = char_codes
+        self._alphabet_size = alphabet_size
+        self._prefix_length = prefix_length
+        self._prefix_state = state
+        self._prefix_alive = state[2].any(axis=1)
+
+    @experimental(as_of='0.4.0-dev')
+    def search(self, sequences, offsets=None, chunk_size=10000):
+        """Find all occurrences of the motifs in sequences.
+
+        Parameters
+        ----------
+        sequences : Sequence, iterable (Sequence), or bytes
+            Sequence(s) to search, e.g., the generator returned by
+            ``skbio.io.read``. If `offsets` is provided, `sequences` must
+            instead be the concatenated ASCII characters of the sequences
+            (e.g., ``bytes`` or a 1D ``np.uint8`` array).
+        offsets : 1D array_like (int), optional
+            Boundaries of the sequences within `sequences`: sequence ``i`` is
+            ``sequences[offsets[i]:offsets[i + 1]]``.
+        chunk_size : int, optional
+            Number of sequences searched together when `sequences` is an
+            iterable. Larger values are faster but use more memory.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per match, ordered by sequence, position and motif.
+            Columns are ``'sequence'`` (the index of the sequence),
+            ``'motif'`` (the index of the motif in ``motifs``), ``'start'``
+            and ``'end'`` (the 0-based, half-open coordinates of the match in
+            the sequence), and ``'mismatches'``.
+
+        Raises
+        ------
+        TypeError
+            If a sequence is not a ``Sequence``.
+        ValueError
+            If `offsets` is invalid.
+
+        """
+        columns = ['sequence', 'motif', 'start', 'end', 'mismatches']
+
+        if offsets is not None:
+            chunks = [_split_concatenated(sequences, offsets)]
+        else:
+            if isinstance(sequences, Sequence):
+                sequences = [sequences]
+            chunks = _concatenate_chunks(sequences, chunk_size, Sequence,
+                                         'Sequence objects')
+
+        return _search_chunks(chunks, self._search_chars, columns)
+
+    def _search_chars(self, chars, offsets):
+        """Search concatenated sequences for the motifs.
+
+        Returns the sequence, motif, start, end and number of mismatches of
+        each match.
+
+        """
+        max_length = self._tables.shape[0]
+        # pad so that every motif can be compared at every position; matches
+        # extending past the end of a sequence are discarded below
+        chars = np.concatenate([chars,
+                                np.zeros(max_length, dtype=np.uint8)])
+        codes = self._char_codes[chars]
+
+        positions, motifs, mismatches = [], [], []
+        if self._motifs:
+            for start in range(0, offsets[-1], self._block_size):
+                block = self._search_block(
+                    chars, codes, np.arange(start, min(start +
+                                                       self._block_size,
+                                                       offsets[-1])))
+                for hits, values in zip((positions, motifs, mismatches),
+                                        block):
+                    hits.append(values)
+
+        if positions:
+            positions = np.concatenate(positions)
+            motifs = np.concatenate(motifs)
+            mismatches = np.concatenate(mismatches)
+        else:
+            positions = motifs = mismatches = np.empty(0, dtype=np.intp)
+
+        sequences = np.searchsorted(offsets, positions, side='right') - 1
+        ends = positions + self._lengths[motifs]
+        keep = ends <= offsets[sequences + 1]
+        order = np.lexsort((motifs[keep], positions[keep], sequences[keep]))
+        sequences = sequences[keep][order]
+        positions = positions[keep][order]
+        return (sequences, motifs[keep][order],
+                positions - offsets[sequences], ends[keep][order] - offsets[
+                    sequences], mismatches[keep][order])
+
+    def _search_block(self, chars, codes, positions):
+        """Find the motifs matching at each of `positions`.
+
+        The search state after the first few characters is looked up from the
+        precomputed states. Each following character is then compared against
+        the corresponding character of every motif at once; positions where
+        every motif has already failed are dropped as the search proceeds.
+
+        """
+        prefixes = np.zeros(positions.size, dtype=np.intp)
+        for j in range(self._prefix_length):
+            prefixes *= self._alphabet_size
+            prefixes += codes[positions + j]
+        keep = self._prefix_alive[prefixes]
+        positions = positions[keep]
+        state = self._take_state(self._prefix_state, prefixes[keep])
+
+        for j in range(self._prefix_length, self._tables.shape[0]):
+            state = self._advance(state,
+                                  self._tables[j][chars[positions + j]])
+            keep = state[2].any(axis=1)
+            # dropping positions requires copying the state, so only drop
+            # them once enough positions can be dropped
+            if (np.count_nonzero(keep) < 0.75 * keep.size or
+                    j == self._tables.shape[0] - 1):
+                positions = positions[keep]
+                state = self._take_state(state, keep)
+        counters, _, alive = state
+
+        # only positions matching at least one motif are left, so expanding
+        # the bits is cheap
+        matched = (alive[:, :, np.newaxis] >>
+                   np.arange(64, dtype=np.uint64)) & np.uint64(1)
+        rows, motifs = matched.reshape(positions.size,
+                                       self._used.size * 64).nonzero()
+
+        mismatches = np.zeros(rows.size, dtype=np.intp)
+        words, bits = np.divmod(motifs, 64)
+        bits = bits.astype(np.uint64)
+        for b, counter in enumerate(counters):
+            mismatches |= (((counter[rows, words] >> bits) & np.uint64(1))
+                           .astype(np.intp) << b)
+        return positions[rows], motifs, mismatches
+
+    # The search state at each position is a tuple of ``(counters, overflow,
+    # alive)``. Mismatches are counted with bit-sliced counters: bit i of
+    # ``counters[b]`` is bit b of the number of mismatches of motif i, and
+    # motifs with more mismatches than the counters can hold are marked in
+    # ``overflow``. ``alive`` marks motifs with at most `max_mismatches` so
+    # far.
+
+    def _initial_state(self, size):
+        shape = (size, self._used.size)
+        counters = [np.zeros(shape, dtype=np.uint64)
+                    for _ in range(int(self._max_mismatches).bit_length())]
+        alive = np.empty(shape, dtype=np.uint64)
+        alive[:] = self._used
+        return counters, np.zeros(shape, dtype=np.uint64), alive
+
+    def _take_state(self, state, indices):
+        counters, overflow, alive = state
+        return ([counter[indices] for counter in counters], overflow[indices],
+                alive[indices])
+
+    def _advance(self, state, matches):
+        """Update the search state with the next character's matches."""
+        counters, overflow, alive = state
+        if not counters:
+            return counters, overflow, alive & matches
+
+        carry = ~matches
+        new_counters = []
+        for counter in counters:
+            new_counters.append(counter ^ carry)
+            carry = counter & carry
+        overflow = overflow | carry
+        return (new_counters, overflow,
+                self._within_mismatches(new_counters, overflow))
+
+    def _within_mismatches(self, counters, overflow):
+        """Return bits of the motifs with at most `max_mismatches`."""
+        less = np.zeros_like(overflow)
+        equal = ~overflow
+        for b in reversed(range(len(counters))):
+            if self._max_mismatches >> b & 1:
+                less |= equal & ~counters[b]
+                equal &= counters[b]
+            else:
+                equal &= ~counters[b]
+        return (less | equal) & self._used
@@ -13,8 +13,12 @@ from abc import ABCMeta, abstractproperty
 
 import numpy as np
 
-from skbio.util._decorator import classproperty, stable
+from skbio._base import PositionalMetadataMixin
+from skbio.util._decorator import (classproperty, classonlymethod, stable,
+                                   experimental)
 from ._iupac_sequence import _motifs as parent_motifs
+from ._packed import _PackedNucleotides, _INVALID_CODE
+from ._kmer import _count_kmers, _format_kmer_counts, _max_dense_k
 
 
 class NucleotideMixin(with_metaclass(ABCMeta, object)):
@@ -34,6 +38,7 @@ class NucleotideMixin(with_metaclass(ABCMeta, object)):
     """
     __complement_lookup = None
     __gc_codes = None
+    __packing_encodings = None
 
     @classproperty
     def _complement_lookup(cls):
@@ -53,6 +58,51 @@ class NucleotideMixin(with_metaclass(ABCMeta, object)):
             cls.__gc_codes = np.asarray([ord(g) for g in gc_iupac_chars])
         return cls.__gc_codes
 
+    @classproperty
+    def _packing_encodings(cls):
+        """Encodings used to pack sequence characters, smallest first.
+
+        Non-degenerate characters are packed into 2 bits. Otherwise 4 bits are
+        used: each non-degenerate character sets one bit, degenerate
+        characters set the bits of the characters they represent and the
+        default gap character is stored as zero.
+
+        """
+        if cls.__packing_encodings is not None:
+            return cls.__packing_encodings
+
+        nondegenerates = sorted(cls.nondegenerate_chars)
+        two_bit = {c: i for i, c in enumerate(nondegenerates)}
+        four_bit = {c: 1 << i for i, c in enumerate(nondegenerates)}
+        for degenerate, expansions in cls.degenerate_map.items():
+            four_bit[degenerate] = sum(four_bit[c] for c in expansions)
+        four_bit[cls.default_gap_char] = 0
+
+        encodings = []
+        for bits, codes in ((2, two_bit), (4, four_bit)):
+            lookup = np.full(cls._number_of_extended_ascii_codes,
+                             _INVALID_CODE, dtype=np.uint8)
+            chars = np.zeros(1 << bits, dtype=np.uint8)
+            for char, code in codes.items():
+                lookup[ord(char)] = code
+                chars[code] = ord(char)
+            encodings.append((bits, lookup, chars))
+        cls.__packing_encodings = encodings
+        return encodings
+
+    @property
+    def _bytes(self):
+        if self._packed is not None:
+            bytes_ = self._packed.unpack()
+            bytes_.flags.writeable = False
+            return bytes_
+        return self._unpacked_bytes
+
+    @_bytes.setter
+    def _bytes(self, bytes_):
+        self._packed = None
+        self._unpacked_bytes = bytes_
+
     @property
     def _motifs(self):
         return _motifs
@@ -76,6 +126,256 @@ class NucleotideMixin(with_metaclass(ABCMeta, object)):
         """
         return set()  # pragma: no cover
 
+    @experimental(as_of='0.4.0-dev')
+    def pack(self):
+        """Return a copy of the sequence stored in 2 or 4 bits per character.
+
+        Sequences containing only non-degenerate characters are stored in 2
+        bits per character; otherwise 4 bits per character are used. This
+        reduces memory use by 4x or 2x, respectively.
+
+        Returns
+        -------
+        NucleotideMixin
+            Packed sequence of the same type and with the same metadata and
+            positional metadata as this sequence.
+
+        Raises
+        ------
+        ValueError
+            If the sequence contains characters other than non-degenerate
+            characters, degenerate characters, and the default gap character.
+
+        See Also
+        --------
+        is_packed
+
+        Notes
+        -----
+        Packed sequences behave exactly like unpacked sequences and compare
+        equal to them. ``len``, equality between packed sequences,
+        ``complement``, ``gc_content``, ``gc_frequency``, and
+        ``kmer_frequencies`` operate on the packed representation directly.
+        Slicing with a contiguous slice only unpacks the selected characters
+        and returns an unpacked sequence. Other operations transparently unpack
+        the sequence as needed; their results are not packed.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> seq = DNA('ACGTTGCA').pack()
+        >>> seq.is_packed()
+        True
+        >>> seq == DNA('ACGTTGCA')
+        True
+        >>> str(seq.complement())
+        'TGCAACGT'
+        >>> seq.gc_content()
+        0.5
+        >>> str(seq[2:5])
+        'GTT'
+
+        """
+        if self._packed is not None:
+            return self._to_packed(self._packed)
+
+        packed = _PackedNucleotides.from_bytes(self._bytes,
+                                               self._packing_encodings)
+        if packed is None:
+            raise ValueError(
+                "Cannot pack a sequence containing characters other than "
+                "non-degenerate characters, degenerate characters, and the "
+                "default gap character (%r)." % self.default_gap_char)
+        return self._to_packed(packed)
+
+    @experimental(as_of='0.4.0-dev')
+    def is_packed(self):
+        """Determine if the sequence is stored in packed form.
+
+        Returns
+        -------
+        bool
+            Indicates whether the sequence is packed.
+
+        See Also
+        --------
+        pack
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> DNA('ACGT').is_packed()
+        False
+        >>> DNA('ACGT').pack().is_packed()
+        True
+
+        """
+        return self._packed is not None
+
+    def _to_packed(self, packed):
+        """Return a copy of the sequence storing `packed` characters."""
+        metadata = None
+        if self.has_metadata():
+            metadata = self._metadata
+        seq = self._constructor(sequence=np.empty(0, dtype=np.uint8),
+                                metadata=metadata)
+        seq._packed = packed
+        seq._unpacked_bytes = None
+        seq._positional_metadata = PositionalMetadataMixin._copy_(self)
+        return seq
+
+    def _kmer_codes(self):
+        """Return 2-bit codes of the characters, marking other characters."""
+        if self._packed is not None and self._packed.bits == 2:
+            return self._packed.codes()
+        return self._packing_encodings[0][1][self._bytes]
+
+    @experimental(as_of='0.4.0-dev')
+    def kmer_counts(self, k, overlap=True, canonical=False, output='dict'):
+        """Count words of length `k` using 2-bit integer encoded nucleotides.
+
+        Parameters
+        ----------
+        k : int
+            The word length. Must be between 1 and 31.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+        canonical : bool, optional
+            If ``True``, count each kmer together with its reverse complement,
+            reporting the lexicographically smaller of the two. This makes the
+            counts independent of which strand was sequenced.
+        output : {'dict', 'dense', 'sparse'}, optional
+            Type of the result. ``'dict'`` maps each observed kmer to its
+            count. ``'dense'`` returns a 1D ``np.ndarray`` of length ``4 **
+            k`` and is only supported for ``k <= 12``. ``'sparse'`` returns a
+            ``scipy.sparse.csr_matrix`` of shape ``(1, 4 ** k)``.
+
+        Returns
+        -------
+        dict, np.ndarray, or scipy.sparse.csr_matrix
+            Kmer counts. Positions in ``'dense'`` and ``'sparse'`` results
+            correspond to kmers in lexicographic order (i.e., ``AA...A`` is
+            first and ``TT...T`` (or ``UU...U``) is last).
+
+        Raises
+        ------
+        ValueError
+            If `k` is not between 1 and 31, if `output` is invalid, or if
+            `output` is ``'dense'`` and `k` is greater than 12.
+
+        See Also
+        --------
+        kmer_frequencies
+        batch_kmer_counts
+
+        Notes
+        -----
+        Unlike ``kmer_frequencies``, kmers are counted without creating a
+        sequence or string per kmer: nucleotides are encoded as 2-bit integers
+        and each kmer is represented by a 64-bit integer. Kmers containing
+        characters other than non-degenerate characters (e.g., gaps or
+        degenerate characters) are not counted.
+
+        Examples
+        --------
+        >>> from pprint import pprint
+        >>> from skbio import DNA
+        >>> s = DNA('ACGTTNACG')
+        >>> pprint(s.kmer_counts(3))
+        {'ACG': 2, 'CGT': 1, 'GTT': 1}
+        >>> pprint(s.kmer_counts(3, canonical=True))
+        {'AAC': 1, 'ACG': 3}
+        >>> s.kmer_counts(1, output='dense')
+        array([2, 2, 2, 2])
+
+        """
+        result = type(self).batch_kmer_counts(
+            [self], k, overlap=overlap, canonical=canonical, output=output)
+        if output == 'sparse':
+            return result
+        return result[0]
+
+    @classonlymethod
+    @experimental(as_of='0.4.0-dev')
+    def batch_kmer_counts(cls, sequences, k, overlap=True, canonical=False,
+                          output='sparse'):
+        """Count words of length `k` in each of several sequences.
+
+        Parameters
+        ----------
+        sequences : iterable (NucleotideMixin)
+            Sequences of the type calling this class method.
+        k : int
+            The word length. Must be between 1 and 31.
+        overlap : bool, optional
+            Defines whether the kmers should be overlapping or not.
+        canonical : bool, optional
+            If ``True``, count each kmer together with its reverse complement,
+            reporting the lexicographically smaller of the two.
+        output : {'sparse', 'dense', 'dict'}, optional
+            Type of the result. ``'sparse'`` returns a
+            ``scipy.sparse.csr_matrix`` of shape ``(n, 4 ** k)`` where ``n`` is
+            the number of sequences. ``'dense'`` returns a 2D ``np.ndarray``
+            of the same shape and is only supported for ``k <= 12``.
+            ``'dict'`` returns a list of dicts mapping each observed kmer to
+            its count.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix, np.ndarray, or list of dict
+            Kmer counts of each sequence, in the order of `sequences`.
+
+        Raises
+        ------
+        TypeError
+            If `sequences` contains an object that is not an instance of the
+            class calling this method.
+        ValueError
+            If `k` is not between 1 and 31, if `output` is invalid, or if
+            `output` is ``'dense'`` and `k` is greater than 12.
+
+        See Also
+        --------
+        kmer_counts
+
+        Notes
+        -----
+        All sequences are counted in a single vectorized pass. See
+        ``kmer_counts`` for details.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> counts = DNA.batch_kmer_counts([DNA('AACG'), DNA('CGTT')], 2)
+        >>> counts.shape
+        (2, 16)
+        >>> print(counts.toarray()[:, [0, 1, 6, 15]])
+        [[1 1 1 0]
+         [0 0 1 1]]
+
+        """
+        if not 1 <= k <= 31:
+            raise ValueError("k must be between 1 and 31, not %r." % k)
+        if output not in ('sparse', 'dense', 'dict'):
+            raise ValueError("`output` must be 'dict', 'dense', or 'sparse', "
+                             "not %r." % output)
+        if output == 'dense' and k > _max_dense_k:
+            raise ValueError("Dense kmer counts are only supported for k <= "
+                             "%d, not %d." % (_max_dense_k, k))
+
+        codes_list = []
+        for seq in sequences:
+            if not isinstance(seq, cls):
+                raise TypeError(
+                    "Cannot count kmers of %r with %s.batch_kmer_counts." %
+                    (type(seq).__name__, cls.__name__))
+            codes_list.append(seq._kmer_codes())
+
+        rows, words, counts = _count_kmers(codes_list, k, overlap=overlap,
+                                           canonical=canonical)
+        return _format_kmer_counts(rows, words, counts, len(codes_list), k,
+                                   output, cls._packing_encodings[0][2])
+
     @stable(as_of='0.4.0')
     def complement(self, reverse=False):
         """Return the complement of the nucleotide sequence.
@@ -147,8 +447,15 @@ class NucleotideMixin(with_metaclass(ABCMeta, object)):
         array([5, 4, 3, 2, 1, 0])
 
         """
-        result = self._complement_lookup[self._bytes]
-        complement = self._to(sequence=result)
+        if self._packed is not None:
+            packed = self._packed
+            lookup = dict((bits, lookup) for bits, lookup, _ in
+                          self._packing_encodings)[packed.bits]
+            codes = lookup[self._complement_lookup[packed.chars]]
+            complement = self._to_packed(packed.translate(codes))
+        else:
+            result = self._complement_lookup[self._bytes]
+            complement = self._to(sequence=result)
         if reverse:
             complement = complement[::-1]
         return complement
@@ -342,13 +649,21 @@ class NucleotideMixin(with_metaclass(ABCMeta, object)):
 
         """
 
-        counts = np.bincount(self._bytes,
-                             minlength=self._number_of_extended_ascii_codes)
+        if self._packed is not None:
+            counts = np.zeros(self._number_of_extended_ascii_codes,
+                              dtype=np.int64)
+            counts[self._packed.chars] = self._packed.code_counts()
+        else:
+            counts = np.bincount(
+                self._bytes, minlength=self._number_of_extended_ascii_codes)
         gc = counts[self._gc_codes].sum()
         if relative:
-            seq = self.degap()
-            if len(seq) != 0:
-                gc /= len(seq)
+            if self._packed is not None:
+                length = len(self) - counts[self._gap_codes].sum()
+            else:
+                length = len(self.degap())
+            if length != 0:
+                gc /= length
         return gc
 
 
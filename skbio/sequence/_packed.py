@@ -0,0 +1,193 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+
+# Marks an ASCII code that cannot be represented by an encoding.
+_INVALID_CODE = 255
+
+
+class _PackedNucleotides(object):
+    """Sequence characters packed into 2 or 4 bits per position.
+
+    Each position is stored as a small integer code; ``chars`` maps codes back
+    to ASCII codes. The first position occupies the least significant bits of
+    the first byte and unused trailing bits of the last byte are always zero,
+    so two packed sequences using the same encoding are equal if and only if
+    their packed bytes are equal.
+
+    Parameters
+    ----------
+    data : 1D np.ndarray (np.uint8)
+        Packed codes.
+    length : int
+        Number of positions.
+    bits : {2, 4}
+        Number of bits per position.
+    chars : 1D np.ndarray (np.uint8)
+        ASCII code of the character represented by each code.
+
+    """
+    def __init__(self, data, length, bits, chars):
+        data.flags.writeable = False
+        self.data = data
+        self.length = length
+        self.bits = bits
+        self.chars = chars
+
+    @classmethod
+    def from_bytes(cls, bytes_, encodings):
+        """Pack ASCII codes using the first encoding that represents them.
+
+        Parameters
+        ----------
+        bytes_ : 1D np.ndarray (np.uint8)
+            ASCII codes to pack.
+        encodings : iterable of tuple
+            ``(bits, lookup, chars)`` tuples, tried in order. ``lookup`` maps
+            each ASCII code to its code, or ``_INVALID_CODE`` if the character
+            cannot be represented.
+
+        Returns
+        -------
+        _PackedNucleotides or None
+            ``None`` if none of the encodings can represent `bytes_`.
+
+        """
+        for bits, lookup, chars in encodings:
+            codes = lookup[bytes_]
+            if not (codes == _INVALID_CODE).any():
+                return cls(_pack_codes(codes, bits), len(bytes_), bits, chars)
+        return None
+
+    @property
+    def _per_byte(self):
+        return 8 // self.bits
+
+    @property
+    def _padding(self):
+        return -self.length % self._per_byte
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.data.flags.writeable = False
+
+    def __len__(self):
+        return self.length
+
+    def __eq__(self, other):
+        return (self.length == other.length and self.bits == other.bits and
+                np.array_equal(self.chars, other.chars) and
+                np.array_equal(self.data, other.data))
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def codes(self, start=0, stop=None):
+        """Return the codes of positions ``start`` to ``stop``."""
+        if stop is None:
+            stop = self.length
+        stop = max(start, stop)
+        per_byte = self._per_byte
+        first = start // per_byte
+        last = -(-stop // per_byte)
+        shifts = np.arange(0, 8, self.bits, dtype=np.uint8)
+        mask = np.uint8((1 << self.bits) - 1)
+        codes = ((self.data[first:last, np.newaxis] >> shifts) & mask).ravel()
+        offset = start - first * per_byte
+        return codes[offset:offset + stop - start]
+
+    def unpack(self, start=0, stop=None):
+        """Return the ASCII codes of positions ``start`` to ``stop``."""
+        return self.chars[self.codes(start, stop)]
+
+    def take(self, positions):
+        """Return the ASCII codes of the (non-negative) `positions`."""
+        positions = np.asarray(positions, dtype=np.intp)
+        per_byte = self._per_byte
+        shifts = (positions % per_byte * self.bits).astype(np.uint8)
+        mask = np.uint8((1 << self.bits) - 1)
+        return self.chars[(self.data[positions // per_byte] >> shifts) & mask]
+
+    def translate(self, lookup, chars=None):
+        """Map every code through `lookup` without unpacking.
+
+        Parameters
+        ----------
+        lookup : 1D np.ndarray (np.uint8)
+            New code for each code.
+        chars : 1D np.ndarray (np.uint8), optional
+            ASCII codes for the new codes. Defaults to the current ``chars``.
+
+        Returns
+        -------
+        _PackedNucleotides
+
+        """
+        if chars is None:
+            chars = self.chars
+        data = _byte_lookup(lookup, self.bits)[self.data]
+        if self._padding:
+            # Keep the unused trailing bits zero.
+            data[-1] &= np.uint8((1 << (8 - self._padding * self.bits)) - 1)
+        return _PackedNucleotides(data, self.length, self.bits, chars)
+
+    def code_counts(self):
+        """Return the number of times each code occurs without unpacking."""
+        byte_counts = np.bincount(self.data, minlength=256)
+        counts = byte_counts.dot(_byte_code_counts(self.bits))
+        # Padding is stored as code zero.
+        counts[0] -= self._padding
+        return counts
+
+
+def _pack_codes(codes, bits):
+    per_byte = 8 // bits
+    padding = -len(codes) % per_byte
+    if padding:
+        codes = np.concatenate([codes, np.zeros(padding, dtype=np.uint8)])
+    shifts = np.arange(0, 8, bits, dtype=np.uint8)
+    return np.bitwise_or.reduce(codes.reshape(-1, per_byte) << shifts, axis=1)
+
+
+_byte_lookups = {}
+
+
+def _byte_lookup(lookup, bits):
+    """Expand a per-code lookup table into a per-byte lookup table."""
+    key = (bits, lookup.tostring())
+    if key not in _byte_lookups:
+        all_bytes = np.arange(256, dtype=np.uint8)
+        codes = _PackedNucleotides(all_bytes, 256 * 8 // bits, bits,
+                                   None).codes()
+        _byte_lookups[key] = _pack_codes(lookup[codes], bits)
+    return _byte_lookups[key]
+
+
+_byte_code_count_tables = {}
+
+
+def _byte_code_counts(bits):
+    """Return table of the number of times each code occurs in each byte."""
+    if bits not in _byte_code_count_tables:
+        all_bytes = np.arange(256, dtype=np.uint8)
+        per_byte = 8 // bits
+        codes = _PackedNucleotides(all_bytes, 256 * per_byte, bits,
+                                   None).codes().reshape(256, per_byte)
+        table = np.zeros((256, 1 << bits), dtype=np.int64)
+        for i in range(per_byte):
+            table[np.arange(256), codes[:, i]] += 1
+        _byte_code_count_tables[bits] = table
+    return _byte_code_count_tables[bits]
@@ -194,9 +194,7 @@ class RNA(IUPACSequence, NucleotideMixin):
         if self.has_metadata():
             metadata = self.metadata
 
-        positional_metadata = None
-        if self.has_positional_metadata():
-            positional_metadata = self.positional_metadata
+        positional_metadata = self._positional_metadata_source_()
 
         # turn off validation because `seq` is guaranteed to be valid
         return skbio.DNA(seq, metadata=metadata,
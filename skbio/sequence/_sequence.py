@@ -23,8 +23,13 @@ import pandas as pd
 
 from skbio._base import SkbioObject, MetadataMixin, PositionalMetadataMixin
 from skbio.sequence._repr import _SequenceReprBuilder
+from skbio.sequence._kmer import (_kmer_frequencies_from_bytes,
+                                  _kmer_frequencies_from_packed)
+from skbio.sequence._approximate import _find_approximate
+from skbio.sequence._base import (_split_concatenated, _concatenate_chunks,
+                                  _search_chunks)
 from skbio.util._decorator import (stable, experimental, deprecated,
-                                   classonlymethod, overrides)
+                                   classonlymethod, classproperty, overrides)
 
 
 class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
@@ -322,6 +327,9 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
     # is the 6th bit.
     _ascii_invert_case_bit_offset = 32
     _ascii_lowercase_boundary = 90
+    # Packed representation of the sequence characters, if any (see
+    # ``NucleotideMixin.pack``).
+    _packed = None
     default_write_format = 'fasta'
     __hash__ = None
 
@@ -368,6 +376,12 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
     def _string(self):
         return self._bytes.tostring()
 
+    @classproperty
+    def _approximate_match_map(cls):
+        # Characters matched by each pattern character (besides itself) when
+        # searching approximately.
+        return {}
+
     @classonlymethod
     @experimental(as_of="0.4.0-dev")
     def concat(cls, sequences, how='strict'):
@@ -542,9 +556,8 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
             # for positional metadata
             if metadata is None and sequence.has_metadata():
                 metadata = sequence.metadata
-            if (positional_metadata is None and
-                    sequence.has_positional_metadata()):
-                positional_metadata = sequence.positional_metadata
+            if positional_metadata is None:
+                positional_metadata = sequence._positional_metadata_source_()
             sequence = sequence._bytes
 
             self._owns_bytes = False
@@ -583,7 +596,8 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
 
             # If it isn't True, it must be a string_type
             if not (lowercase is True):
-                self.positional_metadata[lowercase] = lowercase_mask
+                self._set_positional_metadata_column_(lowercase,
+                                                      lowercase_mask)
         else:
             raise TypeError("lowercase keyword argument expected a bool or "
                             "string, but got %s" % type(lowercase))
@@ -708,7 +722,10 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
         if not MetadataMixin._eq_(self, other):
             return False
 
-        if self._string != other._string:
+        if self._packed is not None and other._packed is not None:
+            if self._packed != other._packed:
+                return False
+        elif self._string != other._string:
             return False
 
         if not PositionalMetadataMixin._eq_(self, other):
@@ -839,10 +856,15 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
                         list(_slices_from_iter(self._bytes, indexable)))
                     index = _as_slice_if_single_index(indexable)
 
-                    positional_metadata = None
-                    if self.has_positional_metadata():
+                    positional_metadata = self._positional_metadata_source_()
+                    if isinstance(positional_metadata, dict):
+                        positional_metadata = collections.OrderedDict(
+                            (key, np.concatenate(list(
+                                _slices_from_iter(values, index))))
+                            for key, values in positional_metadata.items())
+                    elif positional_metadata is not None:
                         pos_md_slices = list(_slices_from_iter(
-                                             self.positional_metadata, index))
+                                             positional_metadata, index))
                         positional_metadata = pd.concat(pos_md_slices)
 
                     return self._to(sequence=seq,
@@ -864,21 +886,58 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
             # array
             indexable = indexable.astype(int)
 
-        seq = self._bytes[indexable]
+        if self._packed is not None:
+            # Only unpack the requested positions.
+            seq = self._unpack_positions(indexable)
+        else:
+            seq = self._bytes[indexable]
         positional_metadata = self._slice_positional_metadata(indexable)
 
         return self._to(sequence=seq, positional_metadata=positional_metadata)
 
+    def _unpack_positions(self, indexable):
+        """Return the characters of a packed sequence at `indexable`.
+
+        Single indexes, slices and integer or boolean index arrays only
+        unpack the requested positions; anything else is left to NumPy on the
+        unpacked characters (e.g., to raise the same errors).
+
+        """
+        length = len(self)
+        if isinstance(indexable, slice):
+            start, stop, step = indexable.indices(length)
+            if step == 1:
+                return self._packed.unpack(start, stop)
+            return self._packed.take(np.arange(start, stop, step))
+
+        positions = np.asarray(indexable)
+        if positions.dtype == bool and positions.ndim == 1:
+            return self._packed.take(np.flatnonzero(positions))
+        if positions.dtype.kind not in 'iu' or positions.ndim > 1:
+            return self._bytes[indexable]
+        if positions.size and not (-length <= positions.min() and
+                                   positions.max() < length):
+            raise IndexError("index out of bounds for a sequence of length "
+                             "%d" % length)
+        positions = np.where(positions < 0, positions + length, positions)
+        return self._packed.take(positions.reshape(-1))
+
     def _slice_positional_metadata(self, indexable):
-        if self.has_positional_metadata():
-            if _is_single_index(indexable):
-                index = _single_index_to_slice(indexable)
-            else:
-                index = indexable
-            return self.positional_metadata.iloc[index]
-        else:
+        positional_metadata = self._positional_metadata_source_()
+        if positional_metadata is None:
             return None
 
+        if _is_single_index(indexable):
+            index = _single_index_to_slice(indexable)
+        else:
+            index = indexable
+
+        if isinstance(positional_metadata, dict):
+            return collections.OrderedDict(
+                (key, values[index])
+                for key, values in positional_metadata.items())
+        return positional_metadata.iloc[index]
+
     @stable(as_of="0.4.0")
     def __len__(self):
         """Return the number of characters in the biological sequence.
@@ -896,6 +955,8 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
         4
 
         """
+        if self._packed is not None:
+            return len(self._packed)
         return self._bytes.size
 
     @stable(as_of="0.4.0")
@@ -1274,10 +1335,17 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
         # we don't make a distinction between deep vs. shallow copy of bytes
         # because dtype=np.uint8. we only need to make the distinction when
         # dealing with object dtype
-        bytes_ = np.copy(self._bytes)
-
-        seq_copy = self._constructor(sequence=bytes_, metadata=None,
-                                     positional_metadata=None)
+        if self._packed is not None:
+            # packed characters are read-only, so they can be shared
+            seq_copy = self._constructor(
+                sequence=np.empty(0, dtype=np.uint8), metadata=None,
+                positional_metadata=None)
+            seq_copy._packed = self._packed
+            seq_copy._unpacked_bytes = None
+        else:
+            bytes_ = np.copy(self._bytes)
+            seq_copy = self._constructor(sequence=bytes_, metadata=None,
+                                         positional_metadata=None)
 
         if deep:
             seq_copy._metadata = MetadataMixin._deepcopy_(self, memo)
@@ -1908,8 +1976,15 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
         {'ACA': 0.25, 'CAT': 0.25, 'TTA': 0.5}
 
         """
-        kmers = self.iter_kmers(k, overlap=overlap)
-        freqs = dict(collections.Counter((str(seq) for seq in kmers)))
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        if self._packed is not None and k * self._packed.bits <= 64:
+            freqs = _kmer_frequencies_from_packed(self._packed, k,
+                                                  overlap=overlap)
+        else:
+            freqs = _kmer_frequencies_from_bytes(self._bytes, k,
+                                                 overlap=overlap)
 
         if relative:
             if overlap:
@@ -1973,6 +2048,210 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
                 yield slice(lookup[match.start(g)],
                             lookup[match.end(g) - 1] + 1)
 
+    @experimental(as_of="0.4.0-dev")
+    def find_approximate(self, subsequence, max_distance=1, indels=True):
+        r"""Generate slices for approximate occurrences of a subsequence.
+
+        Parameters
+        ----------
+        subsequence : str, Sequence, or 1D np.ndarray (np.uint8 or '\|S1')
+            Subsequence to search for. Must be between 1 and 64 characters
+            long.
+        max_distance : int, optional
+            Maximum number of differences between `subsequence` and a match.
+            Must be smaller than the length of `subsequence`.
+        indels : bool, optional
+            If ``True``, differences are substitutions, insertions and
+            deletions (edit distance); otherwise only substitutions are
+            allowed (Hamming distance).
+
+        Yields
+        ------
+        slice
+            Location of the match.
+
+        Raises
+        ------
+        ValueError
+            If `subsequence` is empty or longer than 64 characters, or if
+            `max_distance` is negative or not smaller than the length of
+            `subsequence`.
+        TypeError
+            If `subsequence` is a ``Sequence`` object with a different type
+            than this sequence.
+
+        See Also
+        --------
+        batch_find_approximate
+        find_with_regex
+
+        Notes
+        -----
+        Uses the bit-parallel algorithm of Myers [1]_. If `indels` is
+        ``True``, the matches ending at consecutive positions usually describe
+        the same occurrence, so only the one with the smallest edit distance
+        is reported (the leftmost one in case of ties). Its start is the one
+        resulting in the smallest edit distance and, among those, the one
+        giving a match closest in length to `subsequence`.
+
+        For sequences with degenerate characters (e.g., ``DNA``), a degenerate
+        character in `subsequence` matches any of the characters it
+        represents, as well as itself.
+
+        References
+        ----------
+        .. [1] Myers, G. (1999). A fast bit-vector algorithm for approximate
+           string matching based on dynamic programming. Journal of the ACM,
+           46(3), 395-415.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> s = DNA('GGACGTTACCAGTAGACTG')
+        >>> for match in s.find_approximate('ACGTAC'):
+        ...     match
+        ...     str(s[match])
+        slice(2, 9, None)
+        'ACGTTAC'
+
+        Degenerate characters in the subsequence match the characters they
+        represent:
+
+        >>> for match in s.find_approximate('AGNAGA', max_distance=0):
+        ...     match
+        slice(10, 16, None)
+
+        Only substitutions are allowed if `indels` is ``False``:
+
+        >>> for match in s.find_approximate('ACGTAC', max_distance=2,
+        ...                                 indels=False):
+        ...     match
+        slice(2, 8, None)
+
+        """
+        pattern = self._munge_to_bytestring(subsequence, 'find_approximate')
+        self._validate_approximate_search(pattern, max_distance)
+        offsets = np.array([0, len(self)])
+        _, starts, ends, _ = self._find_approximate(
+            self._bytes, offsets, pattern, max_distance, indels)
+        for start, end in zip(starts, ends):
+            yield slice(start, end)
+
+    @classonlymethod
+    @experimental(as_of="0.4.0-dev")
+    def batch_find_approximate(cls, sequences, subsequence, max_distance=1,
+                               indels=True, offsets=None, chunk_size=10000):
+        """Find approximate occurrences of a subsequence in many sequences.
+
+        The sequences are searched together, which is much faster than
+        calling ``find_approximate`` on each of many short sequences (e.g.,
+        reads).
+
+        Parameters
+        ----------
+        sequences : iterable (Sequence) or bytes
+            Sequences to search, e.g., the generator returned by
+            ``skbio.io.read``. Each must be an instance of the class calling
+            this method. If `offsets` is provided, `sequences` must instead be
+            the concatenated ASCII characters of the sequences (e.g.,
+            ``bytes`` or a 1D ``np.uint8`` array).
+        subsequence : str, Sequence, or bytes
+            Subsequence to search for. Must be between 1 and 64 characters
+            long.
+        max_distance : int, optional
+            Maximum number of differences between `subsequence` and a match.
+            Must be smaller than the length of `subsequence`.
+        indels : bool, optional
+            If ``True``, differences are substitutions, insertions and
+            deletions (edit distance); otherwise only substitutions are
+            allowed (Hamming distance).
+        offsets : 1D array_like (int), optional
+            Boundaries of the sequences within `sequences`: sequence ``i`` is
+            ``sequences[offsets[i]:offsets[i + 1]]``.
+        chunk_size : int, optional
+            Number of sequences searched together when `sequences` is an
+            iterable. Larger values are faster but use more memory.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per match, ordered by sequence and position. Columns are
+            ``'sequence'`` (the index of the sequence), ``'start'`` and
+            ``'end'`` (the 0-based, half-open coordinates of the match in the
+            sequence) and ``'distance'``.
+
+        Raises
+        ------
+        ValueError
+            If `subsequence` is empty or longer than 64 characters, if
+            `max_distance` is negative or not smaller than the length of
+            `subsequence`, or if `offsets` is invalid.
+        TypeError
+            If a sequence, or `subsequence` if it is a ``Sequence``, is not an
+            instance of the class calling this method.
+
+        See Also
+        --------
+        find_approximate
+
+        Notes
+        -----
+        Matches are defined as in ``find_approximate``.
+
+        Examples
+        --------
+        >>> from skbio import DNA
+        >>> reads = [DNA('ACGTACGT'), DNA('TTTTTT'), DNA('GGACTTACG')]
+        >>> DNA.batch_find_approximate(reads, 'ACGTAC')
+           sequence  start  end  distance
+        0         0      0    6         0
+        1         2      2    8         1
+
+        """
+        columns = ['sequence', 'start', 'end', 'distance']
+
+        if isinstance(subsequence, Sequence):
+            if type(subsequence) is not cls:
+                raise TypeError(
+                    "Cannot use %s and %s together with "
+                    "`batch_find_approximate`" % (cls.__name__,
+                                                  type(subsequence).__name__))
+            pattern = subsequence._string
+        elif isinstance(subsequence, six.string_types):
+            pattern = subsequence.encode('ascii')
+        else:
+            pattern = bytes(subsequence)
+        cls._validate_approximate_search(pattern, max_distance)
+
+        if offsets is not None:
+            chunks = [_split_concatenated(sequences, offsets)]
+        else:
+            chunks = _concatenate_chunks(sequences, chunk_size, cls,
+                                         '%s objects' % cls.__name__)
+
+        def search(chars, offsets):
+            return cls._find_approximate(chars, offsets, pattern,
+                                         max_distance, indels)
+
+        return _search_chunks(chunks, search, columns)
+
+    @staticmethod
+    def _validate_approximate_search(pattern, max_distance):
+        if not 1 <= len(pattern) <= 64:
+            raise ValueError("`subsequence` must be between 1 and 64 "
+                             "characters long, not %d." % len(pattern))
+        if not 0 <= max_distance < len(pattern):
+            raise ValueError("`max_distance` must be at least zero and "
+                             "smaller than the length of `subsequence`, not "
+                             "%r." % max_distance)
+
+    @classmethod
+    def _find_approximate(cls, chars, offsets, pattern, max_distance,
+                          indels):
+        return _find_approximate(chars, offsets, pattern,
+                                 cls._approximate_match_map, max_distance,
+                                 indels)
+
     @stable(as_of="0.4.0")
     def iter_contiguous(self, included, min_length=1, invert=False):
         """Yield contiguous subsequences based on `included`.
@@ -2086,8 +2365,8 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
             sequence = self._bytes
         if metadata is None and self.has_metadata():
             metadata = self._metadata
-        if positional_metadata is None and self.has_positional_metadata():
-            positional_metadata = self._positional_metadata
+        if positional_metadata is None:
+            positional_metadata = self._positional_metadata_source_()
         return self._constructor(sequence=sequence, metadata=metadata,
                                  positional_metadata=positional_metadata)
 
@@ -2099,9 +2378,10 @@ class Sequence(MetadataMixin, PositionalMetadataMixin, collections.Sequence,
 
         """
         if isinstance(sliceable, six.string_types):
-            if sliceable in self.positional_metadata:
-                if self.positional_metadata[sliceable].dtype == np.bool:
-                    sliceable = self.positional_metadata[sliceable]
+            column = self._get_positional_metadata_column_(sliceable)
+            if column is not None:
+                if column.dtype == np.bool:
+                    sliceable = column
                 else:
                     raise TypeError("Column '%s' in positional metadata does "
                                     "not correspond to a boolean vector" %
@@ -10,7 +10,14 @@ from __future__ import absolute_import, division, print_function
 
 import unittest
 
-from skbio.sequence._base import ElasticLines
+import six
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+
+from skbio import DNA, RNA, Protein
+from skbio.sequence._base import (ElasticLines, _split_concatenated,
+                                  _concatenate_chunks, _search_chunks)
 
 
 class TestElasticLines(unittest.TestCase):
@@ -44,5 +51,57 @@ class TestElasticLines(unittest.TestCase):
                          '------\nfoo\n------\nbar\nbazzzz\n------')
 
 
+class TestConcatenatedSequences(unittest.TestCase):
+    def test_split_concatenated(self):
+        chars, offsets = _split_concatenated(b'xxACGTAAy', [2, 6, 6, 8])
+        self.assertEqual(chars.tostring(), b'ACGTAA')
+        npt.assert_array_equal(offsets, [0, 4, 4, 6])
+
+    def test_split_concatenated_invalid_offsets(self):
+        for offsets in [], [[0, 2]], [-1, 2], [0, 5], [0, 3, 2]:
+            with six.assertRaisesRegex(self, ValueError, '`offsets`'):
+                _split_concatenated(b'ACGT', offsets)
+
+    def test_concatenate_chunks(self):
+        seqs = [DNA('AC'), RNA(''), DNA('GGT'),
+                DNA('T').pack()]
+        chunks = list(_concatenate_chunks(iter(seqs), 2, (DNA, RNA),
+                                          'RNA or DNA'))
+        self.assertEqual([chars.tostring() for chars, _ in chunks],
+                         [b'AC', b'GGTT'])
+        npt.assert_array_equal(chunks[0][1], [0, 2, 2])
+        npt.assert_array_equal(chunks[1][1], [0, 3, 4])
+
+        chunks = list(_concatenate_chunks(seqs, None, (DNA, RNA), ''))
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(list(_concatenate_chunks([], None, DNA, '')), [])
+
+    def test_concatenate_chunks_invalid_type(self):
+        chunks = _concatenate_chunks([DNA('A'), Protein('A')], 1, DNA,
+                                     'DNA objects')
+        next(chunks)
+        with six.assertRaisesRegex(self, TypeError,
+                                   'must be DNA objects, not Protein'):
+            next(chunks)
+
+    def test_search_chunks(self):
+        def search(chars, offsets):
+            positions = np.flatnonzero(chars == ord('A'))
+            sequences = np.searchsorted(offsets, positions, side='right') - 1
+            return sequences, positions - offsets[sequences]
+
+        chunks = _concatenate_chunks([DNA('CA'), DNA('AA'), DNA('CC'),
+                                      DNA('CA')], 2, DNA, '')
+        obs = _search_chunks(chunks, search, ['sequence', 'start'])
+        exp = pd.DataFrame({'sequence': [0, 1, 1, 3], 'start': [1, 0, 1, 1]},
+                           columns=['sequence', 'start'])
+        pd.util.testing.assert_frame_equal(obs, exp, check_dtype=False)
+
+    def test_search_chunks_no_hits(self):
+        obs = _search_chunks([], None, ['sequence', 'start'])
+        self.assertEqual(list(obs.columns), ['sequence', 'start'])
+        self.assertEqual(len(obs), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import itertools
+import unittest
+
+import six
+import numpy as np
+import numpy.testing as npt
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import DegenerateExpansions
+
+
+class TestDegenerateExpansions(unittest.TestCase):
+    def _expansions_reference(self, sequence):
+        choices = [sorted(sequence.degenerate_map.get(c, c))
+                   for c in str(sequence)]
+        return [''.join(chars) for chars in itertools.product(*choices)]
+
+    def test_init_invalid_input(self):
+        for sequence in Sequence('ACGT'), 'ACGT':
+            with six.assertRaisesRegex(self, TypeError, 'IUPACSequence'):
+                DegenerateExpansions(sequence)
+
+    def test_sequence(self):
+        seq = DNA('ACGN')
+        self.assertIs(DegenerateExpansions(seq).sequence, seq)
+
+    def test_len(self):
+        for seq, exp in ((DNA(''), 1), (DNA('ACGT'), 1), (DNA('RYN'), 16),
+                         (RNA('-B.H'), 9), (Protein('XMB'), 40)):
+            expansions = DegenerateExpansions(seq)
+            self.assertEqual(len(expansions), exp)
+            self.assertEqual(expansions.size, exp)
+
+    def test_size_larger_than_len(self):
+        expansions = DegenerateExpansions(DNA('N' * 40))
+        self.assertEqual(expansions.size, 4 ** 40)
+        with self.assertRaises(OverflowError):
+            len(expansions)
+        self.assertEqual(str(expansions[4 ** 40 - 1]), 'T' * 40)
+        self.assertEqual(str(expansions[4 ** 39]), 'C' + 'A' * 39)
+
+    def test_iter(self):
+        for seq in (DNA(''), DNA('ACGT'), DNA('ARYN-GNA'), RNA('UBDHV'),
+                    Protein('AXZ*')):
+            obs = list(DegenerateExpansions(seq))
+            self.assertEqual([str(s) for s in obs],
+                             self._expansions_reference(seq))
+            for s in obs:
+                self.assertIs(type(s), type(seq))
+
+    def test_iter_keeps_metadata(self):
+        seq = DNA('AYN', metadata={'id': 'primer'},
+                  positional_metadata={'quality': [1, 2, 3]})
+        for s in DegenerateExpansions(seq):
+            self.assertEqual(s.metadata, {'id': 'primer'})
+            npt.assert_equal(s.positional_metadata['quality'].values,
+                             [1, 2, 3])
+
+    def test_getitem(self):
+        seq = DNA('GNRYA')
+        expansions = DegenerateExpansions(seq)
+        exp = self._expansions_reference(seq)
+        for i in range(len(exp)):
+            self.assertEqual(str(expansions[i]), exp[i])
+            self.assertEqual(str(expansions[i - len(exp)]), exp[i])
+            self.assertEqual(str(expansions[np.int64(i)]), exp[i])
+
+    def test_getitem_invalid_index(self):
+        expansions = DegenerateExpansions(DNA('ARN'))
+        for index in 8, -9:
+            with six.assertRaisesRegex(self, IndexError, 'out of range'):
+                expansions[index]
+        for index in 1.0, True, slice(0, 2):
+            with six.assertRaisesRegex(self, TypeError, 'integer'):
+                expansions[index]
+
+    def test_iter_batches(self):
+        seq = DNA('NGRYNAN')
+        exp = self._expansions_reference(seq)
+        for batch_size in 1, 2, 3, 5, 16, 100, 10000:
+            batches = list(DegenerateExpansions(seq).iter_batches(batch_size))
+            for batch in batches:
+                self.assertEqual(batch.dtype, np.uint8)
+                self.assertLessEqual(len(batch), batch_size)
+            obs = [row.tostring().decode('ascii')
+                   for row in np.concatenate(batches)]
+            self.assertEqual(obs, exp)
+
+    def test_iter_batches_no_degenerates(self):
+        batches = list(DegenerateExpansions(DNA('ACG')).iter_batches())
+        self.assertEqual(len(batches), 1)
+        npt.assert_equal(batches[0], [[ord('A'), ord('C'), ord('G')]])
+
+        batches = list(DegenerateExpansions(DNA('')).iter_batches())
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].shape, (1, 0))
+
+    def test_iter_batches_invalid_batch_size(self):
+        expansions = DegenerateExpansions(DNA('ARN'))
+        with six.assertRaisesRegex(self, ValueError, '`batch_size`'):
+            next(expansions.iter_batches(0))
+
+    def test_matches(self):
+        seq = DNA('AR-NT')
+        expansions = DegenerateExpansions(seq)
+        for s in self._expansions_reference(seq):
+            self.assertIs(expansions.matches(s), True)
+            self.assertTrue(DNA(s) in expansions)
+        for s in ('AC-AT', 'AR-NT', 'AA.AT', 'AAAAT', 'AA-A', 'AA-ATT', ''):
+            self.assertIs(expansions.matches(s), False)
+            self.assertFalse(DNA(s) in expansions)
+
+    def test_matches_array(self):
+        seq = DNA('GTGYCAGCMGCCGCGGTAA')
+        expansions = DegenerateExpansions(seq)
+        np.random.seed(0)
+        chars = np.random.choice(np.frombuffer(b'ACGT', dtype=np.uint8),
+                                 (500, len(seq)))
+        chars[:4] = np.concatenate(list(expansions.iter_batches()))
+
+        obs = expansions.matches(chars)
+        exp = [expansions.matches(DNA(row)) for row in chars]
+        npt.assert_equal(obs, exp)
+        self.assertTrue(obs[:4].all())
+
+        npt.assert_equal(expansions.matches(chars.view('|S1')), exp)
+        npt.assert_equal(expansions.matches(chars[:, 1:]),
+                         np.zeros(500, dtype=bool))
+
+    def test_matches_invalid_type(self):
+        expansions = DegenerateExpansions(DNA('ARN'))
+        for seq in RNA('AAA'), Sequence('AAA'):
+            with six.assertRaisesRegex(self, TypeError, 'DNA'):
+                expansions.matches(seq)
+
+    def test_matches_invalid_array_dtype(self):
+        expansions = DegenerateExpansions(DNA('AN'))
+        rows = [[65, 67], [65, 71]]
+        npt.assert_equal(expansions.matches(np.array(rows, dtype=np.uint8)),
+                         [True, True])
+        for dtype in np.int64, np.int8, np.uint16, np.float64, '|S2':
+            with six.assertRaisesRegex(self, TypeError, 'dtype np.uint8'):
+                expansions.matches(np.array(rows).astype(dtype))
+
+
+if __name__ == '__main__':
+    unittest.main()
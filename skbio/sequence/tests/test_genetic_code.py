@@ -14,9 +14,11 @@ import unittest
 import six
 import numpy as np
 import numpy.testing as npt
+import pandas as pd
 
 from skbio import Sequence, DNA, RNA, Protein, GeneticCode
 from skbio.sequence._genetic_code import _ncbi_genetic_codes
+from skbio.util import assert_data_frame_almost_equal
 
 
 class TestGeneticCode(unittest.TestCase):
@@ -504,6 +506,220 @@ class TestGeneticCode(unittest.TestCase):
             [Protein('M', metadata={'foo': 'bar', 'baz': 42}),
              Protein('', metadata={'foo': 'bar', 'baz': 42})])
 
+    def test_translate_six_frames_require(self):
+        seq = RNA('AUGCUAACAUAAA')
+        obs = self.sgc.translate_six_frames(seq, start='require')
+        self.assertEqual(next(obs), Protein('MLT*'))
+        with six.assertRaisesRegex(self, ValueError,
+                                   'reading_frame=2.*start=\'require\''):
+            next(obs)
+
+        obs = self.sgc.translate_six_frames(seq, stop='require')
+        self.assertEqual(list(itertools.islice(obs, 2)),
+                         [Protein('MLT'), Protein('C')])
+        with six.assertRaisesRegex(self, ValueError,
+                                   'reading_frame=3.*stop=\'require\''):
+            next(obs)
+
+    def test_translate_six_frames_invalid_input(self):
+        with six.assertRaisesRegex(self, TypeError, 'RNA, not DNA'):
+            next(self.sgc.translate_six_frames(DNA('ACG')))
+        with six.assertRaisesRegex(self, ValueError, 'gapped'):
+            next(self.sgc.translate_six_frames(RNA('AC-G')))
+        with six.assertRaisesRegex(self, NotImplementedError, 'degenerate'):
+            next(self.sgc.translate_six_frames(RNA('ACNG')))
+
+    def _check_translate_many(self, gc, seqs, reading_frames, start, stop):
+        protein, offsets = gc.translate_many(
+            seqs, reading_frames=reading_frames, start=start, stop=stop)
+        self.assertIsInstance(protein, Protein)
+        self.assertEqual(len(offsets), len(seqs) * len(reading_frames) + 1)
+
+        k = 0
+        for seq in seqs:
+            rna = seq.transcribe() if isinstance(seq, DNA) else seq
+            for reading_frame in reading_frames:
+                try:
+                    exp = gc.translate(rna, reading_frame=reading_frame,
+                                       start=start, stop=stop)
+                except ValueError:
+                    # missing required start/stop codon
+                    exp = Protein('')
+                self.assertEqual(protein[offsets[k]:offsets[k + 1]], exp)
+                k += 1
+
+    def test_translate_many(self):
+        np.random.seed(0)
+        seqs = [RNA(''.join(np.random.choice(list('UCAG'), size=length)))
+                for length in [0, 1, 2, 3, 4, 5, 6, 7, 30, 61, 100]]
+        seqs.append(DNA('CCCATGAAATGATTTAA'))
+        for gc in self.sgc, GeneticCode.from_ncbi(25):
+            for reading_frames in ([1, 2, 3, -1, -2, -3], [-2], [3, 1]):
+                for start in 'ignore', 'optional', 'require':
+                    for stop in 'ignore', 'optional', 'require':
+                        self._check_translate_many(gc, seqs, reading_frames,
+                                                   start, stop)
+
+    def test_translate_many_offsets(self):
+        exp_protein, exp_offsets = self.sgc.translate_many(
+            [RNA('AUGCCACUUUAA'), RNA(''), RNA('CCCAUGAAAUGA')],
+            start='optional')
+        for chars in (b'xAUGCCACUUUAACCCAUGAAAUGA',
+                      np.frombuffer(b'xAUGCCACUUUAACCCAUGAAAUGA',
+                                    dtype=np.uint8)):
+            protein, offsets = self.sgc.translate_many(
+                chars, offsets=[1, 13, 13, 25], start='optional')
+            self.assertEqual(protein, exp_protein)
+            npt.assert_array_equal(offsets, exp_offsets)
+
+    def test_translate_many_empty(self):
+        protein, offsets = self.sgc.translate_many([])
+        self.assertEqual(protein, Protein(''))
+        npt.assert_array_equal(offsets, [0])
+
+    def test_translate_many_invalid_input(self):
+        with six.assertRaisesRegex(self, TypeError, 'RNA or DNA, not Protein'):
+            self.sgc.translate_many([RNA('AUG'), Protein('M')])
+        with six.assertRaisesRegex(self, ValueError, 'reading_frame.*4'):
+            self.sgc.translate_many([RNA('AUG')], reading_frames=[1, 4])
+        with six.assertRaisesRegex(self, ValueError, 'start.*maybe'):
+            self.sgc.translate_many([RNA('AUG')], start='maybe')
+        with six.assertRaisesRegex(self, ValueError, 'stop.*maybe'):
+            self.sgc.translate_many([RNA('AUG')], stop='maybe')
+        with six.assertRaisesRegex(self, ValueError, 'gapped'):
+            self.sgc.translate_many([RNA('AUG'), DNA('A-G')])
+        with six.assertRaisesRegex(self, NotImplementedError, 'degenerate'):
+            self.sgc.translate_many([RNA('AUG'), DNA('ANG')])
+        with six.assertRaisesRegex(self, ValueError, 'invalid characters'):
+            self.sgc.translate_many(b'AUGxxx', offsets=[0, 6])
+        for offsets in [[], [0, 7], [-1, 3], [3, 1], [[0, 1]]]:
+            with six.assertRaisesRegex(self, ValueError, '`offsets`'):
+                self.sgc.translate_many(b'AUGCCC', offsets=offsets)
+
+    def _find_orfs_reference(self, gc, seq, reading_frames, min_length, start,
+                             stop):
+        offsets = {'U': 0, 'T': 0, 'C': 1, 'A': 2, 'G': 3}
+        complement = {'U': 'A', 'T': 'A', 'A': 'U', 'C': 'G', 'G': 'C'}
+        amino_acids = str(gc._amino_acids)
+        starts = str(gc._starts)
+
+        orfs = []
+        for reading_frame in reading_frames:
+            chars = str(seq)
+            if reading_frame < 0:
+                chars = ''.join(complement.get(c, 'N')
+                                for c in reversed(chars))
+            shift = abs(reading_frame) - 1
+            codons = [chars[i:i + 3]
+                      for i in range(shift, len(chars) - 2, 3)]
+
+            def codon_info(codon):
+                if not all(c in offsets for c in codon):
+                    return None, False
+                index = (offsets[codon[0]] * 16 + offsets[codon[1]] * 4 +
+                         offsets[codon[2]])
+                return amino_acids[index] == '*', starts[index] == 'M'
+
+            segment_begin = 0
+            for i in range(len(codons) + 1):
+                if i < len(codons):
+                    is_stop, is_start = codon_info(codons[i])
+                    if is_stop is False:
+                        continue
+                    has_stop = bool(is_stop)
+                else:
+                    has_stop = False
+                segment = range(segment_begin, i)
+                first_start = [j for j in segment
+                               if codon_info(codons[j])[1]]
+                if start == 'ignore' or (start == 'optional' and
+                                         not first_start):
+                    begin = segment_begin
+                elif first_start:
+                    begin = first_start[0]
+                else:
+                    begin = None
+                if (begin is not None and i - begin >= min_length and
+                        (has_stop or stop == 'optional')):
+                    last = i if has_stop else i - 1
+                    orf_start = shift + 3 * begin
+                    orf_end = shift + 3 * last + 3
+                    if reading_frame < 0:
+                        orf_start, orf_end = (len(chars) - orf_end,
+                                              len(chars) - orf_start)
+                    orfs.append((reading_frame, orf_start, orf_end))
+                segment_begin = i + 1
+        return orfs
+
+    def test_find_orfs(self):
+        np.random.seed(0)
+        seqs = [RNA(''.join(np.random.choice(list('UCAG'), size=length)))
+                for length in [0, 2, 3, 10, 31, 62, 300]]
+        seqs.append(DNA(''.join(np.random.choice(list('ACGTTTN'), 300))))
+        seqs.append(DNA('CCATGAAATAGCATGCCCTTACTTCATCG'))
+        for gc in self.sgc, GeneticCode.from_ncbi(11):
+            for reading_frames in ([1, 2, 3, -1, -2, -3], [-3, 2]):
+                for start, stop, min_length in itertools.product(
+                        ['ignore', 'optional', 'require'],
+                        ['optional', 'require'], [1, 3]):
+                    obs = gc.find_orfs(seqs, reading_frames=reading_frames,
+                                       min_length=min_length, start=start,
+                                       stop=stop)
+                    self.assertEqual(list(obs.columns),
+                                     ['sequence', 'reading_frame', 'start',
+                                      'end'])
+                    exp = []
+                    for i, seq in enumerate(seqs):
+                        exp.extend(
+                            (i,) + orf for orf in sorted(
+                                self._find_orfs_reference(
+                                    gc, seq, reading_frames, min_length,
+                                    start, stop),
+                                key=lambda orf: (
+                                    reading_frames.index(orf[0]), orf[1])))
+                    self.assertEqual(
+                        [tuple(row) for row in obs.values.tolist()], exp)
+
+    def test_find_orfs_single_sequence(self):
+        obs = self.sgc.find_orfs(RNA('AUGAAAUAGCAUGCCCUUACUUCAUCG'),
+                                 min_length=2)
+        exp = pd.DataFrame({'sequence': [0, 0],
+                            'reading_frame': [1, -3],
+                            'start': [0, 16],
+                            'end': [9, 25]},
+                           columns=['sequence', 'reading_frame', 'start',
+                                    'end'])
+        assert_data_frame_almost_equal(obs, exp)
+
+    def test_find_orfs_offsets(self):
+        seqs = [DNA('CCATGAAATAGCATG'), DNA(''), DNA('CCCTTACTTCATCG')]
+        exp = self.sgc.find_orfs(seqs, start='optional', stop='optional')
+        obs = self.sgc.find_orfs(
+            b'xxCCATGAAATAGCATGCCCTTACTTCATCGyy', offsets=[2, 17, 17, 31],
+            start='optional', stop='optional')
+        assert_data_frame_almost_equal(obs, exp)
+
+    def test_find_orfs_no_orfs(self):
+        for seqs in [], [DNA('')], [RNA('UAGUAG')]:
+            obs = self.sgc.find_orfs(seqs)
+            self.assertEqual(obs.shape, (0, 4))
+            self.assertEqual(list(obs.columns),
+                             ['sequence', 'reading_frame', 'start', 'end'])
+
+    def test_find_orfs_invalid_input(self):
+        with six.assertRaisesRegex(self, TypeError, 'RNA or DNA, not Protein'):
+            self.sgc.find_orfs([Protein('M')])
+        with six.assertRaisesRegex(self, ValueError, 'reading_frame.*0'):
+            self.sgc.find_orfs(RNA('AUG'), reading_frames=[0])
+        with six.assertRaisesRegex(self, ValueError, 'start.*maybe'):
+            self.sgc.find_orfs(RNA('AUG'), start='maybe')
+        with six.assertRaisesRegex(self, ValueError, 'stop.*ignore'):
+            self.sgc.find_orfs(RNA('AUG'), stop='ignore')
+        with six.assertRaisesRegex(self, ValueError, 'min_length.*0'):
+            self.sgc.find_orfs(RNA('AUG'), min_length=0)
+        with six.assertRaisesRegex(self, ValueError, '`offsets`'):
+            self.sgc.find_orfs(b'AUG', offsets=[0, 4])
+
 
 if __name__ == '__main__':
     unittest.main()
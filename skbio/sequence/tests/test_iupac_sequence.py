@@ -446,6 +446,19 @@ class TestIUPACSequence(TestCase):
         self.assertEqual(seq.find_motifs("name1"), "ABC")
         self.assertEqual(seq.find_motifs("name2"), 3)
 
+    def test_find_approximate_degenerates(self):
+        seq = ExampleIUPACSequence("AABCXBAC")
+        obs = seq.find_approximate("XBC", max_distance=0)
+        self.assertEqual(list(obs), [slice(1, 4)])
+
+        obs = seq.find_approximate("XB", max_distance=0, indels=False)
+        self.assertEqual(list(obs), [slice(1, 3), slice(4, 6)])
+
+        obs = ExampleIUPACSequence.batch_find_approximate(
+            [seq, ExampleIUPACSequence("CC")], "ZC", max_distance=0)
+        self.assertEqual(list(obs['sequence']), [0, 1])
+        self.assertEqual(list(obs['start']), [6, 0])
+
     def test_repr(self):
         # basic sanity checks for custom repr stats. more extensive testing is
         # performed on Sequence.__repr__
@@ -0,0 +1,106 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import numpy.testing as npt
+import scipy.sparse
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import kmer_count_matrix
+
+
+class TestKmerCountMatrix(unittest.TestCase):
+    def test_empty(self):
+        counts, kmers = kmer_count_matrix([], 3)
+        self.assertTrue(scipy.sparse.isspmatrix_csr(counts))
+        self.assertEqual(counts.shape, (0, 0))
+        self.assertEqual(kmers, [])
+
+    def test_nucleotide(self):
+        seqs = [DNA('ACGTT'), DNA('ACGAA'), DNA('TTTT'), DNA('')]
+        counts, kmers = kmer_count_matrix(seqs, 2)
+
+        self.assertTrue(scipy.sparse.isspmatrix_csr(counts))
+        self.assertEqual(kmers, ['AA', 'AC', 'CG', 'GA', 'GT', 'TT'])
+        npt.assert_array_equal(counts.toarray(),
+                               [[0, 1, 1, 0, 1, 1],
+                                [1, 1, 1, 1, 0, 0],
+                                [0, 0, 0, 0, 0, 3],
+                                [0, 0, 0, 0, 0, 0]])
+
+    def test_nucleotide_matches_kmer_frequencies(self):
+        seqs = [RNA('ACGUUGCAUG'), RNA('GGGAC-AUN'), RNA('UUUACGU')]
+        for overlap in True, False:
+            counts, kmers = kmer_count_matrix(seqs, 3, overlap=overlap)
+            for seq, row in zip(seqs, counts.toarray()):
+                # Kmers containing gaps or degenerates are not counted.
+                expected = {kmer: count for kmer, count in
+                            seq.kmer_frequencies(3, overlap=overlap).items()
+                            if not any(c in '-N' for c in kmer)}
+                observed = {kmer: count for kmer, count in zip(kmers, row)
+                            if count}
+                self.assertEqual(observed, expected)
+
+    def test_canonical(self):
+        counts, kmers = kmer_count_matrix([DNA('AAT'), DNA('ATT')], 2,
+                                          canonical=True)
+        self.assertEqual(kmers, ['AA', 'AT'])
+        npt.assert_array_equal(counts.toarray(), [[1, 1], [1, 1]])
+
+    def test_non_nucleotide(self):
+        seqs = [Protein('MKVL'), Protein('KVLM*')]
+        counts, kmers = kmer_count_matrix(seqs, 3)
+        self.assertEqual(kmers, ['KVL', 'LM*', 'MKV', 'VLM'])
+        npt.assert_array_equal(counts.toarray(),
+                               [[1, 0, 1, 0], [1, 1, 0, 1]])
+
+        counts, kmers = kmer_count_matrix([Sequence('abcab')], 2,
+                                          overlap=False)
+        self.assertEqual(kmers, ['ab', 'ca'])
+        npt.assert_array_equal(counts.toarray(), [[1, 1]])
+
+    def test_chunk_size(self):
+        seqs = [DNA(s) for s in ['ACGT', 'GGGA', 'TTAC', 'CAT', 'ACGTACGT']]
+        expected_counts, expected_kmers = kmer_count_matrix(seqs, 2)
+        for chunk_size in 1, 2, 3, 10:
+            counts, kmers = kmer_count_matrix(iter(seqs), 2,
+                                              chunk_size=chunk_size)
+            self.assertEqual(kmers, expected_kmers)
+            npt.assert_array_equal(counts.toarray(),
+                                   expected_counts.toarray())
+
+    def test_invalid_k(self):
+        with self.assertRaisesRegexp(ValueError, 'greater than 0'):
+            kmer_count_matrix([DNA('ACGT')], 0)
+        with self.assertRaisesRegexp(ValueError, '31'):
+            kmer_count_matrix([DNA('ACGT')], 32)
+
+    def test_canonical_non_nucleotide(self):
+        with self.assertRaisesRegexp(ValueError, 'Protein'):
+            kmer_count_matrix([Protein('MKV')], 2, canonical=True)
+
+    def test_mixed_types(self):
+        with self.assertRaisesRegexp(TypeError, 'DNA.*RNA'):
+            kmer_count_matrix([DNA('ACGT'), RNA('ACGU')], 2)
+
+    def test_beta_diversity(self):
+        from skbio.diversity import beta_diversity
+
+        seqs = [DNA('ACGTTGCA'), DNA('ACGTAGCA'), DNA('TTTTTTTT')]
+        counts, _ = kmer_count_matrix(seqs, 3)
+        for metric in 'euclidean', 'cosine', 'braycurtis':
+            npt.assert_almost_equal(
+                beta_diversity(metric, counts).data,
+                beta_diversity(metric, counts.toarray()).data)
+
+
+if __name__ == '__main__':
+    unittest.main()
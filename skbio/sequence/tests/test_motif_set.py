@@ -0,0 +1,134 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import six
+import numpy as np
+
+from skbio import Sequence, DNA, RNA, Protein
+from skbio.sequence import MotifSet
+from skbio.util import assert_data_frame_almost_equal
+
+
+class TestMotifSet(unittest.TestCase):
+    def _search_reference(self, motifs, sequences, max_mismatches):
+        hits = []
+        for i, sequence in enumerate(sequences):
+            sequence = str(sequence)
+            for start in range(len(sequence)):
+                for j, motif in enumerate(motifs):
+                    if start + len(motif) > len(sequence):
+                        continue
+                    mismatches = sum(
+                        c != m and c not in motif.degenerate_map.get(m, ())
+                        for m, c in zip(str(motif),
+                                        sequence[start:start + len(motif)]))
+                    if mismatches <= max_mismatches:
+                        hits.append([i, j, start, start + len(motif),
+                                     mismatches])
+        return hits
+
+    def test_search(self):
+        np.random.seed(0)
+        motifs = [DNA(''.join(np.random.choice(list('ACGTRYN'), size=n)))
+                  for n in np.random.randint(1, 9, size=100)]
+        motifs.append(DNA('A' * 64))
+        sequences = [DNA(''.join(np.random.choice(list('ACGTN-'), size=n)))
+                     for n in [0, 1, 5, 30, 100, 70]]
+        for max_mismatches in 0, 1, 2, 3:
+            motif_set = MotifSet(motifs, max_mismatches=max_mismatches)
+            obs = motif_set.search(sequences)
+            self.assertEqual(list(obs.columns),
+                             ['sequence', 'motif', 'start', 'end',
+                              'mismatches'])
+            self.assertEqual(
+                obs.values.tolist(),
+                self._search_reference(motifs, sequences, max_mismatches))
+
+            # blocks of positions and chunks of sequences are searched
+            # independently
+            motif_set._block_size = 7
+            for chunk_size in 1, 4:
+                assert_data_frame_almost_equal(
+                    motif_set.search(iter(sequences), chunk_size=chunk_size),
+                    obs)
+
+            # the number of characters with precomputed search states does
+            # not affect the results
+            for max_prefixes in 1, 100:
+                class PrefixMotifSet(MotifSet):
+                    _max_prefixes = max_prefixes
+                motif_set = PrefixMotifSet(motifs,
+                                           max_mismatches=max_mismatches)
+                self.assertEqual(motif_set._prefix_length,
+                                 0 if max_prefixes == 1 else 2)
+                assert_data_frame_almost_equal(motif_set.search(sequences),
+                                               obs)
+
+    def test_search_protein(self):
+        motifs = MotifSet([Protein('NXST'), Protein('M')])
+        obs = motifs.search([Sequence('MNASTNXST'), Protein('NGSTM')])
+        self.assertEqual(obs.values.tolist(),
+                         [[0, 1, 0, 1, 0], [0, 0, 1, 5, 0], [0, 0, 5, 9, 0],
+                          [1, 0, 0, 4, 0], [1, 1, 4, 5, 0]])
+
+    def test_search_single_sequence(self):
+        obs = MotifSet([RNA('GU')]).search(RNA('GUGU'))
+        self.assertEqual(obs.values.tolist(),
+                         [[0, 0, 0, 2, 0], [0, 0, 2, 4, 0]])
+
+    def test_search_offsets(self):
+        motifs = MotifSet([DNA('ACG'), DNA('GAC')], max_mismatches=1)
+        exp = motifs.search([DNA('ACGACG'), DNA(''), DNA('GACG')])
+        for chars in (b'xxACGACGGACGxx',
+                      np.frombuffer(b'xxACGACGGACGxx', dtype=np.uint8)):
+            obs = motifs.search(chars, offsets=[2, 8, 8, 12])
+            assert_data_frame_almost_equal(obs, exp)
+
+    def test_search_no_hits(self):
+        for motifs, sequences in (([], [DNA('ACGT')]),
+                                  ([DNA('GG')], [DNA('ACGT'), DNA('G')]),
+                                  ([DNA('GG')], [])):
+            obs = MotifSet(motifs).search(sequences)
+            self.assertEqual(obs.shape, (0, 5))
+            self.assertEqual(list(obs.columns),
+                             ['sequence', 'motif', 'start', 'end',
+                              'mismatches'])
+
+    def test_properties(self):
+        motifs = [DNA('ACGT'), DNA('NNN')]
+        motif_set = MotifSet(iter(motifs), max_mismatches=2)
+        self.assertEqual(motif_set.motifs, motifs)
+        self.assertEqual(motif_set.max_mismatches, 2)
+
+    def test_invalid_motifs(self):
+        with six.assertRaisesRegex(self, TypeError, 'IUPACSequence.*str'):
+            MotifSet(['ACGT'])
+        with six.assertRaisesRegex(self, TypeError, 'DNA.*RNA'):
+            MotifSet([DNA('ACGT'), RNA('ACGU')])
+        with six.assertRaisesRegex(self, ValueError, 'not 0'):
+            MotifSet([DNA('')])
+        with six.assertRaisesRegex(self, ValueError, 'not 65'):
+            MotifSet([DNA('A' * 65)])
+        with six.assertRaisesRegex(self, ValueError, 'max_mismatches'):
+            MotifSet([DNA('A')], max_mismatches=-1)
+
+    def test_invalid_sequences(self):
+        motifs = MotifSet([DNA('A')])
+        with six.assertRaisesRegex(self, TypeError, 'Sequence.*str'):
+            motifs.search(['ACGT'])
+        for offsets in [], [0, 5], [2, 1], [[0, 1]]:
+            with six.assertRaisesRegex(self, ValueError, '`offsets`'):
+                motifs.search(b'ACGT', offsets=offsets)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,10 +8,13 @@
 
 from __future__ import absolute_import, division, print_function
 
+import copy
+import pickle
 import unittest
 
 import six
 import numpy as np
+import numpy.testing as npt
 
 from skbio import DNA, RNA, Protein, GeneticCode
 from skbio.sequence._nucleotide_mixin import NucleotideMixin
@@ -469,6 +472,226 @@ class TestNucelotideSequence(unittest.TestCase):
                 self.assertEqual(ratio, seq.gc_frequency(relative=True))
                 self.assertEqual(ratio, seq.gc_content())
 
+    def test_pack(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            # 2 bits for non-degenerates, 4 bits otherwise
+            for chars, nbytes in ((seq_str[:4] * 3, 3),
+                                  (seq_str.replace('.', ''), 8),
+                                  ('', 0)):
+                seq = constructor(chars, metadata={'id': 'foo'},
+                                  positional_metadata={
+                                      'quality': np.arange(len(chars))})
+                packed = seq.pack()
+
+                self.assertFalse(seq.is_packed())
+                self.assertTrue(packed.is_packed())
+                self.assertEqual(packed._packed.nbytes, nbytes)
+                self.assertEqual(len(packed), len(seq))
+                self.assertEqual(str(packed), chars)
+                self.assertEqual(packed, seq)
+                self.assertEqual(seq, packed)
+                self.assertEqual(packed, seq.pack())
+                self.assertEqual(packed.pack(), packed)
+                self.assertFalse(constructor(seq).is_packed())
+                self.assertEqual(constructor(seq), seq)
+
+    def test_pack_invalid_characters(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            with six.assertRaisesRegex(self, ValueError, "gap character"):
+                constructor(seq_str).pack()
+            with six.assertRaisesRegex(self, ValueError, "gap character"):
+                constructor('ACGZ', validate=False).pack()
+
+    def test_pack_not_equal(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            packed = constructor(seq_str[:4]).pack()
+            self.assertNotEqual(packed, constructor(seq_str[:3]).pack())
+            self.assertNotEqual(packed, constructor(seq_str[3::-1]).pack())
+            self.assertNotEqual(packed, constructor(seq_str[:3] + 'N').pack())
+            self.assertNotEqual(packed,
+                                constructor(seq_str[:4], metadata={'id': 'a'}))
+
+    def test_pack_slicing(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            seq_str = seq_str.replace('.', '')
+            seq = constructor(seq_str, positional_metadata={
+                'quality': np.arange(len(seq_str))})
+            packed = seq.pack()
+            for indexable in (slice(None), slice(3, 9), slice(5, 2),
+                              slice(-4, None), slice(None, None, 2),
+                              slice(None, None, -1), slice(8, 1, -3), 7, -1,
+                              np.int64(2), [0, 3, 2], [-1, 0, -len(seq)], [],
+                              np.array([1, 1], dtype=np.uint8),
+                              np.arange(len(seq)) % 3 == 0):
+                obs = packed[indexable]
+                self.assertEqual(obs, seq[indexable])
+                self.assertFalse(obs.is_packed())
+
+            for indexable in (len(seq), -len(seq) - 1, [0, len(seq)]):
+                with self.assertRaises(IndexError):
+                    seq[indexable]
+                with self.assertRaises(IndexError):
+                    packed[indexable]
+
+    def test_pack_indexing_does_not_unpack(self):
+        packed = DNA('ACGT' * 100, positional_metadata={
+            'quality': np.arange(400)}).pack()
+        unpack = packed._packed.unpack
+
+        def partial_unpack(start=0, stop=None):
+            if start == 0 and stop is None:
+                raise AssertionError("the whole sequence was unpacked")
+            return unpack(start, stop)
+
+        packed._packed.unpack = partial_unpack
+        self.assertEqual(str(packed[5]), 'C')
+        self.assertEqual(str(packed[-1]), 'T')
+        self.assertEqual(str(packed[1:9:2]), 'CTCT')
+        self.assertEqual(str(packed[[0, 2, 399]]), 'AGT')
+        self.assertEqual(str(packed[np.arange(400) >= 396]), 'ACGT')
+        self.assertEqual([str(c) for c, _ in zip(packed, range(6))],
+                         list('ACGTAC'))
+        self.assertEqual(packed[7].positional_metadata['quality'][0], 7)
+
+    def test_pack_copy_and_pickle(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            seq = constructor(seq_str[:-2], metadata={'id': 'foo'},
+                              positional_metadata={
+                                  'quality': np.arange(len(seq_str) - 2)})
+            packed = seq.pack()
+            for obs in (copy.copy(packed), copy.deepcopy(packed),
+                        pickle.loads(pickle.dumps(packed))):
+                self.assertTrue(obs.is_packed())
+                self.assertEqual(obs, seq)
+                self.assertFalse(obs._packed.data.flags.writeable)
+            obs = copy.deepcopy(packed)
+            obs.metadata['id'] = 'bar'
+            self.assertEqual(packed.metadata['id'], 'foo')
+
+    def test_pack_complement(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            for chars in (seq_str[:4] * 3 + seq_str[:1], seq_str[:-2]):
+                seq = constructor(chars, positional_metadata={
+                    'quality': np.arange(len(chars))})
+                packed = seq.pack()
+
+                obs = packed.complement()
+                self.assertTrue(obs.is_packed())
+                self.assertEqual(obs, seq.complement())
+                self.assertEqual(obs.complement(), seq)
+                self.assertEqual(packed.reverse_complement(),
+                                 seq.reverse_complement())
+
+    def test_pack_gc_frequency_and_gc_content(self):
+        for constructor in (DNA, RNA):
+            for seq_str, count, ratio in (('', 0, 0.0), ('ACGA', 2, 0.5),
+                                          ('ACGS', 3, 0.75), ('----', 0, 0.0),
+                                          ('G--', 1, 1.0), ('ACN-', 1, 1 / 3),
+                                          ('CCCCCCCCC', 9, 1.0)):
+                seq = constructor(seq_str).pack()
+                self.assertEqual(count, seq.gc_frequency())
+                self.assertEqual(ratio, seq.gc_frequency(relative=True))
+                self.assertEqual(ratio, seq.gc_content())
+
+    def test_pack_kmer_frequencies(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            for chars in ((seq_str[:4] * 5)[:-1], seq_str[:-2] * 2):
+                seq = constructor(chars)
+                packed = seq.pack()
+                for k in (1, 2, 3, 16, 17):
+                    for overlap in (True, False):
+                        for relative in (True, False):
+                            self.assertEqual(
+                                packed.kmer_frequencies(k, overlap, relative),
+                                seq.kmer_frequencies(k, overlap, relative))
+                with self.assertRaises(ValueError):
+                    packed.kmer_frequencies(0)
+
+    def test_kmer_counts(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            t = seq_str[3]
+            seq = constructor('AAC%sN-CAACG' % t)
+
+            self.assertEqual(seq.kmer_counts(1),
+                             {'A': 4, 'C': 3, 'G': 1, t: 1})
+            self.assertEqual(seq.kmer_counts(3),
+                             {'AAC': 2, 'AC' + t: 1, 'CAA': 1, 'ACG': 1})
+            self.assertEqual(seq.kmer_counts(3, overlap=False),
+                             {'AAC': 1, 'CAA': 1})
+            self.assertEqual(seq.kmer_counts(12), {})
+            self.assertEqual(constructor('').kmer_counts(2), {})
+
+            # Kmers and their reverse complements are counted together.
+            self.assertEqual(seq.kmer_counts(3, canonical=True),
+                             {'AAC': 2, 'AC' + t: 1, 'CAA': 1, 'ACG': 1})
+            self.assertEqual(
+                constructor('ACGCG%s' % t).kmer_counts(3, canonical=True),
+                {'ACG': 2, 'CGC': 2})
+
+            exp = np.zeros(16, dtype=int)
+            exp[[0, 1, 4, 6, 7]] = [2, 2, 1, 1, 1]
+            npt.assert_array_equal(seq.kmer_counts(2, output='dense'), exp)
+            obs = seq.kmer_counts(2, output='sparse')
+            self.assertEqual(obs.shape, (1, 16))
+            npt.assert_array_equal(obs.toarray(), exp[np.newaxis])
+
+            # Packed sequences give the same counts.
+            for packed in (seq.pack(), constructor('AAC%sCAACG' % t).pack()):
+                self.assertEqual(
+                    packed.kmer_counts(3, canonical=True),
+                    constructor(str(packed)).kmer_counts(3, canonical=True))
+
+    def test_kmer_counts_matches_kmer_frequencies(self):
+        rng = np.random.RandomState(42)
+        for constructor, seq_str in (self.dna, self.rna):
+            seq = constructor(''.join(rng.choice(list(seq_str[:4]), 500)))
+            for k in (1, 5, 31):
+                for overlap in (True, False):
+                    self.assertEqual(seq.kmer_counts(k, overlap=overlap),
+                                     seq.kmer_frequencies(k, overlap=overlap))
+
+    def test_kmer_counts_invalid_parameters(self):
+        seq = DNA('ACGT')
+        for k in (0, 32):
+            with six.assertRaisesRegex(self, ValueError, "between 1 and 31"):
+                seq.kmer_counts(k)
+        with six.assertRaisesRegex(self, ValueError, "`output`"):
+            seq.kmer_counts(2, output='list')
+        with six.assertRaisesRegex(self, ValueError, "k <= 12"):
+            seq.kmer_counts(13, output='dense')
+
+    def test_batch_kmer_counts(self):
+        for constructor, seq_str in (self.dna, self.rna):
+            t = seq_str[3]
+            seqs = [constructor('AACG'), constructor(''),
+                    constructor('CG%s%s' % (t, t)).pack(),
+                    constructor('AC-CG')]
+
+            obs = constructor.batch_kmer_counts(seqs, 2)
+            exp = np.zeros((4, 16), dtype=int)
+            exp[0, [0, 1, 6]] = 1
+            exp[2, [6, 11, 15]] = 1
+            exp[3, [1, 6]] = 1
+            self.assertEqual(obs.shape, (4, 16))
+            npt.assert_array_equal(obs.toarray(), exp)
+            npt.assert_array_equal(
+                constructor.batch_kmer_counts(seqs, 2, output='dense'), exp)
+            self.assertEqual(
+                constructor.batch_kmer_counts(seqs, 2, output='dict'),
+                [seq.kmer_counts(2) for seq in seqs])
+
+            obs = constructor.batch_kmer_counts(iter(seqs), 2, overlap=False,
+                                                canonical=True, output='dict')
+            self.assertEqual(obs, [{'AA': 1, 'CG': 1}, {}, {'CG': 1, 'AA': 1},
+                                   {'AC': 1}])
+
+            self.assertEqual(constructor.batch_kmer_counts([], 3).shape,
+                             (0, 64))
+
+    def test_batch_kmer_counts_invalid_type(self):
+        with six.assertRaisesRegex(self, TypeError, "'RNA'.*DNA"):
+            DNA.batch_kmer_counts([DNA('ACGT'), RNA('ACGU')], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
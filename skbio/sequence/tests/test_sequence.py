@@ -29,6 +29,58 @@ from skbio.util._testing import (ReallyEqualMixin, MetadataMixinTests,
                                  PositionalMetadataMixinTests)
 
 
+def _find_approximate_reference(text, pattern, max_distance, indels):
+    matches = []
+    if not indels:
+        for start in range(len(text) - len(pattern) + 1):
+            if sum(a != b for a, b in zip(pattern,
+                                          text[start:start + len(pattern)])
+                   ) <= max_distance:
+                matches.append((start, start + len(pattern)))
+        return matches
+
+    def distance(a, b):
+        previous = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            current = [i]
+            for j in range(1, len(b) + 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (a[i - 1] != b[j - 1])))
+            previous = current
+        return previous[-1]
+
+    # smallest edit distance of a match ending at each position
+    end_distances = []
+    previous = list(range(len(pattern) + 1))
+    for char in text:
+        current = [0]
+        for i in range(1, len(pattern) + 1):
+            current.append(min(previous[i] + 1, current[i - 1] + 1,
+                               previous[i - 1] + (pattern[i - 1] != char)))
+        previous = current
+        end_distances.append(current[-1])
+
+    end = 0
+    while end < len(text):
+        if end_distances[end] > max_distance:
+            end += 1
+            continue
+        run_end = end
+        while (run_end < len(text) and
+               end_distances[run_end] <= max_distance):
+            run_end += 1
+        best = min(range(end, run_end), key=lambda e: end_distances[e])
+        best_distance = end_distances[best]
+        starts = [start for start in range(max(0, best + 1 - len(pattern) -
+                                               max_distance), best + 1)
+                  if distance(pattern, text[start:best + 1]) == best_distance]
+        start = min(starts, key=lambda s: (abs(best + 1 - s - len(pattern)),
+                                           best + 1 - s))
+        matches.append((start, best + 1))
+        end = run_end
+    return matches
+
+
 class SequenceSubclass(Sequence):
     """Used for testing purposes."""
     pass
@@ -591,8 +643,8 @@ class TestSequence(TestCase, ReallyEqualMixin):
 
     def test_slice_positional_metadata(self):
         seq = Sequence('ABCDEFGHIJ',
-                       positional_metadata={'foo': np.arange(10),
-                                            'bar': np.arange(100, 110)})
+                       positional_metadata={'foo': list(range(10)),
+                                            'bar': list(range(100, 110))})
         self.assertTrue(pd.DataFrame({'foo': [0], 'bar': [100]}).equals(
                         seq._slice_positional_metadata(0)))
         self.assertTrue(pd.DataFrame({'foo': [0], 'bar': [100]}).equals(
@@ -604,6 +656,81 @@ class TestSequence(TestCase, ReallyEqualMixin):
             {'foo': [9], 'bar': [109]}, index=[9]).equals(
                 seq._slice_positional_metadata(9)))
 
+    def test_slice_positional_metadata_arrays(self):
+        seq = Sequence('ABCDEFGHIJ',
+                       positional_metadata={'foo': np.arange(10),
+                                            'bar': np.arange(100, 110)})
+
+        obs = seq._slice_positional_metadata(0)
+        self.assertEqual(list(obs), ['bar', 'foo'])
+        npt.assert_equal(obs['foo'], np.array([0]))
+        npt.assert_equal(obs['bar'], np.array([100]))
+
+        obs = seq._slice_positional_metadata(slice(0, 2))
+        npt.assert_equal(obs['foo'], np.array([0, 1]))
+        npt.assert_equal(obs['bar'], np.array([100, 101]))
+
+        obs = seq._slice_positional_metadata(np.array([9, 0]))
+        npt.assert_equal(obs['foo'], np.array([9, 0]))
+        npt.assert_equal(obs['bar'], np.array([109, 100]))
+
+    def test_positional_metadata_arrays_lazy_dataframe(self):
+        quality = np.array([3, 3, 20, 11], dtype=np.uint8)
+        seq = Sequence('ACgt', positional_metadata={'quality': quality},
+                       lowercase='lower')
+
+        # Slicing, copying, comparing and column access don't create a
+        # DataFrame.
+        self.assertEqual(seq[1:3], Sequence(
+            'Cg', positional_metadata={'quality': quality[1:3]},
+            lowercase='lower'))
+        self.assertEqual(copy.copy(seq), seq)
+        self.assertEqual(copy.deepcopy(seq), seq)
+        self.assertEqual(seq[(slice(0, 1), slice(2, 4))].lowercase('lower'),
+                         'Agt')
+        npt.assert_equal(seq._get_positional_metadata_column_('quality'),
+                         quality)
+        self.assertIsNone(seq._get_positional_metadata_column_('foo'))
+        self.assertIsNone(seq._positional_metadata_df)
+
+        # Input is copied.
+        quality[0] = 42
+        self.assertEqual(seq._get_positional_metadata_column_('quality')[0],
+                         3)
+
+        # Accessing the property creates an equivalent DataFrame, ordered as
+        # it would be without the fast path.
+        exp = pd.DataFrame({'quality': np.array([3, 3, 20, 11],
+                                                dtype=np.uint8)})
+        exp['lower'] = np.array([False, False, True, True])
+        assert_data_frame_almost_equal(seq.positional_metadata, exp)
+        self.assertIsNone(seq._positional_metadata_arrays)
+
+        # Mixing storage forms still compares correctly.
+        other = Sequence('ACgt', positional_metadata={
+            'quality': np.array([3, 3, 20, 11], dtype=np.uint8)},
+            lowercase='lower')
+        self.assertEqual(seq, other)
+        self.assertEqual(other, seq)
+        other = Sequence('ACgt', positional_metadata={
+            'quality': np.array([3, 3, 20, 11], dtype=np.int64)},
+            lowercase='lower')
+        self.assertNotEqual(Sequence(seq), other)
+
+    def test_positional_metadata_arrays_nan_equality(self):
+        seq1 = Sequence('AB', positional_metadata={
+            'foo': np.array([np.nan, 1.0])})
+        seq2 = Sequence('AB', positional_metadata={
+            'foo': np.array([np.nan, 1.0])})
+        seq3 = Sequence('AB', positional_metadata={
+            'foo': np.array([np.nan, 2.0])})
+        self.assertEqual(seq1, seq2)
+        self.assertNotEqual(seq1, seq3)
+
+    def test_positional_metadata_arrays_wrong_length(self):
+        with six.assertRaisesRegex(self, ValueError, r'\(3\).*\(2\)'):
+            Sequence('AB', positional_metadata={'foo': np.arange(3)})
+
     def test_getitem_with_int_no_positional_metadata(self):
         seq = Sequence("Sequence string !1@2#3?.,",
                        metadata={'id': 'id2', 'description': 'no_qual'})
@@ -1855,6 +1982,126 @@ class TestSequence(TestCase, ReallyEqualMixin):
         self.assertEqual(list(obs), [slice(0, 4), slice(8, 10), slice(12, 16),
                                      slice(19, 20)])
 
+    def test_find_approximate(self):
+        seq = Sequence('GGACGTTACCAGTAGACTG')
+
+        obs = seq.find_approximate('ACGTAC')
+        self.assertIs(type(obs), GeneratorType)
+        self.assertEqual(list(obs), [slice(2, 9)])
+
+        self.assertEqual(list(seq.find_approximate('ACGTAC', max_distance=2)),
+                         [slice(2, 9), slice(10, 14), slice(13, 17)])
+        self.assertEqual(list(seq.find_approximate('CAGTAG', max_distance=0)),
+                         [slice(9, 15)])
+        self.assertEqual(list(seq.find_approximate('ZZZZ', max_distance=3)),
+                         [])
+        self.assertEqual(list(Sequence('').find_approximate('A', 0)), [])
+
+    def test_find_approximate_without_indels(self):
+        seq = Sequence('GGACGTTACCAGTAGACTG')
+
+        obs = seq.find_approximate('ACGTAC', max_distance=2, indels=False)
+        self.assertEqual(list(obs), [slice(2, 8)])
+
+        obs = seq.find_approximate('AG', indels=False)
+        self.assertEqual(list(obs), [slice(0, 2), slice(2, 4), slice(3, 5),
+                                     slice(7, 9), slice(10, 12),
+                                     slice(13, 15), slice(15, 17),
+                                     slice(17, 19)])
+
+    def test_find_approximate_sequence_as_input(self):
+        seq = Sequence('GGACGTTACCAGTAGACTG')
+        obs = seq.find_approximate(Sequence('ACGTTAC'), max_distance=0)
+        self.assertEqual(list(obs), [slice(2, 9)])
+
+        with six.assertRaisesRegex(self, TypeError, 'SequenceSubclass'):
+            list(seq.find_approximate(SequenceSubclass('ACGTTAC')))
+
+    def test_find_approximate_invalid_input(self):
+        seq = Sequence('GGACGTTACCAGTAGACTG')
+        for subsequence in '', 'A' * 65:
+            with six.assertRaisesRegex(self, ValueError, 'between 1 and 64'):
+                list(seq.find_approximate(subsequence))
+        for max_distance in -1, 4:
+            with six.assertRaisesRegex(self, ValueError, '`max_distance`'):
+                list(seq.find_approximate('ACGT', max_distance))
+
+    def test_find_approximate_matches_brute_force(self):
+        state = np.random.RandomState(0)
+        for length, max_distance in (1, 0), (5, 2), (12, 3), (64, 10):
+            pattern = ''.join(state.choice(list('ACGT'), length))
+            # long enough to be searched in several windows
+            chars = list(pattern * 3 +
+                         ''.join(state.choice(list('ACGT'), 9000)))
+            for i in state.choice(len(chars), 300):
+                chars[i] = state.choice(list('ACGT-'))
+            text = ''.join(state.permutation(chars))
+            text = pattern + text[:4000] + pattern[1:] + text[4000:]
+            seq = Sequence(text)
+
+            for indels in True, False:
+                obs = [(s.start, s.stop) for s in seq.find_approximate(
+                    pattern, max_distance, indels)]
+                exp = _find_approximate_reference(text, pattern,
+                                                  max_distance, indels)
+                self.assertEqual(obs, exp)
+
+    def test_batch_find_approximate(self):
+        seqs = [SequenceSubclass('ACGTACGT'), SequenceSubclass('TTTTTT'),
+                SequenceSubclass(''), SequenceSubclass('GGACTTACG')]
+        exp = pd.DataFrame({'sequence': [0, 3], 'start': [0, 2],
+                            'end': [6, 8], 'distance': [0, 1]},
+                           columns=['sequence', 'start', 'end', 'distance'])
+
+        for chunk_size in 1, 2, 10:
+            obs = SequenceSubclass.batch_find_approximate(
+                iter(seqs), 'ACGTAC', chunk_size=chunk_size)
+            assert_data_frame_almost_equal(obs, exp)
+
+        obs = SequenceSubclass.batch_find_approximate(
+            b'..ACGTACGTTTTTTTGGACTTACG', SequenceSubclass('ACGTAC'),
+            offsets=[2, 10, 16, 16, 25])
+        assert_data_frame_almost_equal(obs, exp)
+
+        obs = SequenceSubclass.batch_find_approximate(
+            seqs, 'ACGTAC', max_distance=2, indels=False)
+        exp = pd.DataFrame({'sequence': [0, 3], 'start': [0, 2],
+                            'end': [6, 8], 'distance': [0, 1]},
+                           columns=['sequence', 'start', 'end', 'distance'])
+        assert_data_frame_almost_equal(obs, exp)
+
+    def test_batch_find_approximate_matches_find_approximate(self):
+        state = np.random.RandomState(0)
+        seqs = [Sequence(''.join(state.choice(list('ACGT'),
+                                              state.randint(0, 200))))
+                for _ in range(100)]
+        for indels in True, False:
+            obs = Sequence.batch_find_approximate(seqs, 'ACGTTGCA', 2, indels,
+                                                  chunk_size=7)
+            exp = [(i, s.start, s.stop) for i, seq in enumerate(seqs)
+                   for s in seq.find_approximate('ACGTTGCA', 2, indels)]
+            self.assertEqual(list(zip(obs['sequence'], obs['start'],
+                                      obs['end'])), exp)
+
+    def test_batch_find_approximate_no_sequences(self):
+        obs = Sequence.batch_find_approximate([], 'ACGT')
+        exp = pd.DataFrame({'sequence': [], 'start': [], 'end': [],
+                            'distance': []},
+                           columns=['sequence', 'start', 'end', 'distance'],
+                           dtype=np.intp)
+        assert_data_frame_almost_equal(obs, exp)
+
+    def test_batch_find_approximate_invalid_input(self):
+        with six.assertRaisesRegex(self, TypeError, 'SequenceSubclass.*str'):
+            SequenceSubclass.batch_find_approximate(['ACGT'], 'ACGT')
+        with six.assertRaisesRegex(self, TypeError, 'SequenceSubclassTwo'):
+            SequenceSubclass.batch_find_approximate(
+                [SequenceSubclass('ACGT')], SequenceSubclassTwo('ACGT'))
+        with six.assertRaisesRegex(self, ValueError, '`max_distance`'):
+            Sequence.batch_find_approximate([], 'ACGT', max_distance=4)
+        with six.assertRaisesRegex(self, ValueError, '`offsets`'):
+            Sequence.batch_find_approximate(b'ACGT', 'ACGT', offsets=[0, 5])
+
     def test_iter_contiguous_index_array(self):
         s = Sequence("0123456789abcdef")
         for c in list, tuple, np.array, pd.Series:
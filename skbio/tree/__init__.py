@@ -35,6 +35,7 @@ Utility Functions
 
     fasta_to_pairlist
     majority_rule
+    rf_dists
 
 Exceptions
 ----------
@@ -242,11 +243,12 @@ from ._tree import TreeNode
 from ._trie import CompressedTrie, fasta_to_pairlist
 from ._nj import nj
 from ._majority_rule import majority_rule
+from ._compare import rf_dists
 from ._exception import (TreeError, NoLengthError, DuplicateNodeError,
                          MissingNodeError, NoParentError)
 
 __all__ = ['TreeNode', 'CompressedTrie', 'fasta_to_pairlist', 'nj',
-           'majority_rule', 'TreeError', 'NoLengthError', 'DuplicateNodeError',
-           'MissingNodeError', 'NoParentError']
+           'majority_rule', 'rf_dists', 'TreeError', 'NoLengthError',
+           'DuplicateNodeError', 'MissingNodeError', 'NoParentError']
 
 test = TestRunner(__file__).test
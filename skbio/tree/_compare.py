@@ -0,0 +1,116 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from skbio.stats.distance import DistanceMatrix
+from skbio.util._decorator import experimental
+
+
+@experimental(as_of="0.4.0-dev")
+def rf_dists(trees, ids=None, proportion=False):
+    r"""Compute the Robinson-Foulds distances between all pairs of trees
+
+    Parameters
+    ----------
+    trees : iterable of TreeNode
+        The trees to compare. All trees must have the same set of tip names.
+        `trees` is only iterated over once, so it can be a generator (e.g.,
+        the trees of a multi-tree Newick file read with ``skbio.io.read``).
+    ids : sequence of str, optional
+        IDs of the trees, in the order of `trees`. If not provided, trees are
+        identified by their position in `trees`, starting at ``'0'``.
+    proportion : bool, optional
+        If ``True``, divide each distance by the total number of clades of the
+        two trees (a distance of 0 is kept if both trees have no clades).
+
+    Returns
+    -------
+    DistanceMatrix
+        The Robinson-Foulds distance between each pair of trees.
+
+    Raises
+    ------
+    ValueError
+        If no tree is provided.
+    ValueError
+        If the trees do not all have the same set of tip names.
+
+    See Also
+    --------
+    TreeNode.compare_rfd
+    skbio.stats.distance.DistanceMatrix
+
+    Notes
+    -----
+    As in ``TreeNode.compare_rfd``, the distance between two trees is the
+    number of clades of more than one tip (excluding the root) found in only
+    one of the trees [1]_.
+
+    Each clade is encoded once as a bitset over the tip names, and the trees
+    are reduced to a sparse tree by clade incidence matrix, so that the
+    number of clades shared by all pairs of trees is computed by a single
+    sparse matrix product instead of comparing the trees pair by pair.
+
+    References
+    ----------
+    .. [1] Comparison of phylogenetic trees. Robinson and Foulds.
+       Mathematical Biosciences. 1981. 53:131-141
+
+    Examples
+    --------
+    >>> from skbio import TreeNode
+    >>> from skbio.tree import rf_dists
+    >>> trees = [TreeNode.read(["((a,b),(c,d));"]),
+    ...          TreeNode.read(["(((a,b),c),d);"]),
+    ...          TreeNode.read(["(((a,c),b),d);"])]
+    >>> dm = rf_dists(trees, ids=['t1', 't2', 't3'])
+    >>> print(dm)
+    3x3 distance matrix
+    IDs:
+    't1', 't2', 't3'
+    Data:
+    [[ 0.  2.  4.]
+     [ 2.  0.  2.]
+     [ 4.  2.  0.]]
+
+    """
+    tip_indices = None
+    clade_ids = {}
+    rows, columns = [], []
+    num_trees = 0
+    for i, tree in enumerate(trees):
+        names = {tip.name for tip in tree.tips()}
+        if tip_indices is None:
+            tip_indices = {name: j for j, name in enumerate(names)}
+        elif len(names) != len(tip_indices) or \
+                not all(name in tip_indices for name in names):
+            raise ValueError("All trees must have the same set of tip names; "
+                             "tree %d differs from the first tree." % i)
+        for clade in tree._subsets_bits(tip_indices):
+            rows.append(i)
+            columns.append(clade_ids.setdefault(clade, len(clade_ids)))
+        num_trees += 1
+
+    if num_trees == 0:
+        raise ValueError("At least one tree must be provided.")
+
+    incidence = csr_matrix(
+        (np.ones(len(rows)), (rows, columns)),
+        shape=(num_trees, len(clade_ids)))
+    shared = incidence.dot(incidence.T).toarray()
+    counts = np.diag(shared)
+    totals = np.add.outer(counts, counts)
+    dists = totals - 2 * shared
+    if proportion:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dists = np.where(totals > 0, dists / totals, 0.0)
+    return DistanceMatrix(dists, ids)
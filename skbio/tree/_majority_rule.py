@@ -8,7 +8,6 @@
 
 from __future__ import absolute_import, division, print_function
 
-from collections import defaultdict
 from future.builtins import zip
 
 import numpy as np
@@ -20,54 +19,105 @@ from skbio.util._decorator import experimental
 def _walk_clades(trees, weights):
     """Walk all the clades of all the trees
 
+    Trees are consumed one at a time, and each clade is encoded as a bitset
+    (a Python int) over the index of its tips, so that memory depends on the
+    number of distinct clades rather than on the number of trees.
+
     Parameters
     ----------
-    trees : list of TreeNode
+    trees : iterable of TreeNode
         The trees to walk
-    weights : np.array
-        Tree weights
+    weights : np.array or None
+        Tree weights, in the order of `trees`. If ``None``, all trees are
+        weighted 1.
 
     Returns
     -------
     list of tuple
-        The clades and support values sorted by support value such that the
-        most supported clade is index 0. The tuples are of the form:
-        (frozenset, float).
-    defaultdict(float)
-        The edge lengths, keyed by frozenset of the clade, and valued by the
+        The clades and support values sorted by clade size such that the
+        largest clade is index 0. The tuples are of the form: (int, float).
+    dict
+        The edge lengths, keyed by the bitset of the clade, and valued by the
         weighted average length of the clade by the trees the clade was
-        observed in.
+        observed in, or None if the clade was observed without a length.
+    list
+        The tip names, such that bit ``i`` of a clade stands for
+        ``tip_names[i]``.
+    float
+        The sum of the weights of the trees.
+
+    Raises
+    ------
+    ValueError
+        If `weights` is provided and there are not as many trees as weights.
 
     """
-    clade_counts = defaultdict(float)
-    edge_lengths = defaultdict(float)
-    total = weights.sum()
-
-    # get clade counts
-    def tipnames_f(n):
-        return [n.name] if n.is_tip() else []
-
-    for tree, weight in zip(trees, weights):
-        tree.cache_attr(tipnames_f, 'tip_names', frozenset)
+    clade_counts = {}
+    edge_lengths = {}
+    tip_indices = {}
+    total = 0.0
+    num_trees = 0
 
+    trees = iter(trees)
+    if weights is None:
+        pairs = ((1.0, tree) for tree in trees)
+    else:
+        # weights are drawn first so that no tree is consumed past the last
+        # weight
+        pairs = zip(weights, trees)
+
+    for weight, tree in pairs:
+        num_trees += 1
+        total += weight
+        bitsets = {}
         for node in tree.postorder():
-            tip_names = node.tip_names
+            if node.children:
+                clade = 0
+                for child in node.children:
+                    clade |= bitsets.pop(id(child))
+            else:
+                index = tip_indices.setdefault(node.name, len(tip_indices))
+                clade = 1 << index
+            bitsets[id(node)] = clade
+
+            clade_counts[clade] = clade_counts.get(clade, 0.0) + weight
 
             # if node.length is not None, fetch it and weight it
-            length = node.length * weight if node.length is not None else None
+            if node.length is None:
+                edge_lengths[clade] = None
+            elif edge_lengths.get(clade, 0.0) is not None:
+                edge_lengths[clade] = (edge_lengths.get(clade, 0.0) +
+                                       node.length * weight)
 
-            clade_counts[tip_names] += weight
+    if weights is not None and (num_trees != len(weights) or
+                                next(trees, None) is not None):
+        raise ValueError("Number of weights and trees differ.")
 
-            if length is None:
-                edge_lengths[tip_names] = None
-            else:
-                edge_lengths[tip_names] += length / total
+    for clade, length in edge_lengths.items():
+        if length is not None:
+            edge_lengths[clade] = length / total
+
+    tip_names = [None] * len(tip_indices)
+    for name, index in tip_indices.items():
+        tip_names[index] = name
+
+    # sort clades by size
+    clade_counts = sorted(clade_counts.items(),
+                          key=lambda x: _clade_size(x[0]), reverse=True)
+
+    return clade_counts, edge_lengths, tip_names, total
 
-    # sort clades by number times observed
-    clade_counts = sorted(clade_counts.items(), key=lambda x: len(x[0]),
-                          reverse=True)
 
-    return clade_counts, edge_lengths
+def _clade_size(clade):
+    """Return the number of tips of a clade encoded as a bitset."""
+    return bin(clade).count('1')
+
+
+def _clade_tips(clade):
+    """Return the indices of the tips of a clade encoded as a bitset."""
+    bits = np.frombuffer(format(clade, 'b')[::-1].encode('ascii'),
+                         dtype=np.uint8)
+    return np.flatnonzero(bits == ord('1'))
 
 
 def _filter_clades(clade_counts, cutoff_threshold):
@@ -76,9 +126,9 @@ def _filter_clades(clade_counts, cutoff_threshold):
     Parameters
     ----------
     clade_counts : list of tuple
-        Where the first element in each tuple is the frozenset of the clade,
+        Where the first element in each tuple is the bitset of the clade,
         and the second element is the support value. It is expected that this
-        list is sorted by descending order by support.
+        list is sorted by descending order by clade size.
     cutoff_threshold : float
         The minimum weighted observation count that a clade must have to be
         considered supported.
@@ -86,7 +136,7 @@ def _filter_clades(clade_counts, cutoff_threshold):
     Returns
     -------
     dict
-        A dict of the accepted clades, keyed by the frozenset of the clade and
+        A dict of the accepted clades, keyed by the bitset of the clade and
         valued by the support value.
     """
     accepted_clades = {}
@@ -97,18 +147,17 @@ def _filter_clades(clade_counts, cutoff_threshold):
         if count <= cutoff_threshold:
             continue
 
-        if len(clade) > 1:
+        if clade & (clade - 1):
             # check the current clade against all the accepted clades to see if
             # it conflicts. A conflict is defined as:
             # 1. the clades are not disjoint
             # 2. neither clade is a subset of the other
             for accepted_clade in accepted_clades:
-                intersect = clade.intersection(accepted_clade)
-                subset = clade.issubset(accepted_clade)
-                superset = clade.issuperset(accepted_clade)
-
-                if intersect and not (subset or superset):
+                intersect = clade & accepted_clade
+                if intersect and intersect != clade and \
+                        intersect != accepted_clade:
                     conflict = True
+                    break
 
         if conflict is False:
             accepted_clades[clade] = count
@@ -116,76 +165,67 @@ def _filter_clades(clade_counts, cutoff_threshold):
     return accepted_clades
 
 
-def _build_trees(clade_counts, edge_lengths, support_attr):
+def _build_trees(clade_counts, edge_lengths, support_attr, tip_names):
     """Construct the trees with support
 
     Parameters
     ----------
     clade_counts : dict
-        Keyed by the frozenset of the clade and valued by the support
+        Keyed by the bitset of the clade and valued by the support
     edge_lengths : dict
-        Keyed by the frozenset of the clade and valued by the weighted length
+        Keyed by the bitset of the clade and valued by the weighted length
     support_attr : str
         The name of the attribute to hold the support value
+    tip_names : list
+        The name of the tip of each bit of the clades
 
     Returns
     -------
     list of TreeNode
         A list of the constructed trees
     """
-    nodes = {}
-    queue = [(len(clade), clade) for clade in clade_counts]
-    while queue:
-        # The values within the queue are updated on each iteration, so it
-        # doesn't look like an insertion sort will make sense unfortunately
-        queue.sort()
-        (clade_size, clade) = queue.pop(0)
-        new_queue = []
-
-        # search for ancestors of clade
-        for (_, ancestor) in queue:
-            if clade.issubset(ancestor):
-                # update ancestor such that, in the following example:
-                # ancestor == {1, 2, 3, 4}
-                # clade == {2, 3}
-                # new_ancestor == {1, {2, 3}, 4}
-                new_ancestor = (ancestor - clade) | frozenset([clade])
-
-                # update references for counts and lengths
-                clade_counts[new_ancestor] = clade_counts.pop(ancestor)
-                edge_lengths[new_ancestor] = edge_lengths.pop(ancestor)
-
-                ancestor = new_ancestor
-
-            new_queue.append((len(ancestor), ancestor))
+    # the largest clade built so far containing each tip; clades are built
+    # from the smallest, so these are the children of the next clade that
+    # contains them
+    tops = {}
+    for clade in sorted(clade_counts, key=_clade_size):
+        tips = _clade_tips(clade)
+        children = []
+        seen = set()
+        for tip in tips:
+            child = tops.get(tip)
+            if child is not None and id(child) not in seen:
+                seen.add(id(child))
+                children.append(child)
 
         # if the clade is a tip, then we have a name
-        if clade_size == 1:
-            name = list(clade)[0]
-        else:
-            name = None
+        name = tip_names[tips[0]] if len(tips) == 1 else None
 
-        # the clade will not be in nodes if it is a tip
-        children = [nodes.pop(c) for c in clade if c in nodes]
-        length = edge_lengths[clade]
-
-        node = TreeNode(children=children, length=length, name=name)
+        node = TreeNode(children=children, length=edge_lengths[clade],
+                        name=name)
         setattr(node, support_attr, clade_counts[clade])
-        nodes[clade] = node
-
-        queue = new_queue
+        for tip in tips:
+            tops[tip] = node
 
-    return list(nodes.values())
+    roots = []
+    seen = set()
+    for tip in sorted(tops):
+        if id(tops[tip]) not in seen:
+            seen.add(id(tops[tip]))
+            roots.append(tops[tip])
+    return roots
 
 
 @experimental(as_of="0.4.0")
 def majority_rule(trees, weights=None, cutoff=0.5, support_attr='support'):
-    r"""Determines consensus trees from a list of rooted trees
+    r"""Determines consensus trees from a collection of rooted trees
 
     Parameters
     ----------
-    trees : list of TreeNode
-        The trees to operate on
+    trees : iterable of TreeNode
+        The trees to operate on. Trees are consumed one at a time, so this
+        may be a generator, such as the trees of a newick file read with
+        ``skbio.io.read(fh, format='newick')``.
     weights : list or np.array of {int, float}, optional
         If provided, the list must be in index order with `trees`. Each tree
         will receive the corresponding weight. If omitted, all trees will be
@@ -216,6 +256,10 @@ def majority_rule(trees, weights=None, cutoff=0.5, support_attr='support'):
     clade was observed in. For instance, if {A, B, C} was observed in 5 trees
     all with a weight of 1, its support would then be 5.
 
+    Clades are counted as bitsets over the tips, and only the support and
+    total edge length of each distinct clade are kept, so memory does not
+    grow with the number of trees beyond the clades they introduce.
+
     References
     ----------
     .. [1] Margush T, McMorris FR. (1981) "Consensus n-trees." Bulletin for
@@ -266,18 +310,25 @@ def majority_rule(trees, weights=None, cutoff=0.5, support_attr='support'):
     >>> len(consensus_trees)
     4
 
+    Trees can also be streamed, for instance from a newick file holding one
+    tree per line, without holding all of them in memory.
+
+    >>> from skbio.io import read
+    >>> newick = StringIO("((a,b),c);\n((a,b),c);\n(a,(b,c));\n")
+    >>> consensus = majority_rule(read(newick, format='newick'))[0]
+    >>> print(consensus)
+    ((a,b),c);
+    <BLANKLINE>
+
     """
-    if weights is None:
-        weights = np.ones(len(trees), dtype=float)
-    else:
+    if weights is not None:
         weights = np.asarray(weights)
-        if len(weights) != len(trees):
+        if hasattr(trees, '__len__') and len(weights) != len(trees):
             raise ValueError("Number of weights and trees differ.")
 
-    cutoff_threshold = cutoff * weights.sum()
-
-    clade_counts, edge_lengths = _walk_clades(trees, weights)
-    clade_counts = _filter_clades(clade_counts, cutoff_threshold)
-    trees = _build_trees(clade_counts, edge_lengths, support_attr)
+    clade_counts, edge_lengths, tip_names, total = _walk_clades(trees,
+                                                                weights)
+    clade_counts = _filter_clades(clade_counts, cutoff * total)
+    trees = _build_trees(clade_counts, edge_lengths, support_attr, tip_names)
 
     return trees
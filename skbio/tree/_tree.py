@@ -759,6 +759,29 @@ class TreeNode(SkbioObject):
                 i.__leaf_set = leaf_set
         return frozenset(sets)
 
+    def _subsets_bits(self, tip_indices):
+        """Return the subsets of ``subsets`` as bitsets of tip names.
+
+        Each subset is a Python int in which bit ``tip_indices[name]`` is set
+        for each tip name of the subset, so that subsets can be hashed,
+        compared and intersected without building sets of names.
+
+        """
+        bits = {}
+        sets = set()
+        for node in self.postorder(include_self=False):
+            if node.children:
+                leaf_bits = 0
+                for child in node.children:
+                    leaf_bits |= bits.pop(id(child))
+                # keep subsets of more than one tip
+                if leaf_bits & (leaf_bits - 1):
+                    sets.add(leaf_bits)
+            else:
+                leaf_bits = 1 << tip_indices[node.name]
+            bits[id(node)] = leaf_bits
+        return sets
+
     @experimental(as_of="0.4.0")
     def root_at(self, node):
         r"""Return a new tree rooted at the provided node.
@@ -2568,8 +2591,9 @@ class TreeNode(SkbioObject):
             tree1 = self
             tree2 = other
 
-        tree1_sets = tree1.subsets()
-        tree2_sets = tree2.subsets()
+        tip_indices = {n: i for i, n in enumerate(t1names | t2names)}
+        tree1_sets = tree1._subsets_bits(tip_indices)
+        tree2_sets = tree2._subsets_bits(tip_indices)
 
         not_in_both = tree1_sets.symmetric_difference(tree2_sets)
 
@@ -2615,14 +2639,20 @@ class TreeNode(SkbioObject):
         0.5
 
         """
-        self_sets, other_sets = self.subsets(), other.subsets()
+        self_names, other_names = self.subset(), other.subset()
+        tip_indices = {n: i for i, n in
+                       enumerate(self_names | other_names)}
+        self_sets = self._subsets_bits(tip_indices)
+        other_sets = other._subsets_bits(tip_indices)
 
         if exclude_absent_taxa:
-            in_both = self.subset() & other.subset()
+            in_both = 0
+            for name in self_names & other_names:
+                in_both |= 1 << tip_indices[name]
             self_sets = (i & in_both for i in self_sets)
-            self_sets = frozenset({i for i in self_sets if len(i) > 1})
+            self_sets = {i for i in self_sets if i & (i - 1)}
             other_sets = (i & in_both for i in other_sets)
-            other_sets = frozenset({i for i in other_sets if len(i) > 1})
+            other_sets = {i for i in other_sets if i & (i - 1)}
 
         total_subsets = len(self_sets) + len(other_sets)
         intersection_length = len(self_sets & other_sets)
@@ -0,0 +1,80 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from __future__ import absolute_import, division, print_function
+
+import io
+from unittest import TestCase, main
+
+import six
+import numpy as np
+import numpy.testing as npt
+
+from skbio import TreeNode, DistanceMatrix, read
+from skbio.stats.distance import DissimilarityMatrixError
+from skbio.tree import rf_dists
+
+
+class RFDistsTests(TestCase):
+    def setUp(self):
+        self.newicks = [u'((a,b),(c,d));', u'(((a,b),c),d);',
+                        u'(((a,c),b),d);', u'(a,b,c,d);',
+                        u'((d,c),(b,a));']
+        self.trees = [TreeNode.read([newick]) for newick in self.newicks]
+
+    def test_same_as_compare_rfd(self):
+        for proportion in (False, True):
+            obs = rf_dists(self.trees, proportion=proportion)
+            self.assertIsInstance(obs, DistanceMatrix)
+            self.assertEqual(obs.ids, ('0', '1', '2', '3', '4'))
+            exp = [[t1.compare_rfd(t2, proportion=proportion)
+                    if t1.subsets() or t2.subsets() else 0.0
+                    for t2 in self.trees] for t1 in self.trees]
+            npt.assert_almost_equal(obs.data, exp)
+
+    def test_random_trees(self):
+        state = np.random.RandomState(0)
+        trees = []
+        for _ in range(10):
+            nodes = [TreeNode(name='t%d' % i) for i in range(20)]
+            while len(nodes) > 1:
+                i, j = sorted(state.choice(len(nodes), 2, replace=False))
+                right, left = nodes.pop(j), nodes.pop(i)
+                nodes.append(TreeNode(children=[left, right]))
+            trees.append(nodes[0])
+        obs = rf_dists(iter(trees))
+        for i, t1 in enumerate(trees):
+            for j, t2 in enumerate(trees):
+                self.assertEqual(obs[i, j], t1.compare_rfd(t2))
+
+    def test_ids(self):
+        obs = rf_dists(self.trees[:2], ids=['x', 'y'])
+        self.assertEqual(obs, DistanceMatrix([[0, 2], [2, 0]], ['x', 'y']))
+
+    def test_generator_of_newick_trees(self):
+        obs = rf_dists(read(io.StringIO(u'\n'.join(self.newicks)),
+                            format='newick', into=None))
+        self.assertEqual(obs, rf_dists(self.trees))
+
+    def test_single_tree(self):
+        obs = rf_dists(self.trees[:1])
+        self.assertEqual(obs, DistanceMatrix([[0]]))
+
+    def test_invalid_input(self):
+        with six.assertRaisesRegex(self, ValueError, 'At least one'):
+            rf_dists([])
+        with six.assertRaisesRegex(self, ValueError, 'tree 1 differs'):
+            rf_dists([self.trees[0], TreeNode.read([u'((a,b),(c,e));'])])
+        with six.assertRaisesRegex(self, ValueError, 'tree 2 differs'):
+            rf_dists(self.trees[:2] + [TreeNode.read([u'((a,b),c);'])])
+        with self.assertRaises(DissimilarityMatrixError):
+            rf_dists(self.trees[:2], ids=['x'])
+
+
+if __name__ == '__main__':
+    main()
@@ -13,10 +13,15 @@ from unittest import TestCase, main
 import numpy as np
 
 from skbio.io._fileobject import StringIO
-from skbio import TreeNode
+from skbio import TreeNode, read
 from skbio.tree import majority_rule
 from skbio.tree._majority_rule import (_walk_clades, _filter_clades,
-                                       _build_trees)
+                                       _build_trees, _clade_size,
+                                       _clade_tips)
+
+
+def _names(clade, tip_names):
+    return frozenset(tip_names[i] for i in _clade_tips(clade))
 
 
 class MajorityRuleTests(TestCase):
@@ -52,6 +57,50 @@ class MajorityRuleTests(TestCase):
 
         with self.assertRaises(ValueError):
             majority_rule(trees, weights=[1, 2])
+        with self.assertRaises(ValueError):
+            majority_rule(iter(trees), weights=[1, 2])
+        with self.assertRaises(ValueError):
+            majority_rule(iter(trees), weights=[1] * 10)
+
+    def test_majority_rule_streamed_trees(self):
+        newicks = ["(A,(B,(H,(D,(J,(((G,E),(F,I)),C))))));",
+                   "(A,(B,(D,((J,H),(((G,E),(F,I)),C)))));",
+                   "(A,(B,(D,(H,(J,(((G,E),(F,I)),C))))));",
+                   "(A,(B,(E,(G,((F,I),((J,(H,D)),C))))));",
+                   "(A,(B,(E,(G,((F,I),(((J,H),D),C))))));",
+                   "(A,(B,(E,((F,I),(G,((J,(H,D)),C))))));",
+                   "(A,(B,(E,((F,I),(G,(((J,H),D),C))))));",
+                   "(A,(B,(E,((G,(F,I)),((J,(H,D)),C)))));",
+                   "(A,(B,(E,((G,(F,I)),(((J,H),D),C)))));"]
+        exp = majority_rule([TreeNode.read(StringIO(newick))
+                             for newick in newicks])[0]
+
+        trees = read(StringIO('\n'.join(newicks)), format='newick')
+        obs = majority_rule(trees)
+        self.assertEqual(len(obs), 1)
+        self.assertEqual(exp.compare_subsets(obs[0]), 0.0)
+        self.assertEqual(
+            sorted(n.support for n in obs[0].non_tips()),
+            sorted(n.support for n in exp.non_tips()))
+
+        trees = (TreeNode.read(StringIO(newick)) for newick in newicks)
+        obs = majority_rule(trees, weights=np.arange(1, 10))
+        self.assertEqual(obs[0].support, 45)
+
+    def test_majority_rule_edge_lengths(self):
+        trees = [TreeNode.read(StringIO("((a:1,b:2):3,c:4):0;")),
+                 TreeNode.read(StringIO("((a:3,b:2):1,c:2):0;")),
+                 TreeNode.read(StringIO("(a:1,(b:2,c:3):4):0;"))]
+        obs = majority_rule(trees)[0]
+        self.assertEqual(obs.length, 0)
+        clade = obs.find('a').parent
+        self.assertAlmostEqual(clade.length, 4 / 3)
+        self.assertAlmostEqual(obs.find('a').length, 5 / 3)
+        self.assertAlmostEqual(obs.find('c').length, 3)
+
+    def test_majority_rule_no_trees(self):
+        self.assertEqual(majority_rule([]), [])
+        self.assertEqual(majority_rule(iter([])), [])
 
     def test_majority_rule_multiple_trees(self):
         trees = [
@@ -114,57 +163,110 @@ class MajorityRuleTests(TestCase):
             frozenset(['D', 'E', 'X']): 1.0,
             frozenset(['A', 'B', 'D', 'E', 'X']): 1.0}
 
-        obs_clades, obs_lengths = _walk_clades(trees, np.ones(len(trees)))
-        self.assertEqual(set(obs_clades), set(exp_clades))
-        self.assertEqual(obs_lengths, exp_lengths_nolength)
+        for weights in (np.ones(len(trees)), None):
+            obs_clades, obs_lengths, tip_names, total = _walk_clades(
+                trees, weights)
+            self.assertEqual(sorted(tip_names), ['A', 'B', 'D', 'E', 'X'])
+            self.assertEqual(total, 2.0)
+            self.assertEqual(
+                set((_names(clade, tip_names), count)
+                    for clade, count in obs_clades), set(exp_clades))
+            self.assertEqual(
+                {_names(clade, tip_names): length
+                 for clade, length in obs_lengths.items()},
+                exp_lengths_nolength)
+            # clades are sorted by size
+            sizes = [_clade_size(clade) for clade, _ in obs_clades]
+            self.assertEqual(sizes, sorted(sizes, reverse=True))
 
         for t in trees:
             for n in t.traverse(include_self=True):
                 n.length = 2.0
 
-        obs_clades, obs_lengths = _walk_clades(trees, np.ones(len(trees)))
+        obs_clades, obs_lengths, tip_names, total = _walk_clades(
+            trees, np.ones(len(trees)))
+
+        self.assertEqual(
+            set((_names(clade, tip_names), count)
+                for clade, count in obs_clades), set(exp_clades))
+        self.assertEqual(
+            {_names(clade, tip_names): length
+             for clade, length in obs_lengths.items()}, exp_lengths)
 
-        self.assertEqual(set(obs_clades), set(exp_clades))
-        self.assertEqual(obs_lengths, exp_lengths)
+        # a clade observed without a length in any tree has no length
+        trees[1].find('A').length = None
+        obs_lengths = _walk_clades(trees, np.ones(len(trees)))[1]
+        self.assertIsNone(obs_lengths[1])
+
+    def test_walk_clades_weights_and_trees_differ(self):
+        trees = [TreeNode.read(StringIO("((A,B),(D,E));")),
+                 TreeNode.read(StringIO("((A,B),(D,(E,X)));"))]
+        for weights in ([1], [1, 1, 1]):
+            with self.assertRaises(ValueError):
+                _walk_clades(iter(trees), np.asarray(weights))
+
+    def test_clade_tips(self):
+        self.assertEqual(list(_clade_tips(1)), [0])
+        self.assertEqual(list(_clade_tips(0b101100)), [2, 3, 5])
+        self.assertEqual(list(_clade_tips(1 << 200 | 2)), [1, 200])
+        self.assertEqual(_clade_size(1 << 200 | 2), 2)
 
     def test_filter_clades(self):
-        clade_counts = [(frozenset(['A', 'B']), 8),
-                        (frozenset(['A', 'C']), 7),
-                        (frozenset(['A']), 6),
-                        (frozenset(['B']), 5)]
+        # the tips A, B, C and D are the bits 1, 2, 4 and 8
+        clade_counts = [(0b11, 8),
+                        (0b101, 7),
+                        (0b1, 6),
+                        (0b10, 5)]
         obs = _filter_clades(clade_counts, 2)
-        exp = {frozenset(['A', 'B']): 8,
-               frozenset(['A']): 6,
-               frozenset(['B']): 5}
+        exp = {0b11: 8,
+               0b1: 6,
+               0b10: 5}
         self.assertEqual(obs, exp)
 
-        clade_counts = [(frozenset(['A']), 8),
-                        (frozenset(['B']), 7),
-                        (frozenset(['C']), 7),
-                        (frozenset(['A', 'B']), 6),
-                        (frozenset(['A', 'B', 'C']), 5),
-                        (frozenset(['D']), 2)]
+        clade_counts = [(0b111, 5),
+                        (0b11, 6),
+                        (0b1, 8),
+                        (0b10, 7),
+                        (0b100, 7),
+                        (0b1000, 2)]
         obs = _filter_clades(clade_counts, 4)
-        exp = {frozenset(['A']): 8,
-               frozenset(['B']): 7,
-               frozenset(['C']): 7,
-               frozenset(['A', 'B']): 6,
-               frozenset(['A', 'B', 'C']): 5}
+        exp = {0b1: 8,
+               0b10: 7,
+               0b100: 7,
+               0b11: 6,
+               0b111: 5}
         self.assertEqual(obs, exp)
 
     def test_build_trees(self):
-        clade_counts = {frozenset(['A', 'B']): 6,
-                        frozenset(['A']): 7,
-                        frozenset(['B']): 8}
-        edge_lengths = {frozenset(['A', 'B']): 1,
-                        frozenset(['A']): 2,
-                        frozenset(['B']): 3}
-        tree = _build_trees(clade_counts, edge_lengths, 'foo')[0]
+        clade_counts = {0b11: 6,
+                        0b1: 7,
+                        0b10: 8}
+        edge_lengths = {0b11: 1,
+                        0b1: 2,
+                        0b10: 3}
+        tree = _build_trees(clade_counts, edge_lengths, 'foo', ['A', 'B'])[0]
         self.assertEqual(tree.foo, 6)
         tree_foos = set([c.foo for c in tree.children])
         tree_lens = set([c.length for c in tree.children])
         self.assertEqual(tree_foos, set([7, 8]))
         self.assertEqual(tree_lens, set([2, 3]))
+        self.assertEqual([c.name for c in tree.children], ['A', 'B'])
+
+    def test_build_trees_nested_and_disjoint(self):
+        # tips of a clade need not have consecutive bits, and tips that are
+        # not accepted as clades are left out
+        tip_names = ['a', 'b', 'c', 'd', 'e', 'f']
+        clade_counts = {0b111111: 1, 0b10101: 1, 0b101: 1, 0b1: 1, 0b100: 1,
+                        0b10000: 1, 0b10: 1, 0b1000: 1, 0b1010: 1}
+        edge_lengths = dict.fromkeys(clade_counts)
+        trees = _build_trees(clade_counts, edge_lengths, 'support', tip_names)
+        self.assertEqual(len(trees), 1)
+        self.assertEqual(str(trees[0]), '(((a,c),e),(b,d));\n')
+
+        del clade_counts[0b111111]
+        trees = _build_trees(clade_counts, edge_lengths, 'support', tip_names)
+        self.assertEqual([str(tree) for tree in trees],
+                         ['((a,c),e);\n', '(b,d);\n'])
 
 
 if __name__ == '__main__':
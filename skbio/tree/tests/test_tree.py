@@ -368,6 +368,18 @@ class TreeTests(TestCase):
         self.assertEqual(t.subsets(), frozenset(
             [frozenset('ab'), frozenset('cd')]))
 
+    def test_subsets_bits(self):
+        """_subsets_bits should encode the subsets as bitsets of tip names"""
+        t = TreeNode.read(StringIO(u'(((a,b),(c)),((d,e,f),g),(h));'))
+        tip_indices = {name: i for i, name in enumerate('abcdefgh')}
+        exp = {frozenset(i) for i in ('ab', 'abc', 'def', 'defg')}
+        self.assertEqual(t.subsets(), exp)
+        obs = {frozenset(name for name, i in tip_indices.items()
+                         if bits >> i & 1)
+               for bits in t._subsets_bits(tip_indices)}
+        self.assertEqual(obs, exp)
+        self.assertEqual(TreeNode(name='a')._subsets_bits({'a': 0}), set())
+
     def test_is_tip(self):
         """see if we're a tip or not"""
         self.assertFalse(self.simple_t.is_tip())
@@ -899,6 +911,13 @@ class TreeTests(TestCase):
         with self.assertRaises(ValueError):
             t.compare_rfd(t4)
 
+    def test_compare_rfd_shears_trees(self):
+        """compare_rfd should only compare the tips found in both trees"""
+        t = TreeNode.read(StringIO(u'((H,G),(R,M));'))
+        t3 = TreeNode.read(StringIO(u'(((H,G),(R,X)),M);'))
+        self.assertEqual(t.compare_rfd(t3), 2.0)
+        self.assertEqual(t3.compare_rfd(t), 2.0)
+
     def test_assign_ids(self):
         """Assign IDs to the tree"""
         t1 = TreeNode.read(StringIO(u"(((a,b),c),(e,f),(g));"))